@@ -0,0 +1,33 @@
+"""add seeker interest index for matching newly published listings
+
+Revision ID: 3c8a5e1f7d46
+Revises: 9e4c1f7a2b83
+Create Date: 2026-10-20 01:06:48.117402
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3c8a5e1f7d46'
+down_revision: Union[str, Sequence[str], None] = '9e4c1f7a2b83'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        "ix_seeker_profiles_interest",
+        "seeker_profiles",
+        ["city_key", "budget_max"],
+        postgresql_where=sa.text("visible"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_seeker_profiles_interest", table_name="seeker_profiles")
@@ -0,0 +1,107 @@
+"""add packed roommate trait features to listings
+
+Revision ID: 5b1d7e3a9c24
+Revises: 7c2e9b4d1a60
+Create Date: 2026-10-19 22:05:47.119630
+
+"""
+import re
+import zlib
+from collections.abc import Iterable, Mapping
+from itertools import groupby
+from typing import Any, Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5b1d7e3a9c24'
+down_revision: Union[str, Sequence[str], None] = '7c2e9b4d1a60'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Trait word encoding as of this revision (``core.domain.traits``), copied so
+# later edits to the app cannot change what this migration writes.
+_WORD = re.compile(r"[a-z0-9]+")
+_INTEREST_BITS = 40
+_MAJOR_OFFSET = 40
+_MAJOR_BITS = 16
+_HABIT_OFFSET = 56
+_MAJOR_STOP_WORDS = frozenset(
+    {"and", "of", "in", "the", "major", "minor", "science", "sciences", "studies"}
+)
+_HABIT_WORDS = (
+    (
+        frozenset({"early", "morning", "bird", "riser"}),
+        frozenset({"late", "night", "owl", "nocturnal"}),
+    ),
+    (
+        frozenset({"quiet", "library", "silent", "focused"}),
+        frozenset({"social", "group", "groups", "loud"}),
+    ),
+    (
+        frozenset({"tidy", "clean", "neat", "organized", "organised"}),
+        frozenset({"relaxed", "messy", "casual", "laid"}),
+    ),
+)
+
+
+def _words(text: str | None) -> list[str]:
+    return _WORD.findall(text.lower()) if text else []
+
+
+def _bucket(token: str, width: int) -> int:
+    return zlib.crc32(token.encode()) % width
+
+
+def _roommate_word(row: Mapping[str, Any]) -> int:
+    word = 0
+    interests = row["interests_csv"].split(",") if row["interests_csv"] else []
+    for interest in interests:
+        key = " ".join(_words(interest))
+        if key:
+            word |= 1 << _bucket(key, _INTEREST_BITS)
+    for token in _words(row["major"]):
+        if token not in _MAJOR_STOP_WORDS:
+            word |= 1 << (_MAJOR_OFFSET + _bucket(token, _MAJOR_BITS))
+    from_bio = set(_words(row["bio"]))
+    fields = (row["sleeping_habits"], row["study_habits"], row["cleanliness"])
+    pairs = zip(fields, _HABIT_WORDS, strict=True)
+    for index, (text, (first, second)) in enumerate(pairs):
+        words = set(_words(text)) if text else from_bio
+        is_first, is_second = bool(words & first), bool(words & second)
+        if is_first != is_second:
+            word |= 1 << (_HABIT_OFFSET + 2 * index + is_second)
+    return word
+
+
+def _encode_roommates(rows: Iterable[Mapping[str, Any]]) -> bytes:
+    return b"".join(_roommate_word(row).to_bytes(8, "little") for row in rows)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column("listings", sa.Column("roommate_features", sa.LargeBinary(), nullable=True))
+    # Encoded in Python (keyword tables, hashing), so backfill from here.
+    conn = op.get_bind()
+    rows = conn.execute(
+        sa.text(
+            "SELECT listing_id, interests_csv, major, sleeping_habits, study_habits, "
+            "cleanliness, bio FROM listing_roommates ORDER BY listing_id, id"
+        )
+    ).mappings()
+    updates = [
+        {"id": listing_id, "features": _encode_roommates(roommates)}
+        for listing_id, roommates in groupby(rows, key=lambda row: row["listing_id"])
+    ]
+    if updates:
+        conn.execute(
+            sa.text("UPDATE listings SET roommate_features = :features WHERE id = :id"),
+            updates,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column("listings", "roommate_features")
@@ -0,0 +1,221 @@
+"""add gazetteer lat/lon and geohash to listings and seeker_profiles
+
+Revision ID: 7c2e9b4d1a60
+Revises: d3f81a6c2e57
+Create Date: 2026-10-19 20:41:08.517302
+
+"""
+import csv
+import io
+import re
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7c2e9b4d1a60'
+down_revision: Union[str, Sequence[str], None] = 'd3f81a6c2e57'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TABLES = ("listings", "seeker_profiles")
+
+# Gazetteer lookup and geohash as of this revision (``core.geo``), copied along
+# with the bundled data so later edits to the app cannot change what this
+# migration writes.
+_GAZETTEER_CSV = """\
+city,state,lat,lon
+Altoona,WI,44.8044,-91.4427
+Appleton,WI,44.2619,-88.4154
+Ashland,WI,46.5924,-90.8838
+Augusta,WI,44.6802,-91.1199
+Baraboo,WI,43.4711,-89.7443
+Beloit,WI,42.5083,-89.0318
+Black River Falls,WI,44.2947,-90.8515
+Bloomer,WI,45.1002,-91.4893
+Chippewa Falls,WI,44.9369,-91.3929
+De Pere,WI,44.4489,-88.0604
+Durand,WI,44.6264,-91.9657
+Eau Claire,WI,44.8113,-91.4985
+Fall Creek,WI,44.7633,-91.2771
+Fitchburg,WI,42.9608,-89.4698
+Fond du Lac,WI,43.7730,-88.4471
+Green Bay,WI,44.5133,-88.0133
+Hudson,WI,44.9747,-92.7569
+Janesville,WI,42.6828,-89.0187
+Kenosha,WI,42.5847,-87.8212
+La Crosse,WI,43.8014,-91.2396
+Lake Hallie,WI,44.8919,-91.4190
+Madison,WI,43.0731,-89.4012
+Manitowoc,WI,44.0886,-87.6576
+Marshfield,WI,44.6689,-90.1718
+Menomonie,WI,44.8755,-91.9193
+Mequon,WI,43.2158,-87.9845
+Middleton,WI,43.0972,-89.5043
+Milwaukee,WI,43.0389,-87.9065
+Neenah,WI,44.1858,-88.4626
+Onalaska,WI,43.8844,-91.2351
+Osseo,WI,44.5722,-91.2271
+Oshkosh,WI,44.0247,-88.5426
+Platteville,WI,42.7342,-90.4785
+Racine,WI,42.7261,-87.7829
+Rhinelander,WI,45.6366,-89.4121
+Rice Lake,WI,45.5061,-91.7382
+River Falls,WI,44.8614,-92.6238
+Sheboygan,WI,43.7508,-87.7145
+Stevens Point,WI,44.5236,-89.5746
+Sun Prairie,WI,43.1836,-89.2137
+Superior,WI,46.7208,-92.1041
+Waukesha,WI,43.0117,-88.2315
+Wausau,WI,44.9591,-89.6301
+Wauwatosa,WI,43.0495,-88.0076
+West Allis,WI,43.0167,-88.0070
+Whitewater,WI,42.8336,-88.7323
+Wisconsin Rapids,WI,44.3836,-89.8173
+Bemidji,MN,47.4716,-94.8827
+Bloomington,MN,44.8408,-93.2983
+Brainerd,MN,46.3580,-94.2008
+Burnsville,MN,44.7677,-93.2777
+Duluth,MN,46.7867,-92.1005
+Eden Prairie,MN,44.8547,-93.4708
+Edina,MN,44.8897,-93.3499
+Hastings,MN,44.7443,-92.8524
+Mankato,MN,44.1636,-93.9994
+Maple Grove,MN,45.0725,-93.4558
+Marshall,MN,44.4469,-95.7884
+Minneapolis,MN,44.9778,-93.2650
+Moorhead,MN,46.8738,-96.7678
+Morris,MN,45.5919,-95.9139
+Northfield,MN,44.4583,-93.1616
+Osseo,MN,45.1194,-93.4024
+Owatonna,MN,44.0839,-93.2261
+Plymouth,MN,45.0105,-93.4555
+Red Wing,MN,44.5625,-92.5338
+Richfield,MN,44.8833,-93.2830
+Rochester,MN,44.0121,-92.4802
+Roseville,MN,45.0061,-93.1566
+Saint Cloud,MN,45.5579,-94.1632
+Saint Louis Park,MN,44.9483,-93.3480
+Saint Paul,MN,44.9537,-93.0900
+Saint Peter,MN,44.3236,-93.9580
+Stillwater,MN,45.0564,-92.8060
+Winona,MN,44.0499,-91.6393
+Woodbury,MN,44.9239,-92.9594
+"""
+_Point = tuple[float, float]
+# Keyed by (city key, state), and by city key alone where that is unambiguous.
+_Gazetteer = tuple[dict[tuple[str, str], _Point], dict[str, _Point]]
+_BASE32 = "0123456789bcdefghjkmnpqrstuvwxyz"
+_GEOHASH_PRECISION = 7
+_CITY_WORD = re.compile(r"[^\W_]+(?:['-][^\W_]+)*")
+_TRAILING_STATE = re.compile(r",\s*[a-z]{2}\s*$")
+_CITY_PREFIXES = {"st": "saint", "ste": "sainte", "ft": "fort", "mt": "mount"}
+_CITY_ALIASES = {
+    "eauclaire": "eau claire",
+    "lacrosse": "la crosse",
+    "mpls": "minneapolis",
+    "msp": "minneapolis",
+    "madtown": "madison",
+    "stevens pt": "stevens point",
+}
+
+
+def _city_key(value: str | None) -> str:
+    if not value:
+        return ""
+    text = _TRAILING_STATE.sub("", value.lower().replace(".", " "))
+    words = _CITY_WORD.findall(text)
+    if words and words[0] in _CITY_PREFIXES:
+        words[0] = _CITY_PREFIXES[words[0]]
+    key = " ".join(words)
+    return _CITY_ALIASES.get(key, key)
+
+
+def _gazetteer() -> _Gazetteer:
+    by_city_state = {
+        (_city_key(row["city"]), row["state"]): (float(row["lat"]), float(row["lon"]))
+        for row in csv.DictReader(io.StringIO(_GAZETTEER_CSV))
+    }
+    by_city: dict[str, set[_Point]] = {}
+    for (city, _), point in by_city_state.items():
+        by_city.setdefault(city, set()).add(point)
+    # A bare city name only resolves when no other state has the same one.
+    unique = {city: next(iter(points)) for city, points in by_city.items() if len(points) == 1}
+    return by_city_state, unique
+
+
+def _locate(gazetteer: _Gazetteer, city: str | None, state: str | None) -> _Point | None:
+    key = _city_key(city)
+    if not key:
+        return None
+    if state and state.strip():
+        return gazetteer[0].get((key, state.strip().upper()))
+    return gazetteer[1].get(key)
+
+
+def _geohash(lat: float, lon: float) -> str:
+    lat_lo, lat_hi, lon_lo, lon_hi = -90.0, 90.0, -180.0, 180.0
+    chars: list[str] = []
+    bits = value = 0
+    even = True
+    while len(chars) < _GEOHASH_PRECISION:
+        if even:
+            mid = (lon_lo + lon_hi) / 2
+            if lon >= mid:
+                value, lon_lo = value * 2 + 1, mid
+            else:
+                value, lon_hi = value * 2, mid
+        else:
+            mid = (lat_lo + lat_hi) / 2
+            if lat >= mid:
+                value, lat_lo = value * 2 + 1, mid
+            else:
+                value, lat_hi = value * 2, mid
+        even = not even
+        bits += 1
+        if bits == 5:
+            chars.append(_BASE32[value])
+            bits = value = 0
+    return "".join(chars)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    conn = op.get_bind()
+    gazetteer = _gazetteer()
+    for table in TABLES:
+        op.add_column(table, sa.Column("lat", sa.Float(), nullable=True))
+        op.add_column(table, sa.Column("lon", sa.Float(), nullable=True))
+        op.add_column(table, sa.Column("geohash", sa.String(12, collation="C"), nullable=True))
+        # Resolved from the bundled gazetteer; seekers have no state column.
+        state = "state" if table == "listings" else "NULL AS state"
+        rows = conn.execute(
+            sa.text(f"SELECT id, city, {state} FROM {table} WHERE city IS NOT NULL")
+        ).all()
+        updates = []
+        for row in rows:
+            point = _locate(gazetteer, row.city, row.state)
+            if point is not None:
+                lat, lon = point
+                updates.append(
+                    {"id": row.id, "lat": lat, "lon": lon, "geohash": _geohash(lat, lon)}
+                )
+        if updates:
+            conn.execute(
+                sa.text(
+                    f"UPDATE {table} SET lat = :lat, lon = :lon, geohash = :geohash WHERE id = :id"
+                ),
+                updates,
+            )
+        op.create_index(f"ix_{table}_geohash", table, ["geohash"])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table in reversed(TABLES):
+        op.drop_index(f"ix_{table}_geohash", table_name=table)
+        op.drop_column(table, "geohash")
+        op.drop_column(table, "lon")
+        op.drop_column(table, "lat")
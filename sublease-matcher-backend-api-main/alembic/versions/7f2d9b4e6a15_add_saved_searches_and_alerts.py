@@ -0,0 +1,72 @@
+"""add saved_searches and search_alerts
+
+Revision ID: 7f2d9b4e6a15
+Revises: 3c8a5e1f7d46
+Create Date: 2026-10-20 02:27:13.640915
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7f2d9b4e6a15'
+down_revision: Union[str, Sequence[str], None] = '3c8a5e1f7d46'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "saved_searches",
+        sa.Column("id", sa.String(length=64), nullable=False),
+        sa.Column("seeker_id", sa.String(length=64), nullable=False),
+        sa.Column("city", sa.Text(), nullable=False),
+        sa.Column("city_key", sa.Text(), nullable=False),
+        sa.Column("max_price", sa.Numeric(10, 2), nullable=True),
+        sa.Column("move_in", sa.Date(), nullable=True),
+        sa.Column("move_out", sa.Date(), nullable=True),
+        sa.Column("interests_csv", sa.Text(), server_default="", nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.ForeignKeyConstraint(["seeker_id"], ["seeker_profiles.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_saved_searches_lookup", "saved_searches", ["city_key", "max_price"])
+    op.create_index("ix_saved_searches_seeker", "saved_searches", ["seeker_id"])
+    op.create_table(
+        "search_alerts",
+        sa.Column("id", sa.String(length=64), nullable=False),
+        sa.Column("seeker_id", sa.String(length=64), nullable=False),
+        sa.Column("search_id", sa.String(length=64), nullable=False),
+        sa.Column("listing_id", sa.String(length=64), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column("read_at", sa.DateTime(timezone=True), nullable=True),
+        sa.ForeignKeyConstraint(["seeker_id"], ["seeker_profiles.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["search_id"], ["saved_searches.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["listing_id"], ["listings.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("search_id", "listing_id", name="uq_search_alerts_search_listing"),
+    )
+    op.create_index("ix_search_alerts_inbox", "search_alerts", ["seeker_id", "created_at"])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_search_alerts_inbox", table_name="search_alerts")
+    op.drop_table("search_alerts")
+    op.drop_index("ix_saved_searches_seeker", table_name="saved_searches")
+    op.drop_index("ix_saved_searches_lookup", table_name="saved_searches")
+    op.drop_table("saved_searches")
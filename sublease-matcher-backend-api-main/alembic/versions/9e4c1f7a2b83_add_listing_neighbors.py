@@ -0,0 +1,37 @@
+"""add listing_neighbors for item-item recommendations
+
+Revision ID: 9e4c1f7a2b83
+Revises: 5b1d7e3a9c24
+Create Date: 2026-10-19 23:41:12.508316
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9e4c1f7a2b83'
+down_revision: Union[str, Sequence[str], None] = '5b1d7e3a9c24'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Filled by scripts/db/listing_neighbors.py; empty until its first run.
+    op.create_table(
+        "listing_neighbors",
+        sa.Column("listing_id", sa.String(length=64), nullable=False),
+        sa.Column("neighbor_id", sa.String(length=64), nullable=False),
+        sa.Column("similarity", sa.Float(), nullable=False),
+        sa.ForeignKeyConstraint(["listing_id"], ["listings.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["neighbor_id"], ["listings.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("listing_id", "neighbor_id"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("listing_neighbors")
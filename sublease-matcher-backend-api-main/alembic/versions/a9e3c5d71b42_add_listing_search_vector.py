@@ -0,0 +1,52 @@
+"""add listings.search_vector for full-text search
+
+Revision ID: a9e3c5d71b42
+Revises: f2b9d04c6e13
+Create Date: 2026-10-19 17:05:51.318204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a9e3c5d71b42'
+down_revision: Union[str, Sequence[str], None] = 'f2b9d04c6e13'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# The listing document as of this revision (adapters/sqlalchemy/search.py keeps the
+# live one); copied so the backfill does not change when the app does.
+SEARCH_DOCUMENT_SQL = """
+    setweight(to_tsvector('english', coalesce(listings.title, '')), 'A')
+    || setweight(to_tsvector('english', coalesce(host_profiles.bio, '')), 'B')
+    || setweight(to_tsvector('english', coalesce((
+        SELECT string_agg(concat_ws(' ', r.bio, r.major), ' ')
+        FROM listing_roommates AS r
+        WHERE r.listing_id = listings.id
+    ), '')), 'C')
+"""
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column("listings", sa.Column("search_vector", postgresql.TSVECTOR(), nullable=True))
+    op.execute(
+        f"UPDATE listings SET search_vector = {SEARCH_DOCUMENT_SQL} "
+        "FROM host_profiles WHERE host_profiles.id = listings.host_id"
+    )
+    op.create_index(
+        "ix_listings_search_vector",
+        "listings",
+        ["search_vector"],
+        postgresql_using="gin",
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_listings_search_vector", table_name="listings")
+    op.drop_column("listings", "search_vector")
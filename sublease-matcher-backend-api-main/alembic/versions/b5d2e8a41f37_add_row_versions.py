@@ -0,0 +1,35 @@
+"""add row versions for conditional GETs
+
+Revision ID: b5d2e8a41f37
+Revises: 7c1f4b2d9e10
+Create Date: 2026-10-19 10:02:11.530914
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b5d2e8a41f37'
+down_revision: Union[str, Sequence[str], None] = '7c1f4b2d9e10'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_TABLES = ("listings", "seeker_profiles", "matches")
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for table in _TABLES:
+        op.add_column(
+            table,
+            sa.Column("version", sa.Integer(), server_default=sa.text("1"), nullable=False),
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table in reversed(_TABLES):
+        op.drop_column(table, "version")
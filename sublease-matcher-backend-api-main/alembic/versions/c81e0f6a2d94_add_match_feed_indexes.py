@@ -0,0 +1,38 @@
+"""add match feed indexes
+
+Revision ID: c81e0f6a2d94
+Revises: b5d2e8a41f37
+Create Date: 2026-10-19 11:20:47.204561
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c81e0f6a2d94'
+down_revision: Union[str, Sequence[str], None] = 'b5d2e8a41f37'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        "ix_matches_seeker_feed",
+        "matches",
+        ["seeker_id", sa.text("score DESC NULLS LAST"), "id"],
+    )
+    op.create_index(
+        "ix_matches_listing_feed",
+        "matches",
+        ["listing_id", sa.text("score DESC NULLS LAST"), "id"],
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_matches_listing_feed", table_name="matches")
+    op.drop_index("ix_matches_seeker_feed", table_name="matches")
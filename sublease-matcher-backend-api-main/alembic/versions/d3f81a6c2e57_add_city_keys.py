@@ -0,0 +1,72 @@
+"""add normalized city_key to listings and seeker_profiles
+
+Revision ID: d3f81a6c2e57
+Revises: a9e3c5d71b42
+Create Date: 2026-10-19 18:12:36.902144
+
+"""
+import re
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd3f81a6c2e57'
+down_revision: Union[str, Sequence[str], None] = 'a9e3c5d71b42'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TABLES = ("listings", "seeker_profiles")
+
+# ``normalize_city_key`` as of this revision, so later edits to the app cannot
+# change what this migration writes.
+_CITY_WORD = re.compile(r"[^\W_]+(?:['-][^\W_]+)*")
+_TRAILING_STATE = re.compile(r",\s*[a-z]{2}\s*$")
+_CITY_PREFIXES = {"st": "saint", "ste": "sainte", "ft": "fort", "mt": "mount"}
+_CITY_ALIASES = {
+    "eauclaire": "eau claire",
+    "lacrosse": "la crosse",
+    "mpls": "minneapolis",
+    "msp": "minneapolis",
+    "madtown": "madison",
+    "stevens pt": "stevens point",
+}
+
+
+def _city_key(value: str | None) -> str | None:
+    if not value:
+        return None
+    text = _TRAILING_STATE.sub("", value.lower().replace(".", " "))
+    words = _CITY_WORD.findall(text)
+    if words and words[0] in _CITY_PREFIXES:
+        words[0] = _CITY_PREFIXES[words[0]]
+    key = " ".join(words)
+    return _CITY_ALIASES.get(key, key) or None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    conn = op.get_bind()
+    for table in TABLES:
+        op.add_column(table, sa.Column("city_key", sa.Text(), nullable=True))
+        # The key is computed in Python (aliases, prefixes), so backfill from here.
+        rows = conn.execute(
+            sa.text(f"SELECT id, city FROM {table} WHERE city IS NOT NULL")
+        ).all()
+        updates = [
+            {"id": row.id, "city_key": _city_key(row.city)} for row in rows
+        ]
+        if updates:
+            conn.execute(
+                sa.text(f"UPDATE {table} SET city_key = :city_key WHERE id = :id"), updates
+            )
+        op.create_index(f"ix_{table}_city_key", table, ["city_key"])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table in reversed(TABLES):
+        op.drop_index(f"ix_{table}_city_key", table_name=table)
+        op.drop_column(table, "city_key")
@@ -0,0 +1,86 @@
+"""add partitioned swipe_events log
+
+Revision ID: e4a7c2915b08
+Revises: c81e0f6a2d94
+Create Date: 2026-10-19 14:05:12.730118
+
+"""
+from datetime import date
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e4a7c2915b08'
+down_revision: Union[str, Sequence[str], None] = 'c81e0f6a2d94'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+MONTHS_AHEAD = 3
+
+
+def _add_months(month: date, count: int) -> date:
+    index = month.year * 12 + month.month - 1 + count
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "swipe_events",
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column("id", sa.String(length=64), nullable=False),
+        sa.Column("actor_kind", sa.String(length=8), nullable=False),
+        sa.Column("actor_id", sa.String(length=64), nullable=False),
+        sa.Column("target_id", sa.String(length=64), nullable=False),
+        sa.Column("action", sa.String(length=8), nullable=False),
+        sa.CheckConstraint(
+            "actor_kind IN ('SEEKER', 'HOST')", name="ck_swipe_events_actor_kind"
+        ),
+        sa.CheckConstraint("action IN ('LIKE', 'PASS', 'UNDO')", name="ck_swipe_events_action"),
+        sa.PrimaryKeyConstraint("created_at", "id"),
+        postgresql_partition_by="RANGE (created_at)",
+    )
+    op.create_index("ix_swipe_events_actor", "swipe_events", ["actor_id", "created_at"])
+
+    # Monthly partitions from the oldest existing swipe through a few months ahead,
+    # so the backfill below lands in real partitions rather than the default one.
+    bind = op.get_bind()
+    oldest = bind.execute(
+        sa.text(
+            "SELECT min(created_at)::date FROM ("
+            " SELECT created_at FROM seeker_swipes UNION ALL SELECT created_at FROM host_swipes"
+            ") s"
+        )
+    ).scalar()
+    month = (oldest or date.today()).replace(day=1)
+    last = _add_months(date.today().replace(day=1), MONTHS_AHEAD)
+    while month < last:
+        op.execute(
+            f"CREATE TABLE swipe_events_{month:%Y_%m} PARTITION OF swipe_events "
+            f"FOR VALUES FROM ('{month.isoformat()}') TO ('{_add_months(month, 1).isoformat()}')"
+        )
+        month = _add_months(month, 1)
+    op.execute("CREATE TABLE swipe_events_default PARTITION OF swipe_events DEFAULT")
+
+    # Seed history with the current decisions; earlier overwritten decisions are gone.
+    op.execute(
+        "INSERT INTO swipe_events (created_at, id, actor_kind, actor_id, target_id, action) "
+        "SELECT created_at, id, 'SEEKER', seeker_id, listing_id, decision::text FROM seeker_swipes "
+        "UNION ALL "
+        "SELECT created_at, id, 'HOST', host_id, seeker_id, decision::text FROM host_swipes"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_swipe_events_actor", table_name="swipe_events")
+    # Dropping the parent drops every attached partition with it.
+    op.drop_table("swipe_events")
@@ -0,0 +1,89 @@
+"""add listings.seq and seeker_seen_sets
+
+Revision ID: f2b9d04c6e13
+Revises: e4a7c2915b08
+Create Date: 2026-10-19 15:32:08.441907
+
+"""
+import struct
+from collections.abc import Iterable
+from itertools import groupby
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f2b9d04c6e13'
+down_revision: Union[str, Sequence[str], None] = 'e4a7c2915b08'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _encode_seen_set(seqs: Iterable[int]) -> bytes:
+    """``SeenSet(seqs).to_bytes()`` as of this revision, so later edits to the app
+    cannot change what this migration writes.
+
+    Header ``<3sI`` (b"SS1", container count), then per 16-bit high key in order a
+    ``<HBI`` (high, kind, size) record followed by the sorted low halves as ``<H``
+    (kind 0, at most 4096 of them) or an 8 KiB bitmap (kind 1).
+    """
+    containers: dict[int, set[int]] = {}
+    for seq in seqs:
+        containers.setdefault(seq >> 16, set()).add(seq & 0xFFFF)
+    parts = [struct.pack("<3sI", b"SS1", len(containers))]
+    for high in sorted(containers):
+        lows = sorted(containers[high])
+        if len(lows) > 4096:
+            bitmap = bytearray(8192)
+            for low in lows:
+                bitmap[low >> 3] |= 1 << (low & 7)
+            parts.append(struct.pack("<HBI", high, 1, len(bitmap)) + bytes(bitmap))
+        else:
+            parts.append(struct.pack(f"<HBI{len(lows)}H", high, 0, len(lows), *lows))
+    return b"".join(parts)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Adding an identity column numbers the existing rows.
+    op.add_column(
+        "listings",
+        sa.Column("seq", sa.BigInteger(), sa.Identity(), nullable=False),
+    )
+    op.create_unique_constraint("listings_seq_key", "listings", ["seq"])
+    op.create_table(
+        "seeker_seen_sets",
+        sa.Column("seeker_id", sa.String(length=64), nullable=False),
+        sa.Column("bitmap", sa.LargeBinary(), nullable=False),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.ForeignKeyConstraint(["seeker_id"], ["seeker_profiles.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("seeker_id"),
+    )
+
+    bind = op.get_bind()
+    rows = bind.execute(
+        sa.text(
+            "SELECT s.seeker_id, l.seq FROM seeker_swipes s "
+            "JOIN listings l ON l.id = s.listing_id ORDER BY s.seeker_id"
+        )
+    )
+    seen_sets = sa.table(
+        "seeker_seen_sets", sa.column("seeker_id", sa.String), sa.column("bitmap", sa.LargeBinary)
+    )
+    for seeker_id, group in groupby(rows, key=lambda row: row[0]):
+        bitmap = _encode_seen_set(seq for _, seq in group)
+        bind.execute(seen_sets.insert().values(seeker_id=seeker_id, bitmap=bitmap))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("seeker_seen_sets")
+    op.drop_constraint("listings_seq_key", "listings", type_="unique")
+    op.drop_column("listings", "seq")
@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""[export-swipe-log] Write seekers' swipe history as a replay log for core's replay_eval."""
+# ruff: noqa: E402
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+from collections import defaultdict
+from datetime import datetime
+from getpass import getuser
+from pathlib import Path
+
+import sqlalchemy as sa
+
+DEFAULT_DB_NAME = "sublease_dev_sql"
+DEFAULT_PYTHONPATH = "src:../sublease-matcher-backend-core/src"
+
+
+def _default_database_url() -> str:
+    user = os.environ.get("USER") or getuser()
+    return f"postgresql+psycopg://{user}@localhost:5432/{DEFAULT_DB_NAME}"
+
+
+def _ensure_database_url() -> str:
+    database_url = os.environ.get("SM_DATABASE_URL")
+    if not database_url:
+        database_url = _default_database_url()
+        os.environ["SM_DATABASE_URL"] = database_url
+    return database_url
+
+
+def _ensure_pythonpath() -> None:
+    pythonpath = os.environ.get("PYTHONPATH")
+    if pythonpath:
+        return
+    os.environ["PYTHONPATH"] = DEFAULT_PYTHONPATH
+    for path in DEFAULT_PYTHONPATH.split(":"):
+        if path and path not in sys.path:
+            sys.path.insert(0, path)
+
+
+_ensure_pythonpath()
+_ensure_database_url()
+
+from sublease_matcher.core.replay import (
+    listing_record,
+    seeker_record,
+    swipe_record,
+    write_log,
+)
+
+from sublease_matcher.api.adapters.sqlalchemy import models
+from sublease_matcher.api.adapters.sqlalchemy.db import SessionLocal
+from sublease_matcher.api.adapters.sqlalchemy.uow import SqlAlchemyUnitOfWork
+
+DEFAULT_OUT = "models/swipes.jsonl"
+CHUNK_SIZE = 1000
+
+Swipe = tuple[datetime, str, str, str]
+
+
+def _swipes(uow: SqlAlchemyUnitOfWork, since: datetime | None) -> list[Swipe]:
+    """Seeker LIKE/PASS events in time order, minus the ones a later UNDO took back."""
+    events = models.SwipeEvent
+    query = (
+        sa.select(events.created_at, events.actor_id, events.target_id, events.action)
+        .where(events.actor_kind == "SEEKER")
+        .order_by(events.created_at, events.id)
+        .execution_options(yield_per=CHUNK_SIZE)
+    )
+    if since is not None:
+        query = query.where(events.created_at >= since)
+
+    swipes: list[Swipe | None] = []
+    # Positions of the decisions still standing, per (seeker, listing).
+    standing: defaultdict[tuple[str, str], list[int]] = defaultdict(list)
+    for created_at, seeker_id, listing_id, action in uow.session.execute(query):
+        stack = standing[(seeker_id, listing_id)]
+        if action == "UNDO":
+            if stack:
+                swipes[stack.pop()] = None
+            continue
+        stack.append(len(swipes))
+        swipes.append((created_at, seeker_id, listing_id, action))
+    return [swipe for swipe in swipes if swipe is not None]
+
+
+def _chunks(ids: list[str]) -> list[list[str]]:
+    return [ids[start : start + CHUNK_SIZE] for start in range(0, len(ids), CHUNK_SIZE)]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--out", type=Path, default=Path(DEFAULT_OUT), help="JSON-lines file to write"
+    )
+    parser.add_argument(
+        "--since",
+        type=datetime.fromisoformat,
+        default=None,
+        help="only export swipes at or after this ISO timestamp",
+    )
+    args = parser.parse_args()
+
+    with SqlAlchemyUnitOfWork(SessionLocal) as uow:
+        swipes = _swipes(uow, args.since)
+        seeker_ids = sorted({seeker_id for _, seeker_id, _, _ in swipes})
+        listing_ids = sorted({listing_id for _, _, listing_id, _ in swipes})
+        args.out.parent.mkdir(parents=True, exist_ok=True)
+        with args.out.open("w") as out:
+            # Replay needs both availability dates; swipes of other seekers go unscored.
+            seekers = sum(
+                write_log(
+                    out,
+                    (
+                        seeker_record(seeker)
+                        for seeker in uow.seekers.get_many(chunk).values()
+                        if seeker.get("available_from") and seeker.get("available_to")
+                    ),
+                )
+                for chunk in _chunks(seeker_ids)
+            )
+            listings = sum(
+                write_log(out, map(listing_record, uow.listings.get_many(chunk).values()))
+                for chunk in _chunks(listing_ids)
+            )
+            write_log(out, (swipe_record(*swipe) for swipe in swipes))
+    print(
+        f"[export-swipe-log] {len(swipes)} swipes, {seekers} seekers, "
+        f"{listings} listings -> {args.out}"
+    )
+
+
+if __name__ == "__main__":
+    main()
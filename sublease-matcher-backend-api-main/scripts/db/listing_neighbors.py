@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""[listing-neighbors] Rebuild item-item listing neighbours from seeker likes."""
+# ruff: noqa: E402
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+from getpass import getuser
+
+DEFAULT_DB_NAME = "sublease_dev_sql"
+DEFAULT_PYTHONPATH = "src:../sublease-matcher-backend-core/src"
+
+
+def _default_database_url() -> str:
+    user = os.environ.get("USER") or getuser()
+    return f"postgresql+psycopg://{user}@localhost:5432/{DEFAULT_DB_NAME}"
+
+
+def _ensure_database_url() -> str:
+    database_url = os.environ.get("SM_DATABASE_URL")
+    if not database_url:
+        database_url = _default_database_url()
+        os.environ["SM_DATABASE_URL"] = database_url
+    return database_url
+
+
+def _ensure_pythonpath() -> None:
+    pythonpath = os.environ.get("PYTHONPATH")
+    if pythonpath:
+        return
+    os.environ["PYTHONPATH"] = DEFAULT_PYTHONPATH
+    for path in DEFAULT_PYTHONPATH.split(":"):
+        if path and path not in sys.path:
+            sys.path.insert(0, path)
+
+
+_ensure_pythonpath()
+_ensure_database_url()
+
+from sublease_matcher.core.services.neighbors import (
+    DEFAULT_K,
+    DEFAULT_MAX_BASKET,
+    DEFAULT_MIN_CO_LIKES,
+)
+
+from sublease_matcher.api.adapters.sqlalchemy.db import engine
+from sublease_matcher.api.adapters.sqlalchemy.listing_neighbors import rebuild_neighbors
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--k", type=int, default=DEFAULT_K, help="neighbours kept per listing")
+    parser.add_argument(
+        "--shards",
+        type=int,
+        default=1,
+        help="passes over the likes; memory for co-like counts shrinks roughly by this factor",
+    )
+    parser.add_argument(
+        "--max-basket",
+        type=int,
+        default=DEFAULT_MAX_BASKET,
+        help="most recent likes counted per seeker",
+    )
+    parser.add_argument(
+        "--min-co-likes",
+        type=int,
+        default=DEFAULT_MIN_CO_LIKES,
+        help="seekers who must like both listings before they are neighbours",
+    )
+    args = parser.parse_args()
+
+    with engine.begin() as conn:
+        stored = rebuild_neighbors(
+            conn,
+            k=args.k,
+            shards=args.shards,
+            max_basket=args.max_basket,
+            min_co_likes=args.min_co_likes,
+        )
+    print(f"[listing-neighbors] stored {stored} neighbour pairs (k={args.k})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""[swipe-partitions] Create upcoming monthly swipe_events partitions and detach old ones."""
+# ruff: noqa: E402
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+from datetime import date
+from getpass import getuser
+
+DEFAULT_DB_NAME = "sublease_dev_sql"
+DEFAULT_PYTHONPATH = "src:../sublease-matcher-backend-core/src"
+
+
+def _default_database_url() -> str:
+    user = os.environ.get("USER") or getuser()
+    return f"postgresql+psycopg://{user}@localhost:5432/{DEFAULT_DB_NAME}"
+
+
+def _ensure_database_url() -> str:
+    database_url = os.environ.get("SM_DATABASE_URL")
+    if not database_url:
+        database_url = _default_database_url()
+        os.environ["SM_DATABASE_URL"] = database_url
+    return database_url
+
+
+def _ensure_pythonpath() -> None:
+    pythonpath = os.environ.get("PYTHONPATH")
+    if pythonpath:
+        return
+    os.environ["PYTHONPATH"] = DEFAULT_PYTHONPATH
+    for path in DEFAULT_PYTHONPATH.split(":"):
+        if path and path not in sys.path:
+            sys.path.insert(0, path)
+
+
+_ensure_pythonpath()
+_ensure_database_url()
+
+from sublease_matcher.api.adapters.sqlalchemy.db import engine
+from sublease_matcher.api.adapters.sqlalchemy.swipe_log import (
+    add_months,
+    detach_partitions_before,
+    ensure_partitions,
+    month_start,
+)
+
+
+def _parse_month(value: str) -> date:
+    return date.fromisoformat(f"{value}-01")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--ahead", type=int, default=3, help="months to pre-create, starting with the current one"
+    )
+    parser.add_argument(
+        "--detach-before",
+        type=_parse_month,
+        metavar="YYYY-MM",
+        help="detach every monthly partition that ends on or before this month",
+    )
+    args = parser.parse_args()
+
+    this_month = month_start(date.today())
+    with engine.begin() as conn:
+        created = ensure_partitions(conn, start=this_month, months=args.ahead)
+        print(
+            f"[swipe-partitions] {len(created)} created through "
+            f"{add_months(this_month, args.ahead - 1):%Y-%m}: {', '.join(created) or '-'}"
+        )
+        if args.detach_before is not None:
+            detached = detach_partitions_before(conn, args.detach_before)
+            print(f"[swipe-partitions] detached: {', '.join(detached) or '-'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""[train-ranker] Fit the recommendation ranking model to seekers' LIKE/PASS swipes."""
+# ruff: noqa: E402
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+from collections.abc import Iterator
+from getpass import getuser
+from pathlib import Path
+
+import sqlalchemy as sa
+
+DEFAULT_DB_NAME = "sublease_dev_sql"
+DEFAULT_PYTHONPATH = "src:../sublease-matcher-backend-core/src"
+
+
+def _default_database_url() -> str:
+    user = os.environ.get("USER") or getuser()
+    return f"postgresql+psycopg://{user}@localhost:5432/{DEFAULT_DB_NAME}"
+
+
+def _ensure_database_url() -> str:
+    database_url = os.environ.get("SM_DATABASE_URL")
+    if not database_url:
+        database_url = _default_database_url()
+        os.environ["SM_DATABASE_URL"] = database_url
+    return database_url
+
+
+def _ensure_pythonpath() -> None:
+    pythonpath = os.environ.get("PYTHONPATH")
+    if pythonpath:
+        return
+    os.environ["PYTHONPATH"] = DEFAULT_PYTHONPATH
+    for path in DEFAULT_PYTHONPATH.split(":"):
+        if path and path not in sys.path:
+            sys.path.insert(0, path)
+
+
+_ensure_pythonpath()
+_ensure_database_url()
+
+from sublease_matcher.core.ranking import PairFeatures, pair_features, save_model, train
+from sublease_matcher.core.ranking.train import DEFAULT_HOLDOUT, DEFAULT_L2
+from sublease_matcher.core.services.scoring import ListingScoring, SeekerScoring
+
+from sublease_matcher.api.adapters.sqlalchemy import models
+from sublease_matcher.api.adapters.sqlalchemy.db import SessionLocal
+from sublease_matcher.api.adapters.sqlalchemy.uow import SqlAlchemyUnitOfWork
+from sublease_matcher.api.services.scoring import listing_projection, seeker_projection
+
+DEFAULT_OUT = "models/ranker.json"
+CHUNK_SIZE = 1000
+
+
+def _samples(uow: SqlAlchemyUnitOfWork) -> Iterator[tuple[PairFeatures, bool]]:
+    """Features and outcome of every current seeker decision, oldest first."""
+    seekers: dict[str, SeekerScoring | None] = {}
+    listings: dict[str, ListingScoring | None] = {}
+    rows = uow.session.execute(
+        sa.select(
+            models.SeekerSwipe.seeker_id,
+            models.SeekerSwipe.listing_id,
+            models.SeekerSwipe.decision,
+        )
+        .order_by(models.SeekerSwipe.created_at, models.SeekerSwipe.id)
+        .execution_options(yield_per=CHUNK_SIZE)
+    )
+    for chunk in rows.partitions():
+        # Projections are small, so each profile is loaded once for the whole run.
+        new_seekers = list({seeker_id for seeker_id, _, _ in chunk} - seekers.keys())
+        loaded_seekers = uow.seekers.get_many(new_seekers)
+        for seeker_id in new_seekers:
+            seeker = loaded_seekers.get(seeker_id)
+            seekers[seeker_id] = seeker_projection(seeker) if seeker else None
+        new_listings = list({listing_id for _, listing_id, _ in chunk} - listings.keys())
+        loaded_listings = uow.listings.get_many(new_listings)
+        for listing_id in new_listings:
+            listing = loaded_listings.get(listing_id)
+            listings[listing_id] = listing_projection(listing) if listing else None
+
+        for seeker_id, listing_id, decision in chunk:
+            seeker_scoring, listing_scoring = seekers[seeker_id], listings[listing_id]
+            if seeker_scoring is not None and listing_scoring is not None:
+                yield pair_features(seeker_scoring, listing_scoring), decision == "LIKE"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--out",
+        type=Path,
+        default=Path(DEFAULT_OUT),
+        help="file the API loads (SM_RANKING_MODEL_PATH); a versioned copy is kept beside it",
+    )
+    parser.add_argument("--l2", type=float, default=DEFAULT_L2, help="L2 regularisation")
+    parser.add_argument(
+        "--holdout",
+        type=float,
+        default=DEFAULT_HOLDOUT,
+        help="share of the latest swipes scored for the reported metrics",
+    )
+    args = parser.parse_args()
+
+    with SqlAlchemyUnitOfWork(SessionLocal) as uow:
+        model = train(_samples(uow), l2=args.l2, holdout=args.holdout)
+    versioned = args.out.with_name(f"{args.out.stem}-{model.version}{args.out.suffix}")
+    save_model(model, versioned)
+    save_model(model, args.out)
+    metrics = ", ".join(f"{name}={value:.4g}" for name, value in model.metrics.items())
+    print(f"[train-ranker] model {model.version} -> {args.out} ({metrics})")
+
+
+if __name__ == "__main__":
+    main()
@@ -5,6 +5,7 @@ from .memory_repos import (
     InMemoryHostRepo,
     InMemoryListingRepo,
     InMemoryMatchRepo,
+    InMemoryOutboxRepo,
     InMemorySeekerRepo,
     InMemorySwipeRepo,
 )
@@ -15,6 +16,7 @@ __all__ = [
     "InMemoryHostRepo",
     "InMemoryListingRepo",
     "InMemoryMatchRepo",
+    "InMemoryOutboxRepo",
     "InMemorySeekerRepo",
     "InMemorySwipeRepo",
     "InMemoryUnitOfWork",
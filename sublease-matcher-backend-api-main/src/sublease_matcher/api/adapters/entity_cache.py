@@ -0,0 +1,286 @@
+"""Process-wide read-through cache for listing and seeker lookups.
+
+Entries are keyed by ``(kind, field, value)`` and bounded by an LRU size and a
+TTL. Every hit is checked against the row's ``version`` column (bumped on each
+write) with an index-only lookup, so a write made by any worker is seen on the
+next read instead of after the TTL; the cache saves the full load with its
+photos, roommates and host, not the round trip. Hosts carry no version and are
+a single primary-key read, so they are not cached.
+
+Within a worker, writes go through the wrapped repo and are tracked per unit
+of work: the writing UoW bypasses the cache for keys it dirtied (so it reads
+its own uncommitted rows), and the keys are invalidated again once it commits
+or rolls back. Fills carry the epoch they started at, so a reader that loaded
+a row before a concurrent invalidation cannot repopulate the stale copy.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Iterable
+from dataclasses import asdict, dataclass
+from functools import lru_cache
+from typing import Any, TypeVar, cast
+
+from ..config import get_settings
+from ..interfaces.types import HostDict, ListingDict, SeekerDict
+
+CacheKey = tuple[str, str, str]
+T = TypeVar("T")
+
+
+def _copy(value: Any) -> Any:
+    # Repo dicts only nest lists/dicts of scalars; cheaper than copy.deepcopy.
+    if isinstance(value, dict):
+        return {key: _copy(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_copy(item) for item in value]
+    return value
+
+
+@dataclass(slots=True)
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    expirations: int = 0
+    invalidations: int = 0
+    rejected_fills: int = 0
+    # Hits whose version no longer matched the row's.
+    stale: int = 0
+
+
+class EntityCache:
+    def __init__(
+        self,
+        *,
+        max_entries: int,
+        ttl_seconds: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._max_entries = max_entries
+        self._ttl = ttl_seconds
+        self._clock = clock
+        self._entries: OrderedDict[CacheKey, tuple[float, dict[str, Any]]] = OrderedDict()
+        self._tombstones: OrderedDict[CacheKey, int] = OrderedDict()
+        self._tombstone_floor = 0
+        self._epoch = 0
+        self._lock = threading.Lock()
+        self.stats = CacheStats()
+
+    def get(self, key: CacheKey) -> dict[str, Any] | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.stats.misses += 1
+                return None
+            expires_at, value = entry
+            if expires_at <= self._clock():
+                del self._entries[key]
+                self.stats.expirations += 1
+                self.stats.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.stats.hits += 1
+        return cast(dict[str, Any], _copy(value))
+
+    def fill_token(self) -> int:
+        with self._lock:
+            return self._epoch
+
+    def put(self, keys: Iterable[CacheKey], value: dict[str, Any], token: int) -> None:
+        """Store ``value`` under every alias key unless one was invalidated after ``token``."""
+        keys = list(keys)
+        stored = _copy(value)
+        with self._lock:
+            if token < self._tombstone_floor or any(
+                self._tombstones.get(key, -1) >= token for key in keys
+            ):
+                self.stats.rejected_fills += 1
+                return
+            expires_at = self._clock() + self._ttl
+            for key in keys:
+                self._entries[key] = (expires_at, stored)
+                self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+                self.stats.evictions += 1
+
+    def invalidate(self, keys: Iterable[CacheKey]) -> None:
+        with self._lock:
+            # Fills that took their token at or before this stamp may hold the old row.
+            stamp = self._epoch
+            self._epoch += 1
+            for key in keys:
+                if self._entries.pop(key, None) is not None:
+                    self.stats.invalidations += 1
+                self._tombstones[key] = stamp
+                self._tombstones.move_to_end(key)
+            while len(self._tombstones) > self._max_entries:
+                _, epoch = self._tombstones.popitem(last=False)
+                self._tombstone_floor = max(self._tombstone_floor, epoch + 1)
+
+    def reject_stale(self, keys: Iterable[CacheKey]) -> None:
+        """Drop a hit whose row has moved on; another worker wrote it."""
+        with self._lock:
+            self.stats.hits -= 1
+            self.stats.misses += 1
+            self.stats.stale += 1
+        self.invalidate(keys)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._epoch += 1
+            self._tombstone_floor = self._epoch
+
+    def snapshot(self) -> dict[str, int]:
+        with self._lock:
+            return {**asdict(self.stats), "size": len(self._entries)}
+
+
+@lru_cache(maxsize=1)
+def get_entity_cache() -> EntityCache:
+    settings = get_settings()
+    return EntityCache(
+        max_entries=settings.entity_cache_max_entries,
+        ttl_seconds=settings.entity_cache_ttl_seconds,
+    )
+
+
+class CacheScope:
+    """Per-unit-of-work view of the shared cache that remembers which keys it dirtied."""
+
+    def __init__(self, cache: EntityCache) -> None:
+        self.cache = cache
+        self._dirty: set[CacheKey] = set()
+
+    def read(
+        self,
+        key: CacheKey,
+        load: Callable[[], T | None],
+        aliases: Callable[[T], Iterable[CacheKey]],
+        *,
+        version: Callable[[], object],
+        version_of: Callable[[T], object],
+    ) -> T | None:
+        """``version()`` reads the row's current version; a hit must carry the same."""
+        if key in self._dirty:
+            return load()
+        cached = cast(T | None, self.cache.get(key))
+        if cached is not None:
+            if version_of(cached) == version():
+                return cached
+            self.cache.reject_stale(aliases(cached))
+        token = self.cache.fill_token()
+        value = load()
+        if value is not None:
+            keys = list(aliases(value))
+            if not self._dirty.intersection(keys):
+                self.cache.put(keys, value, token)  # type: ignore[arg-type]
+        return value
+
+    def wrote(self, keys: Iterable[CacheKey]) -> None:
+        keys = list(keys)
+        self._dirty.update(keys)
+        self.cache.invalidate(keys)
+
+    def finish(self) -> None:
+        """Called after commit/rollback: drop anything filled while our writes were in flight."""
+        if self._dirty:
+            self.cache.invalidate(self._dirty)
+            self._dirty = set()
+
+
+def seeker_keys(seeker: SeekerDict) -> list[CacheKey]:
+    keys: list[CacheKey] = [("seeker", "id", seeker["id"])]
+    if seeker.get("user_id"):
+        keys.append(("seeker", "user", seeker["user_id"]))
+    return keys
+
+
+def _version(row: Any) -> int:
+    # Rows written before versioning read as 1, as in the repos.
+    return int(row.get("version", 1))
+
+
+def _id_and_version(row: Any) -> tuple[str, int]:
+    return row["id"], _version(row)
+
+
+def host_keys(host: HostDict) -> list[CacheKey]:
+    keys: list[CacheKey] = [("host", "id", host["id"])]
+    if host.get("user_id"):
+        keys.append(("host", "user", host["user_id"]))
+    return keys
+
+
+def listing_keys(listing: ListingDict) -> list[CacheKey]:
+    keys: list[CacheKey] = [("listing", "id", listing["id"])]
+    if listing.get("host_id"):
+        keys.append(("listing", "host", listing["host_id"]))
+    return keys
+
+
+class _CachedRepo:
+    # Deliberately not a Protocol subclass: the protocol stubs would shadow __getattr__
+    # forwarding for the uncached methods (queues, search, version lookups).
+
+    def __init__(self, inner: Any, scope: CacheScope) -> None:
+        self._inner = inner
+        self._scope = scope
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._inner, name)
+
+
+class CachedSeekerRepo(_CachedRepo):
+    def get(self, seeker_id: str) -> SeekerDict | None:
+        return self._scope.read(
+            ("seeker", "id", seeker_id),
+            lambda: self._inner.get(seeker_id),
+            seeker_keys,
+            version=lambda: self._inner.get_version(seeker_id),
+            version_of=_version,
+        )
+
+    def get_by_user(self, user_id: str) -> SeekerDict | None:
+        return self._scope.read(
+            ("seeker", "user", user_id),
+            lambda: self._inner.get_by_user(user_id),
+            seeker_keys,
+            version=lambda: self._inner.get_version_by_user(user_id),
+            version_of=_id_and_version,
+        )
+
+    def upsert(self, seeker: SeekerDict) -> SeekerDict:
+        saved: SeekerDict = self._inner.upsert(seeker)
+        self._scope.wrote(seeker_keys(saved))
+        return saved
+
+
+class CachedListingRepo(_CachedRepo):
+    def get(self, listing_id: str) -> ListingDict | None:
+        return self._scope.read(
+            ("listing", "id", listing_id),
+            lambda: self._inner.get(listing_id),
+            listing_keys,
+            version=lambda: self._inner.get_version(listing_id),
+            version_of=_version,
+        )
+
+    def get_by_host(self, host_id: str) -> ListingDict | None:
+        return self._scope.read(
+            ("listing", "host", host_id),
+            lambda: self._inner.get_by_host(host_id),
+            listing_keys,
+            version=lambda: self._inner.get_version_by_host(host_id),
+            version_of=_id_and_version,
+        )
+
+    def upsert(self, listing: ListingDict) -> ListingDict:
+        saved: ListingDict = self._inner.upsert(listing)
+        self._scope.wrote(listing_keys(saved))
+        return saved
@@ -0,0 +1,125 @@
+"""Per-unit-of-work identity map for seeker, host and listing lookups.
+
+Within one UoW every ``get``/``get_by_user``/``get_by_host`` for the same key
+returns the same dict without another query, misses are remembered too, and an
+``upsert`` replaces the entry under all of its alias keys so later lookups see
+the write. The map is cleared on commit and rollback.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable
+from typing import Any, TypeVar
+
+from ..interfaces.types import HostDict, ListingDict, SeekerDict
+from .entity_cache import CacheKey, host_keys, listing_keys, seeker_keys
+
+T = TypeVar("T")
+
+
+class IdentityMap:
+    def __init__(self) -> None:
+        self._entries: dict[CacheKey, Any] = {}
+        self.hits = 0
+
+    def lookup(
+        self,
+        key: CacheKey,
+        load: Callable[[], T | None],
+        aliases: Callable[[T], Iterable[CacheKey]],
+    ) -> T | None:
+        if key in self._entries:
+            self.hits += 1
+            return self._entries[key]  # type: ignore[no-any-return]
+        value = load()
+        if value is None:
+            self._entries[key] = None
+        else:
+            for alias in aliases(value):
+                self._entries.setdefault(alias, value)
+        return value
+
+    def remember(self, keys: Iterable[CacheKey], value: Any) -> None:
+        keys = list(keys)
+        previous = self._entries.get(keys[0])
+        if previous is not None:
+            self.forget(key for key, entry in self._entries.items() if entry is previous)
+        for key in keys:
+            self._entries[key] = value
+
+    def forget(self, keys: Iterable[CacheKey]) -> None:
+        for key in list(keys):
+            self._entries.pop(key, None)
+
+    def forget_where(self, kind: str, predicate: Callable[[Any], bool]) -> None:
+        self.forget(
+            key
+            for key, value in self._entries.items()
+            if key[0] == kind and (value is None or predicate(value))
+        )
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+class _MappedRepo:
+    # Not a Protocol subclass, so uncached methods and attributes such as ``_data``
+    # fall through to the wrapped repo.
+
+    def __init__(self, inner: Any, identity_map: IdentityMap) -> None:
+        self._inner = inner
+        self._map = identity_map
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._inner, name)
+
+
+class MappedSeekerRepo(_MappedRepo):
+    def get(self, seeker_id: str) -> SeekerDict | None:
+        return self._map.lookup(
+            ("seeker", "id", seeker_id), lambda: self._inner.get(seeker_id), seeker_keys
+        )
+
+    def get_by_user(self, user_id: str) -> SeekerDict | None:
+        return self._map.lookup(
+            ("seeker", "user", user_id), lambda: self._inner.get_by_user(user_id), seeker_keys
+        )
+
+    def upsert(self, seeker: SeekerDict) -> SeekerDict:
+        saved: SeekerDict = self._inner.upsert(seeker)
+        self._map.remember(seeker_keys(saved), saved)
+        return saved
+
+
+class MappedHostRepo(_MappedRepo):
+    def get(self, host_id: str) -> HostDict | None:
+        return self._map.lookup(("host", "id", host_id), lambda: self._inner.get(host_id), host_keys)
+
+    def get_by_user(self, user_id: str) -> HostDict | None:
+        return self._map.lookup(
+            ("host", "user", user_id), lambda: self._inner.get_by_user(user_id), host_keys
+        )
+
+    def upsert(self, host: HostDict) -> HostDict:
+        saved: HostDict = self._inner.upsert(host)
+        self._map.remember(host_keys(saved), saved)
+        # Listing dicts embed the host bio; reload them on next access.
+        self._map.forget_where("listing", lambda listing: listing.get("host_id") == saved["id"])
+        return saved
+
+
+class MappedListingRepo(_MappedRepo):
+    def get(self, listing_id: str) -> ListingDict | None:
+        return self._map.lookup(
+            ("listing", "id", listing_id), lambda: self._inner.get(listing_id), listing_keys
+        )
+
+    def get_by_host(self, host_id: str) -> ListingDict | None:
+        return self._map.lookup(
+            ("listing", "host", host_id), lambda: self._inner.get_by_host(host_id), listing_keys
+        )
+
+    def upsert(self, listing: ListingDict) -> ListingDict:
+        saved: ListingDict = self._inner.upsert(listing)
+        self._map.remember(listing_keys(saved), saved)
+        return saved
@@ -0,0 +1,62 @@
+"""Geohash cell index for the in-memory repos.
+
+Every row is filed under each prefix of its geohash, so a radius query is one
+dict lookup per covering cell (see ``Radius.cells``). Only the rows in those
+cells get an exact distance check, which mirrors the prefix range scan plus
+distance filter the SQL repos run.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from typing import Any
+
+from sublease_matcher.core.geo import GeoPoint, Radius, geohash, locate
+
+
+def set_location(row: Any, *, state: str | None = None) -> None:
+    """Resolve ``row["city"]`` (and ``state``, if known) to lat/lon and geohash."""
+    point = locate(row.get("city"), state)
+    row["lat"], row["lon"] = point if point is not None else (None, None)
+    row["geohash"] = geohash(point) if point is not None else None
+
+
+def point_of(row: Mapping[str, Any]) -> GeoPoint | None:
+    lat, lon = row.get("lat"), row.get("lon")
+    return GeoPoint(lat, lon) if lat is not None and lon is not None else None
+
+
+class GeohashIndex:
+    """geohash prefix -> ids of the rows whose geohash starts with it."""
+
+    def __init__(self) -> None:
+        self._cells: dict[str, set[str]] = {}
+        self._hashes: dict[str, str] = {}
+
+    def __len__(self) -> int:
+        return len(self._hashes)
+
+    def index(self, row_id: str, cell: str | None) -> None:
+        self.remove(row_id)
+        if not cell:
+            return
+        self._hashes[row_id] = cell
+        for end in range(1, len(cell) + 1):
+            self._cells.setdefault(cell[:end], set()).add(row_id)
+
+    def remove(self, row_id: str) -> None:
+        cell = self._hashes.pop(row_id, None)
+        if cell is None:
+            return
+        for end in range(1, len(cell) + 1):
+            ids = self._cells[cell[:end]]
+            ids.discard(row_id)
+            if not ids:
+                del self._cells[cell[:end]]
+
+    def candidates(self, radius: Radius) -> set[str]:
+        """Ids in the cells covering ``radius``; a superset of the rows inside it."""
+        found: set[str] = set()
+        for cell in radius.cells():
+            found |= self._cells.get(cell, set())
+        return found
@@ -1,24 +1,112 @@
 from __future__ import annotations
 
-from collections.abc import Sequence
-from datetime import datetime
+import hashlib
+import heapq
+import threading
+from collections.abc import Iterable, Sequence
+from datetime import datetime, timedelta
 from decimal import Decimal
-from typing import Literal
+from typing import Any, Literal
 from uuid import uuid4
 
+from sublease_matcher.core.domain import SeekerId, normalize_city_key
+from sublease_matcher.core.geo import Radius
+from sublease_matcher.core.services.interest import Interest, InterestIndex, Opening
+from sublease_matcher.core.services.scoring import to_cents
+
 from ..interfaces.repos import (
     HostRepo,
+    ListingNeighborRepo,
     ListingRepo,
     MatchRepo,
+    OutboxRepo,
+    SavedSearchRepo,
+    SearchAlertRepo,
     SeekerRepo,
+    SeenSetRepo,
     SwipeRepo,
 )
-from ..interfaces.types import HostDict, ListingDict, MatchDict, SeekerDict, SwipeDict
+from ..interfaces.types import (
+    HostDict,
+    ListingDict,
+    MatchDict,
+    MatchUpsertDict,
+    OutboxEventDict,
+    RecipientDict,
+    SavedSearchDict,
+    SearchAlertDict,
+    SeekerDict,
+    SwipeDict,
+)
+from ..seen_set import SeenSet
+from .memory_geo import GeohashIndex, point_of, set_location
+from .memory_search import InvertedIndex
+from .roommate_features import encode_roommates
+
+
+def _next_version(current: Any) -> int:
+    # Seeded rows carry no version and read as 1, so their first write must land on 2.
+    return current.get("version", 1) + 1 if current is not None else 1
+
+
+def _feed_key(match: Any) -> tuple[bool, float, str]:
+    # score DESC NULLS LAST, id ASC -- the order SqlAlchemyMatchRepo.feed_page uses.
+    score = match.get("score")
+    return (score is None, -(score or 0.0), match["id"])
+
+
+def _interest(seeker: SeekerDict) -> Interest | None:
+    if seeker.get("hidden") or not seeker.get("city_key"):
+        return None
+    return Interest(
+        seeker["city_key"] or "",
+        to_cents(seeker.get("budget_max")),
+        seeker.get("available_from"),
+    )
+
+
+def _search_interest(search: SavedSearchDict) -> Interest:
+    return Interest(
+        search["city_key"],
+        to_cents(search.get("max_price")),
+        search.get("move_in"),
+        search.get("move_out"),
+        frozenset(search.get("interests") or ()),
+    )
+
+
+def _opening(listing: ListingDict) -> Opening:
+    return Opening(
+        listing.get("city_key") or normalize_city_key(listing.get("city")),
+        to_cents(listing.get("price_per_month")),
+        listing.get("available_from"),
+        listing.get("available_to"),
+        frozenset(
+            interest.lower()
+            for roommate in listing.get("roommates") or ()
+            for interest in roommate.get("interests") or ()
+        ),
+    )
+
+
+def _digest(parts: Sequence[str]) -> str:
+    return hashlib.md5(",".join(parts).encode(), usedforsecurity=False).hexdigest()
 
 
 class InMemorySeekerRepo(SeekerRepo):
     def __init__(self, data: dict[str, SeekerDict] | None = None) -> None:
         self._data: dict[str, SeekerDict] = data or {}
+        self._cells = GeohashIndex()
+        self._interests = InterestIndex()
+        for seeker in self._data.values():
+            self._locate(seeker)
+
+    def _locate(self, seeker: SeekerDict) -> None:
+        # Seekers only give a city, so names shared across states stay unresolved.
+        seeker["city_key"] = normalize_city_key(seeker.get("city")) or None
+        set_location(seeker)
+        self._cells.index(seeker["id"], seeker.get("geohash"))
+        self._interests.put(SeekerId(seeker["id"]), _interest(seeker))
 
     def get(self, seeker_id: str) -> SeekerDict | None:
         return self._data.get(seeker_id)
@@ -32,19 +120,52 @@ class InMemorySeekerRepo(SeekerRepo):
     def upsert(self, seeker: SeekerDict) -> SeekerDict:
         seeker_id = seeker.get("id") or str(uuid4())
         seeker["id"] = seeker_id
+        seeker["version"] = _next_version(self._data.get(seeker_id))
+        self._locate(seeker)
         self._data[seeker_id] = seeker
         return seeker
 
-    def queue_for_host(self, host_id: str) -> Sequence[SeekerDict]:
+    def get_version(self, seeker_id: str) -> int | None:
+        seeker = self._data.get(seeker_id)
+        return seeker.get("version", 1) if seeker is not None else None
+
+    def get_version_by_user(self, user_id: str) -> tuple[str, int] | None:
+        for seeker in self._data.values():
+            if seeker.get("user_id") == user_id:
+                return seeker["id"], seeker.get("version", 1)
+        return None
+
+    def get_many(self, seeker_ids: Sequence[str]) -> dict[str, SeekerDict]:
+        return {sid: self._data[sid] for sid in seeker_ids if sid in self._data}
+
+    def queue_for_host(
+        self, host_id: str, *, within: Radius | None = None
+    ) -> Sequence[SeekerDict]:
+        if within is not None:
+            nearby = sorted(self._cells.candidates(within))
+            return [
+                seeker
+                for seeker in (self._data[seeker_id] for seeker_id in nearby)
+                if not seeker.get("hidden") and within.contains(point_of(seeker))
+            ]
         return [
             seeker for seeker in self._data.values()
             if not seeker.get("hidden")
         ]
 
+    def interested_in(self, listing: ListingDict) -> Sequence[SeekerDict]:
+        return [self._data[seeker_id] for seeker_id in self._interests.match(_opening(listing))]
+
 
 class InMemoryHostRepo(HostRepo):
-    def __init__(self, data: dict[str, HostDict] | None = None) -> None:
+    def __init__(
+        self,
+        data: dict[str, HostDict] | None = None,
+        *,
+        listings: InMemoryListingRepo | None = None,
+    ) -> None:
         self._data: dict[str, HostDict] = data or {}
+        self._listings = listings
 
     def get(self, host_id: str) -> HostDict | None:
         return self._data.get(host_id)
@@ -58,13 +179,30 @@ class InMemoryHostRepo(HostRepo):
     def upsert(self, host: HostDict) -> HostDict:
         host_id = host.get("id") or str(uuid4())
         host["id"] = host_id
+        current = self._data.get(host_id)
         self._data[host_id] = host
+        if self._listings is not None and "bio" in host:
+            if current is None or current.get("bio") != host["bio"]:
+                self._listings.host_bio_changed(host_id, host["bio"])
         return host
 
 
 class InMemoryListingRepo(ListingRepo):
     def __init__(self, data: dict[str, ListingDict] | None = None) -> None:
         self._data: dict[str, ListingDict] = data or {}
+        self._next_seq = 1 + max((item.get("seq", 0) for item in self._data.values()), default=0)
+        self._text_index = InvertedIndex()
+        self._cells = GeohashIndex()
+        for listing in self._data.values():
+            if "seq" not in listing:
+                listing["seq"] = self._take_seq()
+            self._locate(listing)
+            listing["roommate_features"] = encode_roommates(listing.get("roommates"))
+            self._index_text(listing)
+
+    def _take_seq(self) -> int:
+        seq, self._next_seq = self._next_seq, self._next_seq + 1
+        return seq
 
     def get(self, listing_id: str) -> ListingDict | None:
         return self._data.get(listing_id)
@@ -78,9 +216,55 @@ class InMemoryListingRepo(ListingRepo):
     def upsert(self, listing: ListingDict) -> ListingDict:
         listing_id = listing.get("id") or str(uuid4())
         listing["id"] = listing_id
+        current = self._data.get(listing_id)
+        listing["version"] = _next_version(current)
+        listing["seq"] = current["seq"] if current is not None else self._take_seq()
+        self._locate(listing)
+        listing["roommate_features"] = encode_roommates(listing.get("roommates"))
         self._data[listing_id] = listing
+        self._index_text(listing)
         return listing
 
+    def _locate(self, listing: ListingDict) -> None:
+        listing["city_key"] = normalize_city_key(listing.get("city")) or None
+        set_location(listing, state=listing.get("state"))
+        self._cells.index(listing["id"], listing.get("geohash"))
+
+    def _nearby(self, within: Radius) -> list[ListingDict]:
+        candidates = (self._data[listing_id] for listing_id in self._cells.candidates(within))
+        found = [listing for listing in candidates if within.contains(point_of(listing))]
+        return sorted(found, key=lambda listing: listing["seq"])
+
+    def _index_text(self, listing: ListingDict) -> None:
+        roommates = listing.get("roommates") or []
+        self._text_index.index(
+            listing["id"],
+            title=listing.get("title"),
+            body=[listing.get("bio")]
+            + [text for r in roommates for text in (r.get("bio"), r.get("major"))],
+        )
+
+    def host_bio_changed(self, host_id: str, bio: str | None) -> None:
+        """Listings carry their host's bio, as the SQL rows do through the join."""
+        for listing in self._data.values():
+            if listing.get("host_id") == host_id:
+                listing["bio"] = bio
+                listing["version"] = _next_version(listing)
+                self._index_text(listing)
+
+    def get_version(self, listing_id: str) -> int | None:
+        listing = self._data.get(listing_id)
+        return listing.get("version", 1) if listing is not None else None
+
+    def get_version_by_host(self, host_id: str) -> tuple[str, int] | None:
+        listing = self.get_by_host(host_id)
+        if listing is None:
+            return None
+        return listing["id"], listing.get("version", 1)
+
+    def get_many(self, listing_ids: Sequence[str]) -> dict[str, ListingDict]:
+        return {lid: self._data[lid] for lid in listing_ids if lid in self._data}
+
     def search(
         self,
         city: str | None = None,
@@ -88,7 +272,8 @@ class InMemoryListingRepo(ListingRepo):
     ) -> Sequence[ListingDict]:
         results: list[ListingDict] = list(self._data.values())
         if city:
-            results = [listing for listing in results if listing.get("city") == city]
+            key = normalize_city_key(city)
+            results = [listing for listing in results if listing.get("city_key") == key]
         if max_price is not None:
             filtered: list[ListingDict] = []
             for listing in results:
@@ -98,8 +283,199 @@ class InMemoryListingRepo(ListingRepo):
             results = filtered
         return results
 
-    def queue_for_seeker(self, seeker_id: str) -> Sequence[ListingDict]:
-        return [listing for listing in self._data.values() if listing.get("status") == "PUBLISHED"]
+    def queue_for_seeker(
+        self,
+        seeker_id: str,
+        *,
+        seen: SeenSet | None = None,
+        within: Radius | None = None,
+    ) -> Sequence[ListingDict]:
+        candidates = self._data.values() if within is None else self._nearby(within)
+        return [
+            listing
+            for listing in candidates
+            if listing.get("status") == "PUBLISHED" and (seen is None or listing["seq"] not in seen)
+        ]
+
+    def search_text(
+        self,
+        query: str,
+        *,
+        limit: int,
+        after: tuple[float, str] | None = None,
+        within: Radius | None = None,
+    ) -> Sequence[tuple[ListingDict, float]]:
+        nearby = None if within is None else {listing["id"] for listing in self._nearby(within)}
+        hits = [
+            (-rank, listing_id)
+            for listing_id, rank in self._text_index.search(query).items()
+            if self._data[listing_id].get("status") == "PUBLISHED"
+            and (nearby is None or listing_id in nearby)
+        ]
+        if after is not None:
+            boundary = (-after[0], after[1])
+            hits = [hit for hit in hits if hit > boundary]
+        return [(self._data[listing_id], -key) for key, listing_id in heapq.nsmallest(limit, hits)]
+
+
+class InMemorySeenSetRepo(SeenSetRepo):
+    """Seen-sets kept as serialized blobs, like the ``seeker_seen_sets`` table."""
+
+    def __init__(self, listings: InMemoryListingRepo) -> None:
+        self._listings = listings
+        self._data: dict[str, bytes] = {}
+        self._lock = threading.Lock()
+
+    def get(self, seeker_id: str) -> SeenSet:
+        return SeenSet.from_bytes(self._data.get(seeker_id))
+
+    def get_many(self, seeker_ids: Sequence[str]) -> dict[str, SeenSet]:
+        return {
+            seeker_id: SeenSet.from_bytes(self._data[seeker_id])
+            for seeker_id in seeker_ids
+            if seeker_id in self._data
+        }
+
+    def _update(self, seeker_id: str, listing_id: str, *, add: bool) -> None:
+        listing = self._listings.get(listing_id)
+        if listing is None:
+            return
+        with self._lock:
+            seen = self.get(seeker_id)
+            changed = seen.add(listing["seq"]) if add else seen.discard(listing["seq"])
+            if changed:
+                self._data[seeker_id] = seen.to_bytes()
+
+    def add(self, seeker_id: str, listing_id: str) -> None:
+        self._update(seeker_id, listing_id, add=True)
+
+    def discard(self, seeker_id: str, listing_id: str) -> None:
+        self._update(seeker_id, listing_id, add=False)
+
+
+class InMemoryListingNeighborRepo(ListingNeighborRepo):
+    """Neighbour lists keyed by listing, like the ``listing_neighbors`` table."""
+
+    def __init__(self) -> None:
+        self._data: dict[str, dict[str, float]] = {}
+
+    def similar_to(self, listing_ids: Sequence[str]) -> dict[str, float]:
+        similar: dict[str, float] = {}
+        for listing_id in listing_ids:
+            for neighbor_id, similarity in self._data.get(listing_id, {}).items():
+                if similarity > similar.get(neighbor_id, 0.0):
+                    similar[neighbor_id] = similarity
+        return similar
+
+    def replace(self, rows: Iterable[tuple[str, Sequence[tuple[str, float]]]]) -> int:
+        data = {listing_id: dict(neighbors) for listing_id, neighbors in rows}
+        # One swap, so readers see either the old lists or the new ones.
+        self._data = data
+        return sum(len(neighbors) for neighbors in data.values())
+
+
+class InMemorySavedSearchRepo(SavedSearchRepo):
+    """Saved searches filed in an ``InterestIndex``, like ``ix_saved_searches_lookup``.
+
+    Deleting a search drops its alerts from ``alerts``, as ``ON DELETE CASCADE`` does.
+    """
+
+    def __init__(self, *, alerts: InMemorySearchAlertRepo | None = None) -> None:
+        self._data: dict[str, SavedSearchDict] = {}
+        self._index = InterestIndex()
+        self._lock = threading.Lock()
+        self._alerts = alerts
+
+    def add(self, search: SavedSearchDict) -> SavedSearchDict:
+        row: SavedSearchDict = {
+            **search,
+            "id": search.get("id") or str(uuid4()),
+            "city_key": normalize_city_key(search.get("city")),
+            "created_at": datetime.utcnow(),
+        }
+        with self._lock:
+            self._data[row["id"]] = row
+            self._index.put(row["id"], _search_interest(row))
+        return row
+
+    def list_for_seeker(self, seeker_id: str) -> Sequence[SavedSearchDict]:
+        return sorted(
+            (row for row in self._data.values() if row["seeker_id"] == seeker_id),
+            key=lambda row: (row["created_at"], row["id"]),
+        )
+
+    def delete(self, seeker_id: str, search_id: str) -> bool:
+        with self._lock:
+            row = self._data.get(search_id)
+            if row is None or row["seeker_id"] != seeker_id:
+                return False
+            del self._data[search_id]
+            self._index.discard(search_id)
+        if self._alerts is not None:
+            self._alerts.search_deleted(search_id)
+        return True
+
+    def matching(self, listing: ListingDict) -> Sequence[SavedSearchDict]:
+        return [self._data[search_id] for search_id in self._index.match(_opening(listing))]
+
+
+class InMemorySearchAlertRepo(SearchAlertRepo):
+    """Alerts inbox, unique per (search, listing) like the ``search_alerts`` table."""
+
+    def __init__(self) -> None:
+        self._data: dict[str, SearchAlertDict] = {}
+        self._pairs: set[tuple[str, str]] = set()
+        self._lock = threading.Lock()
+
+    def add_many(self, rows: Sequence[tuple[str, str, str]]) -> int:
+        now = datetime.utcnow()
+        added = 0
+        with self._lock:
+            for seeker_id, search_id, listing_id in rows:
+                if (search_id, listing_id) in self._pairs:
+                    continue
+                self._pairs.add((search_id, listing_id))
+                alert: SearchAlertDict = {
+                    "id": str(uuid4()),
+                    "seeker_id": seeker_id,
+                    "search_id": search_id,
+                    "listing_id": listing_id,
+                    "created_at": now,
+                    "read_at": None,
+                }
+                self._data[alert["id"]] = alert
+                added += 1
+        return added
+
+    def search_deleted(self, search_id: str) -> None:
+        with self._lock:
+            for alert in [a for a in self._data.values() if a["search_id"] == search_id]:
+                del self._data[alert["id"]]
+                self._pairs.discard((search_id, alert["listing_id"]))
+
+    def inbox(
+        self, seeker_id: str, *, unread_only: bool = False, limit: int = 50
+    ) -> Sequence[SearchAlertDict]:
+        alerts = [
+            alert
+            for alert in self._data.values()
+            if alert["seeker_id"] == seeker_id
+            and not (unread_only and alert["read_at"] is not None)
+        ]
+        alerts.sort(key=lambda alert: (alert["created_at"], alert["id"]), reverse=True)
+        return alerts[:limit]
+
+    def mark_read(self, seeker_id: str, alert_ids: Sequence[str]) -> int:
+        now = datetime.utcnow()
+        marked = 0
+        with self._lock:
+            for alert_id in alert_ids:
+                alert = self._data.get(alert_id)
+                if alert is None or alert["seeker_id"] != seeker_id or alert["read_at"]:
+                    continue
+                alert["read_at"] = now
+                marked += 1
+        return marked
 
 
 class InMemorySwipeRepo(SwipeRepo):
@@ -137,10 +513,32 @@ class InMemorySwipeRepo(SwipeRepo):
         self._data.pop(last_swipe["id"], None)
         return last_swipe
 
+    def recent_likes(self, user_id: str, limit: int) -> list[str]:
+        decided: set[str] = set()
+        liked: list[str] = []
+        for swipe in reversed(self._by_user_stack.get(user_id) or []):
+            target_id = swipe["target_id"]
+            if not target_id.startswith("listing-") or target_id in decided:
+                continue
+            decided.add(target_id)
+            if swipe["decision"] == "like":
+                liked.append(target_id)
+                if len(liked) == limit:
+                    break
+        return liked
+
 
 class InMemoryMatchRepo(MatchRepo):
-    def __init__(self, data: dict[str, MatchDict] | None = None) -> None:
+    def __init__(
+        self,
+        data: dict[str, MatchDict] | None = None,
+        *,
+        seekers: InMemorySeekerRepo | None = None,
+        listings: InMemoryListingRepo | None = None,
+    ) -> None:
         self._data: dict[str, MatchDict] = data or {}
+        self._seekers = seekers
+        self._listings = listings
 
     def list_for_seeker(self, seeker_id: str) -> Sequence[MatchDict]:
         return [match for match in self._data.values() if match.get("seeker_id") == seeker_id]
@@ -148,6 +546,54 @@ class InMemoryMatchRepo(MatchRepo):
     def list_for_host(self, host_id: str) -> Sequence[MatchDict]:
         return list(self._data.values())
 
+    def get_for_pair(self, seeker_id: str, listing_id: str) -> MatchDict | None:
+        return self._data.get(f"{seeker_id}:{listing_id}")
+
+    def feed_page(
+        self,
+        *,
+        seeker_id: str | None,
+        host_id: str | None,
+        limit: int,
+        after: tuple[float | None, str] | None = None,
+    ) -> Sequence[MatchDict]:
+        # Without the listing store no listing is known to belong to the host.
+        host_listings: set[str] = set()
+        if host_id and self._listings is not None:
+            host_listings = {
+                listing["id"]
+                for listing in self._listings._data.values()
+                if listing.get("host_id") == host_id
+            }
+        rows = [
+            match
+            for match in self._data.values()
+            if (seeker_id and match.get("seeker_id") == seeker_id)
+            or match.get("listing_id") in host_listings
+        ]
+        rows.sort(key=_feed_key)
+        if after is not None:
+            boundary = _feed_key({"score": after[0], "id": after[1]})
+            rows = [match for match in rows if _feed_key(match) > boundary]
+        return rows[:limit]
+
+    def version_tag_for_seeker(self, seeker_id: str) -> str:
+        parts = []
+        for match in sorted(self.list_for_seeker(seeker_id), key=lambda m: m["id"]):
+            listing_version = (
+                self._listings.get_version(match["listing_id"]) if self._listings else None
+            )
+            parts.append(f"{match['id']}:{match.get('version', 1)}:{listing_version}")
+        return _digest(parts)
+
+    def version_tag_for_host(self, host_id: str) -> str:
+        parts = []
+        for match in sorted(self.list_for_host(host_id), key=lambda m: m["id"]):
+            seeker = self._seekers.get(match["seeker_id"]) if self._seekers else None
+            seeker_version = seeker.get("version", 1) if seeker is not None else None
+            parts.append(f"{match['id']}:{match.get('version', 1)}:{seeker_version}")
+        return _digest(parts)
+
     def upsert(
         self,
         seeker_id: str,
@@ -170,17 +616,121 @@ class InMemoryMatchRepo(MatchRepo):
             ),
             None,
         )
+        became_mutual = status_literal == "MUTUAL" and not (existing or {}).get("matched_at")
         if existing:
             existing["status"] = status_literal
             existing["score"] = score
-            return existing
+            existing["version"] = _next_version(existing)
+            if became_mutual:
+                existing["matched_at"] = datetime.utcnow()
+            return {**existing, "became_mutual": became_mutual}
         new_match: MatchDict = {
             "id": key,
             "seeker_id": seeker_id,
             "listing_id": listing_id,
             "status": status_literal,
             "score": score,
-            "matched_at": None,
+            "matched_at": datetime.utcnow() if became_mutual else None,
+            "version": 1,
         }
         self._data[key] = new_match
-        return new_match
+        return {**new_match, "became_mutual": became_mutual}
+
+    def upsert_many(self, rows: Sequence[MatchUpsertDict]) -> list[MatchDict]:
+        return [
+            self.upsert(row["seeker_id"], row["listing_id"], row["status"], row["score"])
+            for row in rows
+        ]
+
+
+class InMemoryOutboxRepo(OutboxRepo):
+    """Outbox kept in process memory; recipients resolve through profile contact emails."""
+
+    def __init__(self, seekers: InMemorySeekerRepo, hosts: InMemoryHostRepo) -> None:
+        self._seekers = seekers
+        self._hosts = hosts
+        self._data: dict[str, dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    def enqueue(
+        self,
+        recipient_user_id: str,
+        event_type: str,
+        payload: dict[str, Any],
+    ) -> OutboxEventDict:
+        now = datetime.utcnow()
+        row: dict[str, Any] = {
+            "id": str(uuid4()),
+            "recipient_user_id": recipient_user_id,
+            "event_type": event_type,
+            "payload": dict(payload),
+            "attempts": 0,
+            "created_at": now,
+            "available_at": now,
+            "processed_at": None,
+            "last_error": None,
+        }
+        with self._lock:
+            self._data[row["id"]] = row
+        return self._to_event(row)
+
+    def claim_batch(
+        self, limit: int, *, lease_seconds: float = 300.0
+    ) -> Sequence[OutboxEventDict]:
+        now = datetime.utcnow()
+        with self._lock:
+            pending = sorted(
+                (
+                    row
+                    for row in self._data.values()
+                    if row["processed_at"] is None and row["available_at"] <= now
+                ),
+                key=lambda row: (row["available_at"], row["id"]),
+            )[:limit]
+            # A lease rather than a flag, so a tick that dies mid-send cannot strand rows.
+            lease_until = now + timedelta(seconds=lease_seconds)
+            for row in pending:
+                row["available_at"] = lease_until
+        return [self._to_event(row) for row in pending]
+
+    def mark_processed(self, event_ids: Sequence[str], *, error: str | None = None) -> None:
+        now = datetime.utcnow()
+        with self._lock:
+            for event_id in event_ids:
+                row = self._data[event_id]
+                row["processed_at"] = now
+                row["last_error"] = error
+
+    def reschedule(
+        self,
+        event_ids: Sequence[str],
+        *,
+        error: str,
+        delay_seconds: float,
+    ) -> None:
+        with self._lock:
+            for event_id in event_ids:
+                row = self._data[event_id]
+                row["attempts"] += 1
+                row["available_at"] = datetime.utcnow() + timedelta(seconds=delay_seconds)
+                row["last_error"] = error
+
+    def recipient(self, user_id: str) -> RecipientDict | None:
+        profile = self._seekers.get_by_user(user_id) or self._hosts.get_by_user(user_id)
+        if profile is None:
+            return None
+        return {
+            "user_id": user_id,
+            "email": profile.get("contact_email"),
+            "notifications_enabled": True,
+        }
+
+    def _to_event(self, row: dict[str, Any]) -> OutboxEventDict:
+        return {
+            "id": row["id"],
+            "recipient_user_id": row["recipient_user_id"],
+            "event_type": row["event_type"],
+            "payload": dict(row["payload"]),
+            "attempts": row["attempts"],
+            "created_at": row["created_at"],
+        }
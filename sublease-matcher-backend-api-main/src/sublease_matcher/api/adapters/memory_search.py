@@ -0,0 +1,100 @@
+"""Inverted index with BM25 ranking for the in-memory listing repo.
+
+Mirrors the Postgres search closely enough for tests and local runs: the same
+fields (title, host bio, roommate bios and majors), AND semantics across query
+terms, and title matches counting more (each title token is counted twice).
+Tokens are lower-cased alphanumeric runs with English stop words dropped and a
+plural ``s`` stripped.
+"""
+
+from __future__ import annotations
+
+import math
+import re
+from collections import Counter
+from collections.abc import Iterable
+
+_TOKEN = re.compile(r"[a-z0-9]+")
+_STOP_WORDS = frozenset(
+    "a an and are as at be but by for from has have i in is it its my near of on or "
+    "our the to we with you your".split()
+)
+TITLE_WEIGHT = 2
+K1 = 1.2
+B = 0.75
+
+
+def tokenize(text: str | None) -> list[str]:
+    tokens = []
+    for token in _TOKEN.findall((text or "").lower()):
+        if token in _STOP_WORDS:
+            continue
+        if len(token) > 3 and token.endswith("s") and not token.endswith("ss"):
+            token = token[:-1]
+        tokens.append(token)
+    return tokens
+
+
+class InvertedIndex:
+    """term -> {doc id: weighted term frequency}, plus document lengths."""
+
+    def __init__(self) -> None:
+        self._postings: dict[str, dict[str, int]] = {}
+        self._lengths: dict[str, int] = {}
+        self._terms: dict[str, list[str]] = {}
+        self._total_length = 0
+
+    def __len__(self) -> int:
+        return len(self._lengths)
+
+    def index(self, doc_id: str, *, title: str | None, body: Iterable[str | None]) -> None:
+        self.remove(doc_id)
+        counts: Counter[str] = Counter()
+        for token in tokenize(title):
+            counts[token] += TITLE_WEIGHT
+        for text in body:
+            counts.update(tokenize(text))
+        for term, frequency in counts.items():
+            self._postings.setdefault(term, {})[doc_id] = frequency
+        length = sum(counts.values())
+        self._terms[doc_id] = list(counts)
+        self._lengths[doc_id] = length
+        self._total_length += length
+
+    def remove(self, doc_id: str) -> None:
+        length = self._lengths.pop(doc_id, None)
+        if length is None:
+            return
+        self._total_length -= length
+        for term in self._terms.pop(doc_id):
+            postings = self._postings[term]
+            del postings[doc_id]
+            if not postings:
+                del self._postings[term]
+
+    def search(self, query: str) -> dict[str, float]:
+        """BM25 score of every document containing all query terms."""
+        terms = list(dict.fromkeys(tokenize(query)))
+        if not terms or not self._lengths:
+            return {}
+        postings = [self._postings.get(term, {}) for term in terms]
+        if not all(postings):
+            return {}
+        postings.sort(key=len)
+        matches = set(postings[0]).intersection(*postings[1:])
+        count = len(self._lengths)
+        average = self._total_length / count
+        weighted = [
+            (docs, math.log(1 + (count - len(docs) + 0.5) / (len(docs) + 0.5)) * (K1 + 1))
+            for docs in postings
+        ]
+        lengths = self._lengths
+        scores = {}
+        for doc_id in matches:
+            norm = K1 * (1 - B + B * lengths[doc_id] / average)
+            score = 0.0
+            for docs, idf in weighted:
+                frequency = docs[doc_id]
+                score += idf * frequency / (frequency + norm)
+            scores[doc_id] = score
+        return scores
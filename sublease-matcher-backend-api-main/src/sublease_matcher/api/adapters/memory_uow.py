@@ -1,17 +1,39 @@
 from __future__ import annotations
 
+import logging
+import threading
+import zlib
+from collections.abc import Callable
 from types import TracebackType
-from typing import Self
+from typing import Self, TypeVar
 
+from ..interfaces.repos import HostRepo, ListingRepo, SeekerRepo
 from ..interfaces.uow import UnitOfWork
+from .identity_map import IdentityMap, MappedHostRepo, MappedListingRepo, MappedSeekerRepo
 from .memory_repos import (
     InMemoryHostRepo,
+    InMemoryListingNeighborRepo,
     InMemoryListingRepo,
     InMemoryMatchRepo,
+    InMemoryOutboxRepo,
+    InMemorySavedSearchRepo,
+    InMemorySearchAlertRepo,
     InMemorySeekerRepo,
+    InMemorySeenSetRepo,
     InMemorySwipeRepo,
 )
 
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Striped rather than global: unrelated keys rarely share a stripe, so writers don't serialize.
+_LOCK_STRIPES = tuple(threading.Lock() for _ in range(256))
+
+
+def _stripe(key: str) -> int:
+    return zlib.crc32(key.encode()) % len(_LOCK_STRIPES)
+
 
 class InMemoryUnitOfWork(UnitOfWork):
     def __init__(
@@ -21,13 +43,63 @@ class InMemoryUnitOfWork(UnitOfWork):
         listings: InMemoryListingRepo,
         swipes: InMemorySwipeRepo,
         matches: InMemoryMatchRepo,
+        outbox: InMemoryOutboxRepo | None = None,
+        seen_sets: InMemorySeenSetRepo | None = None,
+        listing_neighbors: InMemoryListingNeighborRepo | None = None,
+        saved_searches: InMemorySavedSearchRepo | None = None,
+        search_alerts: InMemorySearchAlertRepo | None = None,
+        *,
+        identity_map: bool = False,
     ) -> None:
-        self.seekers = seekers
-        self.hosts = hosts
-        self.listings = listings
+        self._stores = (seekers, hosts, listings)
+        # Typed as the protocols: with identity_map they are wrapped below.
+        self.seekers: SeekerRepo = seekers
+        self.hosts: HostRepo = hosts
+        self.listings: ListingRepo = listings
         self.swipes = swipes
         self.matches = matches
+        self.outbox = outbox or InMemoryOutboxRepo(seekers, hosts)
+        self.seen_sets = seen_sets or InMemorySeenSetRepo(listings)
+        self.listing_neighbors = listing_neighbors or InMemoryListingNeighborRepo()
+        self.search_alerts = search_alerts or InMemorySearchAlertRepo()
+        self.saved_searches = saved_searches or InMemorySavedSearchRepo(alerts=self.search_alerts)
         self._committed = False
+        self._on_commit: list[Callable[[], None]] = []
+        self._held: list[threading.Lock] = []
+        self.identity_map: IdentityMap | None = None
+        if identity_map:
+            # Per-request wrapper over shared repos; the process-wide UoW stays unwrapped.
+            self.identity_map = IdentityMap()
+            self.seekers = MappedSeekerRepo(seekers, self.identity_map)
+            self.hosts = MappedHostRepo(hosts, self.identity_map)
+            self.listings = MappedListingRepo(listings, self.identity_map)
+
+    def fork(self, *, identity_map: bool = True) -> InMemoryUnitOfWork:
+        """A fresh unit of work over the same repos, so commit hooks stay request-local."""
+        seekers, hosts, listings = self._stores
+        return InMemoryUnitOfWork(
+            seekers,
+            hosts,
+            listings,
+            self.swipes,
+            self.matches,
+            self.outbox,
+            self.seen_sets,
+            self.listing_neighbors,
+            self.saved_searches,
+            self.search_alerts,
+            identity_map=identity_map,
+        )
+
+    def row_counts(self) -> dict[str, int]:
+        seekers, hosts, listings = self._stores
+        return {
+            "seekers": len(seekers._data),
+            "hosts": len(hosts._data),
+            "listings": len(listings._data),
+            "swipes": len(self.swipes._data),
+            "matches": len(self.matches._data),
+        }
 
     def __enter__(self) -> Self:
         self._committed = False
@@ -46,6 +118,51 @@ class InMemoryUnitOfWork(UnitOfWork):
 
     def commit(self) -> None:
         self._committed = True
+        self._release()
+        if self.identity_map is not None:
+            self.identity_map.clear()
+        callbacks, self._on_commit = self._on_commit, []
+        for callback in callbacks:
+            try:
+                callback()
+            except Exception:
+                logger.exception("on_commit callback failed")
 
     def rollback(self) -> None:
         self._committed = False
+        self._release()
+        if self.identity_map is not None:
+            self.identity_map.clear()
+        self._on_commit.clear()
+
+    def on_commit(self, callback: Callable[[], None]) -> None:
+        self._on_commit.append(callback)
+
+    def run_in_transaction(
+        self,
+        fn: Callable[[Self], T],
+        *,
+        isolation_level: str | None = None,
+        max_attempts: int | None = None,
+    ) -> T:
+        # Memory repos have no isolation levels or serialization failures; ``lock`` does the work.
+        self.commit()
+        try:
+            result = fn(self)
+        except BaseException:
+            self.rollback()
+            raise
+        self.commit()
+        return result
+
+    def lock(self, *keys: str) -> None:
+        held = set(map(id, self._held))
+        for stripe in sorted({_stripe(key) for key in keys}):
+            lock = _LOCK_STRIPES[stripe]
+            if id(lock) not in held:
+                lock.acquire()
+                self._held.append(lock)
+
+    def _release(self) -> None:
+        while self._held:
+            self._held.pop().release()
@@ -0,0 +1,36 @@
+"""Roommate trait vectors for stored listings.
+
+Both listing repos call ``encode_roommates`` on write, so
+``listings.roommate_features`` always matches the roommate rows and scoring reads
+it as is. Roommate dicts arrive in either the API's camelCase or the column names.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping, Sequence
+from typing import Any
+
+from sublease_matcher.core.domain import encode_traits, pack_traits
+
+
+def _interests(roommate: Mapping[str, Any]) -> list[str]:
+    interests = roommate.get("interests")
+    if isinstance(interests, list):
+        return interests
+    csv = roommate.get("interests_csv")
+    return csv.split(",") if csv else []
+
+
+def roommate_traits(roommate: Mapping[str, Any]) -> int:
+    return encode_traits(
+        interests=_interests(roommate),
+        major=roommate.get("major"),
+        sleeping_habits=roommate.get("sleepingHabits") or roommate.get("sleeping_habits"),
+        study_habits=roommate.get("studyHabits") or roommate.get("study_habits"),
+        cleanliness=roommate.get("cleanliness"),
+        bio=roommate.get("bio"),
+    )
+
+
+def encode_roommates(roommates: Sequence[Mapping[str, Any]] | None) -> bytes:
+    return pack_traits(roommate_traits(roommate) for roommate in roommates or ())
@@ -5,9 +5,12 @@ from sqlalchemy.orm import sessionmaker
 
 from sublease_matcher.api.config import get_settings
 
+from .instrumentation import install_query_instrumentation
+
 settings = get_settings()
 if not settings.database_url:
     raise RuntimeError("SM_DATABASE_URL must be set for SQLAlchemy dev setup")
 
 engine = create_engine(settings.database_url, future=True)
+install_query_instrumentation(engine, slow_query_ms=settings.sql_slow_query_ms)
 SessionLocal = sessionmaker(bind=engine, autoflush=False, autocommit=False, future=True)
@@ -0,0 +1,34 @@
+"""Radius filters over the ``lat`` / ``lon`` / ``geohash`` columns.
+
+A radius becomes a handful of geohash prefix ranges, served by the btree on
+``geohash`` (a "C"-collated column, so ``>= cell AND < cell || '{'`` is a plain
+index range: every base32 character sorts below ``{``). Rows in those cells
+then get an exact check with the same local planar distance the core uses:
+arithmetic on columns, no trigonometry per row.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+import sqlalchemy as sa
+from sqlalchemy.orm import InstrumentedAttribute
+from sublease_matcher.core.geo import KM_PER_DEGREE_LAT, Radius
+
+_PAST_LAST_BASE32 = "{"
+
+
+def within_clause(
+    lat: sa.ColumnElement[Any] | InstrumentedAttribute[Any],
+    lon: sa.ColumnElement[Any] | InstrumentedAttribute[Any],
+    cell: sa.ColumnElement[Any] | InstrumentedAttribute[Any],
+    radius: Radius,
+) -> sa.ColumnElement[bool]:
+    """Rows whose ``(lat, lon)`` lies inside ``radius``."""
+    prefixes = [
+        sa.and_(cell >= prefix, cell < prefix + _PAST_LAST_BASE32)
+        for prefix in radius.cells()
+    ]
+    dy = (lat - float(radius.center.lat)) * KM_PER_DEGREE_LAT
+    dx = (lon - float(radius.center.lon)) * radius.km_per_lon
+    return sa.and_(sa.or_(*prefixes), dx * dx + dy * dy <= float(radius.km) ** 2)
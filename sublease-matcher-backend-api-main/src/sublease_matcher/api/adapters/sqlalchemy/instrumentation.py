@@ -0,0 +1,145 @@
+"""Engine-level query instrumentation: per-request counters, slow-query log, N+1 hints."""
+
+from __future__ import annotations
+
+import logging
+import re
+import time
+from collections import Counter
+from collections.abc import Iterator, Mapping, Sequence
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+logger = logging.getLogger(__name__)
+
+_IN_LIST = re.compile(r"\bIN\s*\((?:[^()]|\([^()]*\))*\)", re.IGNORECASE)
+_WHITESPACE = re.compile(r"\s+")
+_START_KEY = "_sm_query_started"
+
+_current_stats: ContextVar[QueryStats | None] = ContextVar("sm_query_stats", default=None)
+
+
+class QueryBudgetExceeded(AssertionError):
+    """Raised when a tracked block issues more statements than its budget allows."""
+
+
+@dataclass(slots=True)
+class QueryStats:
+    """Statement count, DB time and repeated statement shapes for one request."""
+
+    statements: int = 0
+    total_ms: float = 0.0
+    shapes: Counter[str] = field(default_factory=Counter)
+
+    def record(self, statement: str, elapsed_ms: float) -> None:
+        self.statements += 1
+        self.total_ms += elapsed_ms
+        self.shapes[statement_shape(statement)] += 1
+
+    def repeated(self, threshold: int) -> list[tuple[str, int]]:
+        """Statement shapes issued at least ``threshold`` times (likely N+1 loops)."""
+
+        return [(shape, count) for shape, count in self.shapes.most_common() if count >= threshold]
+
+
+def statement_shape(statement: str) -> str:
+    """Collapse whitespace and expanded IN lists so identical queries share one key."""
+
+    collapsed = _IN_LIST.sub("IN (...)", statement)
+    return _WHITESPACE.sub(" ", collapsed).strip()
+
+
+def redact_parameters(parameters: Any) -> Any:
+    """Replace bound values with their type names so logs never carry user data."""
+
+    if isinstance(parameters, Mapping):
+        return {key: f"<{type(value).__name__}>" for key, value in parameters.items()}
+    if isinstance(parameters, Sequence) and not isinstance(parameters, (str, bytes)):
+        return [redact_parameters(item) for item in parameters]
+    return f"<{type(parameters).__name__}>"
+
+
+def current_query_stats() -> QueryStats | None:
+    return _current_stats.get()
+
+
+@contextmanager
+def track_queries() -> Iterator[QueryStats]:
+    """Collect statement stats for everything executed in the current context."""
+
+    stats = QueryStats()
+    token = _current_stats.set(stats)
+    try:
+        yield stats
+    finally:
+        _current_stats.reset(token)
+
+
+def enforce_query_budget(
+    stats: QueryStats,
+    *,
+    max_statements: int | None,
+    max_repeats: int | None = None,
+    label: str = "block",
+) -> None:
+    if max_statements is not None and stats.statements > max_statements:
+        raise QueryBudgetExceeded(
+            f"{label} issued {stats.statements} statements (budget {max_statements})"
+        )
+    if max_repeats is not None:
+        repeated = stats.repeated(max_repeats + 1)
+        if repeated:
+            shape, count = repeated[0]
+            raise QueryBudgetExceeded(
+                f"{label} repeated one statement {count} times (limit {max_repeats}): {shape}"
+            )
+
+
+@contextmanager
+def query_budget(
+    max_statements: int | None,
+    *,
+    max_repeats: int | None = None,
+    label: str = "block",
+) -> Iterator[QueryStats]:
+    """Test helper: fail when the wrapped block exceeds its statement budget."""
+
+    with track_queries() as stats:
+        yield stats
+    enforce_query_budget(
+        stats, max_statements=max_statements, max_repeats=max_repeats, label=label
+    )
+
+
+def install_query_instrumentation(engine: Engine, *, slow_query_ms: float) -> None:
+    """Attach timing hooks to ``engine``; safe to call once per engine."""
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _before(conn, cursor, statement, parameters, context, executemany):  # type: ignore[no-untyped-def]
+        conn.info.setdefault(_START_KEY, []).append(time.perf_counter())
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _after(conn, cursor, statement, parameters, context, executemany):  # type: ignore[no-untyped-def]
+        started = conn.info[_START_KEY].pop()
+        elapsed_ms = (time.perf_counter() - started) * 1000.0
+        stats = _current_stats.get()
+        if stats is not None:
+            stats.record(statement, elapsed_ms)
+        if elapsed_ms >= slow_query_ms:
+            logger.warning(
+                "Slow query (%.1f ms): %s params=%s",
+                elapsed_ms,
+                statement_shape(statement),
+                redact_parameters(parameters),
+            )
+
+    @event.listens_for(engine, "handle_error")
+    def _on_error(exception_context):  # type: ignore[no-untyped-def]
+        conn = exception_context.connection
+        if conn is not None and conn.info.get(_START_KEY):
+            conn.info[_START_KEY].pop()
@@ -0,0 +1,79 @@
+"""Offline rebuild of ``listing_neighbors`` from the LIKE rows in ``seeker_swipes``.
+
+Likes are streamed seeker by seeker with a server-side cursor, once per shard
+(see ``core.services.neighbors``), and neighbour lists are written in batches
+as each shard finishes, so neither side of the job holds the whole matrix.
+The old lists are deleted in the same transaction, so readers keep seeing them
+until the new ones commit.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator, Sequence
+from itertools import groupby, islice
+from operator import itemgetter
+
+import sqlalchemy as sa
+from sqlalchemy.engine import Connection
+from sublease_matcher.core.services.neighbors import (
+    DEFAULT_K,
+    DEFAULT_MAX_BASKET,
+    DEFAULT_MIN_CO_LIKES,
+    iter_neighbors,
+)
+
+from . import models
+
+BATCH_SIZE = 1000
+_STREAM_ROWS = 5000
+
+
+def like_baskets(conn: Connection, *, max_basket: int) -> Iterator[list[str]]:
+    """Each seeker's liked listing ids, most recent first and at most ``max_basket``."""
+    rows = conn.execution_options(yield_per=_STREAM_ROWS).execute(
+        sa.select(models.SeekerSwipe.seeker_id, models.SeekerSwipe.listing_id)
+        .where(models.SeekerSwipe.decision == "LIKE")
+        .order_by(models.SeekerSwipe.seeker_id, models.SeekerSwipe.created_at.desc())
+    )
+    for _, likes in groupby(rows, key=itemgetter(0)):
+        yield [listing_id for _, listing_id in islice(likes, max_basket)]
+
+
+def store_neighbors(
+    conn: Connection, rows: Iterable[tuple[str, Sequence[tuple[str, float]]]]
+) -> int:
+    """Replace every neighbour list with ``rows``; returns the number of pairs stored."""
+    conn.execute(sa.delete(models.ListingNeighbor))
+    stored = 0
+    batch: list[dict[str, object]] = []
+    for listing_id, neighbors in rows:
+        batch.extend(
+            {"listing_id": listing_id, "neighbor_id": neighbor_id, "similarity": similarity}
+            for neighbor_id, similarity in neighbors
+        )
+        if len(batch) >= BATCH_SIZE:
+            conn.execute(sa.insert(models.ListingNeighbor), batch)
+            stored += len(batch)
+            batch = []
+    if batch:
+        conn.execute(sa.insert(models.ListingNeighbor), batch)
+        stored += len(batch)
+    return stored
+
+
+def rebuild_neighbors(
+    conn: Connection,
+    *,
+    k: int = DEFAULT_K,
+    shards: int = 1,
+    max_basket: int = DEFAULT_MAX_BASKET,
+    min_co_likes: int = DEFAULT_MIN_CO_LIKES,
+) -> int:
+    rows = iter_neighbors(
+        lambda: like_baskets(conn, max_basket=max_basket),
+        k=k,
+        shards=shards,
+        max_basket=max_basket,
+        min_co_likes=min_co_likes,
+    )
+    return store_neighbors(conn, rows)
@@ -2,10 +2,12 @@ from __future__ import annotations
 
 from datetime import date, datetime
 from decimal import Decimal
+from typing import Any
 
 import sqlalchemy as sa
 from sqlalchemy import CheckConstraint, ForeignKey, UniqueConstraint
 from sqlalchemy.dialects.postgresql import ENUM as PGEnum
+from sqlalchemy.dialects.postgresql import JSONB, TSVECTOR
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
 
 
@@ -107,6 +109,15 @@ class SeekerProfile(Base):
             "available_to IS NULL OR available_to >= available_from",
             name="ck_seeker_available_dates",
         ),
+        sa.Index("ix_seeker_profiles_city_key", "city_key"),
+        sa.Index("ix_seeker_profiles_geohash", "geohash"),
+        # Reverse lookup for a newly published listing: city, then budget range.
+        sa.Index(
+            "ix_seeker_profiles_interest",
+            "city_key",
+            "budget_max",
+            postgresql_where=sa.text("visible"),
+        ),
     )
 
     id: Mapped[str] = mapped_column(sa.String(length=64), primary_key=True)
@@ -131,11 +142,22 @@ class SeekerProfile(Base):
         nullable=True,
     )
     city: Mapped[str | None] = mapped_column(sa.Text, nullable=True)
+    # normalize_city_key(city), set by the repo on write.
+    city_key: Mapped[str | None] = mapped_column(sa.Text, nullable=True)
+    # Gazetteer coordinates of the city, set by the repo on write (see geo.py).
+    lat: Mapped[float | None] = mapped_column(sa.Float, nullable=True)
+    lon: Mapped[float | None] = mapped_column(sa.Float, nullable=True)
+    geohash: Mapped[str | None] = mapped_column(sa.String(12, collation="C"), nullable=True)
     interests_csv: Mapped[str | None] = mapped_column(sa.Text, nullable=True)
     contact_email: Mapped[str | None] = mapped_column(sa.Text, nullable=True)
     available_from: Mapped[date | None] = mapped_column(sa.Date, nullable=True)
     available_to: Mapped[date | None] = mapped_column(sa.Date, nullable=True)
     major: Mapped[str | None] = mapped_column(sa.Text, nullable=True)
+    version: Mapped[int] = mapped_column(
+        sa.Integer,
+        nullable=False,
+        server_default=sa.text("1"),
+    )
 
     user: Mapped[User] = relationship("User", back_populates="seeker_profile")
     photos: Mapped[list[SeekerPhoto]] = relationship(
@@ -216,6 +238,9 @@ class Listing(Base):
             "available_to IS NULL OR available_to >= available_from",
             name="ck_listing_available_dates",
         ),
+        sa.Index("ix_listings_search_vector", "search_vector", postgresql_using="gin"),
+        sa.Index("ix_listings_city_key", "city_key"),
+        sa.Index("ix_listings_geohash", "geohash"),
     )
 
     id: Mapped[str] = mapped_column(sa.String(length=64), primary_key=True)
@@ -230,7 +255,13 @@ class Listing(Base):
         nullable=True,
     )
     city: Mapped[str | None] = mapped_column(sa.Text, nullable=True)
+    # normalize_city_key(city), set by the repo on write.
+    city_key: Mapped[str | None] = mapped_column(sa.Text, nullable=True)
     state: Mapped[str | None] = mapped_column(sa.Text, nullable=True)
+    # Gazetteer coordinates of city/state, set by the repo on write (see geo.py).
+    lat: Mapped[float | None] = mapped_column(sa.Float, nullable=True)
+    lon: Mapped[float | None] = mapped_column(sa.Float, nullable=True)
+    geohash: Mapped[str | None] = mapped_column(sa.String(12, collation="C"), nullable=True)
     available_from: Mapped[date | None] = mapped_column(sa.Date, nullable=True)
     available_to: Mapped[date | None] = mapped_column(sa.Date, nullable=True)
     status: Mapped[str] = mapped_column(
@@ -238,6 +269,18 @@ class Listing(Base):
         nullable=False,
         server_default=sa.text("'DRAFT'"),
     )
+    version: Mapped[int] = mapped_column(
+        sa.Integer,
+        nullable=False,
+        server_default=sa.text("1"),
+    )
+    # Dense integer surrogate so per-seeker seen-sets can be compact bitmaps.
+    seq: Mapped[int] = mapped_column(sa.BigInteger, sa.Identity(), unique=True, nullable=False)
+    # Title, host bio and roommate bios/majors; spans tables, so the listing repo
+    # refreshes it (see search.py) instead of a generated column. Never loaded.
+    search_vector: Mapped[Any] = mapped_column(TSVECTOR, nullable=True, deferred=True)
+    # 8 bytes of trait bits per roommate (core ``domain.traits``), rewritten with them.
+    roommate_features: Mapped[bytes | None] = mapped_column(sa.LargeBinary, nullable=True)
 
     host: Mapped[HostProfile] = relationship("HostProfile", back_populates="listings")
     photos: Mapped[list[ListingPhoto]] = relationship(
@@ -356,6 +399,9 @@ class Match(Base):
     __tablename__ = "matches"
     __table_args__ = (
         UniqueConstraint("seeker_id", "listing_id", name="uq_matches_seeker_listing"),
+        # Keyset order of the match feed: score DESC NULLS LAST, id.
+        sa.Index("ix_matches_seeker_feed", "seeker_id", sa.text("score DESC NULLS LAST"), "id"),
+        sa.Index("ix_matches_listing_feed", "listing_id", sa.text("score DESC NULLS LAST"), "id"),
     )
 
     id: Mapped[str] = mapped_column(sa.String(length=64), primary_key=True)
@@ -379,6 +425,189 @@ class Match(Base):
         sa.DateTime(timezone=True),
         nullable=True,
     )
+    version: Mapped[int] = mapped_column(
+        sa.Integer,
+        nullable=False,
+        server_default=sa.text("1"),
+    )
 
     seeker: Mapped[SeekerProfile] = relationship("SeekerProfile", back_populates="matches")
     listing: Mapped[Listing] = relationship("Listing", back_populates="matches")
+
+
+class NotificationOutbox(Base):
+    __tablename__ = "notification_outbox"
+    __table_args__ = (
+        sa.Index(
+            "ix_notification_outbox_pending",
+            "available_at",
+            postgresql_where=sa.text("processed_at IS NULL"),
+        ),
+    )
+
+    id: Mapped[str] = mapped_column(sa.String(length=64), primary_key=True)
+    recipient_user_id: Mapped[str] = mapped_column(
+        sa.String(length=64),
+        ForeignKey("users.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    event_type: Mapped[str] = mapped_column(sa.Text, nullable=False)
+    payload: Mapped[dict[str, Any]] = mapped_column(JSONB, nullable=False)
+    attempts: Mapped[int] = mapped_column(
+        sa.Integer,
+        nullable=False,
+        server_default=sa.text("0"),
+    )
+    created_at: Mapped[datetime] = mapped_column(
+        sa.DateTime(timezone=True),
+        nullable=False,
+        server_default=sa.text("now()"),
+    )
+    available_at: Mapped[datetime] = mapped_column(
+        sa.DateTime(timezone=True),
+        nullable=False,
+        server_default=sa.text("now()"),
+    )
+    processed_at: Mapped[datetime | None] = mapped_column(
+        sa.DateTime(timezone=True),
+        nullable=True,
+    )
+    last_error: Mapped[str | None] = mapped_column(sa.Text, nullable=True)
+
+
+class SeekerSeenSet(Base):
+    """Listings a seeker has swiped, as a serialized ``SeenSet`` of ``listings.seq``."""
+
+    __tablename__ = "seeker_seen_sets"
+
+    seeker_id: Mapped[str] = mapped_column(
+        sa.String(length=64),
+        ForeignKey("seeker_profiles.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    bitmap: Mapped[bytes] = mapped_column(sa.LargeBinary, nullable=False)
+    updated_at: Mapped[datetime] = mapped_column(
+        sa.DateTime(timezone=True),
+        nullable=False,
+        server_default=sa.text("now()"),
+    )
+
+
+class ListingNeighbor(Base):
+    """Top-k listings co-liked with ``listing_id``, rebuilt offline from ``seeker_swipes``."""
+
+    __tablename__ = "listing_neighbors"
+
+    listing_id: Mapped[str] = mapped_column(
+        sa.String(length=64),
+        ForeignKey("listings.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    neighbor_id: Mapped[str] = mapped_column(
+        sa.String(length=64),
+        ForeignKey("listings.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    similarity: Mapped[float] = mapped_column(sa.Float, nullable=False)
+
+
+class SavedSearch(Base):
+    """A seeker's saved search, matched against listings as they change."""
+
+    __tablename__ = "saved_searches"
+    __table_args__ = (
+        # Reverse lookup for a changed listing: its city, then the price ceilings above it.
+        sa.Index("ix_saved_searches_lookup", "city_key", "max_price"),
+        sa.Index("ix_saved_searches_seeker", "seeker_id"),
+    )
+
+    id: Mapped[str] = mapped_column(sa.String(length=64), primary_key=True)
+    seeker_id: Mapped[str] = mapped_column(
+        sa.String(length=64),
+        ForeignKey("seeker_profiles.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    city: Mapped[str] = mapped_column(sa.Text, nullable=False)
+    # normalize_city_key(city), set by the repo on write.
+    city_key: Mapped[str] = mapped_column(sa.Text, nullable=False)
+    max_price: Mapped[Decimal | None] = mapped_column(sa.Numeric(10, 2), nullable=True)
+    move_in: Mapped[date | None] = mapped_column(sa.Date, nullable=True)
+    move_out: Mapped[date | None] = mapped_column(sa.Date, nullable=True)
+    interests_csv: Mapped[str] = mapped_column(sa.Text, nullable=False, server_default="")
+    created_at: Mapped[datetime] = mapped_column(
+        sa.DateTime(timezone=True),
+        nullable=False,
+        server_default=sa.text("now()"),
+    )
+
+
+class SearchAlert(Base):
+    """A listing that matched a saved search; the seeker's alerts inbox."""
+
+    __tablename__ = "search_alerts"
+    __table_args__ = (
+        UniqueConstraint("search_id", "listing_id", name="uq_search_alerts_search_listing"),
+        sa.Index("ix_search_alerts_inbox", "seeker_id", "created_at"),
+    )
+
+    id: Mapped[str] = mapped_column(sa.String(length=64), primary_key=True)
+    seeker_id: Mapped[str] = mapped_column(
+        sa.String(length=64),
+        ForeignKey("seeker_profiles.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    search_id: Mapped[str] = mapped_column(
+        sa.String(length=64),
+        ForeignKey("saved_searches.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    listing_id: Mapped[str] = mapped_column(
+        sa.String(length=64),
+        ForeignKey("listings.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    created_at: Mapped[datetime] = mapped_column(
+        sa.DateTime(timezone=True),
+        nullable=False,
+        server_default=sa.text("now()"),
+    )
+    read_at: Mapped[datetime | None] = mapped_column(sa.DateTime(timezone=True), nullable=True)
+
+
+class SwipeEvent(Base):
+    """Append-only swipe history, range-partitioned by month on ``created_at``.
+
+    ``seeker_swipes``/``host_swipes`` stay as the compact current-decision tables the
+    queues anti-join against. No foreign keys, so profile deletes never rewrite history
+    and old partitions can be detached as-is.
+    """
+
+    __tablename__ = "swipe_events"
+    __table_args__ = (
+        CheckConstraint("actor_kind IN ('SEEKER', 'HOST')", name="ck_swipe_events_actor_kind"),
+        CheckConstraint("action IN ('LIKE', 'PASS', 'UNDO')", name="ck_swipe_events_action"),
+        sa.Index("ix_swipe_events_actor", "actor_id", "created_at"),
+        {"postgresql_partition_by": "RANGE (created_at)"},
+    )
+
+    # The partition key has to be part of the primary key.
+    created_at: Mapped[datetime] = mapped_column(
+        sa.DateTime(timezone=True),
+        primary_key=True,
+        server_default=sa.text("now()"),
+    )
+    id: Mapped[str] = mapped_column(sa.String(length=64), primary_key=True)
+    actor_kind: Mapped[str] = mapped_column(sa.String(length=8), nullable=False)
+    actor_id: Mapped[str] = mapped_column(sa.String(length=64), nullable=False)
+    target_id: Mapped[str] = mapped_column(sa.String(length=64), nullable=False)
+    action: Mapped[str] = mapped_column(sa.String(length=8), nullable=False)
+
+
+# Catch-all so inserts never fail when the monthly partitions were not created ahead of time.
+sa.event.listen(
+    SwipeEvent.__table__,
+    "after_create",
+    sa.DDL(  # type: ignore[no-untyped-call]  # DDL.__init__ is unannotated in SQLAlchemy 2.0
+        "CREATE TABLE IF NOT EXISTS swipe_events_default PARTITION OF swipe_events DEFAULT"
+    ).execute_if(dialect="postgresql"),
+)
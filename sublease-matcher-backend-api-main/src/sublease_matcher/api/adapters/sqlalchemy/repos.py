@@ -1,19 +1,51 @@
 from __future__ import annotations
 
-from collections.abc import Sequence
-from datetime import datetime
+from collections.abc import Callable, Iterable, Sequence
+from datetime import UTC, datetime, timedelta
 from decimal import Decimal
-from typing import Literal, cast
+from typing import Any, Literal, cast
 from uuid import uuid4
 
 import sqlalchemy as sa
 from sqlalchemy import select
-from sqlalchemy.orm import Session
+from sqlalchemy.dialects.postgresql import ARRAY, aggregate_order_by
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session, selectinload
+from sublease_matcher.core.domain import normalize_city_key
+from sublease_matcher.core.geo import GeoPoint, Radius, geohash, locate
 
 from ...interfaces.errors import NotFoundError
-from ...interfaces.repos import HostRepo, ListingRepo, MatchRepo, SeekerRepo, SwipeRepo
-from ...interfaces.types import HostDict, ListingDict, MatchDict, SeekerDict, SwipeDict
+from ...interfaces.repos import (
+    HostRepo,
+    ListingNeighborRepo,
+    ListingRepo,
+    MatchRepo,
+    OutboxRepo,
+    SavedSearchRepo,
+    SearchAlertRepo,
+    SeekerRepo,
+    SeenSetRepo,
+    SwipeRepo,
+)
+from ...interfaces.types import (
+    HostDict,
+    ListingDict,
+    MatchDict,
+    MatchUpsertDict,
+    OutboxEventDict,
+    RecipientDict,
+    SavedSearchDict,
+    SearchAlertDict,
+    SeekerDict,
+    SwipeDict,
+)
+from ...seen_set import SeenSet
+from ..roommate_features import encode_roommates
 from . import models
+from .geo import within_clause
+from .listing_neighbors import store_neighbors
+from .search import refresh_search_vectors, search_statement
+from .swipe_buffer import BufferedSwipe, SwipeBuffer
 
 
 def _csv_from_list(values: Sequence[str] | None) -> str:
@@ -26,6 +58,13 @@ def _list_from_csv(csv_value: str | None) -> list[str]:
     return [item for item in csv_value.split(",") if item]
 
 
+def _set_location(
+    db_obj: models.SeekerProfile | models.Listing, point: GeoPoint | None
+) -> None:
+    db_obj.lat, db_obj.lon = point if point is not None else (None, None)
+    db_obj.geohash = geohash(point) if point is not None else None
+
+
 class SqlAlchemyUserRepo:
     """Utility repo to ensure FK rows exist for user-facing profiles."""
 
@@ -68,12 +107,17 @@ class SqlAlchemySeekerRepo(SeekerRepo):
             "budget_min": seeker.budget_min,
             "budget_max": seeker.budget_max,
             "city": seeker.city,
+            "city_key": seeker.city_key,
+            "lat": seeker.lat,
+            "lon": seeker.lon,
+            "geohash": seeker.geohash,
             "interests_csv": seeker.interests_csv or "",
             "interests": _list_from_csv(seeker.interests_csv),
             "contact_email": seeker.contact_email,
             "major": seeker.major,
             "hidden": not bool(seeker.visible),
             "photos": photos,
+            "version": seeker.version,
         }
 
     def get(self, seeker_id: str) -> SeekerDict | None:
@@ -110,6 +154,9 @@ class SqlAlchemySeekerRepo(SeekerRepo):
         ):
             if field in seeker:
                 setattr(db_obj, field, seeker.get(field))
+        if "city" in seeker:
+            db_obj.city_key = normalize_city_key(db_obj.city) or None
+            _set_location(db_obj, locate(db_obj.city))
         if "interests_csv" in seeker:
             db_obj.interests_csv = seeker.get("interests_csv") or ""
         if "photos" in seeker:
@@ -123,12 +170,39 @@ class SqlAlchemySeekerRepo(SeekerRepo):
             db_obj.visible = not bool(seeker.get("hidden"))
         if db_obj.visible is None:
             db_obj.visible = True
+        db_obj.version = (db_obj.version or 0) + 1
         self.session.flush()
         # Refresh to ensure relationships are accessible if needed immediately
         # self.session.refresh(db_obj) 
         return self._to_dict(db_obj)
 
-    def queue_for_host(self, host_id: str) -> Sequence[SeekerDict]:
+    def get_version(self, seeker_id: str) -> int | None:
+        stmt = select(models.SeekerProfile.version).where(models.SeekerProfile.id == seeker_id)
+        return self.session.scalar(stmt)
+
+    def get_version_by_user(self, user_id: str) -> tuple[str, int] | None:
+        stmt = select(models.SeekerProfile.id, models.SeekerProfile.version).where(
+            models.SeekerProfile.user_id == user_id
+        )
+        row = self.session.execute(stmt).first()
+        return (row.id, row.version) if row else None
+
+    def get_many(self, seeker_ids: Sequence[str]) -> dict[str, SeekerDict]:
+        if not seeker_ids:
+            return {}
+        stmt = (
+            select(models.SeekerProfile)
+            .where(models.SeekerProfile.id.in_(seeker_ids))
+            .options(
+                selectinload(models.SeekerProfile.user),
+                selectinload(models.SeekerProfile.photos),
+            )
+        )
+        return {seeker.id: self._to_dict(seeker) for seeker in self.session.scalars(stmt)}
+
+    def queue_for_host(
+        self, host_id: str, *, within: Radius | None = None
+    ) -> Sequence[SeekerDict]:
         from sqlalchemy.orm import selectinload
         stmt = (
             select(models.SeekerProfile)
@@ -139,9 +213,37 @@ class SqlAlchemySeekerRepo(SeekerRepo):
             )
             .options(selectinload(models.SeekerProfile.user), selectinload(models.SeekerProfile.photos))
         )
+        if within is not None:
+            profile = models.SeekerProfile
+            stmt = stmt.where(within_clause(profile.lat, profile.lon, profile.geohash, within))
         seekers = self.session.scalars(stmt).all()
         return [self._to_dict(seeker) for seeker in seekers]
 
+    def interested_in(self, listing: ListingDict) -> Sequence[SeekerDict]:
+        # ix_seeker_profiles_interest narrows to the city and budget range; the
+        # move-in check runs on those rows only.
+        profile = models.SeekerProfile
+        city_key = listing.get("city_key") or normalize_city_key(listing.get("city"))
+        if not city_key:
+            return []
+        stmt = (
+            select(profile)
+            .where(profile.city_key == city_key, profile.visible == True)  # noqa: E712
+            .order_by(profile.id)
+            .options(selectinload(profile.user), selectinload(profile.photos))
+        )
+        price = listing.get("price_per_month")
+        if price is not None:
+            stmt = stmt.where(sa.or_(profile.budget_max.is_(None), profile.budget_max >= price))
+        # The listing has to be available on the seeker's move-in date.
+        move_in = profile.available_from
+        start, end = listing.get("available_from"), listing.get("available_to")
+        if start is not None:
+            stmt = stmt.where(sa.or_(move_in.is_(None), move_in >= start))
+        if end is not None:
+            stmt = stmt.where(sa.or_(move_in.is_(None), move_in <= end))
+        return [self._to_dict(seeker) for seeker in self.session.scalars(stmt)]
+
 
 class SqlAlchemyHostRepo(HostRepo):
     def __init__(self, session: Session, users: SqlAlchemyUserRepo) -> None:
@@ -183,6 +285,14 @@ class SqlAlchemyHostRepo(HostRepo):
             if field in host:
                 setattr(db_obj, field, host.get(field))
         self.session.flush()
+        if "bio" in host:
+            refresh_search_vectors(self.session, host_id=db_obj.id)
+            # Listing rows embed the host bio: bump them so ETags and cached copies move on.
+            self.session.execute(
+                sa.update(models.Listing)
+                .where(models.Listing.host_id == db_obj.id)
+                .values(version=models.Listing.version + 1)
+            )
         return self._to_dict(db_obj)
 
 
@@ -201,12 +311,19 @@ class SqlAlchemyListingRepo(ListingRepo):
             "title": listing.title,
             "price_per_month": listing.price_per_month,
             "city": listing.city,
+            "city_key": listing.city_key,
             "state": listing.state,
+            "lat": listing.lat,
+            "lon": listing.lon,
+            "geohash": listing.geohash,
             "available_from": listing.available_from,
             "available_to": listing.available_to,
             "status": status_value,
             "bio": listing.host.bio if listing.host else None,
             "photos": photos,
+            "roommate_features": listing.roommate_features or b"",
+            "version": listing.version,
+            "seq": listing.seq,
         }
         data["roommates"] = [
             {
@@ -260,7 +377,12 @@ class SqlAlchemyListingRepo(ListingRepo):
         ):
             if field in listing:
                 setattr(db_obj, field, listing.get(field))
+        if "city" in listing:
+            db_obj.city_key = normalize_city_key(db_obj.city) or None
+        if "city" in listing or "state" in listing:
+            _set_location(db_obj, locate(db_obj.city, db_obj.state))
         if "roommates" in listing:
+            db_obj.roommate_features = encode_roommates(listing.get("roommates"))
             db_obj.roommates.clear()
             for roommate in listing.get("roommates") or []:
                 interests_value = roommate.get("interests")
@@ -295,9 +417,37 @@ class SqlAlchemyListingRepo(ListingRepo):
                             position=idx
                         )
                     )
+        # Covers host bio/contact too: hosts are only written alongside their listing.
+        db_obj.version = (db_obj.version or 0) + 1
         self.session.flush()
+        refresh_search_vectors(self.session, listing_ids=[db_obj.id])
         return self._to_dict(db_obj)
 
+    def get_version(self, listing_id: str) -> int | None:
+        stmt = select(models.Listing.version).where(models.Listing.id == listing_id)
+        return self.session.scalar(stmt)
+
+    def get_version_by_host(self, host_id: str) -> tuple[str, int] | None:
+        stmt = select(models.Listing.id, models.Listing.version).where(
+            models.Listing.host_id == host_id
+        )
+        row = self.session.execute(stmt).first()
+        return (row.id, row.version) if row else None
+
+    def get_many(self, listing_ids: Sequence[str]) -> dict[str, ListingDict]:
+        if not listing_ids:
+            return {}
+        stmt = (
+            select(models.Listing)
+            .where(models.Listing.id.in_(listing_ids))
+            .options(
+                selectinload(models.Listing.host),
+                selectinload(models.Listing.photos),
+                selectinload(models.Listing.roommates),
+            )
+        )
+        return {listing.id: self._to_dict(listing) for listing in self.session.scalars(stmt)}
+
     def search(
         self,
         city: str | None = None,
@@ -305,7 +455,7 @@ class SqlAlchemyListingRepo(ListingRepo):
     ) -> Sequence[ListingDict]:
         stmt = select(models.Listing)
         if city:
-            stmt = stmt.where(models.Listing.city == city)
+            stmt = stmt.where(models.Listing.city_key == normalize_city_key(city))
         if max_price is not None:
             stmt = stmt.where(
                 sa.and_(
@@ -316,8 +466,13 @@ class SqlAlchemyListingRepo(ListingRepo):
         listings = self.session.scalars(stmt).all()
         return [self._to_dict(listing) for listing in listings]
 
-    def queue_for_seeker(self, seeker_id: str) -> Sequence[ListingDict]:
-        from sqlalchemy.orm import selectinload
+    def queue_for_seeker(
+        self,
+        seeker_id: str,
+        *,
+        seen: SeenSet | None = None,
+        within: Radius | None = None,
+    ) -> Sequence[ListingDict]:
         stmt = (
             select(models.Listing)
             .join(models.HostProfile, models.Listing.host_id == models.HostProfile.id)
@@ -327,8 +482,30 @@ class SqlAlchemyListingRepo(ListingRepo):
             )
             .options(selectinload(models.Listing.photos))
         )
-        listings = self.session.scalars(stmt).all()
-        return [self._to_dict(listing) for listing in listings]
+        if within is not None:
+            listing = models.Listing
+            stmt = stmt.where(within_clause(listing.lat, listing.lon, listing.geohash, within))
+        if seen:
+            # The seen-set ships as one array parameter instead of anti-joining the
+            # seeker's swipe rows, and seen listings are never loaded.
+            seen_seqs = sa.literal(list(seen), ARRAY(sa.BigInteger))
+            stmt = stmt.where(models.Listing.seq != sa.all_(seen_seqs))
+        return [self._to_dict(listing) for listing in self.session.scalars(stmt)]
+
+    def search_text(
+        self,
+        query: str,
+        *,
+        limit: int,
+        after: tuple[float, str] | None = None,
+        within: Radius | None = None,
+    ) -> Sequence[tuple[ListingDict, float]]:
+        stmt = search_statement(query, limit=limit, after=after, within=within).options(
+            selectinload(models.Listing.host),
+            selectinload(models.Listing.photos),
+            selectinload(models.Listing.roommates),
+        )
+        return [(self._to_dict(listing), rank) for listing, rank in self.session.execute(stmt)]
 
 
 class SqlAlchemyMatchRepo(MatchRepo):
@@ -344,6 +521,7 @@ class SqlAlchemyMatchRepo(MatchRepo):
             "status": status_value,
             "score": float(match.score) if isinstance(match.score, Decimal) else match.score,
             "matched_at": match.matched_at,
+            "version": match.version,
         }
 
     def list_for_seeker(self, seeker_id: str) -> Sequence[MatchDict]:
@@ -360,6 +538,78 @@ class SqlAlchemyMatchRepo(MatchRepo):
         matches = self.session.scalars(stmt).all()
         return [self._to_dict(match) for match in matches]
 
+    def get_for_pair(self, seeker_id: str, listing_id: str) -> MatchDict | None:
+        stmt = select(models.Match).where(
+            models.Match.seeker_id == seeker_id,
+            models.Match.listing_id == listing_id,
+        )
+        match = self.session.scalars(stmt).first()
+        return self._to_dict(match) if match else None
+
+    def feed_page(
+        self,
+        *,
+        seeker_id: str | None,
+        host_id: str | None,
+        limit: int,
+        after: tuple[float | None, str] | None = None,
+    ) -> Sequence[MatchDict]:
+        owners = []
+        if seeker_id:
+            owners.append(models.Match.seeker_id == seeker_id)
+        if host_id:
+            owners.append(models.Listing.host_id == host_id)
+        if not owners:
+            return []
+        stmt = (
+            select(models.Match)
+            .join(models.Listing, models.Match.listing_id == models.Listing.id)
+            .where(sa.or_(*owners))
+        )
+        if after is not None:
+            score, last_id = after
+            if score is None:
+                stmt = stmt.where(models.Match.score.is_(None), models.Match.id > last_id)
+            else:
+                boundary = Decimal(str(score))
+                stmt = stmt.where(
+                    sa.or_(
+                        models.Match.score < boundary,
+                        sa.and_(models.Match.score == boundary, models.Match.id > last_id),
+                        models.Match.score.is_(None),
+                    )
+                )
+        stmt = stmt.order_by(models.Match.score.desc().nulls_last(), models.Match.id).limit(limit)
+        return [self._to_dict(match) for match in self.session.scalars(stmt)]
+
+    def _version_tag(self, *parts: Any) -> sa.Select[Any]:
+        # One aggregate row: no match, listing or profile objects are materialised.
+        part = sa.func.concat_ws(":", models.Match.id, *parts)
+        digest = sa.func.md5(
+            sa.func.coalesce(
+                sa.func.string_agg(part, aggregate_order_by(sa.literal(","), models.Match.id)),
+                "",
+            )
+        )
+        return select(digest).select_from(models.Match)
+
+    def version_tag_for_seeker(self, seeker_id: str) -> str:
+        stmt = (
+            self._version_tag(models.Match.version, models.Listing.version)
+            .join(models.Listing, models.Match.listing_id == models.Listing.id)
+            .where(models.Match.seeker_id == seeker_id)
+        )
+        return self.session.scalar(stmt) or ""
+
+    def version_tag_for_host(self, host_id: str) -> str:
+        stmt = (
+            self._version_tag(models.Match.version, models.SeekerProfile.version)
+            .join(models.Listing, models.Match.listing_id == models.Listing.id)
+            .join(models.SeekerProfile, models.Match.seeker_id == models.SeekerProfile.id)
+            .where(models.Listing.host_id == host_id)
+        )
+        return self.session.scalar(stmt) or ""
+
     def upsert(
         self,
         seeker_id: str,
@@ -367,47 +617,304 @@ class SqlAlchemyMatchRepo(MatchRepo):
         status: str,
         score: float | None,
     ) -> MatchDict:
-        # Look up by unique constraint (seeker_id, listing_id) instead of constructing a composite ID
-        stmt = select(models.Match).where(
-            models.Match.seeker_id == seeker_id,
-            models.Match.listing_id == listing_id
-        )
-        db_obj = self.session.scalars(stmt).first()
-        
         normalized_status_value = status.upper()
         if normalized_status_value not in {"PENDING", "MUTUAL"}:
             raise ValueError("status must be PENDING or MUTUAL")
         normalized_status = cast(Literal["PENDING", "MUTUAL"], normalized_status_value)
-        
-        if db_obj is None:
-            # For new objects, use a UUID for the ID to avoid length limits
-            db_obj = models.Match(
-                id=str(uuid4()),
-                seeker_id=seeker_id,
-                listing_id=listing_id,
-                status=normalized_status,
-                matched_at=datetime.utcnow() if normalized_status == "MUTUAL" else None
+        row: MatchUpsertDict = {
+            "seeker_id": seeker_id,
+            "listing_id": listing_id,
+            "status": normalized_status,
+            "score": score,
+        }
+        return self.upsert_many([row])[0]
+
+    def upsert_many(self, rows: Sequence[MatchUpsertDict]) -> list[MatchDict]:
+        if not rows:
+            return []
+        # ON CONFLICT cannot touch the same row twice in one statement: last write per pair wins.
+        latest = {(row["seeker_id"], row["listing_id"]): row for row in rows}
+        stamp = datetime.now(UTC)
+        stmt = upsert_matches_statement(latest.values(), matched_at=stamp)
+        matches = self.session.scalars(stmt, execution_options={"populate_existing": True})
+        by_pair: dict[tuple[str, str], MatchDict] = {}
+        for match in matches:
+            saved = self._to_dict(match)
+            # COALESCE keeps an earlier matched_at, so only the promoting write sees our stamp.
+            saved["became_mutual"] = match.matched_at == stamp
+            by_pair[(match.seeker_id, match.listing_id)] = saved
+        return [by_pair[(row["seeker_id"], row["listing_id"])] for row in rows]
+
+
+def upsert_matches_statement(
+    rows: Iterable[MatchUpsertDict], *, matched_at: datetime
+) -> sa.Insert:
+    """One ``INSERT .. ON CONFLICT (seeker_id, listing_id) DO UPDATE .. RETURNING`` round-trip."""
+    values = []
+    for row in rows:
+        status = row["status"].upper()
+        if status not in {"PENDING", "MUTUAL"}:
+            raise ValueError("status must be PENDING or MUTUAL")
+        score = row["score"]
+        values.append(
+            {
+                # New rows get a UUID rather than a composite id to stay within the column length.
+                "id": str(uuid4()),
+                "seeker_id": row["seeker_id"],
+                "listing_id": row["listing_id"],
+                "status": status,
+                "score": None if score is None else Decimal(str(score)),
+                "matched_at": matched_at if status == "MUTUAL" else None,
+                "version": 1,
+            }
+        )
+    table = models.Match.__table__
+    stmt = pg_insert(models.Match).values(values)
+    return stmt.on_conflict_do_update(
+        constraint="uq_matches_seeker_listing",
+        set_={
+            "status": stmt.excluded.status,
+            "score": stmt.excluded.score,
+            "matched_at": sa.func.coalesce(table.c.matched_at, stmt.excluded.matched_at),
+            "version": table.c.version + 1,
+        },
+    ).returning(models.Match)
+
+
+class SqlAlchemySeenSetRepo(SeenSetRepo):
+    def __init__(self, session: Session) -> None:
+        self.session = session
+
+    def get(self, seeker_id: str) -> SeenSet:
+        stmt = select(models.SeekerSeenSet.bitmap).where(
+            models.SeekerSeenSet.seeker_id == seeker_id
+        )
+        return SeenSet.from_bytes(self.session.scalar(stmt))
+
+    def get_many(self, seeker_ids: Sequence[str]) -> dict[str, SeenSet]:
+        if not seeker_ids:
+            return {}
+        stmt = select(models.SeekerSeenSet.seeker_id, models.SeekerSeenSet.bitmap).where(
+            models.SeekerSeenSet.seeker_id.in_(seeker_ids)
+        )
+        return {
+            seeker_id: SeenSet.from_bytes(bitmap)
+            for seeker_id, bitmap in self.session.execute(stmt)
+        }
+
+    def _update(self, seeker_id: str, listing_id: str, *, add: bool) -> None:
+        seq = self.session.scalar(select(models.Listing.seq).where(models.Listing.id == listing_id))
+        if seq is None:
+            return
+        self.session.execute(
+            pg_insert(models.SeekerSeenSet)
+            .values(seeker_id=seeker_id, bitmap=b"")
+            .on_conflict_do_nothing(index_elements=["seeker_id"])
+        )
+        # Row lock: two swipes by the same seeker must not overwrite each other's bit.
+        row = self.session.scalars(
+            select(models.SeekerSeenSet)
+            .where(models.SeekerSeenSet.seeker_id == seeker_id)
+            .with_for_update()
+        ).one()
+        seen = SeenSet.from_bytes(row.bitmap)
+        if seen.add(seq) if add else seen.discard(seq):
+            row.bitmap = seen.to_bytes()
+            row.updated_at = datetime.now(UTC)
+            self.session.flush()
+
+    def add(self, seeker_id: str, listing_id: str) -> None:
+        self._update(seeker_id, listing_id, add=True)
+
+    def discard(self, seeker_id: str, listing_id: str) -> None:
+        self._update(seeker_id, listing_id, add=False)
+
+
+class SqlAlchemyListingNeighborRepo(ListingNeighborRepo):
+    def __init__(self, session: Session) -> None:
+        self.session = session
+
+    def similar_to(self, listing_ids: Sequence[str]) -> dict[str, float]:
+        if not listing_ids:
+            return {}
+        stmt = (
+            select(
+                models.ListingNeighbor.neighbor_id,
+                sa.func.max(models.ListingNeighbor.similarity),
             )
-            self.session.add(db_obj)
-        else:
-            # For updates, we assign the string directly.
-            db_obj.status = normalized_status
-            if normalized_status == "MUTUAL" and not db_obj.matched_at:
-                db_obj.matched_at = datetime.utcnow()
-                
-        if score is None:
-            db_obj.score = None
-        else:
-            db_obj.score = Decimal(str(score))
-        
+            .where(models.ListingNeighbor.listing_id.in_(listing_ids))
+            .group_by(models.ListingNeighbor.neighbor_id)
+        )
+        return {neighbor_id: similarity for neighbor_id, similarity in self.session.execute(stmt)}
+
+    def replace(self, rows: Iterable[tuple[str, Sequence[tuple[str, float]]]]) -> int:
+        return store_neighbors(self.session.connection(), rows)
+
+
+class SqlAlchemySavedSearchRepo(SavedSearchRepo):
+    def __init__(self, session: Session) -> None:
+        self.session = session
+
+    def _to_dict(self, row: models.SavedSearch) -> SavedSearchDict:
+        return {
+            "id": row.id,
+            "seeker_id": row.seeker_id,
+            "city": row.city,
+            "city_key": row.city_key,
+            "max_price": row.max_price,
+            "move_in": row.move_in,
+            "move_out": row.move_out,
+            "interests": _list_from_csv(row.interests_csv),
+            "created_at": row.created_at or datetime.now(UTC),
+        }
+
+    def add(self, search: SavedSearchDict) -> SavedSearchDict:
+        row = models.SavedSearch(
+            id=search.get("id") or str(uuid4()),
+            seeker_id=search["seeker_id"],
+            city=search["city"],
+            city_key=normalize_city_key(search["city"]),
+            max_price=search.get("max_price"),
+            move_in=search.get("move_in"),
+            move_out=search.get("move_out"),
+            interests_csv=",".join(search.get("interests") or ()),
+        )
+        self.session.add(row)
         self.session.flush()
-        return self._to_dict(db_obj)
+        return self._to_dict(row)
 
+    def list_for_seeker(self, seeker_id: str) -> Sequence[SavedSearchDict]:
+        stmt = (
+            select(models.SavedSearch)
+            .where(models.SavedSearch.seeker_id == seeker_id)
+            .order_by(models.SavedSearch.created_at, models.SavedSearch.id)
+        )
+        return [self._to_dict(row) for row in self.session.scalars(stmt)]
 
-class SqlAlchemySwipeRepo(SwipeRepo):
+    def delete(self, seeker_id: str, search_id: str) -> bool:
+        result = cast(
+            sa.CursorResult[Any],
+            self.session.execute(
+                sa.delete(models.SavedSearch).where(
+                    models.SavedSearch.id == search_id,
+                    models.SavedSearch.seeker_id == seeker_id,
+                )
+            ),
+        )
+        return bool(result.rowcount)
+
+    def matching(self, listing: ListingDict) -> Sequence[SavedSearchDict]:
+        # ix_saved_searches_lookup narrows to the city and price range; dates are
+        # checked on those rows, interests on the few that remain.
+        search = models.SavedSearch
+        city_key = listing.get("city_key") or normalize_city_key(listing.get("city"))
+        if not city_key:
+            return []
+        stmt = select(search).where(search.city_key == city_key).order_by(search.id)
+        price = listing.get("price_per_month")
+        if price is not None:
+            stmt = stmt.where(sa.or_(search.max_price.is_(None), search.max_price >= price))
+        start, end = listing.get("available_from"), listing.get("available_to")
+        if start is not None:
+            stmt = stmt.where(sa.or_(search.move_in.is_(None), search.move_in >= start))
+        if end is not None:
+            stmt = stmt.where(
+                sa.or_(search.move_in.is_(None), search.move_in <= end),
+                sa.or_(search.move_out.is_(None), search.move_out <= end),
+            )
+        roommate_interests = {
+            interest.lower()
+            for roommate in listing.get("roommates") or ()
+            for interest in roommate.get("interests") or ()
+        }
+        found = [self._to_dict(row) for row in self.session.scalars(stmt)]
+        return [
+            row
+            for row in found
+            if not row["interests"] or roommate_interests.intersection(row["interests"])
+        ]
+
+
+class SqlAlchemySearchAlertRepo(SearchAlertRepo):
     def __init__(self, session: Session) -> None:
         self.session = session
 
+    def add_many(self, rows: Sequence[tuple[str, str, str]]) -> int:
+        if not rows:
+            return 0
+        stmt = (
+            pg_insert(models.SearchAlert)
+            .values(
+                [
+                    {
+                        "id": str(uuid4()),
+                        "seeker_id": seeker_id,
+                        "search_id": search_id,
+                        "listing_id": listing_id,
+                    }
+                    for seeker_id, search_id, listing_id in rows
+                ]
+            )
+            .on_conflict_do_nothing(index_elements=["search_id", "listing_id"])
+            .returning(models.SearchAlert.id)
+        )
+        return len(self.session.execute(stmt).all())
+
+    def inbox(
+        self, seeker_id: str, *, unread_only: bool = False, limit: int = 50
+    ) -> Sequence[SearchAlertDict]:
+        alert = models.SearchAlert
+        stmt = (
+            select(alert)
+            .where(alert.seeker_id == seeker_id)
+            .order_by(alert.created_at.desc(), alert.id.desc())
+            .limit(limit)
+        )
+        if unread_only:
+            stmt = stmt.where(alert.read_at.is_(None))
+        return [
+            {
+                "id": row.id,
+                "seeker_id": row.seeker_id,
+                "search_id": row.search_id,
+                "listing_id": row.listing_id,
+                "created_at": row.created_at,
+                "read_at": row.read_at,
+            }
+            for row in self.session.scalars(stmt)
+        ]
+
+    def mark_read(self, seeker_id: str, alert_ids: Sequence[str]) -> int:
+        if not alert_ids:
+            return 0
+        result = cast(
+            sa.CursorResult[Any],
+            self.session.execute(
+                sa.update(models.SearchAlert)
+                .where(
+                    models.SearchAlert.seeker_id == seeker_id,
+                    models.SearchAlert.id.in_(alert_ids),
+                    models.SearchAlert.read_at.is_(None),
+                )
+                .values(read_at=sa.func.now())
+            ),
+        )
+        return result.rowcount or 0
+
+
+class SqlAlchemySwipeRepo(SwipeRepo):
+    def __init__(
+        self,
+        session: Session,
+        *,
+        buffer: SwipeBuffer | None = None,
+        on_commit: Callable[[Callable[[], None]], None] | None = None,
+    ) -> None:
+        self.session = session
+        # Buffered passes are only handed to the buffer once the request commits.
+        self._buffer = buffer if on_commit is not None else None
+        self._on_commit = on_commit
+
     def _seeker_for_user(self, user_id: str) -> models.SeekerProfile | None:
         stmt = select(models.SeekerProfile).where(models.SeekerProfile.user_id == user_id)
         return self.session.scalars(stmt).first()
@@ -460,80 +967,124 @@ class SqlAlchemySwipeRepo(SwipeRepo):
             )
         return data
 
+    def _log(
+        self, actor_kind: str, actor_id: str, target_id: str, action: str, at: datetime
+    ) -> None:
+        # History only ever grows; the *_swipes tables hold the current decision per pair.
+        self.session.execute(
+            sa.insert(models.SwipeEvent).values(
+                id=str(uuid4()),
+                created_at=at,
+                actor_kind=actor_kind,
+                actor_id=actor_id,
+                target_id=target_id,
+                action=action,
+            )
+        )
+
+    def _format_buffered(self, swipe: BufferedSwipe) -> SwipeDict:
+        return self._format_swipe(
+            swipe_id=swipe.id,
+            user_id=swipe.user_id,
+            target_id=swipe.target_id,
+            decision=swipe.decision,
+            created_at=swipe.created_at,
+        )
+
+    def _buffer_pass(
+        self,
+        actor_kind: Literal["SEEKER", "HOST"],
+        actor_id: str,
+        user_id: str,
+        target_id: str,
+        at: datetime,
+    ) -> SwipeDict:
+        assert self._buffer is not None and self._on_commit is not None
+        swipe = BufferedSwipe(
+            id=str(uuid4()),
+            actor_kind=actor_kind,
+            actor_id=actor_id,
+            user_id=user_id,
+            target_id=target_id,
+            decision="PASS",
+            created_at=at,
+        )
+        buffer = self._buffer
+        self._on_commit(lambda: buffer.append(swipe))
+        return self._format_buffered(swipe)
+
     def record_swipe(self, swiper_id: str, target_id: str, decision: str) -> SwipeDict:
         normalized = "LIKE" if decision.lower() == "like" else "PASS"
-        now = datetime.utcnow()
+        now = datetime.now(UTC)
+        buffered = normalized == "PASS" and self._buffer is not None
         if target_id.startswith("listing-"):
             seeker = self._seeker_for_user(swiper_id)
             listing = self.session.get(models.Listing, target_id)
             if seeker is None or listing is None:
                 raise NotFoundError("Seeker or listing not found for swipe")
-            
-            # Check for existing swipe
-            stmt = select(models.SeekerSwipe).where(
-                models.SeekerSwipe.seeker_id == seeker.id,
-                models.SeekerSwipe.listing_id == listing.id
-            )
-            swipe = self.session.scalars(stmt).first()
+            if buffered:
+                return self._buffer_pass("SEEKER", seeker.id, swiper_id, listing.id, now)
 
-            if swipe:
-                swipe.decision = normalized
-                swipe.created_at = now
-            else:
-                swipe = models.SeekerSwipe(
-                    id=str(uuid4()),
-                    seeker_id=seeker.id,
-                    listing_id=listing.id,
-                    decision=normalized,
-                    created_at=now,
-                )
-                self.session.add(swipe)
-            
-            self.session.flush()
+            self._log("SEEKER", seeker.id, listing.id, normalized, now)
+            seeker_stmt = pg_insert(models.SeekerSwipe).values(
+                id=str(uuid4()),
+                seeker_id=seeker.id,
+                listing_id=listing.id,
+                decision=normalized,
+                created_at=now,
+            )
+            swipe_id = self.session.scalar(
+                seeker_stmt.on_conflict_do_update(
+                    constraint="uq_seeker_swipe_listing",
+                    set_={"decision": normalized, "created_at": now},
+                ).returning(models.SeekerSwipe.id)
+            )
             return self._format_swipe(
-                swipe_id=swipe.id,
+                swipe_id=str(swipe_id),
                 user_id=swiper_id,
                 target_id=listing.id,
                 decision=normalized,
-                created_at=swipe.created_at or now,
+                created_at=now,
             )
         elif target_id.startswith("seeker-"):
             host = self._host_for_user(swiper_id)
             seeker = self.session.get(models.SeekerProfile, target_id)
             if host is None or seeker is None:
                 raise NotFoundError("Host or seeker not found for swipe")
-            
-            # Check for existing swipe
-            stmt = select(models.HostSwipe).where(
-                models.HostSwipe.host_id == host.id,
-                models.HostSwipe.seeker_id == seeker.id
-            )
-            host_swipe = self.session.scalars(stmt).first()
-
-            if host_swipe:
-                host_swipe.decision = normalized
-                host_swipe.created_at = now
-            else:
-                host_swipe = models.HostSwipe(
-                    id=str(uuid4()),
-                    host_id=host.id,
-                    seeker_id=seeker.id,
-                    decision=normalized,
-                    created_at=now,
-                )
-                self.session.add(host_swipe)
+            if buffered:
+                return self._buffer_pass("HOST", host.id, swiper_id, seeker.id, now)
 
-            self.session.flush()
+            self._log("HOST", host.id, seeker.id, normalized, now)
+            host_stmt = pg_insert(models.HostSwipe).values(
+                id=str(uuid4()),
+                host_id=host.id,
+                seeker_id=seeker.id,
+                decision=normalized,
+                created_at=now,
+            )
+            swipe_id = self.session.scalar(
+                host_stmt.on_conflict_do_update(
+                    constraint="uq_host_swipe_seeker",
+                    set_={"decision": normalized, "created_at": now},
+                ).returning(models.HostSwipe.id)
+            )
             return self._format_swipe(
-                swipe_id=host_swipe.id,
+                swipe_id=str(swipe_id),
                 user_id=swiper_id,
                 target_id=seeker.id,
                 decision=normalized,
-                created_at=host_swipe.created_at or now,
+                created_at=now,
             )
         raise ValueError("target_id must reference a listing or seeker")
 
     def get_swipe(self, user_id: str, target_id: str) -> SwipeDict | None:
+        stored = self._stored_swipe(user_id, target_id)
+        buffered = self._buffer.latest(user_id, target_id) if self._buffer is not None else None
+        if buffered is None or (stored is not None and stored["created_at"] > buffered.created_at):
+            return stored
+        return None if buffered.undone_at is not None else self._format_buffered(buffered)
+
+    def _stored_swipe(self, user_id: str, target_id: str) -> SwipeDict | None:
         if target_id.startswith("listing-"):
             seeker = self._seeker_for_user(user_id)
             if not seeker:
@@ -573,6 +1124,40 @@ class SqlAlchemySwipeRepo(SwipeRepo):
         return None
 
     def undo_last(self, user_id: str) -> SwipeDict | None:
+        stored = self._latest_stored(user_id)
+        buffered = self._buffer.latest_for_user(user_id) if self._buffer is not None else None
+        now = datetime.now(UTC)
+        if buffered is not None and (
+            stored is None or buffered.created_at >= stored[1]["created_at"]
+        ):
+            assert self._buffer is not None and self._on_commit is not None
+            buffer = self._buffer
+            self._on_commit(lambda: buffer.undo(buffered, now))
+            return self._format_buffered(buffered)
+        if stored is None:
+            return None
+        row, data = stored
+        if isinstance(row, models.SeekerSwipe):
+            self._log("SEEKER", row.seeker_id, row.listing_id, "UNDO", now)
+        else:
+            self._log("HOST", row.host_id, row.seeker_id, "UNDO", now)
+        self.session.delete(row)
+        self.session.flush()
+        return data
+
+    def recent_likes(self, user_id: str, limit: int) -> list[str]:
+        stmt = (
+            select(models.SeekerSwipe.listing_id)
+            .join(models.SeekerProfile, models.SeekerSwipe.seeker_id == models.SeekerProfile.id)
+            .where(models.SeekerProfile.user_id == user_id, models.SeekerSwipe.decision == "LIKE")
+            .order_by(models.SeekerSwipe.created_at.desc())
+            .limit(limit)
+        )
+        return list(self.session.scalars(stmt))
+
+    def _latest_stored(
+        self, user_id: str
+    ) -> tuple[models.SeekerSwipe | models.HostSwipe, SwipeDict] | None:
         seeker = self._seeker_for_user(user_id)
         if seeker:
             stmt = (
@@ -584,16 +1169,13 @@ class SqlAlchemySwipeRepo(SwipeRepo):
             swipe = self.session.scalars(stmt).first()
             if swipe is None:
                 return None
-            data = self._format_swipe(
+            return swipe, self._format_swipe(
                 swipe_id=swipe.id,
                 user_id=user_id,
                 target_id=swipe.listing_id,
                 decision=swipe.decision,
                 created_at=swipe.created_at or datetime.utcnow(),
             )
-            self.session.delete(swipe)
-            self.session.flush()
-            return data
         host = self._host_for_user(user_id)
         if host:
             host_stmt = (
@@ -605,14 +1187,105 @@ class SqlAlchemySwipeRepo(SwipeRepo):
             host_swipe = self.session.scalars(host_stmt).first()
             if host_swipe is None:
                 return None
-            data = self._format_swipe(
+            return host_swipe, self._format_swipe(
                 swipe_id=host_swipe.id,
                 user_id=user_id,
                 target_id=host_swipe.seeker_id,
                 decision=host_swipe.decision,
                 created_at=host_swipe.created_at or datetime.utcnow(),
             )
-            self.session.delete(host_swipe)
-            self.session.flush()
-            return data
         return None
+
+
+class SqlAlchemyOutboxRepo(OutboxRepo):
+    """Outbox rows share the request transaction, so events commit with the match."""
+
+    def __init__(self, session: Session) -> None:
+        self.session = session
+
+    def _to_event(self, row: models.NotificationOutbox) -> OutboxEventDict:
+        return {
+            "id": row.id,
+            "recipient_user_id": row.recipient_user_id,
+            "event_type": row.event_type,
+            "payload": dict(row.payload),
+            "attempts": row.attempts,
+            "created_at": row.created_at or datetime.utcnow(),
+        }
+
+    def enqueue(
+        self,
+        recipient_user_id: str,
+        event_type: str,
+        payload: dict[str, Any],
+    ) -> OutboxEventDict:
+        row = models.NotificationOutbox(
+            id=str(uuid4()),
+            recipient_user_id=recipient_user_id,
+            event_type=event_type,
+            payload=payload,
+            attempts=0,
+        )
+        self.session.add(row)
+        self.session.flush()
+        return self._to_event(row)
+
+    def claim_batch(
+        self, limit: int, *, lease_seconds: float = 300.0
+    ) -> Sequence[OutboxEventDict]:
+        # SKIP LOCKED keeps concurrent claims apart; moving available_at out by the
+        # lease keeps the rows claimed after commit, while the caller sends.
+        outbox = models.NotificationOutbox
+        due = (
+            select(outbox.id)
+            .where(outbox.processed_at.is_(None), outbox.available_at <= sa.func.now())
+            .order_by(outbox.available_at, outbox.id)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+            .scalar_subquery()
+        )
+        stmt = (
+            sa.update(outbox)
+            .where(outbox.id.in_(due))
+            .values(available_at=sa.func.now() + timedelta(seconds=lease_seconds))
+            .returning(outbox)
+        )
+        return [self._to_event(row) for row in self.session.scalars(stmt).all()]
+
+    def mark_processed(self, event_ids: Sequence[str], *, error: str | None = None) -> None:
+        if not event_ids:
+            return
+        self.session.execute(
+            sa.update(models.NotificationOutbox)
+            .where(models.NotificationOutbox.id.in_(event_ids))
+            .values(processed_at=sa.func.now(), last_error=error)
+        )
+
+    def reschedule(
+        self,
+        event_ids: Sequence[str],
+        *,
+        error: str,
+        delay_seconds: float,
+    ) -> None:
+        if not event_ids:
+            return
+        self.session.execute(
+            sa.update(models.NotificationOutbox)
+            .where(models.NotificationOutbox.id.in_(event_ids))
+            .values(
+                attempts=models.NotificationOutbox.attempts + 1,
+                available_at=sa.func.now() + timedelta(seconds=delay_seconds),
+                last_error=error,
+            )
+        )
+
+    def recipient(self, user_id: str) -> RecipientDict | None:
+        user = self.session.get(models.User, user_id)
+        if user is None:
+            return None
+        return {
+            "user_id": user.id,
+            "email": user.email,
+            "notifications_enabled": bool(user.email_notifications_enabled),
+        }
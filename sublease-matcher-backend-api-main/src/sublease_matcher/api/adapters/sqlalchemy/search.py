@@ -0,0 +1,84 @@
+"""Full-text search over listings.
+
+``listings.search_vector`` holds the listing title (weight A), the host bio (B)
+and every roommate's bio and major (C). It spans three tables, so rather than a
+generated column it is rebuilt by ``refresh_search_vectors`` whenever the
+listing repo writes a listing or its host. Queries use ``websearch_to_tsquery``
+(quoted phrases, ``or``, ``-term``) against the GIN index and are ranked with
+``ts_rank_cd``; pages are keyset on ``(rank DESC, id)``.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from typing import Any
+
+import sqlalchemy as sa
+from sqlalchemy.orm import Session
+from sublease_matcher.core.geo import Radius
+
+from . import models
+from .geo import within_clause
+
+TEXT_SEARCH_CONFIG = "english"
+
+# Migration a9e3c5d71b42 backfilled with a copy of this; change both only together
+# with a migration that re-runs the backfill.
+SEARCH_DOCUMENT_SQL = f"""
+    setweight(to_tsvector('{TEXT_SEARCH_CONFIG}', coalesce(listings.title, '')), 'A')
+    || setweight(to_tsvector('{TEXT_SEARCH_CONFIG}', coalesce(host_profiles.bio, '')), 'B')
+    || setweight(to_tsvector('{TEXT_SEARCH_CONFIG}', coalesce((
+        SELECT string_agg(concat_ws(' ', r.bio, r.major), ' ')
+        FROM listing_roommates AS r
+        WHERE r.listing_id = listings.id
+    ), '')), 'C')
+"""
+
+
+def refresh_search_vectors(
+    session: Session,
+    *,
+    listing_ids: Sequence[str] = (),
+    host_id: str | None = None,
+) -> None:
+    """Recompute ``search_vector`` for the given listings and/or a host's listings."""
+    if not listing_ids and host_id is None:
+        return
+    session.execute(
+        sa.text(
+            f"UPDATE listings SET search_vector = {SEARCH_DOCUMENT_SQL} "
+            "FROM host_profiles WHERE host_profiles.id = listings.host_id "
+            "AND (listings.id = ANY(:listing_ids) OR listings.host_id = :host_id)"
+        ),
+        {"listing_ids": list(listing_ids), "host_id": host_id},
+    )
+
+
+def search_statement(
+    query: str,
+    *,
+    limit: int,
+    after: tuple[float, str] | None = None,
+    within: Radius | None = None,
+) -> sa.Select[Any]:
+    """Published listings matching ``query``, best first, as ``(Listing, rank)`` rows."""
+    tsquery = sa.func.websearch_to_tsquery(TEXT_SEARCH_CONFIG, query)
+    # Normalization 32 maps the rank into [0, 1) without changing the order.
+    rank = sa.func.ts_rank_cd(models.Listing.search_vector, tsquery, 32).label("rank")
+    stmt = sa.select(models.Listing, rank).where(
+        models.Listing.search_vector.op("@@")(tsquery),
+        models.Listing.status == "PUBLISHED",
+    )
+    if within is not None:
+        stmt = stmt.where(
+            within_clause(
+                models.Listing.lat, models.Listing.lon, models.Listing.geohash, within
+            )
+        )
+    if after is not None:
+        last_rank, last_id = after
+        boundary = sa.cast(sa.literal(last_rank), sa.REAL)
+        stmt = stmt.where(
+            sa.or_(rank < boundary, sa.and_(rank == boundary, models.Listing.id > last_id))
+        )
+    return stmt.order_by(rank.desc(), models.Listing.id).limit(limit)
@@ -0,0 +1,346 @@
+"""Write-behind buffer for PASS swipes.
+
+Passes are the bulk of swipe traffic during bursts and nothing else in the
+request depends on them, so in buffered mode they are appended (and fsynced)
+to a local JSONL log on commit instead of hitting Postgres one row at a time.
+A background flusher rotates the log and writes each segment in one
+transaction: history rows via ``COPY`` into a temp table, current decisions
+via a multi-row ``INSERT .. ON CONFLICT``. Entries stay readable from memory
+until their segment is flushed, and a crash replays whatever is on disk, so
+every step is idempotent.
+
+The buffer is per process: each worker holds an ``flock`` on its own
+``worker-*`` slot under ``SM_SWIPE_BUFFER_DIR`` for its lifetime, so workers
+never rotate or unlink each other's logs, and a restarted worker adopts a slot
+whose owner died (the kernel drops the lock with the process) and replays it.
+Other workers see a buffered pass only after the flush
+(``SM_SWIPE_BUFFER_FLUSH_SECONDS``). Likes are always written through because
+mutual-match detection must see them from every worker.
+"""
+
+from __future__ import annotations
+
+import fcntl
+import json
+import logging
+import os
+import threading
+import uuid
+from collections.abc import Callable
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from functools import lru_cache
+from pathlib import Path
+from typing import IO, Any, Literal, cast
+
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session
+
+from ...config import get_settings
+from . import models
+
+logger = logging.getLogger(__name__)
+
+Op = tuple[Literal["swipe", "undo"], "BufferedSwipe"]
+
+
+@dataclass(slots=True)
+class BufferedSwipe:
+    id: str
+    actor_kind: Literal["SEEKER", "HOST"]
+    actor_id: str
+    user_id: str
+    target_id: str
+    decision: str
+    created_at: datetime
+    undone_at: datetime | None = None
+
+    def to_json(self) -> dict[str, Any]:
+        data = asdict(self)
+        data["created_at"] = self.created_at.isoformat()
+        data["undone_at"] = self.undone_at.isoformat() if self.undone_at else None
+        return data
+
+    @classmethod
+    def from_json(cls, data: dict[str, Any]) -> BufferedSwipe:
+        undone_at = data.get("undone_at")
+        return cls(
+            **{
+                **data,
+                "created_at": datetime.fromisoformat(data["created_at"]),
+                "undone_at": datetime.fromisoformat(undone_at) if undone_at else None,
+            }
+        )
+
+
+def _try_lock(path: Path) -> IO[str] | None:
+    handle = open(path, "a", encoding="utf-8")
+    try:
+        fcntl.flock(handle.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except BlockingIOError:
+        handle.close()
+        return None
+    return handle
+
+
+def _claim_slot(root: Path) -> tuple[Path, IO[str]]:
+    """Lock a ``worker-*`` directory under ``root``: an orphaned one first, else a new one."""
+    root.mkdir(parents=True, exist_ok=True)
+    for slot in sorted(root.glob("worker-*")):
+        lock = _try_lock(slot / "lock")
+        if lock is not None:
+            return slot, lock
+    while True:
+        # Another worker starting at the same moment may lock our new slot first.
+        slot = root / f"worker-{os.getpid()}-{uuid.uuid4().hex[:8]}"
+        slot.mkdir()
+        lock = _try_lock(slot / "lock")
+        if lock is not None:
+            return slot, lock
+
+
+class SwipeBuffer:
+    """Durable, process-local log of swipes waiting for a batch flush."""
+
+    def __init__(self, directory: Path, *, fsync: bool = True) -> None:
+        # The lock is held until close() or process exit; only this buffer touches the slot.
+        self.directory, self._lock_file = _claim_slot(directory)
+        self._active_path = self.directory / "swipes.jsonl"
+        self._flushing_path = self.directory / "swipes.flushing.jsonl"
+        self._fsync = fsync
+        self._lock = threading.Lock()
+        # Every swipe not yet known to be in Postgres (or whose undo is not), by id.
+        self._pending: dict[str, BufferedSwipe] = {}
+        self._segment: list[Op] = []
+        self._inflight: list[Op] | None = None
+        self._recover()
+        self._file = open(self._active_path, "a", encoding="utf-8")
+
+    def _recover(self) -> None:
+        if self._flushing_path.exists():
+            self._inflight = self._replay(self._flushing_path)
+        if self._active_path.exists():
+            self._segment = self._replay(self._active_path)
+
+    def _replay(self, path: Path) -> list[Op]:
+        ops: list[Op] = []
+        with open(path, encoding="utf-8") as handle:
+            for line in handle:
+                try:
+                    record = json.loads(line)
+                    swipe = BufferedSwipe.from_json(record["swipe"])
+                except (ValueError, KeyError, TypeError):
+                    # A torn last line from a crash mid-write; the request never got its 200.
+                    logger.warning("Skipping unreadable swipe buffer line in %s", path)
+                    continue
+                existing = self._pending.get(swipe.id)
+                if existing is not None:
+                    # Share one object per swipe, as the live path does.
+                    existing.undone_at = swipe.undone_at
+                    swipe = existing
+                self._pending[swipe.id] = swipe
+                ops.append((record["op"], swipe))
+        return ops
+
+    def _write(self, op: Literal["swipe", "undo"], swipe: BufferedSwipe) -> None:
+        self._file.write(json.dumps({"op": op, "swipe": swipe.to_json()}) + "\n")
+        self._file.flush()
+        if self._fsync:
+            os.fsync(self._file.fileno())
+        self._segment.append((op, swipe))
+
+    def append(self, swipe: BufferedSwipe) -> None:
+        with self._lock:
+            self._write("swipe", swipe)
+            self._pending[swipe.id] = swipe
+
+    def undo(self, swipe: BufferedSwipe, at: datetime) -> None:
+        with self._lock:
+            swipe.undone_at = at
+            self._write("undo", swipe)
+            self._pending[swipe.id] = swipe
+
+    def latest(self, user_id: str, target_id: str) -> BufferedSwipe | None:
+        """Newest buffered swipe on the pair, undone or not."""
+        with self._lock:
+            candidates = [
+                swipe
+                for swipe in self._pending.values()
+                if swipe.user_id == user_id and swipe.target_id == target_id
+            ]
+        return max(candidates, key=lambda swipe: swipe.created_at, default=None)
+
+    def latest_for_user(self, user_id: str) -> BufferedSwipe | None:
+        with self._lock:
+            candidates = [
+                swipe
+                for swipe in self._pending.values()
+                if swipe.user_id == user_id and swipe.undone_at is None
+            ]
+        return max(candidates, key=lambda swipe: swipe.created_at, default=None)
+
+    def begin_flush(self) -> list[Op]:
+        """Seal the active segment (or return the one still in flight after a failure)."""
+        with self._lock:
+            if self._inflight is None and self._segment:
+                self._file.close()
+                os.replace(self._active_path, self._flushing_path)
+                self._file = open(self._active_path, "a", encoding="utf-8")
+                self._inflight, self._segment = self._segment, []
+            return list(self._inflight or [])
+
+    def complete_flush(self) -> None:
+        with self._lock:
+            for op, swipe in self._inflight or []:
+                # An undo still sitting in the active segment keeps its swipe visible here.
+                if op == "undo" or swipe.undone_at is None:
+                    self._pending.pop(swipe.id, None)
+            self._inflight = None
+            self._flushing_path.unlink(missing_ok=True)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._pending)
+
+    def close(self) -> None:
+        with self._lock:
+            self._file.close()
+            self._lock_file.close()
+
+
+def write_batch(session: Session, ops: list[Op]) -> None:
+    """Apply one sealed segment; safe to repeat if a previous attempt died mid-way."""
+    events = []
+    final: dict[tuple[str, str], Op] = {}
+    for op, swipe in ops:
+        if op == "swipe":
+            at, event_id, action = swipe.created_at, swipe.id, swipe.decision
+        else:
+            # Deterministic id so replaying a half-flushed segment cannot log the undo twice.
+            assert swipe.undone_at is not None  # undo() sets it before logging the op
+            at = swipe.undone_at
+            event_id = str(uuid.uuid5(uuid.NAMESPACE_URL, f"undo:{swipe.id}"))
+            action = "UNDO"
+        events.append((at, event_id, swipe.actor_kind, swipe.actor_id, swipe.target_id, action))
+        final[(swipe.actor_id, swipe.target_id)] = (op, swipe)
+
+    raw = session.connection().connection.driver_connection
+    assert raw is not None  # a checked-out connection always has its driver connection
+    with raw.cursor() as cursor:
+        cursor.execute(
+            "CREATE TEMP TABLE swipe_events_incoming "
+            "(LIKE swipe_events INCLUDING DEFAULTS) ON COMMIT DROP"
+        )
+        with cursor.copy(
+            "COPY swipe_events_incoming "
+            "(created_at, id, actor_kind, actor_id, target_id, action) FROM STDIN"
+        ) as copy:
+            for row in events:
+                copy.write_row(row)
+    session.execute(
+        sa.text(
+            "INSERT INTO swipe_events (created_at, id, actor_kind, actor_id, target_id, action) "
+            "SELECT created_at, id, actor_kind, actor_id, target_id, action "
+            "FROM swipe_events_incoming ON CONFLICT DO NOTHING"
+        )
+    )
+
+    for kind, model, actor_col, target_col, constraint in (
+        ("SEEKER", models.SeekerSwipe, "seeker_id", "listing_id", "uq_seeker_swipe_listing"),
+        ("HOST", models.HostSwipe, "host_id", "seeker_id", "uq_host_swipe_seeker"),
+    ):
+        table = cast(sa.Table, model.__table__)
+        upserts = [
+            {
+                "id": swipe.id,
+                actor_col: swipe.actor_id,
+                target_col: swipe.target_id,
+                "decision": swipe.decision,
+                "created_at": swipe.created_at,
+            }
+            for op, swipe in final.values()
+            if swipe.actor_kind == kind and op == "swipe" and swipe.undone_at is None
+        ]
+        if upserts:
+            stmt = pg_insert(model).values(upserts)
+            excluded = stmt.excluded
+            session.execute(
+                stmt.on_conflict_do_update(
+                    constraint=constraint,
+                    set_={"decision": excluded.decision, "created_at": excluded.created_at},
+                    # A like written through after this pass was buffered must survive the flush.
+                    where=table.c.created_at <= excluded.created_at,
+                )
+            )
+        for _, swipe in final.values():
+            if swipe.actor_kind == kind and swipe.undone_at is not None:
+                # Same effect as an unbuffered undo: drop the pair's decision up to this swipe.
+                session.execute(
+                    sa.delete(table).where(
+                        table.c[actor_col] == swipe.actor_id,
+                        table.c[target_col] == swipe.target_id,
+                        table.c.created_at <= swipe.created_at,
+                    )
+                )
+
+
+class SwipeFlusher:
+    """Background thread that drains the buffer every ``interval_seconds``."""
+
+    def __init__(
+        self,
+        buffer: SwipeBuffer,
+        session_factory: Callable[[], Session],
+        *,
+        interval_seconds: float,
+    ) -> None:
+        self._buffer = buffer
+        self._session_factory = session_factory
+        self._interval = interval_seconds
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def run_once(self) -> int:
+        ops = self._buffer.begin_flush()
+        if not ops:
+            return 0
+        with self._session_factory() as session, session.begin():
+            write_batch(session, ops)
+        self._buffer.complete_flush()
+        return len(ops)
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="swipe-buffer-flush", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float | None = 10.0) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def _flush(self) -> int:
+        try:
+            return self.run_once()
+        except Exception:
+            logger.exception("Swipe buffer flush failed; will retry")
+            return 0
+
+    def _run(self) -> None:
+        while not self._stop.wait(self._interval):
+            self._flush()
+        # On shutdown drain the sealed segment and then whatever was appended meanwhile.
+        while self._flush():
+            pass
+
+
+@lru_cache(maxsize=1)
+def get_swipe_buffer() -> SwipeBuffer | None:
+    settings = get_settings()
+    if not settings.swipe_buffer_dir:
+        return None
+    return SwipeBuffer(Path(settings.swipe_buffer_dir), fsync=settings.swipe_buffer_fsync)
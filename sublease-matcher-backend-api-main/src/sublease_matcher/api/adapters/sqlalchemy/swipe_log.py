@@ -0,0 +1,82 @@
+"""Monthly partition maintenance for the append-only ``swipe_events`` log."""
+
+from __future__ import annotations
+
+import re
+from datetime import date
+
+import sqlalchemy as sa
+from sqlalchemy.engine import Connection
+
+PARENT = "swipe_events"
+_PARTITION_RE = re.compile(rf"^{PARENT}_(\d{{4}})_(\d{{2}})$")
+
+
+def month_start(day: date) -> date:
+    return day.replace(day=1)
+
+
+def add_months(month: date, count: int) -> date:
+    index = month.year * 12 + month.month - 1 + count
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def partition_name(month: date) -> str:
+    return f"{PARENT}_{month:%Y_%m}"
+
+
+def partition_month(name: str) -> date | None:
+    found = _PARTITION_RE.match(name)
+    return date(int(found[1]), int(found[2]), 1) if found else None
+
+
+def list_partitions(conn: Connection) -> list[str]:
+    rows = conn.execute(
+        sa.text(
+            "SELECT c.relname FROM pg_inherits i "
+            "JOIN pg_class c ON c.oid = i.inhrelid "
+            "JOIN pg_class p ON p.oid = i.inhparent "
+            "WHERE p.relname = :parent ORDER BY c.relname"
+        ),
+        {"parent": PARENT},
+    )
+    return list(rows.scalars())
+
+
+def ensure_partitions(conn: Connection, *, start: date, months: int) -> list[str]:
+    """Create the monthly partitions ``[start, start + months)`` that are missing.
+
+    Run it ahead of time (cron/deploy): a month that already has rows in the
+    default partition can no longer get its own partition until they are moved.
+    """
+    existing = set(list_partitions(conn))
+    created = []
+    month = month_start(start)
+    for _ in range(months):
+        name = partition_name(month)
+        if name not in existing:
+            conn.execute(
+                sa.text(
+                    f'CREATE TABLE "{name}" PARTITION OF {PARENT} '
+                    f"FOR VALUES FROM ('{month.isoformat()}') "
+                    f"TO ('{add_months(month, 1).isoformat()}')"
+                )
+            )
+            created.append(name)
+        month = add_months(month, 1)
+    return created
+
+
+def detach_partitions_before(conn: Connection, cutoff: date) -> list[str]:
+    """Detach monthly partitions that end on or before ``cutoff``.
+
+    Detached tables keep their rows and can be dumped, moved to cheaper storage
+    or dropped without touching the live log.
+    """
+    detached = []
+    for name in list_partitions(conn):
+        month = partition_month(name)
+        if month is not None and add_months(month, 1) <= month_start(cutoff):
+            conn.execute(sa.text(f'ALTER TABLE {PARENT} DETACH PARTITION "{name}"'))
+            detached.append(name)
+    return detached
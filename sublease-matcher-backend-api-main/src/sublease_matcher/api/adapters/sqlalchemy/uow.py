@@ -1,19 +1,56 @@
 from __future__ import annotations
 
+import logging
+import random
+import time
+from collections.abc import Callable
 from types import TracebackType
-from typing import Self
+from typing import Self, TypeVar
 
+import sqlalchemy as sa
+from sqlalchemy.exc import DBAPIError
 from sqlalchemy.orm import Session, sessionmaker
 
+from ...config import get_settings
+from ...interfaces.repos import HostRepo, ListingRepo, SeekerRepo
 from ...interfaces.uow import UnitOfWork
+from ..entity_cache import (
+    CachedListingRepo,
+    CachedSeekerRepo,
+    CacheScope,
+    get_entity_cache,
+)
+from ..identity_map import IdentityMap, MappedHostRepo, MappedListingRepo, MappedSeekerRepo
 from .repos import (
     SqlAlchemyHostRepo,
+    SqlAlchemyListingNeighborRepo,
     SqlAlchemyListingRepo,
     SqlAlchemyMatchRepo,
+    SqlAlchemyOutboxRepo,
+    SqlAlchemySavedSearchRepo,
+    SqlAlchemySearchAlertRepo,
     SqlAlchemySeekerRepo,
+    SqlAlchemySeenSetRepo,
     SqlAlchemySwipeRepo,
     SqlAlchemyUserRepo,
 )
+from .swipe_buffer import get_swipe_buffer
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# serialization_failure, deadlock_detected: the transaction lost a race and may simply be re-run.
+RETRYABLE_SQLSTATES = frozenset({"40001", "40P01"})
+
+
+def is_retryable(exc: DBAPIError) -> bool:
+    return getattr(exc.orig, "sqlstate", None) in RETRYABLE_SQLSTATES
+
+
+def retry_delay(attempt: int, base_seconds: float, cap_seconds: float = 1.0) -> float:
+    """Full-jitter exponential backoff, so colliding transactions don't retry in lockstep."""
+    return random.uniform(0, min(cap_seconds, base_seconds * 2 ** (attempt - 1)))
 
 
 class SqlAlchemyUnitOfWork(UnitOfWork):
@@ -21,11 +58,29 @@ class SqlAlchemyUnitOfWork(UnitOfWork):
         self._session_factory = session_factory
         self.session = self._session_factory()
         self.users = SqlAlchemyUserRepo(self.session)
-        self.seekers = SqlAlchemySeekerRepo(self.session, self.users)
-        self.hosts = SqlAlchemyHostRepo(self.session, self.users)
-        self.listings = SqlAlchemyListingRepo(self.session)
-        self.swipes = SqlAlchemySwipeRepo(self.session)
+        # Typed as the protocols: the cache and identity map wrap these below.
+        self.seekers: SeekerRepo = SqlAlchemySeekerRepo(self.session, self.users)
+        self.hosts: HostRepo = SqlAlchemyHostRepo(self.session, self.users)
+        self.listings: ListingRepo = SqlAlchemyListingRepo(self.session)
+        self.swipes = SqlAlchemySwipeRepo(
+            self.session, buffer=get_swipe_buffer(), on_commit=self.on_commit
+        )
         self.matches = SqlAlchemyMatchRepo(self.session)
+        self.outbox = SqlAlchemyOutboxRepo(self.session)
+        self.seen_sets = SqlAlchemySeenSetRepo(self.session)
+        self.listing_neighbors = SqlAlchemyListingNeighborRepo(self.session)
+        self.saved_searches = SqlAlchemySavedSearchRepo(self.session)
+        self.search_alerts = SqlAlchemySearchAlertRepo(self.session)
+        self._on_commit: list[Callable[[], None]] = []
+        self._cache_scope: CacheScope | None = None
+        if get_settings().entity_cache_enabled:
+            self._cache_scope = CacheScope(get_entity_cache())
+            self.seekers = CachedSeekerRepo(self.seekers, self._cache_scope)
+            self.listings = CachedListingRepo(self.listings, self._cache_scope)
+        self.identity_map = IdentityMap()
+        self.seekers = MappedSeekerRepo(self.seekers, self.identity_map)
+        self.hosts = MappedHostRepo(self.hosts, self.identity_map)
+        self.listings = MappedListingRepo(self.listings, self.identity_map)
 
     def __enter__(self) -> Self:
         return self
@@ -48,9 +103,61 @@ class SqlAlchemyUnitOfWork(UnitOfWork):
 
     def commit(self) -> None:
         self.session.commit()
+        self.identity_map.clear()
+        if self._cache_scope is not None:
+            self._cache_scope.finish()
+        callbacks, self._on_commit = self._on_commit, []
+        for callback in callbacks:
+            try:
+                callback()
+            except Exception:
+                logger.exception("on_commit callback failed")
 
     def rollback(self) -> None:
         self.session.rollback()
+        self.identity_map.clear()
+        if self._cache_scope is not None:
+            self._cache_scope.finish()
+        self._on_commit.clear()
+
+    def on_commit(self, callback: Callable[[], None]) -> None:
+        self._on_commit.append(callback)
+
+    def run_in_transaction(
+        self,
+        fn: Callable[[Self], T],
+        *,
+        isolation_level: str | None = None,
+        max_attempts: int | None = None,
+    ) -> T:
+        settings = get_settings()
+        attempts = max_attempts or settings.transaction_max_attempts
+        if self.session.in_transaction():
+            # Usually just the auth lookup; isolation can only be set on a new transaction.
+            self.commit()
+        for attempt in range(1, attempts + 1):
+            try:
+                if isolation_level is not None:
+                    self.session.connection(execution_options={"isolation_level": isolation_level})
+                result = fn(self)
+                self.commit()
+                return result
+            except DBAPIError as exc:
+                self.rollback()
+                if attempt == attempts or not is_retryable(exc):
+                    raise
+                logger.info("Retrying transaction after %s (attempt %d)", exc.orig, attempt)
+                time.sleep(retry_delay(attempt, settings.transaction_retry_backoff_seconds))
+            except BaseException:
+                self.rollback()
+                raise
+        raise AssertionError("unreachable")
+
+    def lock(self, *keys: str) -> None:
+        for key in sorted(set(keys)):
+            self.session.execute(
+                sa.select(sa.func.pg_advisory_xact_lock(sa.func.hashtextextended(key, 0)))
+            )
 
     def close(self) -> None:
         self.session.close()
@@ -14,6 +14,35 @@ class Settings(BaseSettings):
     ]
     database_url: str | None = None
     storage: str = "memory"
+    sql_slow_query_ms: float = 200.0
+    sql_n_plus_one_threshold: int = 5
+    sql_query_budget: int | None = None
+    debug_token: str | None = None
+    notifications_worker_enabled: bool = False
+    notifications_batch_size: int = 100
+    notifications_poll_seconds: float = 5.0
+    notifications_max_attempts: int = 5
+    smtp_host: str = "localhost"
+    smtp_port: int = 1025
+    smtp_sender: str = "no-reply@sublease-matcher.local"
+    smtp_username: str | None = None
+    smtp_password: str | None = None
+    smtp_starttls: bool = False
+    match_events_pg_notify: bool = False
+    match_events_channel: str = "sm_match_events"
+    match_stream_heartbeat_seconds: float = 15.0
+    entity_cache_enabled: bool = False
+    entity_cache_max_entries: int = 10_000
+    entity_cache_ttl_seconds: float = 30.0
+    match_feed_cache_users: int = 1024
+    transaction_max_attempts: int = 5
+    transaction_retry_backoff_seconds: float = 0.02
+    swipe_isolation_level: str = "READ COMMITTED"
+    swipe_buffer_dir: str | None = None
+    swipe_buffer_flush_seconds: float = 1.0
+    swipe_buffer_fsync: bool = True
+    ranking_model_path: str | None = None
+    ranking_model_check_seconds: float = 5.0
 
     model_config = SettingsConfigDict(env_file=".env", env_prefix="SM_")
 
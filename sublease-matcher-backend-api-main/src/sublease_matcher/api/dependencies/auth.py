@@ -3,7 +3,7 @@ from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from sqlalchemy import select
 
 from ..adapters.sqlalchemy import models
-from ..dependencies.uow import get_uow
+from ..dependencies.uow import get_uow, open_uow
 from ..interfaces.uow import UnitOfWork
 
 security = HTTPBearer()
@@ -34,3 +34,11 @@ def get_current_user_id(
     user: models.User = Depends(get_current_user)
 ) -> str:
     return user.id
+
+
+def get_stream_user_id(
+    creds: HTTPAuthorizationCredentials = Depends(security),
+) -> str:
+    """Authenticate with a short-lived session so long-lived streams don't pin a DB connection."""
+    with open_uow() as uow:
+        return get_current_user(creds, uow).id
@@ -1,13 +1,19 @@
 from __future__ import annotations
 
 from collections.abc import Iterator
+from contextlib import contextmanager
 from functools import lru_cache
 
 from ..adapters.memory_repos import (
     InMemoryHostRepo,
+    InMemoryListingNeighborRepo,
     InMemoryListingRepo,
     InMemoryMatchRepo,
+    InMemoryOutboxRepo,
+    InMemorySavedSearchRepo,
+    InMemorySearchAlertRepo,
     InMemorySeekerRepo,
+    InMemorySeenSetRepo,
     InMemorySwipeRepo,
 )
 from ..adapters.memory_uow import InMemoryUnitOfWork
@@ -20,14 +26,30 @@ from ..interfaces.uow import UnitOfWork
 def _build_memory_uow() -> InMemoryUnitOfWork:
     seekers_data, hosts_data, listings_data = build_seed()
     seekers = InMemorySeekerRepo(seekers_data)
-    hosts = InMemoryHostRepo(hosts_data)
     listings = InMemoryListingRepo(listings_data)
+    hosts = InMemoryHostRepo(hosts_data, listings=listings)
     swipes = InMemorySwipeRepo()
-    matches = InMemoryMatchRepo()
-    return InMemoryUnitOfWork(seekers, hosts, listings, swipes, matches)
+    matches = InMemoryMatchRepo(seekers=seekers, listings=listings)
+    outbox = InMemoryOutboxRepo(seekers, hosts)
+    seen_sets = InMemorySeenSetRepo(listings)
+    search_alerts = InMemorySearchAlertRepo()
+    return InMemoryUnitOfWork(
+        seekers,
+        hosts,
+        listings,
+        swipes,
+        matches,
+        outbox,
+        seen_sets,
+        InMemoryListingNeighborRepo(),
+        InMemorySavedSearchRepo(alerts=search_alerts),
+        search_alerts,
+    )
 
 
-def get_uow() -> Iterator[UnitOfWork]:
+@contextmanager
+def open_uow() -> Iterator[UnitOfWork]:
+    """Open a unit of work for the configured backend; usable outside requests."""
     settings = get_settings()
     if settings.storage == "sqlalchemy":
         from ..adapters.sqlalchemy.db import SessionLocal
@@ -36,4 +58,11 @@ def get_uow() -> Iterator[UnitOfWork]:
         with SqlAlchemyUnitOfWork(SessionLocal) as uow:
             yield uow
     else:
-        yield _build_memory_uow()
+        # Fresh UoW per call over the shared repos, so commit hooks stay request-local.
+        with _build_memory_uow().fork() as uow:
+            yield uow
+
+
+def get_uow() -> Iterator[UnitOfWork]:
+    with open_uow() as uow:
+        yield uow
@@ -1,10 +1,24 @@
 from __future__ import annotations
 
-from collections.abc import Sequence
+from collections.abc import Iterable, Sequence
 from decimal import Decimal
-from typing import Protocol
+from typing import Any, Protocol
 
-from .types import HostDict, ListingDict, MatchDict, SeekerDict, SwipeDict
+from sublease_matcher.core.geo import Radius
+
+from ..seen_set import SeenSet
+from .types import (
+    HostDict,
+    ListingDict,
+    MatchDict,
+    MatchUpsertDict,
+    OutboxEventDict,
+    RecipientDict,
+    SavedSearchDict,
+    SearchAlertDict,
+    SeekerDict,
+    SwipeDict,
+)
 
 
 class SeekerRepo(Protocol):
@@ -14,7 +28,27 @@ class SeekerRepo(Protocol):
 
     def upsert(self, seeker: SeekerDict) -> SeekerDict: ...
 
-    def queue_for_host(self, host_id: str) -> Sequence[SeekerDict]: ...
+    def get_version(self, seeker_id: str) -> int | None: ...
+
+    def get_version_by_user(self, user_id: str) -> tuple[str, int] | None:
+        """``(seeker_id, version)`` without loading photos or the user row."""
+        ...
+
+    def get_many(self, seeker_ids: Sequence[str]) -> dict[str, SeekerDict]: ...
+
+    def queue_for_host(
+        self, host_id: str, *, within: Radius | None = None
+    ) -> Sequence[SeekerDict]:
+        """Visible seekers; with ``within``, only those located inside the radius."""
+        ...
+
+    def interested_in(self, listing: ListingDict) -> Sequence[SeekerDict]:
+        """Visible seekers the listing suits (core ``services.interest.suits``), by id.
+
+        Found through an index on city key, budget and move-in date, never by
+        scanning every seeker.
+        """
+        ...
 
 
 class HostRepo(Protocol):
@@ -32,13 +66,108 @@ class ListingRepo(Protocol):
 
     def upsert(self, listing: ListingDict) -> ListingDict: ...
 
+    def get_version(self, listing_id: str) -> int | None: ...
+
+    def get_version_by_host(self, host_id: str) -> tuple[str, int] | None: ...
+
+    def get_many(self, listing_ids: Sequence[str]) -> dict[str, ListingDict]: ...
+
     def search(
         self,
         city: str | None = None,
         max_price: Decimal | None = None,
     ) -> Sequence[ListingDict]: ...
 
-    def queue_for_seeker(self, seeker_id: str) -> Sequence[ListingDict]: ...
+    def queue_for_seeker(
+        self,
+        seeker_id: str,
+        *,
+        seen: SeenSet | None = None,
+        within: Radius | None = None,
+    ) -> Sequence[ListingDict]:
+        """Published listings for the deck, minus those whose ``seq`` is in ``seen``.
+
+        With ``within``, only listings located inside the radius.
+        """
+        ...
+
+    def search_text(
+        self,
+        query: str,
+        *,
+        limit: int,
+        after: tuple[float, str] | None = None,
+        within: Radius | None = None,
+    ) -> Sequence[tuple[ListingDict, float]]:
+        """Published listings matching ``query`` as ``(listing, rank)``, best first.
+
+        Ordered by rank desc then id; ``after`` is the last ``(rank, id)`` of the
+        previous page. ``within`` limits hits to listings inside the radius.
+        """
+        ...
+
+
+class SeenSetRepo(Protocol):
+    """Per-seeker set of swiped listings, stored as one compact blob per seeker."""
+
+    def get(self, seeker_id: str) -> SeenSet: ...
+
+    def get_many(self, seeker_ids: Sequence[str]) -> dict[str, SeenSet]:
+        """Seen-sets of ``seeker_ids``; seekers who never swiped are left out."""
+        ...
+
+    def add(self, seeker_id: str, listing_id: str) -> None: ...
+
+    def discard(self, seeker_id: str, listing_id: str) -> None: ...
+
+
+class ListingNeighborRepo(Protocol):
+    """Item-item neighbours of listings, rebuilt offline from co-likes."""
+
+    def similar_to(self, listing_ids: Sequence[str]) -> dict[str, float]:
+        """Neighbours of any of ``listing_ids``, each with its best similarity."""
+        ...
+
+    def replace(self, rows: Iterable[tuple[str, Sequence[tuple[str, float]]]]) -> int:
+        """Swap in ``(listing_id, [(neighbor_id, similarity), ...])`` rows; returns pairs stored."""
+        ...
+
+
+class SavedSearchRepo(Protocol):
+    """Seekers' saved searches, indexed for lookup by a changed listing."""
+
+    def add(self, search: SavedSearchDict) -> SavedSearchDict: ...
+
+    def list_for_seeker(self, seeker_id: str) -> Sequence[SavedSearchDict]: ...
+
+    def delete(self, seeker_id: str, search_id: str) -> bool: ...
+
+    def matching(self, listing: ListingDict) -> Sequence[SavedSearchDict]:
+        """Searches the listing suits (core ``services.interest.suits``), by id.
+
+        Found through an index on city key, price ceiling and move-in date, never
+        by scanning every search.
+        """
+        ...
+
+
+class SearchAlertRepo(Protocol):
+    """The alerts inbox: one row per (saved search, listing) that matched."""
+
+    def add_many(self, rows: Sequence[tuple[str, str, str]]) -> int:
+        """Store ``(seeker_id, search_id, listing_id)`` rows; existing pairs are skipped.
+
+        Returns the number of new alerts.
+        """
+        ...
+
+    def inbox(
+        self, seeker_id: str, *, unread_only: bool = False, limit: int = 50
+    ) -> Sequence[SearchAlertDict]:
+        """The seeker's alerts, newest first."""
+        ...
+
+    def mark_read(self, seeker_id: str, alert_ids: Sequence[str]) -> int: ...
 
 
 class SwipeRepo(Protocol):
@@ -48,12 +177,40 @@ class SwipeRepo(Protocol):
 
     def undo_last(self, user_id: str) -> SwipeDict | None: ...
 
+    def recent_likes(self, user_id: str, limit: int) -> list[str]:
+        """Listing ids the user currently likes as a seeker, most recent first."""
+        ...
+
 
 class MatchRepo(Protocol):
     def list_for_seeker(self, seeker_id: str) -> Sequence[MatchDict]: ...
 
     def list_for_host(self, host_id: str) -> Sequence[MatchDict]: ...
 
+    def get_for_pair(self, seeker_id: str, listing_id: str) -> MatchDict | None: ...
+
+    def feed_page(
+        self,
+        *,
+        seeker_id: str | None,
+        host_id: str | None,
+        limit: int,
+        after: tuple[float | None, str] | None = None,
+    ) -> Sequence[MatchDict]:
+        """Matches of a seeker and/or a host's listings, ordered by score desc (nulls last), id.
+
+        ``after`` is the ``(score, id)`` of the last row of the previous page.
+        """
+        ...
+
+    def version_tag_for_seeker(self, seeker_id: str) -> str:
+        """Digest of the seeker's match ids/versions and their listings' versions."""
+        ...
+
+    def version_tag_for_host(self, host_id: str) -> str:
+        """Digest of the host's match ids/versions and the matched seekers' versions."""
+        ...
+
     def upsert(
         self,
         seeker_id: str,
@@ -61,3 +218,42 @@ class MatchRepo(Protocol):
         status: str,
         score: float | None,
     ) -> MatchDict: ...
+
+    def upsert_many(self, rows: Sequence[MatchUpsertDict]) -> list[MatchDict]:
+        """Insert-or-update every ``(seeker_id, listing_id)`` pair, returning rows in input order.
+
+        ``matched_at`` is only stamped on the first move to MUTUAL; the write that
+        stamps it comes back with ``became_mutual`` set.
+        """
+        ...
+
+
+class OutboxRepo(Protocol):
+    def enqueue(
+        self,
+        recipient_user_id: str,
+        event_type: str,
+        payload: dict[str, Any],
+    ) -> OutboxEventDict: ...
+
+    def claim_batch(
+        self, limit: int, *, lease_seconds: float = 300.0
+    ) -> Sequence[OutboxEventDict]:
+        """Due events, pushed ``lease_seconds`` into the future so no one else claims them.
+
+        The lease lets the caller commit before sending: events it never settles
+        (a crash mid-send) fall due again once the lease runs out.
+        """
+        ...
+
+    def mark_processed(self, event_ids: Sequence[str], *, error: str | None = None) -> None: ...
+
+    def reschedule(
+        self,
+        event_ids: Sequence[str],
+        *,
+        error: str,
+        delay_seconds: float,
+    ) -> None: ...
+
+    def recipient(self, user_id: str) -> RecipientDict | None: ...
@@ -14,9 +14,17 @@ class SeekerDict(TypedDict, total=False):
     budget_min: Decimal | None
     budget_max: Decimal | None
     city: str | None
+    # normalize_city_key(city), maintained by the repos; compare cities on this.
+    city_key: str | None
+    # Gazetteer coordinates of the city and their geohash, set by the repos on write.
+    lat: float | None
+    lon: float | None
+    geohash: str | None
     interests_csv: str | None
     contact_email: str | None
+    major: str | None
     hidden: bool
+    version: int
 
 
 class HostDict(TypedDict, total=False):
@@ -33,12 +41,20 @@ class ListingDict(TypedDict, total=False):
     title: str | None
     price_per_month: Decimal | None
     city: str | None
+    city_key: str | None
     state: str | None
+    lat: float | None
+    lon: float | None
+    geohash: str | None
     available_from: date | None
     available_to: date | None
     status: Literal["DRAFT", "PUBLISHED", "UNLISTED"]
     bio: str | None
     roommates: list[dict[str, Any]]
+    # Packed roommate trait words (core ``domain.traits``), set by the repos on write.
+    roommate_features: bytes
+    version: int
+    seq: int
 
 
 class SwipeDict(TypedDict):
@@ -56,3 +72,50 @@ class MatchDict(TypedDict, total=False):
     status: Literal["PENDING", "MUTUAL"]
     score: float | None
     matched_at: datetime | None
+    version: int
+    # Only on upsert results: this write stamped ``matched_at``, i.e. the pair just became mutual.
+    became_mutual: bool
+
+
+class MatchUpsertDict(TypedDict):
+    seeker_id: str
+    listing_id: str
+    status: Literal["PENDING", "MUTUAL"]
+    score: float | None
+
+
+class OutboxEventDict(TypedDict):
+    id: str
+    recipient_user_id: str
+    event_type: str
+    payload: dict[str, Any]
+    attempts: int
+    created_at: datetime
+
+
+class RecipientDict(TypedDict):
+    user_id: str
+    email: str | None
+    notifications_enabled: bool
+
+
+class SavedSearchDict(TypedDict, total=False):
+    id: str
+    seeker_id: str
+    city: str
+    # normalize_city_key(city), set by the repos on write.
+    city_key: str
+    max_price: Decimal | None
+    move_in: date | None
+    move_out: date | None
+    interests: list[str]
+    created_at: datetime
+
+
+class SearchAlertDict(TypedDict):
+    id: str
+    seeker_id: str
+    search_id: str
+    listing_id: str
+    created_at: datetime
+    read_at: datetime | None
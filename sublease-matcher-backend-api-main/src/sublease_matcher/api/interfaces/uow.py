@@ -1,9 +1,23 @@
 from __future__ import annotations
 
+from collections.abc import Callable
 from types import TracebackType
-from typing import Protocol, Self
+from typing import Protocol, Self, TypeVar
 
-from .repos import HostRepo, ListingRepo, MatchRepo, SeekerRepo, SwipeRepo
+from .repos import (
+    HostRepo,
+    ListingNeighborRepo,
+    ListingRepo,
+    MatchRepo,
+    OutboxRepo,
+    SavedSearchRepo,
+    SearchAlertRepo,
+    SeekerRepo,
+    SeenSetRepo,
+    SwipeRepo,
+)
+
+T = TypeVar("T")
 
 
 class UnitOfWork(Protocol):
@@ -12,6 +26,11 @@ class UnitOfWork(Protocol):
     listings: ListingRepo
     swipes: SwipeRepo
     matches: MatchRepo
+    outbox: OutboxRepo
+    seen_sets: SeenSetRepo
+    listing_neighbors: ListingNeighborRepo
+    saved_searches: SavedSearchRepo
+    search_alerts: SearchAlertRepo
 
     def __enter__(self) -> Self: ...
 
@@ -25,3 +44,30 @@ class UnitOfWork(Protocol):
     def commit(self) -> None: ...
 
     def rollback(self) -> None: ...
+
+    def on_commit(self, callback: Callable[[], None]) -> None:
+        """Run ``callback`` once the current transaction commits; dropped on rollback."""
+        ...
+
+    def run_in_transaction(
+        self,
+        fn: Callable[[Self], T],
+        *,
+        isolation_level: str | None = None,
+        max_attempts: int | None = None,
+    ) -> T:
+        """Run ``fn(self)`` in a fresh transaction and commit it.
+
+        Work already pending on the unit of work is committed first. Serialization
+        failures and deadlocks roll back and re-run ``fn`` with jittered backoff, so
+        ``fn`` must be safe to repeat (re-register ``on_commit`` hooks inside it).
+        """
+        ...
+
+    def lock(self, *keys: str) -> None:
+        """Take transaction-scoped locks on ``keys``; released on commit/rollback.
+
+        Take every key a transaction needs in one call so locks are acquired in a
+        consistent order.
+        """
+        ...
@@ -1,17 +1,29 @@
-from fastapi import Depends, FastAPI, Request
+import logging
+import secrets
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import asynccontextmanager
+
+from fastapi import Depends, FastAPI, Header, Query, Request
 from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, PlainTextResponse, Response
 from pydantic import BaseModel
 
+from .adapters.entity_cache import get_entity_cache
 from .adapters.memory_uow import InMemoryUnitOfWork
+from .adapters.sqlalchemy.instrumentation import enforce_query_budget, track_queries
+from .adapters.sqlalchemy.swipe_buffer import SwipeFlusher, get_swipe_buffer
 from .config import Settings
 from .dependencies.settings import get_settings
-from .dependencies.uow import get_uow
+from .dependencies.uow import get_uow, open_uow
 from .errors import Problem, problem
 from .interfaces.errors import ConflictError, NotFoundError, ValidationError
 from .logging_config import configure_logging
-from .routers import listings, matches,  seekers, swipes, auth, users
+from .profiling import render_collapsed, sample_stacks
+from .routers import listings, matches, saved_searches,  seekers, swipes, auth, users
+from .services.match_events import PgNotifyBridge, get_match_broker
+from .services.notifications import OutboxWorker, SmtpSender
+from .services.ranking import get_ranker
 
 
 class HealthResponse(BaseModel):
@@ -28,8 +40,60 @@ class SeedCounts(BaseModel):
 
 
 configure_logging()
-
-app = FastAPI(title="Sublease Matcher API")
+logger = logging.getLogger(__name__)
+
+
+@asynccontextmanager
+async def lifespan(_: FastAPI) -> AsyncIterator[None]:
+    settings = get_settings()
+    ranker = get_ranker()
+    if ranker is not None:
+        logger.info("ranking model %s from %s", ranker.model.version, ranker.path)
+    worker: OutboxWorker | None = None
+    if settings.notifications_worker_enabled:
+        sender = SmtpSender(
+            settings.smtp_host,
+            settings.smtp_port,
+            sender=settings.smtp_sender,
+            username=settings.smtp_username,
+            password=settings.smtp_password,
+            starttls=settings.smtp_starttls,
+        )
+        worker = OutboxWorker(
+            open_uow,
+            sender,
+            batch_size=settings.notifications_batch_size,
+            max_attempts=settings.notifications_max_attempts,
+            poll_interval_seconds=settings.notifications_poll_seconds,
+        )
+        worker.start()
+    bridge: PgNotifyBridge | None = None
+    if settings.match_events_pg_notify and settings.database_url:
+        bridge = PgNotifyBridge(
+            settings.database_url, settings.match_events_channel, get_match_broker()
+        )
+        bridge.start()
+    flusher: SwipeFlusher | None = None
+    swipe_buffer = get_swipe_buffer() if settings.storage == "sqlalchemy" else None
+    if swipe_buffer is not None:
+        from .adapters.sqlalchemy.db import SessionLocal
+
+        flusher = SwipeFlusher(
+            swipe_buffer, SessionLocal, interval_seconds=settings.swipe_buffer_flush_seconds
+        )
+        flusher.start()
+    try:
+        yield
+    finally:
+        if flusher is not None:
+            flusher.stop()
+        if bridge is not None:
+            bridge.stop()
+        if worker is not None:
+            worker.stop()
+
+
+app = FastAPI(title="Sublease Matcher API", lifespan=lifespan)
 settings_instance = get_settings()
 app.add_middleware(
     CORSMiddleware,
@@ -40,15 +104,37 @@ app.add_middleware(
 )
 app.include_router(seekers.router)
 app.include_router(seekers.profiles_router)
+app.include_router(saved_searches.router)
 app.include_router(listings.router)
 app.include_router(listings.public_router)
 app.include_router(swipes.router)
-app.include_router(swipes.public_router)
 app.include_router(matches.router)
 app.include_router(auth.router)
 app.include_router(users.router)
 
 
+@app.middleware("http")
+async def instrument_queries(
+    request: Request,
+    call_next: Callable[[Request], Awaitable[Response]],
+) -> Response:
+    settings = get_settings()
+    with track_queries() as stats:
+        response = await call_next(request)
+    if stats.statements:
+        label = f"{request.method} {request.url.path}"
+        logger.debug(
+            "%s: %d statements, %.1f ms in DB", label, stats.statements, stats.total_ms
+        )
+        for shape, count in stats.repeated(settings.sql_n_plus_one_threshold):
+            logger.warning("%s: possible N+1, %d x %s", label, count, shape)
+        if settings.debug:
+            response.headers["X-DB-Query-Count"] = str(stats.statements)
+            response.headers["X-DB-Time-Ms"] = f"{stats.total_ms:.1f}"
+        enforce_query_budget(stats, max_statements=settings.sql_query_budget, label=label)
+    return response
+
+
 @app.get("/", response_model=HealthResponse, tags=["root"])
 def root(settings: Settings = Depends(get_settings)) -> HealthResponse:
     return HealthResponse(status="ok", app_name=settings.app_name)
@@ -61,13 +147,33 @@ def health(settings: Settings = Depends(get_settings)) -> HealthResponse:
 
 @app.get("/_debug/seed_counts", response_model=SeedCounts, tags=["debug"])
 def seed_counts(uow: InMemoryUnitOfWork = Depends(get_uow)) -> SeedCounts:
-    return SeedCounts(
-        seekers=len(uow.seekers._data),
-        hosts=len(uow.hosts._data),
-        listings=len(uow.listings._data),
-        swipes=len(uow.swipes._data),
-        matches=len(uow.matches._data),
-    )
+    return SeedCounts(**uow.row_counts())
+
+
+@app.get("/_debug/cache_stats", tags=["debug"])
+def cache_stats(settings: Settings = Depends(get_settings)) -> dict[str, int | bool]:
+    """Entity cache counters for this worker process."""
+    if not settings.entity_cache_enabled:
+        return {"enabled": False}
+    return {"enabled": True, **get_entity_cache().snapshot()}
+
+
+@app.get("/_debug/profile", response_class=PlainTextResponse, tags=["debug"])
+def profile(
+    seconds: float = Query(5.0, gt=0, le=60),
+    interval_ms: float = Query(10.0, ge=1, le=1000),
+    x_debug_token: str | None = Header(default=None),
+    settings: Settings = Depends(get_settings),
+) -> PlainTextResponse:
+    """Sample this worker's threads and return collapsed stacks for flamegraph.pl/speedscope."""
+    expected = settings.debug_token
+    if not expected or not x_debug_token or not secrets.compare_digest(x_debug_token, expected):
+        raise NotFoundError()
+    try:
+        samples = sample_stacks(seconds, interval=interval_ms / 1000.0)
+    except RuntimeError as exc:
+        raise ConflictError(str(exc)) from exc
+    return PlainTextResponse(render_collapsed(samples))
 
 
 def _problem_response(pb: Problem) -> JSONResponse:
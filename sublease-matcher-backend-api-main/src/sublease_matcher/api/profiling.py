@@ -0,0 +1,54 @@
+"""In-process stack sampler that emits collapsed stacks for flamegraph tooling."""
+
+from __future__ import annotations
+
+import sys
+import threading
+import time
+from collections import Counter
+from types import FrameType
+
+_profile_lock = threading.Lock()
+
+
+def _frame_label(frame: FrameType) -> str:
+    code = frame.f_code
+    module = frame.f_globals.get("__name__", code.co_filename)
+    return f"{module}:{code.co_name}"
+
+
+def collapse_stack(frame: FrameType | None) -> str:
+    """Render a frame chain root-first as ``mod:func;mod:func`` (Brendan Gregg format)."""
+
+    labels: list[str] = []
+    while frame is not None:
+        labels.append(_frame_label(frame))
+        frame = frame.f_back
+    return ";".join(reversed(labels))
+
+
+def sample_stacks(seconds: float, *, interval: float) -> Counter[str]:
+    """Sample every other thread in this process until ``seconds`` have elapsed."""
+
+    if not _profile_lock.acquire(blocking=False):
+        raise RuntimeError("a profile is already running in this worker")
+    try:
+        own_thread = threading.get_ident()
+        samples: Counter[str] = Counter()
+        deadline = time.monotonic() + seconds
+        while time.monotonic() < deadline:
+            # Re-read every tick so threads started mid-profile keep their names.
+            thread_names = {thread.ident: thread.name for thread in threading.enumerate()}
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id == own_thread:
+                    continue
+                name = thread_names.get(thread_id) or f"thread-{thread_id}"
+                samples[f"{name};{collapse_stack(frame)}"] += 1
+            time.sleep(interval)
+        return samples
+    finally:
+        _profile_lock.release()
+
+
+def render_collapsed(samples: Counter[str]) -> str:
+    return "".join(f"{stack} {count}\n" for stack, count in samples.most_common())
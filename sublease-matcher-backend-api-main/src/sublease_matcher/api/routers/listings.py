@@ -1,23 +1,32 @@
 from __future__ import annotations
 
+import base64
+import binascii
+import json
 from collections.abc import Mapping, MutableMapping
 from decimal import Decimal
 from typing import Any, Literal, cast
 
-from fastapi import APIRouter, Depends, Request
+from fastapi import APIRouter, Depends, Header, Query, Request, Response
 
 from ..adapters.memory_uow import InMemoryUnitOfWork
 from ..dependencies.uow import get_uow
 from ..dependencies.auth import get_current_user_id
+from ..etags import etag_matches, make_etag, not_modified, set_etag
 from ..interfaces.errors import ConflictError, NotFoundError, ValidationError
 from ..interfaces.types import HostDict, ListingDict
+from ..services.new_listings import notify_interested_seekers
+from ..services.saved_searches import alert_saved_searches
 from .dto import HostListingDTO
+from .queue_items import ListingQueueItem, to_listing_queue_item
+from .swipes import MAX_RADIUS_KM
 from sublease_matcher.core.errors import Validation
 from sublease_matcher.core.domain.listing import Listing
 from sublease_matcher.core.domain.enums import ListingStatus
 from sublease_matcher.core.domain.value_objects import Money
 from sublease_matcher.core.domain.roommate import RoommateProfile
 from sublease_matcher.core.domain.ids import ListingId, HostId, RoommateId
+from sublease_matcher.core.geo import GeoPoint, Radius
 
 router = APIRouter(prefix="/hosts/me", tags=["listings"])
 public_router = APIRouter(prefix="/listings", tags=["listings"])
@@ -181,17 +190,29 @@ def _persist_listing_from_dto(
 
     try:
         listing = uow.listings.upsert(cast(ListingDict, listing_payload))
+        alert_saved_searches(uow, [listing])
         return HostListingDTO.from_parts(host, listing)
     except Validation as e:
         raise ValidationError(str(e)) from e
 
 
+def _listing_etag(listing_id: str, version: int) -> str:
+    return make_etag("listing", listing_id, version)
+
+
 @router.get("/listing", response_model=HostListingDTO)
 def read_listing(
+    response: Response,
     uow: InMemoryUnitOfWork = Depends(get_uow),
     user_id: str = Depends(get_current_user_id),
-) -> HostListingDTO:
+    if_none_match: str | None = Header(default=None),
+) -> HostListingDTO | Response:
+    host = uow.hosts.get_by_user(user_id)
+    current = uow.listings.get_version_by_host(host["id"]) if host else None
+    if current is not None and etag_matches(if_none_match, _listing_etag(*current)):
+        return not_modified(_listing_etag(*current))
     host, listing = _require_host_listing(uow, user_id)
+    set_etag(response, _listing_etag(listing["id"], listing.get("version", 1)))
     return HostListingDTO.from_parts(host, listing)
 
 
@@ -268,17 +289,73 @@ def read_my_listings(
     return [HostListingDTO.from_parts(host, listing)]
 
 
+def _encode_search_cursor(rank: float, listing_id: str) -> str:
+    raw = json.dumps([rank, listing_id], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def _decode_search_cursor(cursor: str) -> tuple[float, str]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        rank, listing_id = json.loads(base64.urlsafe_b64decode(padded))
+        if not isinstance(rank, (int, float)) or not isinstance(listing_id, str):
+            raise ValueError
+    except (ValueError, TypeError, binascii.Error) as exc:
+        raise ValidationError("Invalid cursor") from exc
+    return float(rank), listing_id
+
+
+@public_router.get("/search", response_model=list[ListingQueueItem])
+def search_listings(
+    response: Response,
+    q: str = Query(..., min_length=1, max_length=200),
+    limit: int = Query(20, ge=1, le=100),
+    cursor: str | None = None,
+    lat: float | None = Query(None, ge=-90, le=90),
+    lon: float | None = Query(None, ge=-180, le=180),
+    within_km: float | None = Query(None, gt=0, le=MAX_RADIUS_KM),
+    uow: InMemoryUnitOfWork = Depends(get_uow),
+) -> list[ListingQueueItem]:
+    """
+    Full-text search over published listings: title, host bio, roommate bios and majors.
+
+    Best match first. Pages with ``cursor`` (see the ``X-Next-Cursor`` response header).
+    ``lat``, ``lon`` and ``within_km`` together keep only listings within that radius.
+    """
+    location = (lat, lon, within_km)
+    if any(value is not None for value in location) and None in location:
+        raise ValidationError("lat, lon and within_km must be given together")
+    within = None
+    if lat is not None and lon is not None and within_km is not None:
+        within = Radius(GeoPoint(lat, lon), within_km)
+    after = _decode_search_cursor(cursor) if cursor else None
+    hits = uow.listings.search_text(q, limit=limit + 1, after=after, within=within)
+    if len(hits) > limit:
+        hits = hits[:limit]
+        last, rank = hits[-1]
+        response.headers["X-Next-Cursor"] = _encode_search_cursor(rank, last["id"])
+    return [to_listing_queue_item(listing) for listing, _ in hits]
+
+
 @public_router.get("/{listing_id}", response_model=HostListingDTO)
 def read_listing_by_id(
     listing_id: str,
+    response: Response,
     uow: InMemoryUnitOfWork = Depends(get_uow),
-) -> HostListingDTO:
+    if_none_match: str | None = Header(default=None),
+) -> HostListingDTO | Response:
+    version = uow.listings.get_version(listing_id)
+    if version is None:
+        raise NotFoundError("Listing not found")
+    if etag_matches(if_none_match, _listing_etag(listing_id, version)):
+        return not_modified(_listing_etag(listing_id, version))
     listing = uow.listings.get(listing_id)
     if listing is None:
         raise NotFoundError("Listing not found")
     host = uow.hosts.get(listing.get("host_id", ""))
     if host is None:
         raise NotFoundError("Host not found for listing")
+    set_etag(response, _listing_etag(listing_id, listing.get("version", 1)))
     return HostListingDTO.from_parts(host, listing)
 
 
@@ -340,6 +417,9 @@ def toggle_listing_publication(
 
     try:
         updated_listing = uow.listings.upsert(listing)
-        return HostListingDTO.from_parts(host, updated_listing)
     except Validation as e:
         raise ValidationError(str(e)) from e
+    if next_status == "PUBLISHED":
+        notify_interested_seekers(uow, updated_listing)
+        alert_saved_searches(uow, [updated_listing])
+    return HostListingDTO.from_parts(host, updated_listing)
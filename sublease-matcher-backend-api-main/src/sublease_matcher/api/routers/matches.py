@@ -4,31 +4,57 @@ Matches router - dedicated endpoints for match operations.
 Provides:
 - GET /matches - Secure, enriched matches for the current user
 - GET /matches/recommendations - Recommendation queue for seekers
+- GET /matches/stream - Server-Sent Events push of new mutual matches
 """
 
 from __future__ import annotations
 
-from typing import Literal, Union
+import asyncio
+import heapq
+import json
+from collections.abc import AsyncIterator
+from typing import TYPE_CHECKING, Any, Literal, Union
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Header, Query, Request, Response
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 
+from ..config import Settings
+from ..dependencies.settings import get_settings
 from ..dependencies.uow import get_uow
-from ..dependencies.auth import get_current_user_id
+from ..dependencies.auth import get_current_user_id, get_stream_user_id
 from ..interfaces.errors import NotFoundError
 from ..interfaces.uow import UnitOfWork
-from ..interfaces.types import ListingDict, MatchDict
-from .swipes import (
-    ListingQueueItem,
-    SeekerQueueItem,
-    MatchOut,
-    _to_listing_queue_item,
-    _to_seeker_queue_item,
-    _to_match_out,
+from ..interfaces.types import ListingDict, SeekerDict
+from ..services.match_events import MatchBroker, get_match_broker
+from ..services.ranking import get_ranker
+from ..services.scoring import listing_projection, seeker_projection
+from sublease_matcher.core.services.compatibility import (
+    blend_compatibility,
+    compatibility_hundredths,
 )
+from sublease_matcher.core.services.neighbors import neighbor_lift
+from sublease_matcher.core.services.scoring import (
+    BUDGET_POINTS,
+    ListingScoring,
+    SeekerScoring,
+    budget_points,
+    city_points,
+    div_round_half_even,
+)
+from .queue_items import ListingQueueItem, SeekerQueueItem, to_listing_queue_item
+from .swipes import MatchOut, match_feed_response
+
+if TYPE_CHECKING:
+    from sublease_matcher.core.ranking import ModelFile
 
 router = APIRouter(prefix="/matches", tags=["matches"])
 
+# Roommate compatibility (0-100) from which the fit is mentioned in the reason.
+GOOD_ROOMMATE_FIT = 70
+# How many of the seeker's latest likes seed the item-item neighbour lookup.
+RECENT_LIKES = 50
+
 
 class EnrichedMatch(MatchOut):
     """A match that includes details about the matched profile/listing."""
@@ -44,62 +70,82 @@ class RecommendationItem(BaseModel):
 
 @router.get("", response_model=list[EnrichedMatch])
 def get_matches(
+    response: Response,
     uow: UnitOfWork = Depends(get_uow),
     user_id: str = Depends(get_current_user_id),
-) -> list[EnrichedMatch]:
+    limit: int = Query(50, ge=1, le=100),
+    cursor: str | None = None,
+    if_none_match: str | None = Header(default=None),
+) -> list[EnrichedMatch] | Response:
     """
-    Get mutual matches for the current user.
-    
-    Identifies if the user is a Seeker or Host and returns appropriate matches
-    enriched with the OTHER party's profile data.
+    Get matches for the current user, best score first.
+
+    Covers both roles: listings the user matched on as a seeker and seekers matched to
+    the user's listing as a host, each enriched with the OTHER party's profile data.
+    Pages with ``cursor`` (see the ``X-Next-Cursor`` response header); honours If-None-Match.
     """
-    # 1. Try as Seeker
-    seeker = uow.seekers.get_by_user(user_id)
-    if seeker and seeker.get("id"):
-        matches = uow.matches.list_for_seeker(seeker["id"])
-        results = []
-        for match in matches:
-            out = EnrichedMatch(**_to_match_out(match).model_dump())
-            # Fetch the listing details
-            listing = uow.listings.get(match["listing_id"])
-            if listing:
-                out.target_profile = _to_listing_queue_item(listing)
-            results.append(out)
-        return results
-
-    # 2. Try as Host
-    host = uow.hosts.get_by_user(user_id)
-    if host and host.get("id"):
-        matches = uow.matches.list_for_host(host["id"])
-        
-        # Filter matches by the host's active listing (if any)
-        # In a real app, a host might have multiple listings, but here we assume one active context
-        listing = uow.listings.get_by_host(host["id"])
-        if listing and listing.get("id"):
-             matches = [m for m in matches if m.get("listing_id") == listing["id"]]
-        
-        results = []
-        for match in matches:
-            out = EnrichedMatch(**_to_match_out(match).model_dump())
-            # Fetch the seeker details
-            matched_seeker = uow.seekers.get(match["seeker_id"])
-            if matched_seeker:
-                out.target_profile = _to_seeker_queue_item(matched_seeker)
-            results.append(out)
-        return results
+    page = match_feed_response(
+        uow, user_id, response, limit=limit, cursor=cursor, if_none_match=if_none_match
+    )
+    if isinstance(page, Response):
+        return page
+    return [EnrichedMatch(**dict(match)) for match in page]
+
+
+def _sse(event: dict[str, Any]) -> str:
+    data = json.dumps(event, default=str)
+    event_id = event.get("match_id") or event.get("listing_id", "")
+    return f"event: {event.get('type', 'message')}\nid: {event_id}\ndata: {data}\n\n"
+
+
+@router.get("/stream", response_class=StreamingResponse)
+async def stream_matches(
+    request: Request,
+    user_id: str = Depends(get_stream_user_id),
+    broker: MatchBroker = Depends(get_match_broker),
+    settings: Settings = Depends(get_settings),
+) -> StreamingResponse:
+    """
+    Push new mutual matches to the current user as they happen (text/event-stream).
+
+    Seekers also get a ``listing.published`` event when a listing that suits
+    them goes live, so an open deck can take it in.
+
+    Sends a comment heartbeat while idle so proxies keep the connection open.
+    """
+
+    async def events() -> AsyncIterator[str]:
+        async with broker.subscribe(user_id) as queue:
+            yield "retry: 5000\n\n"
+            while not await request.is_disconnected():
+                try:
+                    event = await asyncio.wait_for(
+                        queue.get(), timeout=settings.match_stream_heartbeat_seconds
+                    )
+                except TimeoutError:
+                    yield ": keepalive\n\n"
+                    continue
+                yield _sse(event)
 
-    # 3. No profile found
-    return []
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
 
 
 @router.get("/recommendations", response_model=list[RecommendationItem])
 def get_recommendations(
     uow: UnitOfWork = Depends(get_uow),
     user_id: str = Depends(get_current_user_id),
+    ranker: ModelFile | None = Depends(get_ranker),
     limit: int = 20,
 ) -> list[RecommendationItem]:
     """
-    Get personalized listing recommendations for a seeker.
+    Get personalized listing recommendations for a seeker, best score first.
+
+    With a learned ranking model configured, its like probability replaces the
+    hand-tuned score; the whole deck is scored in one batch.
     """
     # Get the seeker profile for the current user
     seeker = uow.seekers.get_by_user(user_id)
@@ -107,21 +153,38 @@ def get_recommendations(
         raise NotFoundError("Seeker profile not found")
     
     # Get the listing queue (already filtered and scored)
-    listing_queue = uow.listings.queue_for_seeker(seeker["id"])
+    seen = uow.seen_sets.get(seeker["id"])
+    listing_queue = uow.listings.queue_for_seeker(seeker["id"], seen=seen)
+    # Neighbours of the latest likes, fetched by key; the deck then just looks them up
+    similar = uow.listing_neighbors.similar_to(uow.swipes.recent_likes(user_id, RECENT_LIKES))
     
-    # Convert to recommendations with score information
+    # Score the whole deck (cheap: no per-pair trig), keep the best; ties stay in deck order
+    seeker_scoring = seeker_projection(seeker)
+    projections = [listing_projection(listing) for listing in listing_queue]
+    learned = (
+        None if ranker is None else ranker.model.score_hundredths(seeker_scoring, projections)
+    )
+    scored = []
+    for index, (listing, listing_scoring) in enumerate(zip(listing_queue, projections, strict=True)):
+        similarity = similar.get(listing["id"], 0.0)
+        if learned is None:
+            score = _calculate_recommendation_score(seeker_scoring, listing_scoring, similarity)
+        else:
+            score = neighbor_lift(learned[index], similarity) / 100
+        scored.append((score, listing, listing_scoring, similarity))
     recommendations: list[RecommendationItem] = []
-    
-    for listing in listing_queue[:limit]:
-        # Calculate score for this listing
-        score = _calculate_recommendation_score(seeker, listing)
-        
+
+    for score, listing, listing_scoring, similarity in heapq.nlargest(
+        limit, scored, key=lambda row: row[0]
+    ):
         # Generate reason text
-        reason = _generate_recommendation_reason(seeker, listing, score)
+        reason = _generate_recommendation_reason(
+            seeker, listing, seeker_scoring, listing_scoring, similarity
+        )
         
         recommendations.append(
             RecommendationItem(
-                listing=_to_listing_queue_item(listing),
+                listing=to_listing_queue_item(listing),
                 score=score,
                 reason=reason,
             )
@@ -131,67 +194,70 @@ def get_recommendations(
 
 
 def _calculate_recommendation_score(
-    seeker: dict, 
-    listing: ListingDict
+    seeker: SeekerScoring, listing: ListingScoring, similarity: float = 0.0
 ) -> float:
     """
     Calculate a recommendation score between 0.0 and 1.0.
+
+    Integer hundredths throughout: 50 for the same city, decaying with distance
+    for nearby towns, and up to 50 for budget fit (one hundredth lost per $10
+    over budget, rounded half-to-even). Roommate compatibility is then blended in,
+    and listings co-liked with the seeker's likes are lifted by ``similarity``.
     """
-    score = 0.0
-    
-    # City match (0.5 points)
-    seeker_city = (seeker.get("city") or "").strip().lower()
-    listing_city = (listing.get("city") or "").strip().lower()
-    
-    if seeker_city and listing_city and seeker_city == listing_city:
-        score += 0.5
-    
-    # Budget fit (0.5 points max)
-    budget_max = seeker.get("budget_max")
-    price = listing.get("price_per_month")
-    
-    if budget_max and price:
-        if price <= budget_max:
-            # Perfect fit
-            score += 0.5
-        else:
-            # Decay: lose 0.1 points per $100 over budget
-            overage = float(price - budget_max)
-            penalty = (overage / 100.0) * 0.1
-            budget_score = max(0.0, 0.5 - penalty)
-            score += budget_score
-    elif not price or not budget_max:
+    points = 0
+    if seeker.city_key:
+        points += city_points(seeker, listing)
+    if seeker.budget_max_cents is not None and listing.price_cents is not None:
+        points += budget_points(listing.price_cents, seeker.budget_max_cents)
+    else:
         # If missing data, be optimistic
-        score += 0.5
-    
-    return round(score, 2)
+        points += BUDGET_POINTS
+    compatibility = compatibility_hundredths(seeker.traits, listing.roommate_features)
+    return neighbor_lift(blend_compatibility(points, compatibility), similarity) / 100
 
 
 def _generate_recommendation_reason(
-    seeker: dict,
+    seeker: SeekerDict,
     listing: ListingDict,
-    score: float,
+    seeker_scoring: SeekerScoring,
+    listing_scoring: ListingScoring,
+    similarity: float = 0.0,
 ) -> str:
     """Generate a human-readable reason for the recommendation."""
     reasons: list[str] = []
     
     # City match
-    seeker_city = (seeker.get("city") or "").strip().lower()
-    listing_city = (listing.get("city") or "").strip().lower()
-    
-    if seeker_city and listing_city and seeker_city == listing_city:
+    if seeker_scoring.city_key and seeker_scoring.city_key == listing_scoring.city_key:
         reasons.append(f"in {listing.get('city')}")
+    elif (
+        seeker_scoring.city_key
+        and seeker_scoring.origin is not None
+        and listing_scoring.point is not None
+        and city_points(seeker_scoring, listing_scoring)
+    ):
+        km = seeker_scoring.origin.distance_km(listing_scoring.point)
+        reasons.append(f"{km:.0f} km away in {listing.get('city')}")
     
     # Budget fit
-    budget_max = seeker.get("budget_max")
-    price = listing.get("price_per_month")
+    budget_max = seeker_scoring.budget_max_cents
+    price = listing_scoring.price_cents
     
-    if budget_max and price:
+    if budget_max is not None and price is not None:
         if price <= budget_max:
             reasons.append("within budget")
         else:
-            overage = float(price - budget_max)
-            reasons.append(f"${overage:.0f} over budget")
+            reasons.append(f"${div_round_half_even(price - budget_max, 100)} over budget")
+
+    # Roommate fit
+    compatibility = compatibility_hundredths(
+        seeker_scoring.traits, listing_scoring.roommate_features
+    )
+    if compatibility is not None and compatibility >= GOOD_ROOMMATE_FIT:
+        reasons.append("compatible roommates")
+
+    # Co-liked with listings the seeker liked
+    if similarity > 0:
+        reasons.append("liked by seekers with similar picks")
     
     # Availability overlap (simplified check)
     seeker_from = seeker.get("available_from")
@@ -0,0 +1,107 @@
+"""
+Queue item models - the listing and seeker cards every router renders.
+
+Shared by the swipe deck, matches, recommendations, search and saved-search
+alerts, so they all serialize a listing or seeker the same way.
+"""
+
+from __future__ import annotations
+
+from decimal import Decimal
+from typing import Literal
+
+from pydantic import BaseModel
+
+from ..interfaces.types import ListingDict, SeekerDict
+
+
+class Roommate(BaseModel):
+    id: str | None = None
+    name: str | None = None
+    major: str | None = None
+    interests: list[str] = []
+    bio: str | None = None
+    photo_url: str | None = None
+    sleepingHabits: str | None = None
+    gender: str | None = None
+    pronouns: str | None = None
+
+
+class ListingQueueItem(BaseModel):
+    id: str
+    title: str | None = None
+    city: str | None = None
+    state: str | None = None
+    pricePerMonth: Decimal | None = None
+    status: Literal["DRAFT", "PUBLISHED", "UNLISTED"] | None = None
+    availableFrom: str | None = None
+    availableTo: str | None = None
+    bio: str | None = None
+    interests: list[str] = []
+    photos: list[str] = []
+    roommates: list[Roommate] = []
+
+
+class SeekerQueueItem(BaseModel):
+    id: str
+    name: str | None = None
+    bio: str | None = None
+    budgetMin: Decimal | None = None
+    budgetMax: Decimal | None = None
+    city: str | None = None
+    available_from: str | None = None
+    available_to: str | None = None
+    major: str | None = None
+    interests: list[str] = []
+    photos: list[str] = []
+
+
+
+def to_listing_queue_item(listing: ListingDict) -> ListingQueueItem:
+    available_from = listing.get("available_from")
+    available_to = listing.get("available_to")
+    return ListingQueueItem(
+        id=listing.get("id", ""),
+        title=listing.get("title"),
+        city=listing.get("city"),
+        state=listing.get("state"),
+        pricePerMonth=listing.get("price_per_month"),
+        status=listing.get("status"),
+        availableFrom=str(available_from) if available_from else None,
+        availableTo=str(available_to) if available_to else None,
+        bio=listing.get("bio"),
+        interests=listing.get("interests", []),
+        photos=listing.get("photos", []),
+        roommates=[
+            Roommate(
+                id=r.get("id"),
+                name=r.get("name"),
+                major=r.get("major"),
+                interests=r.get("interests", []),
+                bio=r.get("bio"),
+                photo_url=r.get("photo_url"),
+                sleepingHabits=r.get("sleepingHabits"),
+                gender=r.get("gender"),
+                pronouns=r.get("pronouns"),
+            )
+            for r in listing.get("roommates", [])
+        ]
+    )
+
+
+def to_seeker_queue_item(seeker: SeekerDict) -> SeekerQueueItem:
+    available_from = seeker.get("available_from")
+    available_to = seeker.get("available_to")
+    return SeekerQueueItem(
+        id=seeker.get("id", ""),
+        name=seeker.get("name"),
+        bio=seeker.get("bio"),
+        budgetMin=seeker.get("budget_min"),
+        budgetMax=seeker.get("budget_max"),
+        city=seeker.get("city"),
+        available_from=str(available_from) if available_from else None,
+        available_to=str(available_to) if available_to else None,
+        major=seeker.get("major"),
+        interests=seeker.get("interests", []),
+        photos=seeker.get("photos", []),
+    )
@@ -0,0 +1,165 @@
+"""
+Saved searches router - a seeker's standing queries and their alerts inbox.
+
+Provides:
+- POST/GET /seekers/me/searches - Save a search, list saved searches
+- DELETE /seekers/me/searches/{search_id} - Drop a saved search
+- GET /seekers/me/alerts - Listings that matched a saved search, newest first
+- POST /seekers/me/alerts/read - Mark alerts read
+
+Searches are not re-run here: alerts are filed as listings are written (see
+``services.saved_searches``), so reading the inbox is a plain lookup.
+"""
+
+from __future__ import annotations
+
+from datetime import date, datetime
+from decimal import Decimal
+
+from fastapi import APIRouter, Depends, Query, Response
+from pydantic import BaseModel, Field
+
+from sublease_matcher.core.domain import normalize_city_key
+
+from ..dependencies.auth import get_current_user_id
+from ..dependencies.uow import get_uow
+from ..interfaces.errors import ConflictError, NotFoundError, ValidationError
+from ..interfaces.types import SavedSearchDict, SeekerDict
+from ..interfaces.uow import UnitOfWork
+from ..services.saved_searches import MAX_SAVED_SEARCHES, normalize_interests
+from .queue_items import ListingQueueItem, to_listing_queue_item
+
+router = APIRouter(prefix="/seekers/me", tags=["saved-searches"])
+
+
+class SavedSearchIn(BaseModel):
+    city: str
+    maxPrice: Decimal | None = Field(default=None, ge=0)
+    moveIn: date | None = None
+    moveOut: date | None = None
+    interests: list[str] = Field(default_factory=list)
+
+
+class SavedSearchOut(SavedSearchIn):
+    id: str
+    createdAt: datetime
+
+
+class AlertOut(BaseModel):
+    id: str
+    searchId: str
+    listing: ListingQueueItem | None = None
+    createdAt: datetime
+    readAt: datetime | None = None
+
+
+class MarkRead(BaseModel):
+    ids: list[str] = Field(default_factory=list, max_length=500)
+
+
+class MarkReadResponse(BaseModel):
+    marked: int
+
+
+def _require_seeker(uow: UnitOfWork, user_id: str) -> SeekerDict:
+    seeker = uow.seekers.get_by_user(user_id)
+    if seeker is None or not seeker.get("id"):
+        raise NotFoundError("Seeker profile not found")
+    return seeker
+
+
+def _to_search_out(search: SavedSearchDict) -> SavedSearchOut:
+    return SavedSearchOut(
+        id=search["id"],
+        city=search["city"],
+        maxPrice=search.get("max_price"),
+        moveIn=search.get("move_in"),
+        moveOut=search.get("move_out"),
+        interests=list(search.get("interests") or ()),
+        createdAt=search["created_at"],
+    )
+
+
+@router.post("/searches", response_model=SavedSearchOut, status_code=201)
+def create_saved_search(
+    payload: SavedSearchIn,
+    uow: UnitOfWork = Depends(get_uow),
+    user_id: str = Depends(get_current_user_id),
+) -> SavedSearchOut:
+    seeker = _require_seeker(uow, user_id)
+    if not normalize_city_key(payload.city):
+        raise ValidationError("city is required")
+    if payload.moveIn and payload.moveOut and payload.moveOut < payload.moveIn:
+        raise ValidationError("moveOut must be on or after moveIn")
+    # Held until commit, so concurrent saves by one seeker count and insert in turn.
+    uow.lock(f"saved-searches:{seeker['id']}")
+    if len(uow.saved_searches.list_for_seeker(seeker["id"])) >= MAX_SAVED_SEARCHES:
+        raise ConflictError(f"At most {MAX_SAVED_SEARCHES} saved searches")
+    search = uow.saved_searches.add(
+        {
+            "seeker_id": seeker["id"],
+            "city": payload.city.strip(),
+            "max_price": payload.maxPrice,
+            "move_in": payload.moveIn,
+            "move_out": payload.moveOut,
+            "interests": normalize_interests(payload.interests),
+        }
+    )
+    return _to_search_out(search)
+
+
+@router.get("/searches", response_model=list[SavedSearchOut])
+def list_saved_searches(
+    uow: UnitOfWork = Depends(get_uow),
+    user_id: str = Depends(get_current_user_id),
+) -> list[SavedSearchOut]:
+    seeker = _require_seeker(uow, user_id)
+    return [_to_search_out(search) for search in uow.saved_searches.list_for_seeker(seeker["id"])]
+
+
+@router.delete("/searches/{search_id}", status_code=204)
+def delete_saved_search(
+    search_id: str,
+    uow: UnitOfWork = Depends(get_uow),
+    user_id: str = Depends(get_current_user_id),
+) -> Response:
+    seeker = _require_seeker(uow, user_id)
+    if not uow.saved_searches.delete(seeker["id"], search_id):
+        raise NotFoundError("Saved search not found")
+    return Response(status_code=204)
+
+
+@router.get("/alerts", response_model=list[AlertOut])
+def read_alerts(
+    uow: UnitOfWork = Depends(get_uow),
+    user_id: str = Depends(get_current_user_id),
+    unread: bool = Query(False, description="Only alerts not yet marked read"),
+    limit: int = Query(50, ge=1, le=100),
+) -> list[AlertOut]:
+    seeker = _require_seeker(uow, user_id)
+    alerts = uow.search_alerts.inbox(seeker["id"], unread_only=unread, limit=limit)
+    listings = uow.listings.get_many(list({alert["listing_id"] for alert in alerts}))
+    return [
+        AlertOut(
+            id=alert["id"],
+            searchId=alert["search_id"],
+            listing=(
+                to_listing_queue_item(listings[alert["listing_id"]])
+                if alert["listing_id"] in listings
+                else None
+            ),
+            createdAt=alert["created_at"],
+            readAt=alert["read_at"],
+        )
+        for alert in alerts
+    ]
+
+
+@router.post("/alerts/read", response_model=MarkReadResponse)
+def mark_alerts_read(
+    payload: MarkRead,
+    uow: UnitOfWork = Depends(get_uow),
+    user_id: str = Depends(get_current_user_id),
+) -> MarkReadResponse:
+    seeker = _require_seeker(uow, user_id)
+    return MarkReadResponse(marked=uow.search_alerts.mark_read(seeker["id"], payload.ids))
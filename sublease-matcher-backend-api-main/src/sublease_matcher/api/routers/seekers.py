@@ -2,11 +2,12 @@ from __future__ import annotations
 
 from decimal import Decimal
 
-from fastapi import APIRouter, Depends, Request
+from fastapi import APIRouter, Depends, Header, Request, Response
 from pydantic import BaseModel
 
 from ..interfaces.uow import UnitOfWork
 from ..dependencies.uow import get_uow
+from ..etags import etag_matches, make_etag, not_modified, set_etag
 from ..interfaces.errors import NotFoundError, ValidationError
 from .dto import SeekerProfileDTO
 from sublease_matcher.core.errors import Validation
@@ -43,10 +44,19 @@ def _clamp_non_negative(value: Decimal | None) -> Decimal | None:
         return None
     return value if value >= Decimal("0") else Decimal("0")
 
-def _read_profile(uow: UnitOfWork, user_id: str) -> SeekerProfileDTO:
+def _read_profile(
+    uow: UnitOfWork,
+    user_id: str,
+    response: Response,
+    if_none_match: str | None,
+) -> SeekerProfileDTO | Response:
+    current = uow.seekers.get_version_by_user(user_id)
+    if current is not None and etag_matches(if_none_match, make_etag("seeker", *current)):
+        return not_modified(make_etag("seeker", *current))
     seeker = uow.seekers.get_by_user(user_id)
     if seeker is None:
         raise NotFoundError("Seeker profile not found")
+    set_etag(response, make_etag("seeker", seeker["id"], seeker.get("version", 1)))
     return safe_profile_from_dict(seeker)
 
 def _upsert_profile(
@@ -121,10 +131,12 @@ def _toggle_hidden(hidden: bool, uow: UnitOfWork, user_id: str) -> bool:
 
 @router.get("/profile", response_model=SeekerProfileDTO)
 def read_profile(
+    response: Response,
     uow: UnitOfWork = Depends(get_uow),
     user_id: str = Depends(get_current_user_id),
-) -> SeekerProfileDTO:
-    return _read_profile(uow, user_id)
+    if_none_match: str | None = Header(default=None),
+) -> SeekerProfileDTO | Response:
+    return _read_profile(uow, user_id, response, if_none_match)
 
 @router.put("/profile", response_model=SeekerProfileDTO)
 def upsert_profile(
@@ -142,10 +154,12 @@ class HideResponse(BaseModel):
 
 @profiles_router.get("/me", response_model=SeekerProfileDTO)
 def read_profile_alias(
+    response: Response,
     uow: UnitOfWork = Depends(get_uow),
     user_id: str = Depends(get_current_user_id),
-) -> SeekerProfileDTO:
-    return _read_profile(uow, user_id)
+    if_none_match: str | None = Header(default=None),
+) -> SeekerProfileDTO | Response:
+    return _read_profile(uow, user_id, response, if_none_match)
 
 @profiles_router.put("/me", response_model=SeekerProfileDTO)
 def upsert_profile_alias(
@@ -1,21 +1,41 @@
 from __future__ import annotations
 
+from collections.abc import Mapping
 from datetime import datetime
-from decimal import Decimal
-from typing import List, Literal, Union
+from typing import Any, Literal
 
-from fastapi import APIRouter, Depends, Request
+from fastapi import APIRouter, Depends, Header, Query, Request, Response
 from pydantic import BaseModel, ConfigDict
 
 from ..adapters.memory_repos import InMemorySwipeRepo
 from ..adapters.memory_uow import InMemoryUnitOfWork
+from ..dependencies.settings import get_settings
 from ..dependencies.uow import get_uow
 from ..dependencies.auth import get_current_user_id
-from ..interfaces.errors import NotFoundError
+from ..etags import etag_matches, make_etag, not_modified, set_etag
+from ..interfaces.errors import NotFoundError, ValidationError
 from ..interfaces.types import HostDict, ListingDict, MatchDict, SeekerDict, SwipeDict
+from ..interfaces.uow import UnitOfWork
+from ..services.match_events import publish_match_event
+from ..services.match_feed import (
+    MatchFeedService,
+    feed_version_tag,
+    get_feed_cache,
+    invalidate_match_feeds,
+)
+from ..services.notifications import MATCH_MUTUAL
+from .queue_items import (
+    ListingQueueItem,
+    SeekerQueueItem,
+    to_listing_queue_item,
+    to_seeker_queue_item,
+)
+from sublease_matcher.core.geo import GeoPoint, Radius
 
 router = APIRouter(prefix="/swipe", tags=["swipe"])
-public_router = APIRouter(tags=["swipe"])
+
+# Upper bound for every ``within_km`` filter; past this the covering cells get coarse.
+MAX_RADIUS_KM = 200.0
 
 
 
@@ -36,47 +56,6 @@ class SwipeIn(BaseModel):
     )
 
 
-class Roommate(BaseModel):
-    id: str | None = None
-    name: str | None = None
-    major: str | None = None
-    interests: list[str] = []
-    bio: str | None = None
-    photo_url: str | None = None
-    sleepingHabits: str | None = None
-    gender: str | None = None
-    pronouns: str | None = None
-
-
-class ListingQueueItem(BaseModel):
-    id: str
-    title: str | None = None
-    city: str | None = None
-    state: str | None = None
-    pricePerMonth: Decimal | None = None
-    status: Literal["DRAFT", "PUBLISHED", "UNLISTED"] | None = None
-    availableFrom: str | None = None
-    availableTo: str | None = None
-    bio: str | None = None
-    interests: list[str] = []
-    photos: list[str] = []
-    roommates: list[Roommate] = []
-
-
-class SeekerQueueItem(BaseModel):
-    id: str
-    name: str | None = None
-    bio: str | None = None
-    budgetMin: Decimal | None = None
-    budgetMax: Decimal | None = None
-    city: str | None = None
-    available_from: str | None = None
-    available_to: str | None = None
-    major: str | None = None
-    interests: list[str] = []
-    photos: list[str] = []
-
-
 class SwipeOut(BaseModel):
     id: str
     user_id: str
@@ -96,7 +75,7 @@ class MatchOut(BaseModel):
     status: Literal["PENDING", "MUTUAL"]
     score: float | None = None
     matched_at: datetime | None = None
-    target_profile: Union[ListingQueueItem, SeekerQueueItem, None] = None
+    target_profile: ListingQueueItem | SeekerQueueItem | None = None
 
 
 def _has_like(swipes: InMemorySwipeRepo, *, user_id: str, target_id: str) -> bool:
@@ -104,53 +83,35 @@ def _has_like(swipes: InMemorySwipeRepo, *, user_id: str, target_id: str) -> boo
     return swipe is not None and swipe.get("decision") == "like"
 
 
-def _to_listing_queue_item(listing: ListingDict) -> ListingQueueItem:
-    available_from = listing.get("available_from")
-    available_to = listing.get("available_to")
-    return ListingQueueItem(
-        id=listing.get("id", ""),
-        title=listing.get("title"),
-        city=listing.get("city"),
-        state=listing.get("state"),
-        pricePerMonth=listing.get("price_per_month"),
-        status=listing.get("status"),
-        availableFrom=str(available_from) if available_from else None,
-        availableTo=str(available_to) if available_to else None,
-        bio=listing.get("bio"),
-        interests=listing.get("interests", []),
-        photos=listing.get("photos", []),
-        roommates=[
-            Roommate(
-                id=r.get("id"),
-                name=r.get("name"),
-                major=r.get("major"),
-                interests=r.get("interests", []),
-                bio=r.get("bio"),
-                photo_url=r.get("photo_url"),
-                sleepingHabits=r.get("sleepingHabits"),
-                gender=r.get("gender"),
-                pronouns=r.get("pronouns"),
-            )
-            for r in listing.get("roommates", [])
-        ]
-    )
-
-
-def _to_seeker_queue_item(seeker: SeekerDict) -> SeekerQueueItem:
-    available_from = seeker.get("available_from")
-    available_to = seeker.get("available_to")
-    return SeekerQueueItem(
-        id=seeker.get("id", ""),
-        name=seeker.get("name"),
-        bio=seeker.get("bio"),
-        budgetMin=seeker.get("budget_min"),
-        budgetMax=seeker.get("budget_max"),
-        city=seeker.get("city"),
-        available_from=str(available_from) if available_from else None,
-        available_to=str(available_to) if available_to else None,
-        major=seeker.get("major"),
-        interests=seeker.get("interests", []),
-        photos=seeker.get("photos", []),
+def _record_mutual_match(
+    uow: InMemoryUnitOfWork,
+    *,
+    seeker: SeekerDict,
+    listing: ListingDict,
+    host: HostDict,
+) -> None:
+    """Upsert the mutual match and, on the first transition, notify both sides.
+
+    The outbox rows share the swipe's transaction, so a rolled-back swipe never emails anyone;
+    the live stream event is likewise only published once the transaction commits.
+    """
+    recipients = [user for user in (seeker.get("user_id"), host.get("user_id")) if user]
+    match = uow.matches.upsert(seeker["id"], listing["id"], status="MUTUAL", score=0.5)
+    invalidate_match_feeds(uow, recipients)
+    if not match.get("became_mutual"):
+        return
+    payload = {
+        "match_id": match["id"],
+        "seeker_id": seeker["id"],
+        "listing_id": listing["id"],
+        "listing_title": listing.get("title"),
+    }
+    for recipient in recipients:
+        uow.outbox.enqueue(recipient, MATCH_MUTUAL, payload)
+    publish_match_event(
+        uow,
+        recipients,
+        {"type": MATCH_MUTUAL, **payload, "matched_at": match.get("matched_at")},
     )
 
 
@@ -165,7 +126,7 @@ def _to_swipe_out(swipe: SwipeDict) -> SwipeOut:
     )
 
 
-def _to_match_out(match: MatchDict, target_profile: Union[ListingQueueItem, SeekerQueueItem, None] = None) -> MatchOut:
+def _to_match_out(match: MatchDict, target_profile: ListingQueueItem | SeekerQueueItem | None = None) -> MatchOut:
     status = match["status"]
     return MatchOut(
         id=match["id"],
@@ -178,32 +139,52 @@ def _to_match_out(match: MatchDict, target_profile: Union[ListingQueueItem, Seek
     )
 
 
+def _radius_around(row: Mapping[str, Any] | None, within_km: float | None) -> Radius | None:
+    """``within_km`` of a profile's or listing's gazetteer location, if one was asked for."""
+    if within_km is None:
+        return None
+    if row is None or row.get("lat") is None or row.get("lon") is None:
+        raise ValidationError("within_km needs a city that can be located; set city and state")
+    return Radius(GeoPoint(row["lat"], row["lon"]), within_km)
+
+
 @router.get("/queue/seeker", response_model=list[ListingQueueItem])
 def seeker_queue(
     uow: InMemoryUnitOfWork = Depends(get_uow),
     user_id: str = Depends(get_current_user_id),
+    within_km: float | None = Query(None, gt=0, le=MAX_RADIUS_KM),
 ) -> list[ListingQueueItem]:
+    """Listings to swipe on; ``within_km`` keeps only those near the seeker's city."""
     seeker = uow.seekers.get_by_user(user_id)
     if seeker is None or not seeker.get("id"):
         # Auto-create profile if missing so the user can start swiping immediately
         seeker = uow.seekers.upsert({"user_id": user_id})
-    listing_queue = uow.listings.queue_for_seeker(seeker["id"])
-    return [_to_listing_queue_item(item) for item in listing_queue]
+    within = _radius_around(seeker, within_km)
+    seen = uow.seen_sets.get(seeker["id"])
+    listing_queue = uow.listings.queue_for_seeker(seeker["id"], seen=seen, within=within)
+    return [to_listing_queue_item(item) for item in listing_queue]
 
 
 @router.get("/queue/host", response_model=list[SeekerQueueItem])
 def host_queue(
     user_id: str = Depends(get_current_user_id),
     uow: InMemoryUnitOfWork = Depends(get_uow),
+    within_km: float | None = Query(None, gt=0, le=MAX_RADIUS_KM),
 ) -> list[SeekerQueueItem]:
+    """Seekers to swipe on; ``within_km`` keeps only those near the host's listing."""
     host = uow.hosts.get_by_user(user_id)
     if host is None or not host.get("id"):
         # Auto-create profile if missing
         host = uow.hosts.upsert({"user_id": user_id})
+    within = None
+    if within_km is not None:
+        within = _radius_around(uow.listings.get_by_host(host["id"]), within_km)
     seeker_queue = [
-        seeker for seeker in uow.seekers.queue_for_host(host["id"]) if not seeker.get("hidden")
+        seeker
+        for seeker in uow.seekers.queue_for_host(host["id"], within=within)
+        if not seeker.get("hidden")
     ]
-    return [_to_seeker_queue_item(item) for item in seeker_queue]
+    return [to_seeker_queue_item(item) for item in seeker_queue]
 
 
 def _handle_mutual_like_for_listing(
@@ -221,7 +202,7 @@ def _handle_mutual_like_for_listing(
     if not host_user_id or not seeker_id or not listing_id:
         return
     if _has_like(uow.swipes, user_id=host_user_id, target_id=seeker_id):
-        uow.matches.upsert(seeker_id, listing_id, status="MUTUAL", score=0.5)
+        _record_mutual_match(uow, seeker=seeker, listing=listing, host=host)
 
 
 def _handle_mutual_like_for_seeker(
@@ -240,7 +221,54 @@ def _handle_mutual_like_for_seeker(
     if not host_user_id or not listing_id or not seeker_user_id or not seeker_id:
         return
     if _has_like(uow.swipes, user_id=seeker_user_id, target_id=listing_id):
-        uow.matches.upsert(seeker_id, listing_id, status="MUTUAL", score=0.5)
+        _record_mutual_match(uow, seeker=seeker, listing=listing, host=host)
+
+
+def _pair_lock_key(seeker_id: str, listing_id: str) -> str:
+    return f"match-pair:{seeker_id}:{listing_id}"
+
+
+def _apply_swipe(uow: InMemoryUnitOfWork, user_id: str, payload: SwipeIn) -> SwipeDict:
+    """Record the swipe and detect a mutual like; re-run as a whole on serialization failure.
+
+    Both sides of a pair take the same lock before writing their like and looking for the
+    other's, so two simultaneous likes cannot each miss the other and skip the match.
+    """
+    if payload.targetId.startswith("listing-"):
+        seeker = uow.seekers.get_by_user(user_id)
+        listing = uow.listings.get(payload.targetId)
+        if payload.decision != "like":
+            swipe = uow.swipes.record_swipe(user_id, payload.targetId, payload.decision)
+            if seeker is not None and listing is not None:
+                uow.seen_sets.add(seeker["id"], listing["id"])
+            return swipe
+        if seeker is None or listing is None:
+            raise NotFoundError("Seeker or listing not found for swipe")
+        uow.lock(_pair_lock_key(seeker["id"], listing["id"]))
+        swipe = uow.swipes.record_swipe(user_id, payload.targetId, payload.decision)
+        uow.seen_sets.add(seeker["id"], listing["id"])
+        _handle_mutual_like_for_listing(uow=uow, seeker=seeker, listing=listing)
+        return swipe
+
+    if payload.decision != "like":
+        return uow.swipes.record_swipe(user_id, payload.targetId, payload.decision)
+
+    if payload.targetId.startswith("seeker-"):
+        host = uow.hosts.get_by_user(user_id)
+        listing = uow.listings.get_by_host(host["id"]) if host and host.get("id") else None
+        seeker = uow.seekers.get(payload.targetId)
+        # Host and Seeker MUST exist, but Listing is optional corresponding to a new host
+        if host is None or seeker is None:
+            raise NotFoundError("Host or seeker not found for swipe")
+        # Only try to match if a listing actually exists
+        if listing is not None:
+            uow.lock(_pair_lock_key(seeker["id"], listing["id"]))
+        swipe = uow.swipes.record_swipe(user_id, payload.targetId, payload.decision)
+        if listing is not None:
+            _handle_mutual_like_for_seeker(uow=uow, host=host, listing=listing, seeker=seeker)
+        return swipe
+
+    return uow.swipes.record_swipe(user_id, payload.targetId, payload.decision)
 
 
 @router.post("/swipes", response_model=SwipeOut)
@@ -249,34 +277,10 @@ def record_swipe(
     uow: InMemoryUnitOfWork = Depends(get_uow),
     user_id: str = Depends(get_current_user_id),
 ) -> SwipeOut:
-    swipe = uow.swipes.record_swipe(user_id, payload.targetId, payload.decision)
-
-    if swipe["decision"] == "like":
-        if payload.targetId.startswith("listing-"):
-            seeker = uow.seekers.get_by_user(user_id)
-            listing = uow.listings.get(payload.targetId)
-            if seeker is None or listing is None:
-                raise NotFoundError("Seeker or listing not found for swipe")
-            if seeker is not None and listing is not None:
-                _handle_mutual_like_for_listing(uow=uow, seeker=seeker, listing=listing)
-        elif payload.targetId.startswith("seeker-"):
-            host = uow.hosts.get_by_user(user_id)
-            listing = uow.listings.get_by_host(host["id"]) if host and host.get("id") else None
-            seeker = uow.seekers.get(payload.targetId)
-            
-            # Host and Seeker MUST exist, but Listing is optional corresponding to a new host
-            if host is None or seeker is None:
-                raise NotFoundError("Host or seeker not found for swipe")
-                
-            # Only try to match if a listing actually exists
-            if host is not None and listing is not None and seeker is not None:
-                _handle_mutual_like_for_seeker(
-                    uow=uow,
-                    host=host,
-                    listing=listing,
-                    seeker=seeker,
-                )
-
+    swipe = uow.run_in_transaction(
+        lambda tx: _apply_swipe(tx, user_id, payload),
+        isolation_level=get_settings().swipe_isolation_level,
+    )
     return _to_swipe_out(swipe)
 
 
@@ -286,62 +290,54 @@ def undo_swipe(
     user_id: str = Depends(get_current_user_id),
 ) -> UndoResponse:
     restored = uow.swipes.undo_last(user_id)
+    if restored is not None and restored["target_id"].startswith("listing-"):
+        seeker = uow.seekers.get_by_user(user_id)
+        if seeker is not None:
+            # The listing goes back into the deck.
+            uow.seen_sets.discard(seeker["id"], restored["target_id"])
     return UndoResponse(restored=_to_swipe_out(restored) if restored else None)
 
 
-def _compute_matches(user_id: str, uow: InMemoryUnitOfWork) -> List[MatchOut]:
-    seeker = uow.seekers.get_by_user(user_id)
-    matches: List[MatchDict] = []
-    
-    # Check if user is a seeker
-    if seeker and seeker.get("id"):
-        matches.extend(uow.matches.list_for_seeker(seeker["id"]))
-
-    # Check if user is a host
-    host = uow.hosts.get_by_user(user_id)
-    if host and host.get("id"):
-        listing = uow.listings.get_by_host(host["id"])
-        # Only return matches for the current listing? Or all host matches?
-        # Use existing logic: list_for_host returns matches for all listings of that host (implied by host_id)
-        host_matches = uow.matches.list_for_host(host["id"])
-        matches.extend(host_matches)
-    
-    # If no matches found but profiles exist, return empty list instead of error
-    # The original error "No seeker or host context found" implies the user has NO profile at all.
-    # We should return empty list if profiles exist but no matches.
-    # If NO profile exists, empty list is also probably better than error for "my matches".
-    
-    results: List[MatchOut] = []
-    
-    for match in matches:
-        target_profile = None
-        if seeker and seeker.get("id"):
-            # User is Seeker, target is Listing
-            listing = uow.listings.get(match["listing_id"])
-            if listing:
-                target_profile = _to_listing_queue_item(listing)
-        elif host and host.get("id"):
-            # User is Host, target is Seeker
-            match_seeker = uow.seekers.get(match["seeker_id"])
-            if match_seeker:
-                target_profile = _to_seeker_queue_item(match_seeker)
-        
-        results.append(_to_match_out(match, target_profile))
-
+def match_feed_response(
+    uow: UnitOfWork,
+    user_id: str,
+    response: Response,
+    *,
+    limit: int,
+    cursor: str | None,
+    if_none_match: str | None,
+) -> list[MatchOut] | Response:
+    """Shared body of every "my matches" endpoint: conditional GET over one feed page."""
+    tag = feed_version_tag(uow, user_id)
+    etag = make_etag(tag, limit, cursor)
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
+    page = MatchFeedService(uow, get_feed_cache()).page(
+        user_id, limit=limit, cursor=cursor, tag=tag
+    )
+    set_etag(response, etag)
+    if page.next_cursor:
+        response.headers["X-Next-Cursor"] = page.next_cursor
+    results: list[MatchOut] = []
+    for item in page.items:
+        target_profile: ListingQueueItem | SeekerQueueItem | None = None
+        if item.listing is not None:
+            target_profile = to_listing_queue_item(item.listing)
+        elif item.seeker is not None:
+            target_profile = to_seeker_queue_item(item.seeker)
+        results.append(_to_match_out(item.match, target_profile))
     return results
 
 
 @router.get("/matches/me", response_model=list[MatchOut])
 def my_matches(
+    response: Response,
     uow: InMemoryUnitOfWork = Depends(get_uow),
     user_id: str = Depends(get_current_user_id),
-) -> list[MatchOut]:
-    return _compute_matches(user_id, uow)
-
-
-@public_router.get("/matches", response_model=list[MatchOut])
-def matches_alias(
-    uow: InMemoryUnitOfWork = Depends(get_uow),
-    user_id: str = Depends(get_current_user_id),
-) -> list[MatchOut]:
-    return _compute_matches(user_id, uow)
+    limit: int = Query(50, ge=1, le=100),
+    cursor: str | None = None,
+    if_none_match: str | None = Header(default=None),
+) -> list[MatchOut] | Response:
+    return match_feed_response(
+        uow, user_id, response, limit=limit, cursor=cursor, if_none_match=if_none_match
+    )
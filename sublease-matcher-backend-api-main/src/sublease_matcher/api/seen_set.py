@@ -0,0 +1,166 @@
+"""Roaring-style compressed set of listing surrogate ids (``listings.seq``).
+
+Ids are split into a 16-bit high key and a 16-bit low part. Each high key owns a
+container: a sorted ``array('H')`` while it holds at most 4096 values (2 bytes per
+id) and an 8 KiB bitmap beyond that. A seeker who swiped a few hundred listings
+therefore costs well under a kilobyte, and membership is a dict lookup plus a
+bisect or a bit test.
+"""
+
+from __future__ import annotations
+
+import struct
+import sys
+from array import array
+from bisect import bisect_left
+from collections.abc import Iterable, Iterator
+
+ARRAY_MAX = 4096
+BITMAP_BYTES = 8192
+_MAGIC = b"SS1"
+_HEADER = struct.Struct("<3sI")
+_CONTAINER = struct.Struct("<HBI")
+_ARRAY, _BITMAP = 0, 1
+
+
+def _split(value: int) -> tuple[int, int]:
+    if not 0 <= value < 1 << 32:
+        raise ValueError(f"seen-set ids must fit in 32 bits, got {value}")
+    return value >> 16, value & 0xFFFF
+
+
+class SeenSet:
+    __slots__ = ("_containers",)
+
+    def __init__(self, values: Iterable[int] = ()) -> None:
+        self._containers: dict[int, array[int] | bytearray] = {}
+        for value in values:
+            self.add(value)
+
+    def __contains__(self, value: object) -> bool:
+        if not isinstance(value, int) or not 0 <= value < 1 << 32:
+            return False
+        container = self._containers.get(value >> 16)
+        if container is None:
+            return False
+        low = value & 0xFFFF
+        if isinstance(container, bytearray):
+            return bool(container[low >> 3] & (1 << (low & 7)))
+        index = bisect_left(container, low)
+        return index < len(container) and container[index] == low
+
+    def add(self, value: int) -> bool:
+        """Add ``value``; returns False if it was already present."""
+        high, low = _split(value)
+        container = self._containers.setdefault(high, array("H"))
+        if isinstance(container, bytearray):
+            byte, bit = low >> 3, 1 << (low & 7)
+            if container[byte] & bit:
+                return False
+            container[byte] |= bit
+            return True
+        index = bisect_left(container, low)
+        if index < len(container) and container[index] == low:
+            return False
+        container.insert(index, low)
+        if len(container) > ARRAY_MAX:
+            self._containers[high] = _to_bitmap(container)
+        return True
+
+    def discard(self, value: int) -> bool:
+        """Remove ``value``; returns False if it was absent."""
+        high, low = _split(value)
+        container = self._containers.get(high)
+        if container is None:
+            return False
+        if isinstance(container, bytearray):
+            byte, bit = low >> 3, 1 << (low & 7)
+            if not container[byte] & bit:
+                return False
+            container[byte] &= ~bit & 0xFF
+            if _cardinality(container) <= ARRAY_MAX:
+                self._containers[high] = array("H", _bitmap_values(container))
+            return True
+        index = bisect_left(container, low)
+        if index == len(container) or container[index] != low:
+            return False
+        del container[index]
+        if not container:
+            del self._containers[high]
+        return True
+
+    def __len__(self) -> int:
+        return sum(
+            _cardinality(c) if isinstance(c, bytearray) else len(c)
+            for c in self._containers.values()
+        )
+
+    def __iter__(self) -> Iterator[int]:
+        for high in sorted(self._containers):
+            container = self._containers[high]
+            lows = _bitmap_values(container) if isinstance(container, bytearray) else container
+            for low in lows:
+                yield high << 16 | low
+
+    def to_bytes(self) -> bytes:
+        parts = [_HEADER.pack(_MAGIC, len(self._containers))]
+        for high in sorted(self._containers):
+            container = self._containers[high]
+            if isinstance(container, bytearray):
+                parts.append(_CONTAINER.pack(high, _BITMAP, BITMAP_BYTES))
+                parts.append(bytes(container))
+            else:
+                parts.append(_CONTAINER.pack(high, _ARRAY, len(container)))
+                parts.append(_little_endian(container).tobytes())
+        return b"".join(parts)
+
+    @classmethod
+    def from_bytes(cls, blob: bytes | None) -> SeenSet:
+        seen = cls()
+        if not blob:
+            return seen
+        magic, count = _HEADER.unpack_from(blob, 0)
+        if magic != _MAGIC:
+            raise ValueError("not a serialized SeenSet")
+        offset = _HEADER.size
+        for _ in range(count):
+            high, kind, size = _CONTAINER.unpack_from(blob, offset)
+            offset += _CONTAINER.size
+            if kind == _BITMAP:
+                seen._containers[high] = bytearray(blob[offset : offset + size])
+                offset += size
+            else:
+                lows = array("H")
+                lows.frombytes(blob[offset : offset + 2 * size])
+                seen._containers[high] = _little_endian(lows)
+                offset += 2 * size
+        return seen
+
+
+def _little_endian(values: array[int]) -> array[int]:
+    if sys.byteorder == "little":
+        return values
+    swapped = array("H", values)
+    swapped.byteswap()
+    return swapped
+
+
+def _to_bitmap(values: Iterable[int]) -> bytearray:
+    bitmap = bytearray(BITMAP_BYTES)
+    for low in values:
+        bitmap[low >> 3] |= 1 << (low & 7)
+    return bitmap
+
+
+def _bitmap_values(bitmap: bytearray) -> list[int]:
+    return [
+        byte_index << 3 | bit
+        for byte_index, byte in enumerate(bitmap)
+        if byte
+        for bit in range(8)
+        if byte & (1 << bit)
+    ]
+
+
+def _cardinality(bitmap: bytearray) -> int:
+    return int.from_bytes(bitmap, "little").bit_count()
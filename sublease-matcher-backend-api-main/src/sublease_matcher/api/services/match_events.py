@@ -0,0 +1,152 @@
+"""Live match events: an asyncio fan-out broker plus an optional Postgres LISTEN/NOTIFY bridge."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import threading
+from collections.abc import AsyncIterator, Sequence
+from contextlib import asynccontextmanager
+from functools import lru_cache
+from typing import Any
+
+import sqlalchemy as sa
+from sqlalchemy.engine import make_url
+
+from ..config import get_settings
+from ..interfaces.uow import UnitOfWork
+
+logger = logging.getLogger(__name__)
+
+
+class MatchBroker:
+    """Per-user fan-out to asyncio queues living on the server's event loop.
+
+    ``publish`` is safe to call from worker threads (sync endpoints, LISTEN bridge);
+    delivery is hopped onto the loop. Slow subscribers lose their oldest events
+    rather than growing without bound.
+    """
+
+    def __init__(self, *, queue_size: int = 100) -> None:
+        self._queue_size = queue_size
+        self._subscribers: dict[str, set[asyncio.Queue[dict[str, Any]]]] = {}
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+    @asynccontextmanager
+    async def subscribe(self, user_id: str) -> AsyncIterator[asyncio.Queue[dict[str, Any]]]:
+        self._loop = asyncio.get_running_loop()
+        queue: asyncio.Queue[dict[str, Any]] = asyncio.Queue(maxsize=self._queue_size)
+        self._subscribers.setdefault(user_id, set()).add(queue)
+        try:
+            yield queue
+        finally:
+            queues = self._subscribers.get(user_id)
+            if queues is not None:
+                queues.discard(queue)
+                if not queues:
+                    del self._subscribers[user_id]
+
+    def subscriber_count(self) -> int:
+        return sum(len(queues) for queues in self._subscribers.values())
+
+    def publish(self, user_ids: Sequence[str], event: dict[str, Any]) -> None:
+        loop = self._loop
+        if loop is None or loop.is_closed():
+            return
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is loop:
+            self._dispatch(user_ids, event)
+        else:
+            loop.call_soon_threadsafe(self._dispatch, tuple(user_ids), event)
+
+    def _dispatch(self, user_ids: Sequence[str], event: dict[str, Any]) -> None:
+        for user_id in user_ids:
+            for queue in self._subscribers.get(user_id, ()):
+                if queue.full():
+                    queue.get_nowait()
+                queue.put_nowait(event)
+
+
+@lru_cache(maxsize=1)
+def get_match_broker() -> MatchBroker:
+    return MatchBroker()
+
+
+def publish_match_event(uow: UnitOfWork, user_ids: Sequence[str], event: dict[str, Any]) -> None:
+    """Announce ``event`` to ``user_ids`` once ``uow`` commits.
+
+    With ``SM_MATCH_EVENTS_PG_NOTIFY`` the event rides on ``pg_notify`` inside the
+    transaction (Postgres only delivers it on commit) and every API worker's
+    bridge fans it out; otherwise it is handed to this process's broker after commit.
+    """
+    settings = get_settings()
+    session = getattr(uow, "session", None)
+    if settings.match_events_pg_notify and session is not None:
+        message = json.dumps({"user_ids": list(user_ids), "event": event}, default=str)
+        session.execute(
+            sa.select(sa.func.pg_notify(settings.match_events_channel, message))
+        )
+        return
+    broker = get_match_broker()
+    recipients = tuple(user_ids)
+    uow.on_commit(lambda: broker.publish(recipients, event))
+
+
+class PgNotifyBridge:
+    """Background thread that LISTENs on a channel and republishes into the local broker."""
+
+    def __init__(
+        self,
+        database_url: str,
+        channel: str,
+        broker: MatchBroker,
+        *,
+        reconnect_seconds: float = 5.0,
+    ) -> None:
+        self._conninfo = make_url(database_url).set(drivername="postgresql").render_as_string(
+            hide_password=False
+        )
+        self._channel = channel
+        self._broker = broker
+        self._reconnect_seconds = reconnect_seconds
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="match-events-listen", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float | None = 5.0) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def _run(self) -> None:
+        import psycopg
+        from psycopg import sql
+
+        while not self._stop.is_set():
+            try:
+                with psycopg.connect(self._conninfo, autocommit=True) as conn:
+                    conn.execute(sql.SQL("LISTEN {}").format(sql.Identifier(self._channel)))
+                    while not self._stop.is_set():
+                        for notify in conn.notifies(timeout=1.0):
+                            self._forward(notify.payload)
+            except Exception:
+                logger.exception("LISTEN bridge lost its connection; reconnecting")
+                self._stop.wait(self._reconnect_seconds)
+
+    def _forward(self, payload: str) -> None:
+        try:
+            message = json.loads(payload)
+            self._broker.publish(message["user_ids"], message["event"])
+        except (ValueError, KeyError, TypeError):
+            logger.warning("Ignoring malformed match event notification")
@@ -0,0 +1,172 @@
+"""Single match feed behind every "my matches" endpoint.
+
+Rows come from the repo already ordered by score (desc, nulls last) then id and
+are paged with an opaque keyset cursor. Counterpart profiles are loaded in one
+batch per page. Enriched pages are cached per user; entries are keyed by the
+match-set version tag, so a stale page is never served, and are dropped
+eagerly when one of the user's matches is written.
+"""
+
+from __future__ import annotations
+
+import base64
+import binascii
+import json
+import threading
+from collections import OrderedDict
+from collections.abc import Sequence
+from dataclasses import dataclass
+from functools import lru_cache
+
+from ..config import get_settings
+from ..etags import make_etag
+from ..interfaces.errors import ValidationError
+from ..interfaces.types import ListingDict, MatchDict, SeekerDict
+from ..interfaces.uow import UnitOfWork
+
+
+@dataclass(slots=True, frozen=True)
+class FeedItem:
+    match: MatchDict
+    listing: ListingDict | None = None
+    seeker: SeekerDict | None = None
+
+
+@dataclass(slots=True, frozen=True)
+class FeedPage:
+    items: list[FeedItem]
+    next_cursor: str | None
+
+
+def encode_cursor(match: MatchDict) -> str:
+    raw = json.dumps([match.get("score"), match["id"]], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[float | None, str]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        score, match_id = json.loads(base64.urlsafe_b64decode(padded))
+        if (score is not None and not isinstance(score, (int, float))) or not isinstance(
+            match_id, str
+        ):
+            raise ValueError
+    except (ValueError, TypeError, binascii.Error) as exc:
+        raise ValidationError("Invalid cursor") from exc
+    return (float(score) if score is not None else None), match_id
+
+
+def feed_version_tag(uow: UnitOfWork, user_id: str) -> str:
+    """Validator for the user's whole match feed, computed with aggregate queries only.
+
+    Covers both roles and the counterparts' row versions, so it changes whenever
+    any page of the feed would.
+    """
+    parts: list[object] = ["matches", user_id]
+    seeker = uow.seekers.get_version_by_user(user_id)
+    if seeker is not None:
+        parts += ["seeker", seeker[0], uow.matches.version_tag_for_seeker(seeker[0])]
+    host = uow.hosts.get_by_user(user_id)
+    if host and host.get("id"):
+        listing = uow.listings.get_version_by_host(host["id"])
+        parts += ["host", host["id"], listing, uow.matches.version_tag_for_host(host["id"])]
+    return make_etag(*parts)
+
+
+class FeedPageCache:
+    """Per-user LRU of enriched pages for this worker process."""
+
+    def __init__(self, *, max_users: int, pages_per_user: int = 8) -> None:
+        self._max_users = max_users
+        self._pages_per_user = pages_per_user
+        self._users: OrderedDict[str, OrderedDict[tuple[str, str | None, int], FeedPage]] = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+
+    def get(self, user_id: str, key: tuple[str, str | None, int]) -> FeedPage | None:
+        with self._lock:
+            pages = self._users.get(user_id)
+            if pages is None or key not in pages:
+                return None
+            self._users.move_to_end(user_id)
+            pages.move_to_end(key)
+            return pages[key]
+
+    def put(self, user_id: str, key: tuple[str, str | None, int], page: FeedPage) -> None:
+        with self._lock:
+            pages = self._users.setdefault(user_id, OrderedDict())
+            # A new tag means every older page for this user is stale.
+            for stale in [cached for cached in pages if cached[0] != key[0]]:
+                del pages[stale]
+            pages[key] = page
+            while len(pages) > self._pages_per_user:
+                pages.popitem(last=False)
+            self._users.move_to_end(user_id)
+            while len(self._users) > self._max_users:
+                self._users.popitem(last=False)
+
+    def invalidate(self, user_ids: Sequence[str]) -> None:
+        with self._lock:
+            for user_id in user_ids:
+                self._users.pop(user_id, None)
+
+
+@lru_cache(maxsize=1)
+def get_feed_cache() -> FeedPageCache:
+    return FeedPageCache(max_users=get_settings().match_feed_cache_users)
+
+
+def invalidate_match_feeds(uow: UnitOfWork, user_ids: Sequence[str]) -> None:
+    """Drop cached feed pages for ``user_ids`` once ``uow`` commits."""
+    cache = get_feed_cache()
+    recipients = tuple(user_ids)
+    uow.on_commit(lambda: cache.invalidate(recipients))
+
+
+class MatchFeedService:
+    def __init__(self, uow: UnitOfWork, cache: FeedPageCache | None = None) -> None:
+        self._uow = uow
+        self._cache = cache
+
+    def page(
+        self,
+        user_id: str,
+        *,
+        limit: int,
+        cursor: str | None = None,
+        tag: str | None = None,
+    ) -> FeedPage:
+        after = decode_cursor(cursor) if cursor else None
+        tag = tag or feed_version_tag(self._uow, user_id)
+        key = (tag, cursor, limit)
+        if self._cache is not None:
+            cached = self._cache.get(user_id, key)
+            if cached is not None:
+                return cached
+
+        seeker = self._uow.seekers.get_version_by_user(user_id)
+        seeker_id = seeker[0] if seeker else None
+        host = self._uow.hosts.get_by_user(user_id)
+        host_id = host.get("id") if host else None
+        # One extra row tells us whether another page exists.
+        rows = self._uow.matches.feed_page(
+            seeker_id=seeker_id, host_id=host_id, limit=limit + 1, after=after
+        )
+        has_more = len(rows) > limit
+        rows = list(rows[:limit])
+
+        listing_ids = [m["listing_id"] for m in rows if m["seeker_id"] == seeker_id]
+        seeker_ids = [m["seeker_id"] for m in rows if m["seeker_id"] != seeker_id]
+        listings = self._uow.listings.get_many(listing_ids)
+        seekers = self._uow.seekers.get_many(seeker_ids)
+        items = [
+            FeedItem(match=m, listing=listings.get(m["listing_id"]))
+            if m["seeker_id"] == seeker_id
+            else FeedItem(match=m, seeker=seekers.get(m["seeker_id"]))
+            for m in rows
+        ]
+        page = FeedPage(items=items, next_cursor=encode_cursor(rows[-1]) if has_more else None)
+        if self._cache is not None:
+            self._cache.put(user_id, key, page)
+        return page
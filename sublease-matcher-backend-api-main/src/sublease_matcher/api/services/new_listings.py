@@ -0,0 +1,44 @@
+"""Reverse matching: tell seekers about a listing the moment it is published.
+
+``SeekerRepo.interested_in`` finds the seekers a listing suits through the
+interest index (city key, budget band, move-in month) instead of scoring every
+seeker. Each of them gets an outbox notification and a live event on the
+match stream, so an open client can slot the listing into its deck without
+refetching it. Seekers who already swiped the listing, because it was unlisted
+and published again, are skipped.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+from ..interfaces.types import ListingDict
+from ..interfaces.uow import UnitOfWork
+from .match_events import publish_match_event
+from .notifications import LISTING_PUBLISHED
+
+
+def notify_interested_seekers(uow: UnitOfWork, listing: ListingDict) -> list[str]:
+    """Queue the notifications in ``uow``; returns the recipients' user ids."""
+
+    seekers = [seeker for seeker in uow.seekers.interested_in(listing) if seeker.get("user_id")]
+    seen = uow.seen_sets.get_many([seeker["id"] for seeker in seekers])
+    seq = listing.get("seq")
+    recipients = [
+        seeker["user_id"]
+        for seeker in seekers
+        if seq is None or seeker["id"] not in seen or seq not in seen[seeker["id"]]
+    ]
+    if not recipients:
+        return []
+    price = listing.get("price_per_month")
+    payload: dict[str, Any] = {
+        "listing_id": listing["id"],
+        "listing_title": listing.get("title"),
+        "city": listing.get("city"),
+        "price_per_month": None if price is None else str(price),
+    }
+    for recipient in recipients:
+        uow.outbox.enqueue(recipient, LISTING_PUBLISHED, payload)
+    publish_match_event(uow, recipients, {"type": LISTING_PUBLISHED, **payload})
+    return recipients
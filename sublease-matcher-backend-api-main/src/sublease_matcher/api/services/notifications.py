@@ -0,0 +1,228 @@
+"""Outbox draining: batches pending events, coalesces them per user, hands them to a sender."""
+
+from __future__ import annotations
+
+import logging
+import random
+import smtplib
+import threading
+from collections import defaultdict
+from collections.abc import Callable, Sequence
+from contextlib import AbstractContextManager
+from dataclasses import dataclass
+from email.message import EmailMessage
+from typing import Protocol
+
+from ..interfaces.types import OutboxEventDict, RecipientDict
+from ..interfaces.uow import UnitOfWork
+
+logger = logging.getLogger(__name__)
+
+MATCH_MUTUAL = "match.mutual"
+LISTING_PUBLISHED = "listing.published"
+
+
+@dataclass(slots=True, frozen=True)
+class OutgoingEmail:
+    to: str
+    subject: str
+    body: str
+
+
+class NotificationSender(Protocol):
+    def send(self, message: OutgoingEmail) -> None: ...
+
+
+class SmtpSender(NotificationSender):
+    """Plain SMTP delivery; point it at a local catcher (e.g. MailHog on :1025) in dev."""
+
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        *,
+        sender: str,
+        username: str | None = None,
+        password: str | None = None,
+        starttls: bool = False,
+        timeout: float = 10.0,
+    ) -> None:
+        self._host = host
+        self._port = port
+        self._sender = sender
+        self._username = username
+        self._password = password
+        self._starttls = starttls
+        self._timeout = timeout
+
+    def send(self, message: OutgoingEmail) -> None:
+        email = EmailMessage()
+        email["From"] = self._sender
+        email["To"] = message.to
+        email["Subject"] = message.subject
+        email.set_content(message.body)
+        with smtplib.SMTP(self._host, self._port, timeout=self._timeout) as client:
+            if self._starttls:
+                client.starttls()
+            if self._username and self._password:
+                client.login(self._username, self._password)
+            client.send_message(email)
+
+
+class RecordingSender(NotificationSender):
+    """In-process stand-in for SMTP; keeps every message for assertions."""
+
+    def __init__(self) -> None:
+        self.sent: list[OutgoingEmail] = []
+
+    def send(self, message: OutgoingEmail) -> None:
+        self.sent.append(message)
+
+
+def _title(event: OutboxEventDict) -> str:
+    payload = event["payload"]
+    return str(payload.get("listing_title") or payload.get("listing_id"))
+
+
+def render_digest(recipient: RecipientDict, events: Sequence[OutboxEventDict]) -> OutgoingEmail:
+    """Fold every pending event for one user into a single message."""
+
+    matches = [event for event in events if event["event_type"] != LISTING_PUBLISHED]
+    listings = [event for event in events if event["event_type"] == LISTING_PUBLISHED]
+    if not matches:
+        if len(listings) == 1:
+            subject = "A new listing fits what you're looking for"
+        else:
+            subject = f"{len(listings)} new listings fit what you're looking for"
+    elif len(matches) == 1:
+        subject = "You have a new match"
+    else:
+        subject = f"You have {len(matches)} new matches"
+    lines: list[str] = []
+    if matches:
+        lines += ["Good news! You matched on Sublease Matcher:", ""]
+        lines.extend(f"- {_title(event)}" for event in matches)
+    if listings:
+        if lines:
+            lines.append("")
+        lines += ["New listings that fit your city, budget and move-in date:", ""]
+        lines.extend(f"- {_title(event)}" for event in listings)
+    return OutgoingEmail(to=recipient["email"] or "", subject=subject, body="\n".join(lines))
+
+
+class OutboxWorker:
+    """Background drainer for the notification outbox.
+
+    Every tick claims up to ``batch_size`` due events under a lease and commits,
+    so no row lock is held while mail goes out. It then sends one digest per
+    recipient and settles the batch in a second unit of work: sent events are
+    marked processed, failed ones are retried with jittered exponential backoff
+    until ``max_attempts`` is reached, after which they are parked with the
+    error. Events a tick never settles fall due again when the lease
+    (``lease_seconds``, longer than a batch takes to send) runs out.
+    """
+
+    def __init__(
+        self,
+        uow_factory: Callable[[], AbstractContextManager[UnitOfWork]],
+        sender: NotificationSender,
+        *,
+        batch_size: int = 100,
+        max_attempts: int = 5,
+        base_backoff_seconds: float = 30.0,
+        poll_interval_seconds: float = 5.0,
+        lease_seconds: float = 300.0,
+    ) -> None:
+        self._uow_factory = uow_factory
+        self._sender = sender
+        self._batch_size = batch_size
+        self._max_attempts = max_attempts
+        self._base_backoff = base_backoff_seconds
+        self._poll_interval = poll_interval_seconds
+        self._lease = lease_seconds
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def run_once(self) -> int:
+        """Drain one batch; returns the number of events handled."""
+
+        by_recipient: dict[str, list[OutboxEventDict]] = defaultdict(list)
+        deliveries: list[tuple[RecipientDict, list[OutboxEventDict]]] = []
+        with self._uow_factory() as uow:
+            events = uow.outbox.claim_batch(self._batch_size, lease_seconds=self._lease)
+            for event in events:
+                by_recipient[event["recipient_user_id"]].append(event)
+            for user_id, user_events in by_recipient.items():
+                recipient = uow.outbox.recipient(user_id)
+                if recipient and recipient["email"] and recipient["notifications_enabled"]:
+                    deliveries.append((recipient, user_events))
+                else:
+                    uow.outbox.mark_processed(
+                        [event["id"] for event in user_events],
+                        error="recipient opted out or unreachable",
+                    )
+            uow.commit()
+        if not deliveries:
+            return len(events)
+
+        # Outside any transaction: a slow mail server holds no row locks.
+        outcomes = [
+            (user_events, self._deliver(recipient, user_events))
+            for recipient, user_events in deliveries
+        ]
+
+        with self._uow_factory() as uow:
+            for user_events, error in outcomes:
+                self._settle(uow, user_events, error)
+            uow.commit()
+        return len(events)
+
+    def _deliver(self, recipient: RecipientDict, events: list[OutboxEventDict]) -> Exception | None:
+        """Send the digest; returns the failure, if any."""
+
+        try:
+            self._sender.send(render_digest(recipient, events))
+        except Exception as exc:  # noqa: BLE001 - any sender failure is retried
+            return exc
+        return None
+
+    def _settle(
+        self, uow: UnitOfWork, events: list[OutboxEventDict], error: Exception | None
+    ) -> None:
+        event_ids = [event["id"] for event in events]
+        if error is None:
+            uow.outbox.mark_processed(event_ids)
+            return
+        user_id = events[0]["recipient_user_id"]
+        attempts = max(event["attempts"] for event in events) + 1
+        if attempts >= self._max_attempts:
+            logger.error("Giving up on %d notifications for %s: %s", len(events), user_id, error)
+            uow.outbox.mark_processed(event_ids, error=f"gave up: {error}")
+            return
+        delay = self._base_backoff * (2 ** (attempts - 1))
+        delay *= random.uniform(0.5, 1.5)  # noqa: S311 - jitter, not crypto
+        logger.warning("Notification send failed for %s (attempt %d): %s", user_id, attempts, error)
+        uow.outbox.reschedule(event_ids, error=str(error), delay_seconds=delay)
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._loop, name="outbox-worker", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float | None = 10.0) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def _loop(self) -> None:
+        while not self._stop.is_set():
+            try:
+                handled = self.run_once()
+            except Exception:  # noqa: BLE001 - keep the worker alive across DB hiccups
+                logger.exception("Outbox worker tick failed")
+                handled = 0
+            if handled < self._batch_size:
+                self._stop.wait(self._poll_interval)
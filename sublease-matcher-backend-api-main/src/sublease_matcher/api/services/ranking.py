@@ -0,0 +1,30 @@
+"""The learned ranking model behind recommendations, when one is configured.
+
+With ``SM_RANKING_MODEL_PATH`` unset, recommendations keep the hand-tuned
+score and NumPy is never imported. When it is set, the model is loaded at
+startup and re-read whenever the file is replaced (checked every
+``SM_RANKING_MODEL_CHECK_SECONDS``), so ``make train-ranker`` takes effect in
+every worker without a restart.
+"""
+
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import TYPE_CHECKING
+
+from ..config import get_settings
+
+if TYPE_CHECKING:
+    from sublease_matcher.core.ranking import ModelFile
+
+
+@lru_cache(maxsize=1)
+def get_ranker() -> ModelFile | None:
+    settings = get_settings()
+    if not settings.ranking_model_path:
+        return None
+    from sublease_matcher.core.ranking import ModelFile
+
+    return ModelFile(
+        settings.ranking_model_path, check_seconds=settings.ranking_model_check_seconds
+    )
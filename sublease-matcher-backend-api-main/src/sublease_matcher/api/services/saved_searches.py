@@ -0,0 +1,38 @@
+"""Saved searches, evaluated against each listing as it changes.
+
+Listing writes are the change feed: every write that leaves a listing
+published hands it to ``alert_saved_searches``, which asks
+``SavedSearchRepo.matching`` for the searches it suits. That lookup goes
+through the saved-search index (city key, price ceiling, move-in date), so a
+change costs the searches it matches, not every search, and nothing re-runs
+searches on a timer. Each hit becomes a row in the seeker's alerts inbox;
+``(search, listing)`` is unique there, so edits to a listing that already
+alerted do not alert again.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+
+from ..interfaces.types import ListingDict
+from ..interfaces.uow import UnitOfWork
+
+MAX_SAVED_SEARCHES = 20
+
+
+def normalize_interests(interests: Iterable[str]) -> list[str]:
+    """Lower-cased, stripped and de-duplicated, first spelling's order kept."""
+
+    return list(dict.fromkeys(tag.strip().lower() for tag in interests if tag.strip()))
+
+
+def alert_saved_searches(uow: UnitOfWork, listings: Iterable[ListingDict]) -> int:
+    """File alerts in ``uow`` for the changed ``listings``; returns how many are new."""
+
+    rows = [
+        (search["seeker_id"], search["id"], listing["id"])
+        for listing in listings
+        if listing.get("status") == "PUBLISHED"
+        for search in uow.saved_searches.matching(listing)
+    ]
+    return uow.search_alerts.add_many(rows) if rows else 0
@@ -0,0 +1,49 @@
+"""Scoring projections of stored seeker and listing rows.
+
+Recommendations and the offline ranker trainer score the same projections, so
+both build them here. Rows already carry what scoring needs (``city_key``,
+``lat``/``lon`` and packed ``roommate_features``), so nothing is re-normalized
+or re-located per pair.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from typing import Any
+
+from sublease_matcher.core.domain import ListingId, encode_traits
+from sublease_matcher.core.geo import GeoPoint
+from sublease_matcher.core.services.scoring import (
+    ListingScoring,
+    SeekerScoring,
+    decay_origin,
+    to_cents,
+)
+
+from ..interfaces.types import ListingDict, SeekerDict
+
+
+def point_of(row: Mapping[str, Any]) -> GeoPoint | None:
+    lat, lon = row.get("lat"), row.get("lon")
+    return GeoPoint(lat, lon) if lat is not None and lon is not None else None
+
+
+def seeker_projection(seeker: SeekerDict) -> SeekerScoring:
+    # A zero budget counts as missing, as it always has here.
+    interests = (seeker.get("interests_csv") or "").split(",")
+    return SeekerScoring(
+        seeker.get("city_key") or "",
+        to_cents(seeker.get("budget_max")) or None,
+        decay_origin(point_of(seeker)),
+        encode_traits(interests=interests, major=seeker.get("major"), bio=seeker.get("bio")),
+    )
+
+
+def listing_projection(listing: ListingDict) -> ListingScoring:
+    return ListingScoring(
+        ListingId(listing["id"]),
+        listing.get("city_key") or "",
+        to_cents(listing.get("price_per_month")) or None,
+        point_of(listing),
+        listing.get("roommate_features") or b"",
+    )
@@ -0,0 +1,18 @@
+from sublease_matcher.api.adapters.memory_repos import InMemoryListingRepo, InMemorySeekerRepo
+
+
+def test_repos_store_a_normalized_city_key_and_filter_on_it():
+    listings = InMemoryListingRepo()
+    listings.upsert({"id": "a", "host_id": "h1", "city": "Eau Claire "})
+    listings.upsert({"id": "b", "host_id": "h2", "city": "St. Paul, MN"})
+    listings.upsert({"id": "c", "host_id": "h3", "city": None})
+
+    assert listings.get("a")["city_key"] == "eau claire"
+    assert listings.get("c")["city_key"] is None
+    assert [item["id"] for item in listings.search(city="eau  claire")] == ["a"]
+    assert [item["id"] for item in listings.search(city="Saint Paul")] == ["b"]
+
+    seekers = InMemorySeekerRepo()
+    assert seekers.upsert({"id": "s1", "user_id": "u1", "city": "EAU CLAIRE"})["city_key"] == (
+        "eau claire"
+    )
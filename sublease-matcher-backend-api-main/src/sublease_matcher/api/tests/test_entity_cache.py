@@ -0,0 +1,97 @@
+from sublease_matcher.api.adapters.entity_cache import (
+    CachedListingRepo,
+    CachedSeekerRepo,
+    CacheScope,
+    EntityCache,
+)
+from sublease_matcher.api.adapters.memory_repos import InMemoryListingRepo, InMemorySeekerRepo
+
+
+class CountingSeekers(InMemorySeekerRepo):
+    def __init__(self, data):
+        super().__init__(data)
+        self.loads = 0
+
+    def get_by_user(self, user_id):
+        self.loads += 1
+        return super().get_by_user(user_id)
+
+
+def _seekers():
+    return CountingSeekers({"seeker-1": {"id": "seeker-1", "user_id": "user-1", "city": "Eau Claire"}})
+
+
+def test_repeated_reads_hit_cache_and_return_copies():
+    cache = EntityCache(max_entries=10, ttl_seconds=60)
+    inner = _seekers()
+    repo = CachedSeekerRepo(inner, CacheScope(cache))
+
+    first = repo.get_by_user("user-1")
+    first["city"] = "mutated by caller"
+    second = CachedSeekerRepo(inner, CacheScope(cache)).get_by_user("user-1")
+
+    assert inner.loads == 1
+    assert second["city"] == "Eau Claire"
+    assert cache.snapshot()["hits"] == 1
+
+
+def test_writer_reads_its_own_writes_and_commit_invalidates():
+    cache = EntityCache(max_entries=10, ttl_seconds=60)
+    inner = _seekers()
+    CachedSeekerRepo(inner, CacheScope(cache)).get_by_user("user-1")
+
+    scope = CacheScope(cache)
+    writer = CachedSeekerRepo(inner, scope)
+    writer.upsert({"id": "seeker-1", "user_id": "user-1", "city": "Menomonie"})
+    assert writer.get_by_user("user-1")["city"] == "Menomonie"
+    scope.finish()
+
+    reader = CachedSeekerRepo(inner, CacheScope(cache))
+    assert reader.get("seeker-1")["city"] == "Menomonie"
+    assert reader.get_by_user("user-1")["city"] == "Menomonie"
+
+
+def test_fill_started_before_invalidation_is_rejected():
+    cache = EntityCache(max_entries=10, ttl_seconds=60)
+    key = ("listing", "id", "listing-1")
+    token = cache.fill_token()
+    cache.invalidate([key])
+    cache.put([key], {"id": "listing-1", "title": "stale"}, token)
+    assert cache.get(key) is None
+
+    cache.put([key], {"id": "listing-1", "title": "fresh"}, cache.fill_token())
+    assert cache.get(key)["title"] == "fresh"
+
+
+def test_lru_and_ttl_eviction():
+    now = [0.0]
+    cache = EntityCache(max_entries=2, ttl_seconds=5, clock=lambda: now[0])
+    repo = CachedListingRepo(
+        InMemoryListingRepo({f"listing-{n}": {"id": f"listing-{n}"} for n in range(3)}),
+        CacheScope(cache),
+    )
+    for n in range(3):
+        repo.get(f"listing-{n}")
+    assert cache.snapshot()["evictions"] == 1
+    assert cache.snapshot()["size"] == 2
+
+    now[0] = 10.0
+    repo.get("listing-2")
+    assert cache.snapshot()["expirations"] == 1
+
+
+def test_hits_are_checked_against_the_row_version():
+    cache = EntityCache(max_entries=10, ttl_seconds=60)
+    inner = _seekers()
+    CachedSeekerRepo(inner, CacheScope(cache)).get_by_user("user-1")
+
+    # Another worker writes the row; this process's cache never hears about it.
+    inner.upsert({"id": "seeker-1", "user_id": "user-1", "city": "Menomonie", "hidden": True})
+
+    reader = CachedSeekerRepo(inner, CacheScope(cache))
+    assert reader.get_by_user("user-1")["hidden"] is True
+    assert inner.loads == 2
+    assert cache.snapshot()["stale"] == 1
+    # The refill is current again, so the next read is a plain hit.
+    assert reader.get_by_user("user-1")["city"] == "Menomonie"
+    assert inner.loads == 2
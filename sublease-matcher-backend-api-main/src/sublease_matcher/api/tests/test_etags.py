@@ -0,0 +1,60 @@
+import pytest
+from fastapi.testclient import TestClient
+
+from sublease_matcher.api.dependencies.auth import get_current_user_id
+from sublease_matcher.api.etags import etag_matches, make_etag
+from sublease_matcher.api.main import app
+
+client = TestClient(app)
+
+
+@pytest.fixture
+def as_user():
+    def login(user_id: str) -> None:
+        app.dependency_overrides[get_current_user_id] = lambda: user_id
+
+    yield login
+    app.dependency_overrides.pop(get_current_user_id, None)
+
+
+def test_listing_revalidates_with_304():
+    first = client.get("/listings/listing-1")
+    etag = first.headers["ETag"]
+
+    second = client.get("/listings/listing-1", headers={"If-None-Match": etag})
+    assert second.status_code == 304
+    assert second.content == b""
+    assert second.headers["ETag"] == etag
+
+
+def test_profile_etag_changes_after_update(as_user):
+    as_user("user-2")
+    etag = client.get("/seekers/me/profile").headers["ETag"]
+    assert client.get("/profiles/me", headers={"If-None-Match": etag}).status_code == 304
+
+    client.put("/seekers/me/profile", json={"city": "Menomonie"})
+    fresh = client.get("/seekers/me/profile", headers={"If-None-Match": etag})
+    assert fresh.status_code == 200
+    assert fresh.headers["ETag"] != etag
+    assert fresh.json()["city"] == "Menomonie"
+
+
+def test_match_list_etag_tracks_new_matches(as_user):
+    as_user("user-2")
+    etag = client.get("/matches").headers["ETag"]
+    assert client.get("/matches", headers={"If-None-Match": etag}).status_code == 304
+
+    as_user("user-10")
+    client.post("/swipe/swipes", json={"targetId": "seeker-2", "decision": "like"})
+    as_user("user-2")
+    client.post("/swipe/swipes", json={"targetId": "listing-1", "decision": "like"})
+
+    assert client.get("/matches", headers={"If-None-Match": etag}).status_code == 200
+
+
+def test_if_none_match_parsing():
+    etag = make_etag("listing", "listing-1", 3)
+    assert etag_matches(f'"other", W/{etag}', etag)
+    assert etag_matches("*", etag)
+    assert not etag_matches(None, etag)
+    assert not etag_matches(make_etag("listing", "listing-1", 4), etag)
@@ -0,0 +1,58 @@
+from sublease_matcher.api.adapters.memory_repos import (
+    InMemoryHostRepo,
+    InMemoryListingRepo,
+    InMemoryMatchRepo,
+    InMemorySeekerRepo,
+    InMemorySwipeRepo,
+)
+from sublease_matcher.api.adapters.memory_uow import InMemoryUnitOfWork
+
+
+class CountingSeekers(InMemorySeekerRepo):
+    loads = 0
+
+    def get(self, seeker_id):
+        self.loads += 1
+        return super().get(seeker_id)
+
+    def get_by_user(self, user_id):
+        self.loads += 1
+        return super().get_by_user(user_id)
+
+
+def _uow(seekers):
+    return InMemoryUnitOfWork(
+        seekers,
+        InMemoryHostRepo(),
+        InMemoryListingRepo(),
+        InMemorySwipeRepo(),
+        InMemoryMatchRepo(),
+        identity_map=True,
+    )
+
+
+def test_repeated_lookups_share_one_load_across_alias_keys():
+    seekers = CountingSeekers({"seeker-1": {"id": "seeker-1", "user_id": "user-1"}})
+    uow = _uow(seekers)
+
+    by_user = uow.seekers.get_by_user("user-1")
+    assert uow.seekers.get_by_user("user-1") is by_user
+    assert uow.seekers.get("seeker-1") is by_user
+    assert uow.seekers.get_by_user("user-404") is None
+    assert uow.seekers.get_by_user("user-404") is None
+    assert seekers.loads == 2
+
+
+def test_upsert_is_visible_to_later_lookups_and_rollback_clears():
+    seekers = CountingSeekers()
+    uow = _uow(seekers)
+
+    assert uow.seekers.get_by_user("user-2") is None
+    created = uow.seekers.upsert({"user_id": "user-2", "city": "Eau Claire"})
+    assert uow.seekers.get_by_user("user-2") is created
+    assert uow.seekers.get(created["id"]) is created
+
+    loads = seekers.loads
+    uow.rollback()
+    uow.seekers.get_by_user("user-2")
+    assert seekers.loads == loads + 1
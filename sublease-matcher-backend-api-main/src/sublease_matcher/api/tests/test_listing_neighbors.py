@@ -0,0 +1,51 @@
+from sublease_matcher.core.services.neighbors import iter_neighbors
+
+from sublease_matcher.api.adapters.memory_repos import (
+    InMemoryListingNeighborRepo,
+    InMemorySwipeRepo,
+)
+from sublease_matcher.api.routers.matches import _calculate_recommendation_score
+from sublease_matcher.api.services.scoring import listing_projection, seeker_projection
+
+
+def test_recent_likes_follow_the_latest_decision():
+    swipes = InMemorySwipeRepo()
+    swipes.record_swipe("user-1", "listing-a", "like")
+    swipes.record_swipe("user-1", "listing-b", "like")
+    swipes.record_swipe("user-1", "listing-a", "pass")
+    swipes.record_swipe("user-1", "listing-c", "like")
+    swipes.record_swipe("user-1", "seeker-9", "like")
+    swipes.record_swipe("user-2", "listing-d", "like")
+
+    assert swipes.recent_likes("user-1", 10) == ["listing-c", "listing-b"]
+    assert swipes.recent_likes("user-1", 1) == ["listing-c"]
+    swipes.undo_last("user-1")
+    assert swipes.recent_likes("user-1", 10) == ["listing-c", "listing-b"]
+    assert swipes.recent_likes("user-3", 10) == []
+
+
+def test_neighbor_lookup_keeps_the_best_similarity():
+    repo = InMemoryListingNeighborRepo()
+    stored = repo.replace(
+        [("a", [("b", 0.8), ("c", 0.3)]), ("d", [("c", 0.6)]), ("e", [("f", 0.9)])]
+    )
+    assert stored == 4
+
+    assert repo.similar_to([]) == {}
+    assert repo.similar_to(["a", "d", "x"]) == {"b": 0.8, "c": 0.6}
+
+    repo.replace(iter_neighbors(lambda: [["a", "b"], ["a", "b"]]))
+    assert repo.similar_to(["a", "d"]) == {"b": 1.0}
+
+
+def test_neighbors_lift_only_their_listings():
+    seeker = seeker_projection({"city_key": "madison", "budget_max": 800})
+    listing = listing_projection(
+        {"id": "l1", "city_key": "madison", "price_per_month": 900, "status": "PUBLISHED"}
+    )
+    plain = _calculate_recommendation_score(seeker, listing)
+    assert plain == 0.9
+    assert _calculate_recommendation_score(seeker, listing, 0.0) == plain
+    assert _calculate_recommendation_score(seeker, listing, 1.0) == 0.95
+    far = seeker_projection({"city_key": "duluth", "budget_max": 100})
+    assert _calculate_recommendation_score(far, listing, 1.0) == 0.0
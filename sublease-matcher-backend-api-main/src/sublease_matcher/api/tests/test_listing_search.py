@@ -0,0 +1,80 @@
+from fastapi.testclient import TestClient
+
+from sublease_matcher.api.adapters.memory_repos import InMemoryHostRepo, InMemoryListingRepo
+from sublease_matcher.api.adapters.memory_search import tokenize
+from sublease_matcher.api.main import app
+
+
+def _listing(listing_id, title, *, bio=None, roommates=(), status="PUBLISHED"):
+    return {
+        "id": listing_id,
+        "host_id": f"host-{listing_id}",
+        "title": title,
+        "bio": bio,
+        "status": status,
+        "roommates": list(roommates),
+    }
+
+
+def _repo():
+    repo = InMemoryListingRepo()
+    repo.upsert(_listing("a", "Quiet room near campus"))
+    repo.upsert(_listing("b", "Sunny loft", bio="Quiet building, close to campus"))
+    repo.upsert(
+        _listing("c", "Two bedroom", roommates=[{"bio": "quiet grad student", "major": "Nursing"}])
+    )
+    repo.upsert(_listing("d", "Quiet studio", status="DRAFT"))
+    return repo
+
+
+def test_tokenize_lowercases_and_drops_stop_words_and_plurals():
+    assert tokenize("The Rooms near Water St.") == ["room", "water", "st"]
+
+
+def test_ranks_title_matches_first_and_requires_every_term():
+    repo = _repo()
+
+    hits = repo.search_text("quiet", limit=10)
+    assert [listing["id"] for listing, _ in hits][0] == "a"
+    assert {listing["id"] for listing, _ in hits} == {"a", "b", "c"}
+    assert [listing["id"] for listing, _ in repo.search_text("quiet campus", limit=10)] == [
+        "a",
+        "b",
+    ]
+    assert [listing["id"] for listing, _ in repo.search_text("nursing", limit=10)] == ["c"]
+
+
+def test_reindexes_on_upsert_and_pages_by_keyset():
+    repo = _repo()
+    repo.upsert(_listing("a", "Loud room"))
+    assert "a" not in {listing["id"] for listing, _ in repo.search_text("quiet", limit=10)}
+
+    first = repo.search_text("quiet", limit=1)
+    rest = repo.search_text("quiet", limit=10, after=(first[0][1], first[0][0]["id"]))
+    assert [listing["id"] for listing, _ in first + rest] == [
+        listing["id"] for listing, _ in repo.search_text("quiet", limit=10)
+    ]
+
+
+def test_host_bio_change_reindexes_the_hosts_listings():
+    repo = _repo()
+    hosts = InMemoryHostRepo({"host-a": {"id": "host-a", "bio": None}}, listings=repo)
+    version = repo.get_version("a")
+
+    hosts.upsert({"id": "host-a", "bio": "Yoga teacher, vegetarian kitchen"})
+    assert [listing["id"] for listing, _ in repo.search_text("yoga", limit=10)] == ["a"]
+    assert repo.get_version("a") == version + 1
+
+    hosts.upsert({"id": "host-a", "bio": "Chess club regular"})
+    assert repo.search_text("yoga", limit=10) == []
+    assert [listing["id"] for listing, _ in repo.search_text("chess", limit=10)] == ["a"]
+
+
+def test_search_endpoint_returns_queue_items():
+    client = TestClient(app)
+
+    response = client.get("/listings/search", params={"q": "water st", "limit": 1})
+    assert response.status_code == 200
+    assert [item["id"] for item in response.json()] == ["listing-1"]
+
+    assert client.get("/listings/search", params={"q": "x", "cursor": "%%"}).status_code == 422
@@ -0,0 +1,53 @@
+import asyncio
+import threading
+
+from sublease_matcher.api.dependencies.uow import open_uow
+from sublease_matcher.api.services.match_events import MatchBroker, publish_match_event
+
+
+def test_broker_delivers_only_to_recipients_and_across_threads():
+    broker = MatchBroker()
+
+    async def scenario():
+        async with broker.subscribe("user-1") as mine, broker.subscribe("user-2") as other:
+            thread = threading.Thread(target=broker.publish, args=(["user-1"], {"n": 1}))
+            thread.start()
+            thread.join()
+            assert await asyncio.wait_for(mine.get(), timeout=1) == {"n": 1}
+            assert other.empty()
+        assert broker.subscriber_count() == 0
+
+    asyncio.run(scenario())
+
+
+def test_slow_subscriber_drops_oldest():
+    broker = MatchBroker(queue_size=2)
+
+    async def scenario():
+        async with broker.subscribe("user-1") as queue:
+            for n in range(3):
+                broker.publish(["user-1"], {"n": n})
+            return [queue.get_nowait()["n"], queue.get_nowait()["n"]]
+
+    assert asyncio.run(scenario()) == [1, 2]
+
+
+def test_events_publish_on_commit_only(monkeypatch):
+    published = []
+    broker = MatchBroker()
+    monkeypatch.setattr(broker, "publish", lambda users, event: published.append(event))
+    monkeypatch.setattr(
+        "sublease_matcher.api.services.match_events.get_match_broker", lambda: broker
+    )
+
+    try:
+        with open_uow() as uow:
+            publish_match_event(uow, ["user-1"], {"n": "rolled back"})
+            raise RuntimeError
+    except RuntimeError:
+        pass
+    with open_uow() as uow:
+        publish_match_event(uow, ["user-1"], {"n": "committed"})
+        assert published == []
+
+    assert published == [{"n": "committed"}]
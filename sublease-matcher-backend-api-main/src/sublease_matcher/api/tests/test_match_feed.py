@@ -0,0 +1,86 @@
+from fastapi.testclient import TestClient
+
+from sublease_matcher.api.adapters.memory_repos import (
+    InMemoryHostRepo,
+    InMemoryListingRepo,
+    InMemoryMatchRepo,
+    InMemorySeekerRepo,
+    InMemorySwipeRepo,
+)
+from sublease_matcher.api.adapters.memory_uow import InMemoryUnitOfWork
+from sublease_matcher.api.dependencies.auth import get_current_user_id
+from sublease_matcher.api.main import app
+from sublease_matcher.api.services.match_feed import FeedPageCache, MatchFeedService
+
+
+def _uow():
+    seekers = InMemorySeekerRepo(
+        {
+            "seeker-1": {"id": "seeker-1", "user_id": "user-1"},
+            "seeker-2": {"id": "seeker-2", "user_id": "user-2"},
+        }
+    )
+    hosts = InMemoryHostRepo({"host-1": {"id": "host-1", "user_id": "user-1"}})
+    listings = InMemoryListingRepo(
+        {
+            "listing-a": {"id": "listing-a", "host_id": "host-9", "status": "PUBLISHED"},
+            "listing-b": {"id": "listing-b", "host_id": "host-9", "status": "PUBLISHED"},
+            "listing-h": {"id": "listing-h", "host_id": "host-1", "status": "PUBLISHED"},
+        }
+    )
+    matches = InMemoryMatchRepo(
+        {
+            "m1": {"id": "m1", "seeker_id": "seeker-1", "listing_id": "listing-a", "score": 0.5},
+            "m2": {"id": "m2", "seeker_id": "seeker-1", "listing_id": "listing-b", "score": None},
+            "m3": {"id": "m3", "seeker_id": "seeker-2", "listing_id": "listing-h", "score": 0.9},
+            "m4": {"id": "m4", "seeker_id": "seeker-2", "listing_id": "listing-a", "score": 1.0},
+        },
+        seekers=seekers,
+        listings=listings,
+    )
+    return InMemoryUnitOfWork(seekers, hosts, listings, InMemorySwipeRepo(), matches)
+
+
+def test_feed_pages_both_roles_by_score_with_nulls_last():
+    service = MatchFeedService(_uow())
+
+    first = service.page("user-1", limit=2)
+    assert [item.match["id"] for item in first.items] == ["m3", "m1"]
+    assert first.items[0].seeker["id"] == "seeker-2"
+    assert first.items[1].listing["id"] == "listing-a"
+    assert first.next_cursor is not None
+
+    second = service.page("user-1", limit=2, cursor=first.next_cursor)
+    assert [item.match["id"] for item in second.items] == ["m2"]
+    assert second.next_cursor is None
+
+
+def test_cached_page_is_dropped_when_the_tag_moves():
+    uow = _uow()
+    cache = FeedPageCache(max_users=4)
+    service = MatchFeedService(uow, cache)
+    first = service.page("user-1", limit=10)
+    assert service.page("user-1", limit=10) is first
+
+    uow.matches.upsert("seeker-1", "listing-h", "PENDING", 0.7)
+    ids = [item.match["id"] for item in service.page("user-1", limit=10).items]
+    assert ids == ["m3", "seeker-1:listing-h", "m1", "m2"]
+
+
+def test_invalid_cursor_is_rejected():
+    app.dependency_overrides[get_current_user_id] = lambda: "user-2"
+    try:
+        response = TestClient(app).get("/matches", params={"cursor": "not-a-cursor"})
+    finally:
+        app.dependency_overrides.pop(get_current_user_id, None)
+    assert response.status_code == 422
+
+
+def test_host_feed_without_the_listing_store_is_empty():
+    matches = InMemoryMatchRepo(
+        {"m1": {"id": "m1", "seeker_id": "seeker-1", "listing_id": "listing-a", "score": 0.5}}
+    )
+    assert matches.feed_page(seeker_id=None, host_id="host-1", limit=10) == []
+    assert [m["id"] for m in matches.feed_page(seeker_id="seeker-1", host_id=None, limit=10)] == [
+        "m1"
+    ]
@@ -0,0 +1,36 @@
+from datetime import UTC, datetime
+
+from sqlalchemy.dialects import postgresql
+
+from sublease_matcher.api.adapters.memory_repos import InMemoryMatchRepo
+from sublease_matcher.api.adapters.sqlalchemy.repos import upsert_matches_statement
+
+
+def test_only_the_promoting_write_reports_became_mutual():
+    repo = InMemoryMatchRepo()
+
+    pending, promoted = repo.upsert_many(
+        [
+            {"seeker_id": "seeker-1", "listing_id": "listing-1", "status": "PENDING", "score": 0.4},
+            {"seeker_id": "seeker-1", "listing_id": "listing-1", "status": "MUTUAL", "score": 0.5},
+        ]
+    )
+    again = repo.upsert("seeker-1", "listing-1", "MUTUAL", 0.6)
+
+    assert not pending["became_mutual"]
+    assert promoted["became_mutual"] and promoted["version"] == 2
+    assert not again["became_mutual"]
+    assert again["matched_at"] == promoted["matched_at"]
+    assert "became_mutual" not in repo.get_for_pair("seeker-1", "listing-1")
+
+
+def test_sql_upsert_is_one_on_conflict_statement():
+    stmt = upsert_matches_statement(
+        [{"seeker_id": "seeker-1", "listing_id": "listing-1", "status": "MUTUAL", "score": 0.5}],
+        matched_at=datetime.now(UTC),
+    )
+    sql = str(stmt.compile(dialect=postgresql.dialect()))
+
+    assert "ON CONFLICT ON CONSTRAINT uq_matches_seeker_listing DO UPDATE" in sql
+    assert "coalesce(matches.matched_at, excluded.matched_at)" in sql
+    assert "RETURNING" in sql
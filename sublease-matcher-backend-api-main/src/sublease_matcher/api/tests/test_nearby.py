@@ -0,0 +1,84 @@
+from fastapi.testclient import TestClient
+from sqlalchemy.dialects import postgresql
+from sublease_matcher.core.geo import Radius, locate
+
+from sublease_matcher.api.adapters.memory_repos import InMemoryListingRepo, InMemorySeekerRepo
+from sublease_matcher.api.adapters.sqlalchemy import models
+from sublease_matcher.api.adapters.sqlalchemy.geo import within_clause
+from sublease_matcher.api.main import app
+
+MADISON = locate("Madison", "WI")
+
+
+def _listings():
+    repo = InMemoryListingRepo()
+    for listing_id, city in [
+        ("madison", "Madison"),
+        ("middleton", "Middleton"),
+        ("sun-prairie", "Sun Prairie"),
+        ("milwaukee", "Milwaukee"),
+        ("nowhere", "Atlantis"),
+    ]:
+        repo.upsert(
+            {
+                "id": listing_id,
+                "host_id": f"host-{listing_id}",
+                "title": "Quiet room",
+                "city": city,
+                "state": "WI",
+                "status": "PUBLISHED",
+            }
+        )
+    return repo
+
+
+def test_repos_resolve_coordinates_on_write():
+    listings = _listings()
+    assert (listings.get("madison")["lat"], listings.get("madison")["lon"]) == MADISON
+    assert listings.get("madison")["geohash"].startswith("dp8")
+    assert listings.get("nowhere")["geohash"] is None
+
+    listings.upsert({**listings.get("madison"), "city": "Atlantis"})
+    assert listings.get("madison")["lat"] is None
+
+    seekers = InMemorySeekerRepo()
+    assert seekers.upsert({"id": "s1", "user_id": "u1", "city": "Middleton"})["lat"] is not None
+    # Seekers have no state, and Osseo is in both Wisconsin and Minnesota.
+    assert seekers.upsert({"id": "s2", "user_id": "u2", "city": "Osseo"})["lat"] is None
+
+
+def test_within_filters_queues_and_search():
+    listings = _listings()
+    near = Radius(MADISON, 25)
+
+    assert [item["id"] for item in listings.queue_for_seeker("s", within=near)] == [
+        "madison",
+        "middleton",
+        "sun-prairie",
+    ]
+    assert len(listings.queue_for_seeker("s")) == 5
+    hits = listings.search_text("quiet", limit=10, within=Radius(MADISON, 10))
+    assert {listing["id"] for listing, _ in hits} == {"madison", "middleton"}
+
+    seekers = InMemorySeekerRepo()
+    seekers.upsert({"id": "s1", "user_id": "u1", "city": "Sun Prairie"})
+    seekers.upsert({"id": "s2", "user_id": "u2", "city": "Milwaukee"})
+    assert [s["id"] for s in seekers.queue_for_host("h", within=near)] == ["s1"]
+
+
+def test_sql_filter_is_a_geohash_range_plus_distance_check():
+    listing = models.Listing
+    clause = within_clause(listing.lat, listing.lon, listing.geohash, Radius(MADISON, 25))
+    sql = str(clause.compile(dialect=postgresql.dialect()))
+    assert "listings.geohash >=" in sql and "listings.geohash <" in sql
+    assert "cos" not in sql.lower()
+
+
+def test_search_endpoint_requires_a_complete_radius():
+    client = TestClient(app)
+    params = {"q": "water st", "lat": MADISON.lat, "lon": MADISON.lon}
+
+    assert client.get("/listings/search", params=params).status_code == 422
+    assert client.get("/listings/search", params={**params, "within_km": 500}).status_code == 422
+    response = client.get("/listings/search", params={**params, "within_km": 50})
+    assert response.status_code == 200
@@ -0,0 +1,84 @@
+from datetime import date
+from decimal import Decimal
+
+from sublease_matcher.api.adapters.memory_repos import (
+    InMemoryHostRepo,
+    InMemoryListingRepo,
+    InMemoryMatchRepo,
+    InMemorySeekerRepo,
+    InMemorySwipeRepo,
+)
+from sublease_matcher.api.adapters.memory_uow import InMemoryUnitOfWork
+from sublease_matcher.api.adapters.seed_data import build_seed
+from sublease_matcher.api.services.new_listings import notify_interested_seekers
+from sublease_matcher.api.services.notifications import (
+    LISTING_PUBLISHED,
+    MATCH_MUTUAL,
+    render_digest,
+)
+
+
+def _uow() -> InMemoryUnitOfWork:
+    seekers, hosts, listings = build_seed()
+    return InMemoryUnitOfWork(
+        InMemorySeekerRepo(seekers),
+        InMemoryHostRepo(hosts),
+        InMemoryListingRepo(listings),
+        InMemorySwipeRepo(),
+        InMemoryMatchRepo(),
+    )
+
+
+def test_interest_index_follows_seeker_updates():
+    uow = _uow()
+    listing = uow.listings.get("listing-1")
+    # seeker-2 moves in before the listing frees up.
+    assert [seeker["id"] for seeker in uow.seekers.interested_in(listing)] == ["seeker-1"]
+
+    seeker_2 = uow.seekers.get("seeker-2")
+    uow.seekers.upsert({**seeker_2, "available_from": date(2025, 9, 1), "available_to": None})
+    seeker_1 = uow.seekers.get("seeker-1")
+    uow.seekers.upsert({**seeker_1, "budget_max": Decimal("600")})
+    assert [seeker["id"] for seeker in uow.seekers.interested_in(listing)] == ["seeker-2"]
+
+    uow.seekers.upsert({**uow.seekers.get("seeker-2"), "hidden": True})
+    assert uow.seekers.interested_in(listing) == []
+    assert uow.seekers.interested_in({**listing, "city": "Madison", "city_key": None}) == []
+
+
+def test_publishing_notifies_suited_seekers_who_have_not_swiped_it():
+    uow = _uow()
+    listing = uow.listings.get("listing-1")
+
+    assert notify_interested_seekers(uow, listing) == ["user-1"]
+    (event,) = uow.outbox.claim_batch(10)
+    assert event["recipient_user_id"] == "user-1"
+    assert event["event_type"] == LISTING_PUBLISHED
+    assert event["payload"]["listing_id"] == "listing-1"
+    assert event["payload"]["price_per_month"] == "650"
+
+    uow.seen_sets.add("seeker-1", "listing-1")
+    assert notify_interested_seekers(uow, listing) == []
+
+
+def test_digest_lists_matches_and_new_listings_apart():
+    recipient = {"user_id": "user-1", "email": "s1@example.edu", "notifications_enabled": True}
+
+    def event(event_type, title):
+        return {
+            "id": title,
+            "recipient_user_id": "user-1",
+            "event_type": event_type,
+            "payload": {"listing_title": title},
+            "attempts": 0,
+            "created_at": None,
+        }
+
+    only_new = render_digest(recipient, [event(LISTING_PUBLISHED, "Loft")])
+    assert only_new.subject == "A new listing fits what you're looking for"
+
+    mixed = render_digest(
+        recipient, [event(MATCH_MUTUAL, "Room"), event(LISTING_PUBLISHED, "Loft")]
+    )
+    assert mixed.subject == "You have a new match"
+    assert "- Room" in mixed.body and "- Loft" in mixed.body
@@ -0,0 +1,102 @@
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+
+from sublease_matcher.api.adapters.memory_repos import (
+    InMemoryHostRepo,
+    InMemoryListingRepo,
+    InMemoryMatchRepo,
+    InMemorySeekerRepo,
+    InMemorySwipeRepo,
+)
+from sublease_matcher.api.adapters.memory_uow import InMemoryUnitOfWork
+from sublease_matcher.api.adapters.seed_data import build_seed
+from sublease_matcher.api.services.notifications import (
+    MATCH_MUTUAL,
+    OutboxWorker,
+    RecordingSender,
+)
+
+
+def _uow() -> InMemoryUnitOfWork:
+    seekers, hosts, listings = build_seed()
+    return InMemoryUnitOfWork(
+        InMemorySeekerRepo(seekers),
+        InMemoryHostRepo(hosts),
+        InMemoryListingRepo(listings),
+        InMemorySwipeRepo(),
+        InMemoryMatchRepo(),
+    )
+
+
+def _worker(uow: InMemoryUnitOfWork, sender, **kwargs) -> OutboxWorker:
+    @contextmanager
+    def factory():
+        yield uow
+
+    return OutboxWorker(factory, sender, **kwargs)
+
+
+class _FailingSender:
+    def send(self, message):
+        raise ConnectionRefusedError("smtp down")
+
+
+def test_worker_sends_one_digest_per_recipient():
+    uow = _uow()
+    for listing_id in ("listing-1", "listing-2"):
+        uow.outbox.enqueue("user-1", MATCH_MUTUAL, {"listing_id": listing_id})
+    uow.outbox.enqueue("user-10", MATCH_MUTUAL, {"listing_id": "listing-1"})
+    sender = RecordingSender()
+
+    assert _worker(uow, sender).run_once() == 3
+    assert sorted(message.to for message in sender.sent) == ["h1@example.edu", "s1@example.edu"]
+    assert _worker(uow, sender).run_once() == 0
+
+
+def test_failed_send_is_rescheduled_then_parked():
+    uow = _uow()
+    uow.outbox.enqueue("user-1", MATCH_MUTUAL, {"listing_id": "listing-1"})
+    worker = _worker(uow, _FailingSender(), max_attempts=2, base_backoff_seconds=0)
+
+    assert worker.run_once() == 1
+    (row,) = uow.outbox._data.values()
+    assert row["attempts"] == 1 and row["processed_at"] is None
+
+    assert worker.run_once() == 1
+    assert row["processed_at"] is not None
+    assert row["last_error"].startswith("gave up")
+
+
+def test_sends_happen_after_the_claim_commits():
+    uow = _uow()
+    uow.outbox.enqueue("user-1", MATCH_MUTUAL, {"listing_id": "listing-1"})
+    open_uows: list[bool] = []
+
+    @contextmanager
+    def factory():
+        open_uows.append(True)
+        try:
+            yield uow
+        finally:
+            open_uows.pop()
+
+    class _CheckingSender(RecordingSender):
+        def send(self, message):
+            assert not open_uows, "sent while a unit of work was open"
+            super().send(message)
+
+    sender = _CheckingSender()
+    assert OutboxWorker(factory, sender).run_once() == 1
+    assert len(sender.sent) == 1
+
+
+def test_claims_are_leased_and_fall_due_again_if_never_settled():
+    uow = _uow()
+    uow.outbox.enqueue("user-1", MATCH_MUTUAL, {"listing_id": "listing-1"})
+
+    (event,) = uow.outbox.claim_batch(10, lease_seconds=60)
+    assert uow.outbox.claim_batch(10) == []
+
+    # A tick that died after claiming: the lease runs out and the event is due again.
+    uow.outbox._data[event["id"]]["available_at"] = datetime.utcnow() - timedelta(seconds=1)
+    assert [again["id"] for again in uow.outbox.claim_batch(10)] == [event["id"]]
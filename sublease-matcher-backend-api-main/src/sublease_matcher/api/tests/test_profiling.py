@@ -0,0 +1,70 @@
+import threading
+
+import pytest
+from fastapi.testclient import TestClient
+
+from sublease_matcher.api.config import Settings
+from sublease_matcher.api.dependencies.settings import get_settings
+from sublease_matcher.api.main import app
+from sublease_matcher.api.profiling import render_collapsed, sample_stacks
+
+client = TestClient(app)
+
+
+@pytest.fixture
+def debug_token():
+    app.dependency_overrides[get_settings] = lambda: Settings(debug_token="s3cret")
+    yield "s3cret"
+    app.dependency_overrides.pop(get_settings, None)
+
+
+def test_profile_needs_the_debug_token(debug_token):
+    assert client.get("/_debug/profile", params={"seconds": 0.01}).status_code == 404
+    wrong = {"X-Debug-Token": "guess"}
+    assert client.get("/_debug/profile", params={"seconds": 0.01}, headers=wrong).status_code == 404
+
+    ok = client.get(
+        "/_debug/profile",
+        params={"seconds": 0.05, "interval_ms": 5},
+        headers={"X-Debug-Token": debug_token},
+    )
+    assert ok.status_code == 200
+    assert ok.headers["content-type"].startswith("text/plain")
+
+
+def test_profile_is_off_without_a_configured_token():
+    app.dependency_overrides[get_settings] = lambda: Settings(debug_token=None)
+    try:
+        response = client.get("/_debug/profile", headers={"X-Debug-Token": ""})
+        assert response.status_code == 404
+    finally:
+        app.dependency_overrides.pop(get_settings, None)
+
+
+def test_samples_render_as_collapsed_stacks_with_late_thread_names():
+    stop = threading.Event()
+
+    def spin() -> None:
+        stop.wait(2)
+
+    # Started after the sampler, so its name must come from a later refresh.
+    late = threading.Timer(0.02, lambda: threading.Thread(target=spin, name="late-worker").start())
+    late.start()
+    try:
+        samples = sample_stacks(0.2, interval=0.005)
+    finally:
+        stop.set()
+        late.cancel()
+
+    lines = render_collapsed(samples).splitlines()
+    assert lines
+    for line in lines:
+        stack, count = line.rsplit(" ", 1)
+        assert int(count) >= 1
+        assert ";" in stack
+    late_stacks = [line for line in lines if line.startswith("late-worker;")]
+    assert late_stacks
+    assert any(f"{__name__}:spin" in line for line in late_stacks)
+    # Counts come out most frequent first.
+    counts = [int(line.rsplit(" ", 1)[1]) for line in lines]
+    assert counts == sorted(counts, reverse=True)
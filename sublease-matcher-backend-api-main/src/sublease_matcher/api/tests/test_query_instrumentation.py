@@ -0,0 +1,66 @@
+import pytest
+from sqlalchemy import create_engine, text
+
+from sublease_matcher.api.adapters.sqlalchemy.instrumentation import (
+    QueryBudgetExceeded,
+    install_query_instrumentation,
+    query_budget,
+    redact_parameters,
+    statement_shape,
+    track_queries,
+)
+
+
+def _engine():
+    engine = create_engine("sqlite://")
+    install_query_instrumentation(engine, slow_query_ms=10_000)
+    return engine
+
+
+def test_counts_statements_and_repeated_shapes():
+    engine = _engine()
+    with track_queries() as stats, engine.connect() as conn:
+        for listing_id in ("listing-1", "listing-2", "listing-3"):
+            conn.execute(text("SELECT :id"), {"id": listing_id})
+        conn.execute(text("SELECT 1"))
+    assert stats.statements == 4
+    assert stats.repeated(3) == [("SELECT ?", 3)]
+
+
+def test_statements_outside_tracking_are_ignored():
+    engine = _engine()
+    with engine.connect() as conn:
+        conn.execute(text("SELECT 1"))
+        with track_queries() as stats:
+            conn.execute(text("SELECT 2"))
+    assert stats.statements == 1
+
+
+def test_query_budget_raises_when_exceeded():
+    engine = _engine()
+    with pytest.raises(QueryBudgetExceeded):
+        with query_budget(1), engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+            conn.execute(text("SELECT 2"))
+
+
+def test_query_budget_flags_n_plus_one():
+    engine = _engine()
+    with pytest.raises(QueryBudgetExceeded, match="repeated"):
+        with query_budget(None, max_repeats=2), engine.connect() as conn:
+            for value in range(3):
+                conn.execute(text("SELECT :v"), {"v": value})
+
+
+def test_shape_collapses_in_lists():
+    first = statement_shape("SELECT * FROM listings WHERE id IN (%(id_1)s, %(id_2)s)")
+    second = statement_shape("SELECT * FROM listings\n WHERE id IN (%(id_1)s)")
+    assert first == second == "SELECT * FROM listings WHERE id IN (...)"
+
+
+def test_redaction_hides_values():
+    assert redact_parameters({"email": "s1@example.edu", "n": 3}) == {
+        "email": "<str>",
+        "n": "<int>",
+    }
+    assert redact_parameters(("secret",)) == ["<str>"]
@@ -0,0 +1,38 @@
+import pytest
+from fastapi.testclient import TestClient
+
+from sublease_matcher.api.dependencies.auth import get_current_user_id
+from sublease_matcher.api.main import app
+from sublease_matcher.api.services.ranking import get_ranker
+
+np = pytest.importorskip("numpy")
+
+from sublease_matcher.core.ranking import FEATURES, LinearModel, ModelFile, save_model  # noqa: E402
+
+client = TestClient(app)
+
+
+@pytest.fixture
+def ranker(tmp_path):
+    path = save_model(LinearModel("v1", np.zeros(len(FEATURES)), 0.0), tmp_path / "ranker.json")
+    model_file = ModelFile(path, check_seconds=0)
+    app.dependency_overrides[get_current_user_id] = lambda: "user-1"
+    app.dependency_overrides[get_ranker] = lambda: model_file
+    yield model_file
+    app.dependency_overrides.pop(get_current_user_id, None)
+    app.dependency_overrides.pop(get_ranker, None)
+
+
+def test_recommendations_use_the_model_and_pick_up_a_new_file(ranker):
+    first = client.get("/matches/recommendations")
+    assert first.status_code == 200
+    assert [item["score"] for item in first.json()] == [0.5]
+
+    save_model(LinearModel("v2", np.zeros(len(FEATURES)), -2.0), ranker.path)
+    second = client.get("/matches/recommendations")
+    assert [item["score"] for item in second.json()] == [0.12]
+    assert ranker.model.version == "v2"
+
+
+def test_no_model_configured_by_default():
+    assert get_ranker() is None
@@ -0,0 +1,55 @@
+from sublease_matcher.api.adapters.memory_repos import InMemoryListingRepo
+from sublease_matcher.api.routers.matches import _calculate_recommendation_score
+from sublease_matcher.api.services.scoring import listing_projection, seeker_projection
+
+
+def _listing(listing_id, roommates):
+    return {
+        "id": listing_id,
+        "host_id": f"host-{listing_id}",
+        "city": "Madison",
+        "state": "WI",
+        "status": "PUBLISHED",
+        "roommates": roommates,
+    }
+
+
+def test_listing_repo_encodes_roommates_on_write():
+    repo = InMemoryListingRepo()
+    repo.upsert(_listing("a", [{"name": "Ana", "interests": ["hiking"]}, {"name": "Bo"}]))
+    assert len(repo.get("a")["roommate_features"]) == 16
+
+    repo.upsert(_listing("a", []))
+    assert repo.get("a")["roommate_features"] == b""
+
+
+def test_recommendations_prefer_compatible_roommates():
+    repo = InMemoryListingRepo()
+    repo.upsert(
+        _listing(
+            "alike",
+            [{"interests": ["hiking", "chess"], "sleepingHabits": "early", "major": "Biology"}],
+        )
+    )
+    repo.upsert(
+        _listing(
+            "unlike",
+            [{"interests_csv": "gaming", "sleepingHabits": "night owl", "cleanliness": "messy"}],
+        )
+    )
+    repo.upsert(_listing("alone", []))
+    seeker = seeker_projection(
+        {
+            "city_key": "madison",
+            "interests_csv": "hiking,chess",
+            "major": "Biology",
+            "bio": "Early riser, tidy.",
+        }
+    )
+
+    scores = {
+        listing_id: _calculate_recommendation_score(seeker, listing_projection(repo.get(listing_id)))
+        for listing_id in ("alike", "unlike", "alone")
+    }
+    assert scores["alone"] == 1.0
+    assert scores["alike"] > scores["unlike"]
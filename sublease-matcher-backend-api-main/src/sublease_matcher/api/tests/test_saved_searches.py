@@ -0,0 +1,104 @@
+from datetime import date
+from decimal import Decimal
+
+from fastapi.testclient import TestClient
+
+from sublease_matcher.api.adapters.memory_repos import (
+    InMemoryHostRepo,
+    InMemoryListingRepo,
+    InMemoryMatchRepo,
+    InMemorySeekerRepo,
+    InMemorySwipeRepo,
+)
+from sublease_matcher.api.adapters.memory_uow import InMemoryUnitOfWork
+from sublease_matcher.api.adapters.seed_data import build_seed
+from sublease_matcher.api.dependencies.auth import get_current_user_id
+from sublease_matcher.api.dependencies.uow import open_uow
+from sublease_matcher.api.main import app
+from sublease_matcher.api.services.saved_searches import alert_saved_searches
+
+client = TestClient(app)
+
+
+def _uow() -> InMemoryUnitOfWork:
+    seekers, hosts, listings = build_seed()
+    return InMemoryUnitOfWork(
+        InMemorySeekerRepo(seekers),
+        InMemoryHostRepo(hosts),
+        InMemoryListingRepo(listings),
+        InMemorySwipeRepo(),
+        InMemoryMatchRepo(),
+    )
+
+
+def test_changed_listings_alert_matching_searches_once():
+    uow = _uow()
+    listing = uow.listings.get("listing-1")
+    fits = uow.saved_searches.add(
+        {"seeker_id": "seeker-1", "city": "eau claire ", "max_price": Decimal("700")}
+    )
+    uow.saved_searches.add(
+        {"seeker_id": "seeker-1", "city": "Eau Claire", "max_price": Decimal("600")}
+    )
+    uow.saved_searches.add({"seeker_id": "seeker-2", "city": "Madison"})
+    uow.saved_searches.add(
+        {"seeker_id": "seeker-2", "city": "Eau Claire", "move_in": date(2025, 8, 1)}
+    )
+    picky = uow.saved_searches.add(
+        {"seeker_id": "seeker-2", "city": "Eau Claire", "interests": ["chess"]}
+    )
+
+    assert [search["id"] for search in uow.saved_searches.matching(listing)] == [fits["id"]]
+    assert alert_saved_searches(uow, [listing]) == 1
+    # A later edit of the same listing does not alert the same search again.
+    assert alert_saved_searches(uow, [{**listing, "title": "Renamed"}]) == 0
+    assert alert_saved_searches(uow, [{**listing, "status": "UNLISTED"}]) == 0
+
+    chess_club = {**listing, "roommates": [{"id": "r1", "interests": ["Chess"]}]}
+    assert alert_saved_searches(uow, [chess_club]) == 1
+    (alert,) = uow.search_alerts.inbox("seeker-2")
+    assert alert["search_id"] == picky["id"]
+
+    assert uow.saved_searches.delete("seeker-1", picky["id"]) is False
+    assert uow.saved_searches.delete("seeker-2", picky["id"]) is True
+    assert uow.saved_searches.matching(chess_club) == [fits]
+    # The search's alerts go with it, as ON DELETE CASCADE does in SQL.
+    assert uow.search_alerts.inbox("seeker-2") == []
+
+
+def test_alerts_inbox_endpoints():
+    app.dependency_overrides[get_current_user_id] = lambda: "user-1"
+    try:
+        created = client.post(
+            "/seekers/me/searches", json={"city": "Eau Claire", "maxPrice": "700"}
+        )
+        assert created.status_code == 201
+        search = created.json()
+        # listing-1 has no roommates, so a search for music-lovers stays quiet.
+        picky = client.post(
+            "/seekers/me/searches", json={"city": "Eau Claire", "interests": [" Music", "music"]}
+        ).json()
+        assert picky["interests"] == ["music"]
+        assert client.post(
+            "/seekers/me/searches", json={"city": " ", "maxPrice": "700"}
+        ).status_code == 422
+
+        # listing-1 changes; the write reaches the seeker's inbox.
+        with open_uow() as uow:
+            assert alert_saved_searches(uow, [uow.listings.get("listing-1")]) == 1
+
+        alerts = client.get("/seekers/me/alerts", params={"unread": True}).json()
+        assert [(a["searchId"], a["listing"]["id"]) for a in alerts] == [
+            (search["id"], "listing-1")
+        ]
+        ids = [alerts[0]["id"], "missing"]
+        assert client.post("/seekers/me/alerts/read", json={"ids": ids}).json() == {"marked": 1}
+        assert client.get("/seekers/me/alerts", params={"unread": True}).json() == []
+        assert client.get("/seekers/me/alerts").json()[0]["readAt"] is not None
+
+        for saved in (search, picky):
+            assert client.delete(f"/seekers/me/searches/{saved['id']}").status_code == 204
+        assert client.delete(f"/seekers/me/searches/{search['id']}").status_code == 404
+        assert client.get("/seekers/me/searches").json() == []
+    finally:
+        app.dependency_overrides.pop(get_current_user_id, None)
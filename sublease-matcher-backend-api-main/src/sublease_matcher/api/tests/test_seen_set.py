@@ -0,0 +1,43 @@
+import random
+
+from fastapi.testclient import TestClient
+
+from sublease_matcher.api.dependencies.auth import get_current_user_id
+from sublease_matcher.api.main import app
+from sublease_matcher.api.seen_set import ARRAY_MAX, SeenSet
+
+
+def test_round_trips_through_array_and_bitmap_containers():
+    rng = random.Random(7)
+    values = set(rng.sample(range(1 << 20), 3000)) | set(range(70_000, 70_000 + ARRAY_MAX + 10))
+    seen = SeenSet(values)
+
+    restored = SeenSet.from_bytes(seen.to_bytes())
+    assert list(restored) == sorted(values)
+    assert len(restored) == len(values)
+
+    for value in range(70_000, 70_100):
+        assert restored.discard(value)
+    assert 70_050 not in restored and 70_200 in restored
+    assert not restored.discard(70_050)
+    assert len(SeenSet.from_bytes(b"")) == 0
+
+
+def test_small_sets_stay_small():
+    assert len(SeenSet(range(1, 301)).to_bytes()) < 700
+
+
+def test_swiped_listings_leave_the_deck_until_undone():
+    app.dependency_overrides[get_current_user_id] = lambda: "user-3"
+    client = TestClient(app)
+    try:
+        deck = [item["id"] for item in client.get("/swipe/queue/seeker").json()]
+        target = deck[0]
+
+        client.post("/swipe/swipes", json={"targetId": target, "decision": "pass"})
+        assert target not in [item["id"] for item in client.get("/swipe/queue/seeker").json()]
+
+        client.post("/swipe/swipes/undo")
+        assert target in [item["id"] for item in client.get("/swipe/queue/seeker").json()]
+    finally:
+        app.dependency_overrides.pop(get_current_user_id, None)
@@ -0,0 +1,201 @@
+import os
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import Session
+
+from sublease_matcher.api.adapters.sqlalchemy import models
+from sublease_matcher.api.adapters.sqlalchemy.repos import SqlAlchemySwipeRepo
+from sublease_matcher.api.adapters.sqlalchemy.swipe_buffer import (
+    BufferedSwipe,
+    SwipeBuffer,
+    write_batch,
+)
+
+T0 = datetime(2026, 9, 1, 12, 0, tzinfo=UTC)
+
+
+def _pass(swipe_id, target_id, minutes=0, *, actor_id="seeker-1", user_id="user-1"):
+    return BufferedSwipe(
+        id=swipe_id,
+        actor_kind="SEEKER",
+        actor_id=actor_id,
+        user_id=user_id,
+        target_id=target_id,
+        decision="PASS",
+        created_at=T0 + timedelta(minutes=minutes),
+    )
+
+
+def _stored(target_id, decision, minutes):
+    return {
+        "id": f"stored-{target_id}",
+        "user_id": "user-1",
+        "target_id": target_id,
+        "decision": decision,
+        "created_at": T0 + timedelta(minutes=minutes),
+    }
+
+
+def test_unflushed_swipes_survive_a_restart(tmp_path):
+    buffer = SwipeBuffer(tmp_path, fsync=False)
+    buffer.append(_pass("s1", "listing-1"))
+    buffer.append(_pass("s2", "listing-2", minutes=1))
+    buffer.close()
+    with open(buffer.directory / "swipes.jsonl", "a") as handle:
+        handle.write('{"op": "swipe", "swi')  # torn write from a crash
+
+    recovered = SwipeBuffer(tmp_path, fsync=False)
+    assert recovered.latest_for_user("user-1").id == "s2"
+    assert [swipe.id for _, swipe in recovered.begin_flush()] == ["s1", "s2"]
+
+    recovered.complete_flush()
+    assert len(recovered) == 0
+    assert recovered.directory == buffer.directory
+    assert not (recovered.directory / "swipes.flushing.jsonl").exists()
+
+
+def test_failed_flush_is_retried_with_the_same_segment(tmp_path):
+    buffer = SwipeBuffer(tmp_path, fsync=False)
+    buffer.append(_pass("s1", "listing-1"))
+    first = buffer.begin_flush()
+    buffer.append(_pass("s2", "listing-2", minutes=1))
+
+    assert buffer.begin_flush() == first
+    buffer.complete_flush()
+    assert [swipe.id for _, swipe in buffer.begin_flush()] == ["s2"]
+
+
+def test_undo_of_an_inflight_swipe_stays_visible_until_its_own_flush(tmp_path):
+    buffer = SwipeBuffer(tmp_path, fsync=False)
+    swipe = _pass("s1", "listing-1")
+    buffer.append(swipe)
+    buffer.begin_flush()
+    buffer.undo(swipe, T0 + timedelta(minutes=5))
+    buffer.complete_flush()
+
+    assert buffer.latest_for_user("user-1") is None
+    assert buffer.latest("user-1", "listing-1").undone_at is not None
+    assert [op for op, _ in buffer.begin_flush()] == ["undo"]
+    buffer.complete_flush()
+    assert buffer.latest("user-1", "listing-1") is None
+
+
+def test_workers_sharing_a_directory_keep_separate_logs(tmp_path):
+    first = SwipeBuffer(tmp_path, fsync=False)
+    second = SwipeBuffer(tmp_path, fsync=False)
+    assert first.directory != second.directory
+    first.append(_pass("s1", "listing-1"))
+    second.append(_pass("s2", "listing-2", actor_id="seeker-2", user_id="user-2"))
+
+    # One worker rotating and dropping its segment leaves the other's lines alone.
+    assert [swipe.id for _, swipe in first.begin_flush()] == ["s1"]
+    first.complete_flush()
+    second.close()
+    first.close()
+
+    # A restarted worker adopts a slot whose owner is gone and replays it.
+    adopted = [SwipeBuffer(tmp_path, fsync=False) for _ in range(2)]
+    assert {buffer.directory for buffer in adopted} == {first.directory, second.directory}
+    assert [swipe.id for buffer in adopted for _, swipe in buffer.begin_flush()] == ["s2"]
+
+
+def test_repo_reads_merge_buffered_and_stored_swipes(tmp_path):
+    buffer = SwipeBuffer(tmp_path, fsync=False)
+    hooks = []
+    repo = SqlAlchemySwipeRepo(None, buffer=buffer, on_commit=hooks.append)
+    stored = {
+        "listing-1": _stored("listing-1", "like", minutes=0),
+        "listing-2": _stored("listing-2", "like", minutes=10),
+    }
+    repo._stored_swipe = lambda user_id, target_id: stored.get(target_id)
+    repo._latest_stored = lambda user_id: None
+    buffer.append(_pass("s1", "listing-1", minutes=5))
+    buffer.append(_pass("s2", "listing-2", minutes=6))
+
+    # The newer side wins per pair.
+    assert repo.get_swipe("user-1", "listing-1")["id"] == "s1"
+    assert repo.get_swipe("user-1", "listing-2")["id"] == "stored-listing-2"
+
+    # Undo takes the newest buffered pass, but only once the request commits.
+    assert repo.undo_last("user-1")["id"] == "s2"
+    assert buffer.latest_for_user("user-1").id == "s2"
+    hooks.pop()()
+    assert repo.undo_last("user-1")["id"] == "s1"
+    hooks.pop()()
+    # An undone buffered pass hides the older stored like, as an unbuffered undo deletes it.
+    assert repo.get_swipe("user-1", "listing-1") is None
+    assert repo.undo_last("user-1") is None
+
+
+# write_batch streams rows with psycopg's COPY, so this needs PostgreSQL.
+PG_URL = os.environ.get("SM_TEST_DATABASE_URL")
+
+
+@pytest.mark.skipif(not PG_URL, reason="set SM_TEST_DATABASE_URL to a PostgreSQL database")
+def test_write_batch_is_idempotent_and_keeps_newer_likes(tmp_path):
+    tables = [
+        model.__table__
+        for model in (
+            models.User,
+            models.SeekerProfile,
+            models.HostProfile,
+            models.Listing,
+            models.SeekerSwipe,
+            models.SwipeEvent,
+        )
+    ]
+    with create_engine(PG_URL).connect() as connection:
+        transaction = connection.begin()
+        try:
+            models.Base.metadata.create_all(connection, tables=tables)
+            session = Session(bind=connection)
+            session.add_all(
+                [
+                    models.User(id="user-buffer-s", email="buffer-s@example.com"),
+                    models.User(id="user-buffer-h1", email="buffer-h1@example.com"),
+                    models.User(id="user-buffer-h2", email="buffer-h2@example.com"),
+                    models.SeekerProfile(id="seeker-buffer", user_id="user-buffer-s"),
+                    models.HostProfile(id="host-buffer-1", user_id="user-buffer-h1"),
+                    models.HostProfile(id="host-buffer-2", user_id="user-buffer-h2"),
+                    models.Listing(id="listing-buffer-1", host_id="host-buffer-1"),
+                    models.Listing(id="listing-buffer-2", host_id="host-buffer-2"),
+                ]
+            )
+            session.flush()
+            # A like written through after the pass was buffered.
+            session.add(
+                models.SeekerSwipe(
+                    id="like-1",
+                    seeker_id="seeker-buffer",
+                    listing_id="listing-buffer-1",
+                    decision="LIKE",
+                    created_at=T0 + timedelta(minutes=1),
+                )
+            )
+            session.flush()
+            overtaken = _pass("s1", "listing-buffer-1", actor_id="seeker-buffer")
+            undone = _pass("s2", "listing-buffer-2", 2, actor_id="seeker-buffer")
+            undone.undone_at = T0 + timedelta(minutes=3)
+            ops = [("swipe", overtaken), ("swipe", undone), ("undo", undone)]
+
+            write_batch(session, ops)
+            write_batch(session, ops)  # a replay after a crash mid-flush
+
+            actions = session.scalars(
+                select(models.SwipeEvent.action)
+                .where(models.SwipeEvent.actor_id == "seeker-buffer")
+                .order_by(models.SwipeEvent.created_at)
+            ).all()
+            assert actions == ["PASS", "PASS", "UNDO"]
+            # The later like survives the older pass; the undone pass leaves no decision.
+            rows = session.execute(
+                select(models.SeekerSwipe.listing_id, models.SeekerSwipe.decision).where(
+                    models.SeekerSwipe.seeker_id == "seeker-buffer"
+                )
+            ).all()
+            assert [tuple(row) for row in rows] == [("listing-buffer-1", "LIKE")]
+            session.close()
+        finally:
+            transaction.rollback()
@@ -0,0 +1,87 @@
+import os
+from datetime import date
+
+import pytest
+from sqlalchemy import create_engine, select
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import Session
+from sqlalchemy.schema import CreateTable
+
+from sublease_matcher.api.adapters.sqlalchemy import models
+from sublease_matcher.api.adapters.sqlalchemy.models import SwipeEvent
+from sublease_matcher.api.adapters.sqlalchemy.repos import SqlAlchemySwipeRepo
+from sublease_matcher.api.adapters.sqlalchemy.swipe_log import (
+    add_months,
+    partition_month,
+    partition_name,
+)
+
+
+def test_monthly_partition_names_round_trip_across_years():
+    assert add_months(date(2026, 11, 1), 2) == date(2027, 1, 1)
+    assert add_months(date(2026, 1, 1), -1) == date(2025, 12, 1)
+    assert partition_name(date(2027, 1, 1)) == "swipe_events_2027_01"
+    assert partition_month("swipe_events_2027_01") == date(2027, 1, 1)
+    assert partition_month("swipe_events_default") is None
+
+
+def test_swipe_events_is_range_partitioned_on_created_at():
+    ddl = str(CreateTable(SwipeEvent.__table__).compile(dialect=postgresql.dialect()))
+    assert "PARTITION BY RANGE (created_at)" in ddl
+    assert "PRIMARY KEY (created_at, id)" in ddl
+
+
+# The swipe repo writes with INSERT ... ON CONFLICT ON CONSTRAINT, so this needs PostgreSQL.
+PG_URL = os.environ.get("SM_TEST_DATABASE_URL")
+
+
+@pytest.mark.skipif(not PG_URL, reason="set SM_TEST_DATABASE_URL to a PostgreSQL database")
+def test_swipes_and_undos_are_appended_to_swipe_events():
+    tables = [
+        model.__table__
+        for model in (
+            models.User,
+            models.SeekerProfile,
+            models.HostProfile,
+            models.Listing,
+            models.SeekerSwipe,
+            SwipeEvent,
+        )
+    ]
+    with create_engine(PG_URL).connect() as connection:
+        transaction = connection.begin()
+        try:
+            models.Base.metadata.create_all(connection, tables=tables)
+            session = Session(bind=connection)
+            session.add_all(
+                [
+                    models.User(id="user-swipe-log-s", email="swipe-log-s@example.com"),
+                    models.User(id="user-swipe-log-h", email="swipe-log-h@example.com"),
+                    models.SeekerProfile(id="seeker-swipe-log", user_id="user-swipe-log-s"),
+                    models.HostProfile(id="host-swipe-log", user_id="user-swipe-log-h"),
+                    models.Listing(id="listing-swipe-log", host_id="host-swipe-log"),
+                ]
+            )
+            session.flush()
+            repo = SqlAlchemySwipeRepo(session)
+
+            repo.record_swipe("user-swipe-log-s", "listing-swipe-log", "like")
+            repo.record_swipe("user-swipe-log-s", "listing-swipe-log", "pass")
+            assert repo.get_swipe("user-swipe-log-s", "listing-swipe-log")["decision"] == "pass"
+            assert repo.undo_last("user-swipe-log-s")["decision"] == "pass"
+            assert repo.get_swipe("user-swipe-log-s", "listing-swipe-log") is None
+
+            # The current-decision row is gone, but the history keeps all three steps.
+            events = session.execute(
+                select(SwipeEvent.actor_kind, SwipeEvent.actor_id, SwipeEvent.action)
+                .where(SwipeEvent.target_id == "listing-swipe-log")
+                .order_by(SwipeEvent.created_at)
+            ).all()
+            assert [tuple(event) for event in events] == [
+                ("SEEKER", "seeker-swipe-log", "LIKE"),
+                ("SEEKER", "seeker-swipe-log", "PASS"),
+                ("SEEKER", "seeker-swipe-log", "UNDO"),
+            ]
+            session.close()
+        finally:
+            transaction.rollback()
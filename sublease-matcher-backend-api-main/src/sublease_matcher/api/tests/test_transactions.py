@@ -0,0 +1,81 @@
+import threading
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import sessionmaker
+
+from sublease_matcher.api.adapters.memory_repos import (
+    InMemoryHostRepo,
+    InMemoryListingRepo,
+    InMemoryMatchRepo,
+    InMemorySeekerRepo,
+    InMemorySwipeRepo,
+)
+from sublease_matcher.api.adapters.memory_uow import InMemoryUnitOfWork
+from sublease_matcher.api.adapters.sqlalchemy.uow import SqlAlchemyUnitOfWork
+
+
+class _PgError(Exception):
+    def __init__(self, sqlstate):
+        self.sqlstate = sqlstate
+
+
+def _sql_uow():
+    return SqlAlchemyUnitOfWork(sessionmaker(bind=create_engine("sqlite://")))
+
+
+def _memory_uow():
+    return InMemoryUnitOfWork(
+        InMemorySeekerRepo(),
+        InMemoryHostRepo(),
+        InMemoryListingRepo(),
+        InMemorySwipeRepo(),
+        InMemoryMatchRepo(),
+    )
+
+
+def test_serialization_failures_are_retried_with_fresh_commit_hooks():
+    uow = _sql_uow()
+    calls, fired = [], []
+
+    def work(tx):
+        calls.append(1)
+        tx.on_commit(lambda: fired.append(len(calls)))
+        if len(calls) < 3:
+            raise OperationalError("COMMIT", {}, _PgError("40001"))
+        return "done"
+
+    assert uow.run_in_transaction(work, max_attempts=3) == "done"
+    assert fired == [3]
+
+
+def test_other_database_errors_are_not_retried():
+    uow = _sql_uow()
+    calls = []
+
+    def work(tx):
+        calls.append(1)
+        raise OperationalError("INSERT", {}, _PgError("23505"))
+
+    with pytest.raises(OperationalError):
+        uow.run_in_transaction(work)
+    assert len(calls) == 1
+
+
+def test_memory_lock_blocks_the_same_key_until_commit():
+    first, second = _memory_uow(), _memory_uow()
+    first.lock("match-pair:seeker-1:listing-1")
+    acquired = threading.Event()
+
+    def contend():
+        second.lock("match-pair:seeker-1:listing-1")
+        acquired.set()
+        second.commit()
+
+    thread = threading.Thread(target=contend)
+    thread.start()
+    assert not acquired.wait(0.1)
+    first.commit()
+    thread.join(1)
+    assert acquired.is_set()
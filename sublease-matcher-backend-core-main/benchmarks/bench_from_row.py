@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""Compare validating vs trusted construction of listings loaded from storage.
+
+Run from the package root: ``PYTHONPATH=src python benchmarks/bench_from_row.py``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import timeit
+from collections.abc import Callable
+from datetime import date
+from decimal import Decimal
+from typing import Any
+
+from sublease_matcher.core.domain import (
+    HostId,
+    Listing,
+    ListingId,
+    ListingStatus,
+    Money,
+    RoommateId,
+    RoommateProfile,
+)
+from sublease_matcher.core.mappers import listing_from_row
+
+
+def make_rows(count: int) -> list[dict[str, Any]]:
+    year = date.today().year + 1
+    return [
+        {
+            "id": f"listing-{index}",
+            "host_id": f"host-{index}",
+            "title": f"Room {index} near Water St",
+            "price_per_month": Decimal(500 + index % 400).quantize(Decimal("0.01")),
+            "city": "Eau Claire",
+            "state": "WI",
+            "available_from": date(year, 8, 15),
+            "available_to": date(year, 12, 20),
+            "status": "PUBLISHED",
+            "contact_email": f"h{index}@example.edu",
+            "bio": None,
+            "roommates": [
+                {"id": f"roommate-{index}", "name": "Sam", "interests": ["music"]}
+            ]
+            if index % 3 == 0
+            else [],
+        }
+        for index in range(count)
+    ]
+
+
+def validating_from_row(row: dict[str, Any]) -> Listing:
+    """What adapters would do without the trusted path."""
+
+    roommates = tuple(
+        RoommateProfile(
+            id=RoommateId(r["id"]),
+            name=r["name"],
+            sleeping_habits=r.get("sleeping_habits"),
+            gender=r.get("gender"),
+            pronouns=r.get("pronouns"),
+            interests=tuple(r.get("interests") or ()),
+            major_minor=r.get("major_minor"),
+        )
+        for r in row["roommates"]
+    )
+    return Listing(
+        id=ListingId(row["id"]),
+        host_id=HostId(row["host_id"]),
+        title=row["title"],
+        price_per_month=Money(row["price_per_month"]),
+        city=row["city"],
+        state=row["state"],
+        available_from=row["available_from"],
+        available_to=row["available_to"],
+        status=ListingStatus(row["status"]),
+        contact_email=row["contact_email"],
+        bio=row["bio"],
+        roommates=roommates,
+        roommates_count=len(roommates),
+    )
+
+
+def best_of(
+    fn: Callable[[dict[str, Any]], Listing], rows: list[dict[str, Any]], repeat: int
+) -> float:
+    timings = timeit.repeat(lambda: [fn(row) for row in rows], number=1, repeat=repeat)
+    return min(timings)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=5000)
+    parser.add_argument("--repeat", type=int, default=7)
+    args = parser.parse_args()
+
+    rows = make_rows(args.rows)
+    assert [validating_from_row(r) for r in rows] == [listing_from_row(r) for r in rows]
+
+    validating = best_of(validating_from_row, rows, args.repeat)
+    trusted = best_of(listing_from_row, rows, args.repeat)
+    print(f"{args.rows} listings, best of {args.repeat}")
+    print(f"  validating constructor : {validating * 1000:8.2f} ms")
+    print(f"  listing_from_row       : {trusted * 1000:8.2f} ms")
+    print(f"  speedup                : {validating / trusted:8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
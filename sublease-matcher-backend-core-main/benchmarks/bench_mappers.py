@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""Compare the generated entity mappers with ``dataclasses.asdict``.
+
+Run from the package root: ``PYTHONPATH=src python benchmarks/bench_mappers.py``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import timeit
+from collections.abc import Callable, Sequence
+from dataclasses import asdict
+from datetime import date
+from decimal import Decimal
+from typing import Any
+
+from sublease_matcher.core.domain import (
+    HostId,
+    Listing,
+    ListingId,
+    ListingStatus,
+    Money,
+    RoommateId,
+    RoommateProfile,
+    SeekerId,
+    SeekerProfile,
+    UserId,
+)
+from sublease_matcher.core.mappers import listing_to_dict, seeker_to_dict
+
+
+def make_listings(count: int) -> list[Listing]:
+    year = date.today().year + 1
+    listings = []
+    for index in range(count):
+        roommates = tuple(
+            RoommateProfile(
+                id=RoommateId(f"roommate-{index}-{n}"),
+                name="Sam",
+                sleeping_habits=None,
+                gender=None,
+                pronouns=None,
+                interests=("music", "hiking"),
+                major_minor=None,
+            )
+            for n in range(index % 3)
+        )
+        listings.append(
+            Listing(
+                id=ListingId(f"listing-{index}"),
+                host_id=HostId(f"host-{index}"),
+                title=f"Room {index}",
+                price_per_month=Money(Decimal(500 + index % 400)),
+                city="Eau Claire",
+                state="WI",
+                available_from=date(year, 8, 15),
+                available_to=date(year, 12, 20),
+                status=ListingStatus.PUBLISHED,
+                contact_email=f"h{index}@example.edu",
+                bio=None,
+                roommates=roommates,
+                roommates_count=len(roommates),
+            )
+        )
+    return listings
+
+
+def make_seekers(count: int) -> list[SeekerProfile]:
+    year = date.today().year + 1
+    return [
+        SeekerProfile(
+            id=SeekerId(f"seeker-{index}"),
+            user_id=UserId(f"user-{index}"),
+            bio="hi",
+            available_from=date(year, 1, 10),
+            available_to=date(year, 5, 10),
+            budget_min=Money(Decimal(400)),
+            budget_max=Money(Decimal(800 + index % 200)),
+            city="Eau Claire",
+            interests=("coding", "hiking"),
+            contact_email=f"s{index}@example.edu",
+        )
+        for index in range(count)
+    ]
+
+
+def best_of(fn: Callable[[Any], object], items: Sequence[Any], repeat: int) -> float:
+    run = lambda: [fn(item) for item in items]  # noqa: E731
+    return min(timeit.repeat(run, number=1, repeat=repeat))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--count", type=int, default=5000)
+    parser.add_argument("--repeat", type=int, default=7)
+    args = parser.parse_args()
+
+    cases = [
+        ("Listing", make_listings(args.count), listing_to_dict),
+        ("SeekerProfile", make_seekers(args.count), seeker_to_dict),
+    ]
+    print(f"{args.count} entities, best of {args.repeat}")
+    for name, items, generated in cases:
+        slow = best_of(asdict, items, args.repeat)
+        fast = best_of(generated, items, args.repeat)
+        print(
+            f"  {name:<14} asdict {slow * 1000:8.2f} ms   generated "
+            f"{fast * 1000:7.2f} ms   {slow / fast:6.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
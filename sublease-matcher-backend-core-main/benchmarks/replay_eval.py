@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""Replay a recorded swipe log against match engines and compare them side by side.
+
+Run from the package root, e.g.::
+
+    PYTHONPATH=src python benchmarks/replay_eval.py swipes.jsonl \\
+        --engine simple --engine learned=models/ranker.json
+
+Export a log from the API database with ``make export-swipe-log`` there. Use
+``--start`` to score only the swipes after a model's training cut-off.
+"""
+
+from __future__ import annotations
+
+import argparse
+from datetime import datetime
+
+from sublease_matcher.core.replay import (
+    DEFAULT_K,
+    ReplayListings,
+    format_reports,
+    read_log,
+    replay,
+)
+from sublease_matcher.core.services.matches import SimpleMatchEngine
+from sublease_matcher.core.services.ports import MatchEngine
+
+
+def build_engine(spec: str, listings: ReplayListings) -> MatchEngine:
+    kind, _, arg = spec.partition("=")
+    if kind == "simple":
+        return SimpleMatchEngine(listings)
+    if kind == "learned" and arg:
+        # Imported here: the learned engine needs NumPy.
+        from sublease_matcher.core.ranking import ModelFile
+        from sublease_matcher.core.services.matches import LearnedMatchEngine
+
+        return LearnedMatchEngine(listings, ModelFile(arg))
+    raise SystemExit(f"unknown engine {spec!r}; use 'simple' or 'learned=MODEL.json'")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("log", help="JSON-lines swipe log")
+    parser.add_argument(
+        "--engine",
+        action="append",
+        dest="engines",
+        metavar="SPEC",
+        help="'simple' or 'learned=MODEL.json'; repeat to compare (default: simple)",
+    )
+    parser.add_argument("--k", type=int, default=DEFAULT_K, help="ranking cut-off")
+    parser.add_argument(
+        "--start",
+        type=datetime.fromisoformat,
+        help="ISO timestamp; earlier swipes only warm up the replay",
+    )
+    args = parser.parse_args()
+
+    with open(args.log) as src:
+        log = read_log(src)
+    listings = ReplayListings(log.listings.values())
+    print(
+        f"{len(log.swipes)} swipes, {len(log.seekers)} seekers, "
+        f"{len(log.listings)} listings"
+    )
+    reports = [
+        replay(spec, build_engine(spec, listings), log, k=args.k, start=args.start)
+        for spec in args.engines or ["simple"]
+    ]
+    print(format_reports(reports))
+
+
+if __name__ == "__main__":
+    main()
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from . import enums as _enums
 from . import ids as _ids
+from . import traits as _traits
 from . import value_objects as _value_objects
 from .enums import *  # noqa: F401,F403
 from .ids import *  # noqa: F401,F403
@@ -12,6 +13,7 @@ from .match import Match
 from .roommate import RoommateProfile
 from .seeker import SeekerProfile
 from .swipe import Swipe
+from .traits import *  # noqa: F401,F403
 from .user import UserAccount
 from .value_objects import *  # noqa: F401,F403
 
@@ -19,6 +21,7 @@ __all__ = [
     *_ids.__all__,
     *_enums.__all__,
     *_value_objects.__all__,
+    *_traits.__all__,
     "UserAccount",
     "SeekerProfile",
     "RoommateProfile",
@@ -1,18 +1,21 @@
 """Listing domain entity describing available subleases.
 
 Roommate information is authoritative: the tuple of `roommates` must contain
-exactly `roommates_count` entries when any roommates are supplied.
+exactly `roommates_count` entries when any roommates are supplied. Their trait
+words (see `traits`) are packed into `roommate_features` whenever roommates are
+set, so scoring never re-encodes them.
 """
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import date
 
 from ..errors import Validation
 from .enums import ListingStatus
 from .ids import HostId, ListingId
 from .roommate import RoommateProfile
+from .traits import pack_traits, roommate_traits
 from .value_objects import (
     DateRange,
     Money,
@@ -38,6 +41,7 @@ class Listing:
     bio: str | None
     roommates: tuple[RoommateProfile, ...] = ()
     roommates_count: int = 0
+    roommate_features: bytes = field(default=b"", init=False, repr=False, compare=False)
 
     def __post_init__(self) -> None:
         self.title = self.title.strip()
@@ -82,6 +86,52 @@ class Listing:
         if self.roommates_count != len(roommates):
             raise Validation("roommates_count must equal provided roommates.")
         self.roommates = roommates
+        self.roommate_features = pack_traits(map(roommate_traits, roommates))
+
+    @classmethod
+    def from_trusted_row(
+        cls,
+        *,
+        id: ListingId,  # noqa: A002
+        host_id: HostId,
+        title: str,
+        price_per_month: Money | None,
+        city: str,
+        state: str,
+        available_from: date | None,
+        available_to: date | None,
+        status: ListingStatus,
+        contact_email: str | None,
+        bio: str | None,
+        roommates: tuple[RoommateProfile, ...] = (),
+        roommate_features: bytes | None = None,
+    ) -> Listing:
+        """Rebuild a listing from storage without re-running ``__post_init__``.
+
+        Only for rows that went through the validating constructor when they
+        were written. Availability windows in past years are accepted here,
+        which the validating constructor would reject. Stored
+        ``roommate_features`` are reused; without them they are re-encoded.
+        """
+
+        listing = object.__new__(cls)
+        listing.id = id
+        listing.host_id = host_id
+        listing.title = title
+        listing.price_per_month = price_per_month
+        listing.city = city
+        listing.state = state
+        listing.available_from = available_from
+        listing.available_to = available_to
+        listing.status = status
+        listing.contact_email = contact_email
+        listing.bio = bio
+        listing.roommates = roommates
+        listing.roommates_count = len(roommates)
+        if roommate_features is None:
+            roommate_features = pack_traits(map(roommate_traits, roommates))
+        listing.roommate_features = roommate_features
+        return listing
 
     def publish(self) -> None:
         """Mark the listing as visible to seekers."""
@@ -60,6 +60,40 @@ class SeekerProfile:
         # Ensure interests are stored as a deduplicated, lowercased tuple
         self.interests = normalize_interests(self.interests)
 
+    @classmethod
+    def from_trusted_row(
+        cls,
+        *,
+        id: SeekerId,  # noqa: A002
+        user_id: UserId,
+        bio: str,
+        available_from: date,
+        available_to: date,
+        budget_min: Money | None,
+        budget_max: Money | None,
+        city: str | None,
+        interests: tuple[str, ...],
+        contact_email: str | None,
+        hidden: bool = False,
+    ) -> SeekerProfile:
+        """
+        Rebuild a persisted profile without re-running the rules above.
+        `interests` must already be normalized, as they are when stored.
+        """
+        profile = object.__new__(cls)
+        profile.id = id
+        profile.user_id = user_id
+        profile.bio = bio
+        profile.available_from = available_from
+        profile.available_to = available_to
+        profile.budget_min = budget_min
+        profile.budget_max = budget_max
+        profile.city = city
+        profile.interests = interests
+        profile.contact_email = contact_email
+        profile.hidden = hidden
+        return profile
+
     @property
     def publishable(self) -> bool:
         """
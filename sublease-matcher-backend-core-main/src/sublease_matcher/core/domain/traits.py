@@ -0,0 +1,113 @@
+"""Fixed-width trait words for roommate compatibility.
+
+Each person is encoded once, when their profile is written, into a 64-bit word:
+
+- bits 0-39: interests, each normalized and hashed (CRC-32) to one bit;
+- bits 40-55: major/minor keywords, hashed the same way;
+- bits 56-61: habits as one-hot pairs (sleep early/late, study quiet/social,
+  tidy/relaxed). A dimension whose text matches neither side, or both, is 0.
+
+A listing keeps its roommates' words packed little-endian, ``WORD_BYTES`` each,
+so a seeker can be compared against every roommate in a few big-int operations
+(see ``services.compatibility``). Hashing lets distinct interests share a bit;
+with the handful of interests people list, that barely moves the overlap.
+"""
+
+from __future__ import annotations
+
+import re
+import zlib
+from collections.abc import Iterable
+
+from .roommate import RoommateProfile
+
+WORD_BITS = 64
+WORD_BYTES = WORD_BITS // 8
+INTEREST_BITS = 40
+MAJOR_OFFSET = 40
+MAJOR_BITS = 16
+HABIT_OFFSET = 56
+HABIT_DIMENSIONS = 3
+INTEREST_MASK = (1 << INTEREST_BITS) - 1
+MAJOR_MASK = ((1 << MAJOR_BITS) - 1) << MAJOR_OFFSET
+HABIT_MASK = ((1 << 2 * HABIT_DIMENSIONS) - 1) << HABIT_OFFSET
+
+_WORD = re.compile(r"[a-z0-9]+")
+_MAJOR_STOP_WORDS = frozenset(
+    {"and", "of", "in", "the", "major", "minor", "science", "sciences", "studies"}
+)
+# (first side, second side) keywords per habit dimension, in bit order.
+_HABIT_WORDS = (
+    (
+        frozenset({"early", "morning", "bird", "riser"}),
+        frozenset({"late", "night", "owl", "nocturnal"}),
+    ),
+    (
+        frozenset({"quiet", "library", "silent", "focused"}),
+        frozenset({"social", "group", "groups", "loud"}),
+    ),
+    (
+        frozenset({"tidy", "clean", "neat", "organized", "organised"}),
+        frozenset({"relaxed", "messy", "casual", "laid"}),
+    ),
+)
+
+
+def _words(text: str | None) -> list[str]:
+    return _WORD.findall(text.lower()) if text else []
+
+
+def _bucket(token: str, width: int) -> int:
+    return zlib.crc32(token.encode()) % width
+
+
+def encode_traits(
+    *,
+    interests: Iterable[str] = (),
+    major: str | None = None,
+    sleeping_habits: str | None = None,
+    study_habits: str | None = None,
+    cleanliness: str | None = None,
+    bio: str | None = None,
+) -> int:
+    """Trait word for one person; habit fields that are unset fall back to ``bio``."""
+
+    word = 0
+    for interest in interests:
+        key = " ".join(_words(interest))
+        if key:
+            word |= 1 << _bucket(key, INTEREST_BITS)
+    for token in _words(major):
+        if token not in _MAJOR_STOP_WORDS:
+            word |= 1 << (MAJOR_OFFSET + _bucket(token, MAJOR_BITS))
+    from_bio = set(_words(bio))
+    fields = (sleeping_habits, study_habits, cleanliness)
+    pairs = zip(fields, _HABIT_WORDS, strict=True)
+    for index, (text, (first, second)) in enumerate(pairs):
+        words = set(_words(text)) if text else from_bio
+        is_first, is_second = bool(words & first), bool(words & second)
+        if is_first != is_second:
+            word |= 1 << (HABIT_OFFSET + 2 * index + is_second)
+    return word
+
+
+def roommate_traits(roommate: RoommateProfile) -> int:
+    return encode_traits(
+        interests=roommate.interests,
+        major=roommate.major_minor,
+        sleeping_habits=roommate.sleeping_habits,
+    )
+
+
+def pack_traits(words: Iterable[int]) -> bytes:
+    """Concatenate trait words into the stored per-listing vector."""
+
+    return b"".join(word.to_bytes(WORD_BYTES, "little") for word in words)
+
+
+__all__ = [
+    "WORD_BYTES",
+    "encode_traits",
+    "pack_traits",
+    "roommate_traits",
+]
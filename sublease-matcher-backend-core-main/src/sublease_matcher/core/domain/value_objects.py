@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import re
 from dataclasses import dataclass
 from datetime import date
 from decimal import ROUND_HALF_UP, Decimal
@@ -88,6 +89,28 @@ class Money:
             raise ValueError("Money amount cannot be negative.")
         object.__setattr__(self, "amount", quantized)
 
+    @classmethod
+    def from_trusted(cls, amount: Decimal) -> Money:
+        """Wrap an amount already stored as a non-negative, two-place decimal."""
+
+        money = object.__new__(cls)
+        object.__setattr__(money, "amount", amount)
+        return money
+
+    @classmethod
+    def from_cents(cls, cents: int) -> Money:
+        """Inverse of :attr:`cents`."""
+
+        if cents < 0:
+            raise ValueError("Money amount cannot be negative.")
+        return cls.from_trusted(Decimal(cents).scaleb(-2))
+
+    @property
+    def cents(self) -> int:
+        """The amount as an integer number of cents (exact after quantization)."""
+
+        return int(self.amount.scaleb(2))
+
     def __str__(self) -> str:
         return f"{self.amount:.2f}"
 
@@ -119,6 +142,39 @@ def validate_city(value: str) -> str:
     return candidate
 
 
+_CITY_WORD = re.compile(r"[^\W_]+(?:['-][^\W_]+)*")
+_TRAILING_STATE = re.compile(r",\s*[a-z]{2}\s*$")
+_CITY_PREFIXES = {"st": "saint", "ste": "sainte", "ft": "fort", "mt": "mount"}
+
+# Common spellings seen in profiles, keyed by their already-normalized form.
+CITY_ALIASES = {
+    "eauclaire": "eau claire",
+    "lacrosse": "la crosse",
+    "mpls": "minneapolis",
+    "msp": "minneapolis",
+    "madtown": "madison",
+    "stevens pt": "stevens point",
+}
+
+
+def normalize_city_key(value: str | None) -> str:
+    """Comparison key for a city name; ``""`` when there is no city.
+
+    Case, punctuation and spacing are ignored, a trailing ``", WI"`` style state
+    is dropped, ``St.``/``Ft.``/``Mt.`` prefixes are spelled out and a few
+    common aliases are folded, so ``" St. Paul, MN"`` and ``"saint paul"`` agree.
+    """
+
+    if not value:
+        return ""
+    text = _TRAILING_STATE.sub("", value.lower().replace(".", " "))
+    words = _CITY_WORD.findall(text)
+    if words and words[0] in _CITY_PREFIXES:
+        words[0] = _CITY_PREFIXES[words[0]]
+    key = " ".join(words)
+    return CITY_ALIASES.get(key, key)
+
+
 def validate_availability_dates(
     available_from: date, available_to: date | None
 ) -> None:
@@ -155,6 +211,7 @@ __all__ = [
     "validate_email",
     "validate_state_code",
     "validate_city",
+    "normalize_city_key",
     "validate_availability_dates",
     "DateRange",
 ]
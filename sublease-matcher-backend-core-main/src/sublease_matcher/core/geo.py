@@ -0,0 +1,177 @@
+"""Offline geocoding and radius helpers for city-level locations.
+
+Coordinates come from a small bundled gazetteer (``data/gazetteer.csv``, the
+Wisconsin and Minnesota towns the app serves), looked up by
+``normalize_city_key`` and state. Points are indexed by geohash: a radius query
+expands to the 3x3 block of cells around its centre at the finest precision
+whose cells are at least as large as the radius. Those cells are plain string
+prefixes, so adapters can serve them from a btree or a dict. Candidates are
+then checked with a local planar distance that needs no trigonometry per pair.
+"""
+
+from __future__ import annotations
+
+import csv
+import math
+from dataclasses import dataclass, field
+from functools import lru_cache
+from importlib import resources
+from typing import NamedTuple
+
+from .domain import normalize_city_key
+
+GEOHASH_PRECISION = 7
+_BASE32 = "0123456789bcdefghjkmnpqrstuvwxyz"
+KM_PER_DEGREE_LAT = 110.574
+_KM_PER_DEGREE_LON_EQUATOR = 111.320
+
+
+class GeoPoint(NamedTuple):
+    lat: float
+    lon: float
+
+
+def geohash(point: GeoPoint, precision: int = GEOHASH_PRECISION) -> str:
+    lat_lo, lat_hi, lon_lo, lon_hi = -90.0, 90.0, -180.0, 180.0
+    chars: list[str] = []
+    bits = value = 0
+    even = True
+    while len(chars) < precision:
+        if even:
+            mid = (lon_lo + lon_hi) / 2
+            if point.lon >= mid:
+                value, lon_lo = value * 2 + 1, mid
+            else:
+                value, lon_hi = value * 2, mid
+        else:
+            mid = (lat_lo + lat_hi) / 2
+            if point.lat >= mid:
+                value, lat_lo = value * 2 + 1, mid
+            else:
+                value, lat_hi = value * 2, mid
+        even = not even
+        bits += 1
+        if bits == 5:
+            chars.append(_BASE32[value])
+            bits = value = 0
+    return "".join(chars)
+
+
+def cell_size_degrees(precision: int) -> tuple[float, float]:
+    """``(height, width)`` of a geohash cell in degrees."""
+    lon_bits = (5 * precision + 1) // 2
+    lat_bits = 5 * precision // 2
+    return 180.0 / 2**lat_bits, 360.0 / 2**lon_bits
+
+
+def km_per_degree_lon(lat: float) -> float:
+    return _KM_PER_DEGREE_LON_EQUATOR * math.cos(math.radians(lat))
+
+
+def covering_cells(center: GeoPoint, km: float) -> list[str]:
+    """Geohash prefixes whose union contains every point within ``km`` of ``center``."""
+    precision = GEOHASH_PRECISION
+    while precision > 1:
+        height, width = cell_size_degrees(precision)
+        if (
+            height * KM_PER_DEGREE_LAT >= km
+            and width * km_per_degree_lon(abs(center.lat) + height) >= km
+        ):
+            break
+        precision -= 1
+    height, width = cell_size_degrees(precision)
+    cells = {
+        geohash(
+            GeoPoint(
+                max(-90.0, min(90.0, center.lat + dy * height)),
+                (center.lon + dx * width + 180.0) % 360.0 - 180.0,
+            ),
+            precision,
+        )
+        for dy in (-1, 0, 1)
+        for dx in (-1, 0, 1)
+    }
+    return sorted(cells)
+
+
+@dataclass(slots=True, frozen=True)
+class Radius:
+    """A ``within_km`` filter around a point, with its precomputed local scale."""
+
+    center: GeoPoint
+    km: float
+    km_per_lon: float = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "km_per_lon", km_per_degree_lon(self.center.lat))
+
+    def cells(self) -> list[str]:
+        return covering_cells(self.center, self.km)
+
+    def distance_km(self, point: GeoPoint) -> float:
+        """Equirectangular distance; well under 1% off at these ranges."""
+        dy = (point.lat - self.center.lat) * KM_PER_DEGREE_LAT
+        dx = (point.lon - self.center.lon) * self.km_per_lon
+        return math.sqrt(dx * dx + dy * dy)
+
+    def contains(self, point: GeoPoint | None) -> bool:
+        return point is not None and self.distance_km(point) <= self.km
+
+
+class Gazetteer:
+    """City -> coordinates, keyed by ``(normalize_city_key(city), state)``."""
+
+    def __init__(self, rows: dict[tuple[str, str], GeoPoint]) -> None:
+        self._by_city_state = rows
+        by_city: dict[str, set[GeoPoint]] = {}
+        for (city, _), point in rows.items():
+            by_city.setdefault(city, set()).add(point)
+        # A bare city name only resolves when no other state has the same one.
+        self._by_city = {
+            city: next(iter(points))
+            for city, points in by_city.items()
+            if len(points) == 1
+        }
+
+    def __len__(self) -> int:
+        return len(self._by_city_state)
+
+    def lookup(self, city: str | None, state: str | None = None) -> GeoPoint | None:
+        key = normalize_city_key(city)
+        if not key:
+            return None
+        if state and state.strip():
+            return self._by_city_state.get((key, state.strip().upper()))
+        return self._by_city.get(key)
+
+
+@lru_cache(maxsize=1)
+def default_gazetteer() -> Gazetteer:
+    source = resources.files(__package__).joinpath("data", "gazetteer.csv")
+    with source.open(encoding="utf-8") as handle:
+        rows = {
+            (normalize_city_key(row["city"]), row["state"]): GeoPoint(
+                float(row["lat"]), float(row["lon"])
+            )
+            for row in csv.DictReader(handle)
+        }
+    return Gazetteer(rows)
+
+
+def locate(city: str | None, state: str | None = None) -> GeoPoint | None:
+    """Resolve a city against the bundled gazetteer."""
+    return default_gazetteer().lookup(city, state)
+
+
+__all__ = [
+    "GEOHASH_PRECISION",
+    "KM_PER_DEGREE_LAT",
+    "GeoPoint",
+    "Gazetteer",
+    "Radius",
+    "covering_cells",
+    "default_gazetteer",
+    "geohash",
+    "km_per_degree_lon",
+    "locate",
+]
@@ -1,23 +1,180 @@
-"""Placeholder mappers for bridging domain objects to adapter layers."""
+"""Mappers for bridging domain objects to adapter layers.
+
+The ``*_to_dict`` / ``*_from_dict`` pairs are generated once per entity from
+its dataclass fields. They read and pass attributes directly: nested values
+are shared, not copied or converted the way ``dataclasses.asdict`` would. So
+``listing_to_dict(listing)["price_per_month"]`` is the listing's ``Money`` and
+``["roommates"]`` its tuple of ``RoommateProfile`` objects, not nested dicts;
+use ``dataclasses.asdict`` where plain data is needed (e.g. for JSON).
+``*_from_dict`` goes through the entity's normal, validating constructor,
+leaves ``init=False`` fields to it and fills missing fields from their
+``default`` or ``default_factory``.
+
+The ``*_from_row`` helpers rebuild entities from persisted rows through the
+trusted constructors, skipping validation that already ran on write. Use the
+regular constructors for anything that came from a request.
+"""
 
 from __future__ import annotations
 
-from dataclasses import asdict
-from typing import Any
+from collections.abc import Callable, Mapping
+from dataclasses import MISSING, fields
+from decimal import Decimal
+from typing import Any, cast
+
+from .domain import (
+    HostId,
+    Listing,
+    ListingId,
+    ListingStatus,
+    Match,
+    Money,
+    RoommateId,
+    RoommateProfile,
+    SeekerId,
+    SeekerProfile,
+    Swipe,
+    UserId,
+)
+
+
+def _compile_to_dict(cls: type[Any]) -> Callable[[Any], dict[str, Any]]:
+    items = ", ".join(f"{f.name!r}: obj.{f.name}" for f in fields(cls))
+    source = f"def {cls.__name__.lower()}_to_dict(obj):\n    return {{{items}}}\n"
+    return cast(Callable[[Any], dict[str, Any]], _define(source, {}))
+
+
+def _compile_from_dict(cls: type[Any]) -> Callable[[Mapping[str, Any]], Any]:
+    namespace: dict[str, Any] = {"cls": cls}
+    args = []
+    for field in fields(cls):
+        if not field.init:
+            # The constructor (or __post_init__) sets these; passing them would fail.
+            continue
+        name = field.name
+        if field.default is not MISSING:
+            namespace[f"default_{name}"] = field.default
+            value = f"data.get({name!r}, default_{name})"
+        elif field.default_factory is not MISSING:
+            # Called per missing value, so each entity gets its own mutable default.
+            namespace[f"factory_{name}"] = field.default_factory
+            value = f"data[{name!r}] if {name!r} in data else factory_{name}()"
+        else:
+            value = f"data[{name!r}]"
+        args.append(f"{name}=({value})")
+    source = (
+        f"def {cls.__name__.lower()}_from_dict(data):\n"
+        f"    return cls({', '.join(args)})\n"
+    )
+    return cast(Callable[[Mapping[str, Any]], Any], _define(source, namespace))
+
+
+def _define(source: str, namespace: dict[str, Any]) -> Any:
+    local: dict[str, Any] = {}
+    exec(source, namespace, local)  # noqa: S102 - source is built from field names
+    return next(iter(local.values()))
+
+
+listing_to_dict: Callable[[Listing], dict[str, Any]] = _compile_to_dict(Listing)
+listing_from_dict: Callable[[Mapping[str, Any]], Listing] = _compile_from_dict(Listing)
+seeker_to_dict: Callable[[SeekerProfile], dict[str, Any]] = _compile_to_dict(
+    SeekerProfile
+)
+seeker_from_dict: Callable[[Mapping[str, Any]], SeekerProfile] = _compile_from_dict(
+    SeekerProfile
+)
+match_to_dict: Callable[[Match], dict[str, Any]] = _compile_to_dict(Match)
+match_from_dict: Callable[[Mapping[str, Any]], Match] = _compile_from_dict(Match)
+swipe_to_dict: Callable[[Swipe], dict[str, Any]] = _compile_to_dict(Swipe)
+swipe_from_dict: Callable[[Mapping[str, Any]], Swipe] = _compile_from_dict(Swipe)
+roommate_to_dict: Callable[[RoommateProfile], dict[str, Any]] = _compile_to_dict(
+    RoommateProfile
+)
+roommate_from_dict: Callable[[Mapping[str, Any]], RoommateProfile] = (
+    _compile_from_dict(RoommateProfile)
+)
+
+
+def _money_from_column(value: Any) -> Money | None:
+    if value is None or isinstance(value, Money):
+        return value
+    # NUMERIC(10, 2) columns come back already quantized; anything else is normalized.
+    if isinstance(value, Decimal) and value.as_tuple().exponent == -2:
+        return Money.from_trusted(value)
+    return Money(value)
+
+
+def _roommate_from_row(row: Mapping[str, Any] | RoommateProfile) -> RoommateProfile:
+    if isinstance(row, RoommateProfile):
+        return row
+    return RoommateProfile(
+        id=RoommateId(row["id"]),
+        name=row["name"],
+        sleeping_habits=row.get("sleeping_habits"),
+        gender=row.get("gender"),
+        pronouns=row.get("pronouns"),
+        interests=tuple(row.get("interests") or ()),
+        major_minor=row.get("major_minor"),
+    )
 
-from .domain import Listing, SeekerProfile
 
+def listing_from_row(row: Mapping[str, Any]) -> Listing:
+    """Rebuild a stored listing; ``row`` uses the entity's field names."""
 
-def listing_to_dict(obj: Listing) -> dict[str, Any]:
-    """Return a shallow dict representation of a listing."""
+    return Listing.from_trusted_row(
+        id=ListingId(row["id"]),
+        host_id=HostId(row["host_id"]),
+        title=row["title"],
+        price_per_month=_money_from_column(row.get("price_per_month")),
+        city=row["city"],
+        state=row["state"],
+        available_from=row.get("available_from"),
+        available_to=row.get("available_to"),
+        status=ListingStatus(row["status"]),
+        contact_email=row.get("contact_email"),
+        bio=row.get("bio"),
+        roommates=tuple(_roommate_from_row(r) for r in row.get("roommates") or ()),
+        roommate_features=row.get("roommate_features"),
+    )
 
-    return asdict(obj, dict_factory=dict)
 
+def seeker_from_row(row: Mapping[str, Any]) -> SeekerProfile:
+    """Rebuild a stored seeker profile.
 
-def seeker_to_dict(obj: SeekerProfile) -> dict[str, Any]:
-    """Return a shallow dict representation of a seeker profile."""
+    Interests are read from ``interests`` or, as adapters store them, from a
+    comma-separated ``interests_csv``.
+    """
 
-    return asdict(obj, dict_factory=dict)
+    interests = row.get("interests")
+    if interests is None:
+        csv = row.get("interests_csv")
+        interests = csv.split(",") if csv else ()
+    return SeekerProfile.from_trusted_row(
+        id=SeekerId(row["id"]),
+        user_id=UserId(row["user_id"]),
+        bio=row["bio"],
+        available_from=row["available_from"],
+        available_to=row["available_to"],
+        budget_min=_money_from_column(row.get("budget_min")),
+        budget_max=_money_from_column(row.get("budget_max")),
+        city=row.get("city"),
+        interests=tuple(interests),
+        contact_email=row.get("contact_email"),
+        hidden=bool(row.get("hidden", False)),
+    )
 
 
-__all__ = ["listing_to_dict", "seeker_to_dict"]
+__all__ = [
+    "listing_to_dict",
+    "listing_from_dict",
+    "listing_from_row",
+    "seeker_to_dict",
+    "seeker_from_dict",
+    "seeker_from_row",
+    "match_to_dict",
+    "match_from_dict",
+    "swipe_to_dict",
+    "swipe_from_dict",
+    "roommate_to_dict",
+    "roommate_from_dict",
+]
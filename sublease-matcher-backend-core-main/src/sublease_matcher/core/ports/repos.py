@@ -76,7 +76,9 @@ class ListingRepo(Protocol):
         status: str | None = None,
         limit: int = 20,
         offset: int = 0,
-    ) -> Page: ...
+    ) -> Page:
+        """``city`` is compared by ``normalize_city_key``, not as typed."""
+        ...
 
 
 @runtime_checkable
@@ -98,7 +100,9 @@ class MatchRepo(Protocol):
 
     def upsert(self, match: Match) -> None: ...
 
-    def for_user(self, uid: UserId, *, limit: int = 50, offset: int = 0) -> Page: ...
+    def for_user(self, uid: UserId, *, limit: int = 50, offset: int = 0) -> Page:
+        """Matches for ``uid`` ordered by score desc (nulls last), then id."""
+        ...
 
     def for_pair(self, seeker: SeekerId, listing: ListingId) -> Match | None: ...
 
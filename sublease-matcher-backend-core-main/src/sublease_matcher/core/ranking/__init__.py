@@ -0,0 +1,29 @@
+"""Learned ranking: pair features, a linear model file and its trainer.
+
+Needs NumPy (``pip install -e '.[ml]'``); nothing else in the core imports it.
+"""
+
+from __future__ import annotations
+
+try:
+    import numpy as _numpy  # noqa: F401
+except ImportError as exc:  # pragma: no cover - depends on the install
+    raise ImportError(
+        "sublease_matcher.core.ranking needs NumPy; install the 'ml' extra"
+    ) from exc
+
+from .features import FEATURES, PairFeatures, pair_features
+from .model import MODEL_FORMAT, LinearModel, ModelFile, load_model, save_model
+from .train import train
+
+__all__ = [
+    "FEATURES",
+    "MODEL_FORMAT",
+    "LinearModel",
+    "ModelFile",
+    "PairFeatures",
+    "load_model",
+    "pair_features",
+    "save_model",
+    "train",
+]
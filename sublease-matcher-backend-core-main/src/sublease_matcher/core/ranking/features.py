@@ -0,0 +1,48 @@
+"""Pair features for the learned ranker, shared by training and serving.
+
+Every feature is on 0-1 and comes from the same integer scoring the hand-tuned
+engine uses, so a model file stays meaningful as long as ``FEATURES`` (which
+is saved with it) does not change.
+"""
+
+from __future__ import annotations
+
+from ..services.compatibility import compatibility_hundredths
+from ..services.scoring import (
+    BUDGET_POINTS,
+    CITY_POINTS,
+    ListingScoring,
+    SeekerScoring,
+    budget_points,
+    city_points,
+)
+
+FEATURES: tuple[str, ...] = (
+    "city",
+    "budget",
+    "budget_unknown",
+    "roommates",
+    "no_roommates",
+)
+
+PairFeatures = tuple[float, ...]
+
+
+def pair_features(seeker: SeekerScoring, listing: ListingScoring) -> PairFeatures:
+    """One row of ``FEATURES`` for a seeker-listing pair."""
+
+    city = city_points(seeker, listing) / CITY_POINTS if seeker.city_key else 0.0
+    if seeker.budget_max_cents is None or listing.price_cents is None:
+        budget, budget_unknown = 0.0, 1.0
+    else:
+        points = budget_points(listing.price_cents, seeker.budget_max_cents)
+        budget, budget_unknown = points / BUDGET_POINTS, 0.0
+    compatibility = compatibility_hundredths(seeker.traits, listing.roommate_features)
+    if compatibility is None:
+        roommates, no_roommates = 0.0, 1.0
+    else:
+        roommates, no_roommates = compatibility / 100, 0.0
+    return (city, budget, budget_unknown, roommates, no_roommates)
+
+
+__all__ = ["FEATURES", "PairFeatures", "pair_features"]
@@ -0,0 +1,183 @@
+"""Linear ranking model: one logistic layer over ``FEATURES``, saved as JSON.
+
+A model file records its format, a version string, the feature names it was
+trained on, the weights and the training metrics. Files are written to a
+temporary name and renamed into place, so a reader never sees half a model;
+``ModelFile`` notices the rename and swaps the new model in on its next use.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, cast
+
+import numpy as np
+import numpy.typing as npt
+
+from ..services.scoring import ListingScoring, SeekerScoring
+from .features import FEATURES, PairFeatures, pair_features
+
+logger = logging.getLogger(__name__)
+
+MODEL_FORMAT = 1
+
+FloatArray = npt.NDArray[np.float64]
+
+
+@dataclass(slots=True, frozen=True)
+class LinearModel:
+    """``P(like) = sigmoid(features @ weights + bias)``."""
+
+    version: str
+    weights: FloatArray
+    bias: float
+    features: tuple[str, ...] = FEATURES
+    metrics: Mapping[str, float] = field(default_factory=dict)
+
+    def __post_init__(self) -> None:
+        if self.features != FEATURES:
+            raise ValueError(
+                f"model {self.version} was trained on features {list(self.features)}, "
+                f"this build scores {list(FEATURES)}"
+            )
+        if self.weights.shape != (len(FEATURES),):
+            raise ValueError(f"model {self.version} has {self.weights.size} weights")
+
+    def score_matrix(self, rows: FloatArray) -> FloatArray:
+        """Like probability for each row of a ``(candidates, features)`` matrix."""
+
+        return 1.0 / (1.0 + np.exp(-(rows @ self.weights + self.bias)))
+
+    def score_rows(self, rows: Sequence[PairFeatures]) -> FloatArray:
+        if not rows:
+            return np.zeros(0)
+        return self.score_matrix(np.asarray(rows, dtype=np.float64))
+
+    def score_hundredths(
+        self, seeker: SeekerScoring, listings: Sequence[ListingScoring]
+    ) -> list[int]:
+        """Scores on 0-100 for a whole candidate batch, in one matrix-vector product."""
+
+        rows = [pair_features(seeker, listing) for listing in listings]
+        scores = self.score_rows(rows)
+        return cast(list[int], np.rint(scores * 100).astype(int).tolist())
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "format": MODEL_FORMAT,
+            "version": self.version,
+            "features": list(self.features),
+            "weights": self.weights.tolist(),
+            "bias": self.bias,
+            "metrics": dict(self.metrics),
+        }
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> LinearModel:
+        if data.get("format") != MODEL_FORMAT:
+            raise ValueError(f"unsupported model format {data.get('format')!r}")
+        return cls(
+            version=str(data["version"]),
+            weights=np.asarray(data["weights"], dtype=np.float64),
+            bias=float(data["bias"]),
+            features=tuple(data["features"]),
+            metrics={
+                key: float(value) for key, value in data.get("metrics", {}).items()
+            },
+        )
+
+
+def save_model(model: LinearModel, path: str | os.PathLike[str]) -> Path:
+    """Write ``model`` to ``path`` atomically."""
+
+    target = Path(path)
+    target.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=target.parent, prefix=f".{target.name}.")
+    try:
+        with os.fdopen(fd, "w") as out:
+            json.dump(model.to_dict(), out, indent=2)
+            out.flush()
+            os.fsync(out.fileno())
+        os.replace(tmp, target)
+    except BaseException:
+        Path(tmp).unlink(missing_ok=True)
+        raise
+    return target
+
+
+def load_model(path: str | os.PathLike[str]) -> LinearModel:
+    with open(path) as src:
+        return LinearModel.from_dict(json.load(src))
+
+
+class ModelFile:
+    """A model file that is re-read when it changes on disk.
+
+    The file is loaded on construction, so a missing or broken model fails at
+    startup. Afterwards ``model`` stats the file at most every
+    ``check_seconds``; a replaced file is loaded and swapped in, while one that
+    fails to load is logged and the current model kept.
+    """
+
+    def __init__(
+        self, path: str | os.PathLike[str], *, check_seconds: float = 5.0
+    ) -> None:
+        self.path = Path(path)
+        self._check_seconds = check_seconds
+        self._lock = threading.Lock()
+        self._stamp = self._stat()
+        self._model = load_model(self.path)
+        self._checked_at = time.monotonic()
+
+    def _stat(self) -> tuple[int, int, int] | None:
+        try:
+            stat = self.path.stat()
+        except FileNotFoundError:
+            return None
+        return (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+
+    @property
+    def model(self) -> LinearModel:
+        if time.monotonic() - self._checked_at >= self._check_seconds:
+            self.reload()
+        return self._model
+
+    def reload(self) -> bool:
+        """Load the file if it changed since the last load; ``True`` if swapped."""
+
+        # Requests that find a reload in progress keep scoring with the current model.
+        if not self._lock.acquire(blocking=False):
+            return False
+        try:
+            self._checked_at = time.monotonic()
+            stamp = self._stat()
+            if stamp is None or stamp == self._stamp:
+                return False
+            try:
+                model = load_model(self.path)
+            except (OSError, ValueError, KeyError, TypeError):
+                logger.exception("keeping ranking model %s", self._model.version)
+                self._stamp = stamp
+                return False
+            self._model, self._stamp = model, stamp
+            logger.info("loaded ranking model %s from %s", model.version, self.path)
+            return True
+        finally:
+            self._lock.release()
+
+
+__all__ = [
+    "MODEL_FORMAT",
+    "LinearModel",
+    "ModelFile",
+    "load_model",
+    "save_model",
+]
@@ -0,0 +1,115 @@
+"""Fit a ``LinearModel`` to LIKE/PASS outcomes.
+
+L2-regularised logistic regression solved by Newton's method: with a handful
+of features the Hessian is tiny, so a few iterations converge exactly and no
+learning rate needs tuning. Samples are expected in time order; the latest
+``holdout`` share is scored with a model fitted on the rest, so the reported
+metrics measure how well the past predicts later swipes. The returned model
+is then refitted on everything.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from datetime import UTC, datetime
+
+import numpy as np
+
+from .features import FEATURES, PairFeatures
+from .model import FloatArray, LinearModel
+
+DEFAULT_L2 = 1.0
+DEFAULT_HOLDOUT = 0.2
+_MAX_ITERATIONS = 50
+_TOLERANCE = 1e-8
+
+
+def _sigmoid(z: FloatArray) -> FloatArray:
+    return 1.0 / (1.0 + np.exp(-z))
+
+
+def fit_logistic(rows: FloatArray, labels: FloatArray, *, l2: float) -> FloatArray:
+    """Weights with the bias last; the bias is not regularised."""
+
+    design = np.hstack([rows, np.ones((rows.shape[0], 1))])
+    penalty = np.full(design.shape[1], l2)
+    penalty[-1] = 0.0
+    theta = np.zeros(design.shape[1])
+    for _ in range(_MAX_ITERATIONS):
+        p = _sigmoid(design @ theta)
+        gradient = design.T @ (p - labels) + penalty * theta
+        hessian = (design.T * (p * (1.0 - p))) @ design + np.diag(penalty)
+        # A tiny ridge keeps the solve defined when a feature never varies.
+        step = np.linalg.solve(hessian + 1e-9 * np.eye(len(theta)), gradient)
+        theta -= step
+        if np.max(np.abs(step)) < _TOLERANCE:
+            break
+    return theta
+
+
+def log_loss(labels: FloatArray, scores: FloatArray) -> float:
+    clipped = np.clip(scores, 1e-12, 1 - 1e-12)
+    losses = labels * np.log(clipped) + (1 - labels) * np.log(1 - clipped)
+    return float(-np.mean(losses))
+
+
+def roc_auc(labels: FloatArray, scores: FloatArray) -> float:
+    """Chance that a random LIKE outscores a random PASS (ties count half)."""
+
+    positives = int(labels.sum())
+    negatives = labels.size - positives
+    if not positives or not negatives:
+        return float("nan")
+    order = np.argsort(scores, kind="mergesort")
+    ranks = np.empty(scores.size)
+    sorted_scores = scores[order]
+    # Average ranks over tied scores.
+    _, first, counts = np.unique(sorted_scores, return_index=True, return_counts=True)
+    for start, count in zip(first, counts, strict=True):
+        ranks[order[start : start + count]] = start + (count + 1) / 2
+    wins = ranks[labels == 1].sum() - positives * (positives + 1) / 2
+    return float(wins / (positives * negatives))
+
+
+def train(
+    samples: Iterable[tuple[PairFeatures, bool]],
+    *,
+    l2: float = DEFAULT_L2,
+    holdout: float = DEFAULT_HOLDOUT,
+    version: str | None = None,
+) -> LinearModel:
+    """Fit a model to ``(features, liked)`` samples given oldest first."""
+
+    features: list[PairFeatures] = []
+    outcomes: list[bool] = []
+    for row, liked in samples:
+        features.append(row)
+        outcomes.append(liked)
+    if not features:
+        raise ValueError("no swipes to train on")
+    rows = np.asarray(features, dtype=np.float64).reshape(-1, len(FEATURES))
+    labels = np.asarray(outcomes, dtype=np.float64)
+
+    metrics: dict[str, float] = {
+        "samples": float(labels.size),
+        "likes": float(labels.sum()),
+    }
+    split = int(labels.size * (1 - holdout))
+    if 0 < split < labels.size:
+        theta = fit_logistic(rows[:split], labels[:split], l2=l2)
+        scores = _sigmoid(rows[split:] @ theta[:-1] + theta[-1])
+        metrics["holdout_log_loss"] = log_loss(labels[split:], scores)
+        metrics["holdout_auc"] = roc_auc(labels[split:], scores)
+
+    theta = fit_logistic(rows, labels, l2=l2)
+    if version is None:
+        version = datetime.now(UTC).strftime("%Y%m%dT%H%M%SZ")
+    return LinearModel(
+        version=version,
+        weights=theta[:-1].copy(),
+        bias=float(theta[-1]),
+        metrics=metrics,
+    )
+
+
+__all__ = ["fit_logistic", "log_loss", "roc_auc", "train"]
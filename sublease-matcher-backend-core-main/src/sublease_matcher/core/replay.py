@@ -0,0 +1,379 @@
+"""Offline replay of a recorded swipe log against a ``MatchEngine``.
+
+A log is a JSON-lines file: ``seeker`` and ``listing`` records (entity field
+names, money as decimal strings, dates as ISO strings, ``roommate_features``
+as hex) followed by ``swipe`` records with ``at``, ``seeker_id``,
+``listing_id`` and ``decision`` (``LIKE``/``PASS``). The API's
+``scripts/db/export_swipe_log.py`` writes one from ``swipe_events``. A seeker
+profile needs both availability dates, so a seeker record without them is an
+error; the exporter leaves such seekers out and their swipes go unscored.
+
+Swipes are replayed in time order. Every LIKE from ``start`` on is a query:
+the engine recommends for that seeker, listings the seeker already swiped are
+dropped, and the top ``k`` are compared with the listings the seeker goes on
+to like, this one included:
+
+- hit rate@k: share of queries whose LIKE is in the top ``k``;
+- NDCG@k: the later LIKEs as the relevant set, with binary gains.
+
+Every swiped pair also goes through ``score_pair``. Both calls are timed, so
+engines can be compared on quality and cost over the same log.
+"""
+
+from __future__ import annotations
+
+import json
+import math
+import time
+from collections import defaultdict, deque
+from collections.abc import Callable, Iterable, Mapping, Sequence
+from dataclasses import dataclass, field
+from datetime import UTC, date, datetime
+from decimal import Decimal
+from typing import IO, Any
+
+from .domain import (
+    HostId,
+    Listing,
+    ListingId,
+    ListingStatus,
+    Money,
+    SeekerId,
+    SeekerProfile,
+    UserId,
+    normalize_city_key,
+)
+from .ports.repos import Page
+from .services.ports import MatchEngine
+
+DEFAULT_K = 10
+
+
+@dataclass(slots=True, frozen=True)
+class SwipeRecord:
+    at: datetime
+    seeker_id: SeekerId
+    listing_id: ListingId
+    liked: bool
+
+
+@dataclass(slots=True)
+class SwipeLog:
+    seekers: dict[SeekerId, SeekerProfile] = field(default_factory=dict)
+    listings: dict[ListingId, Listing] = field(default_factory=dict)
+    swipes: list[SwipeRecord] = field(default_factory=list)
+
+
+def _iso(value: date | None) -> str | None:
+    return None if value is None else value.isoformat()
+
+
+def _money(value: Any) -> str | None:
+    if value is None:
+        return None
+    return str(value.amount if isinstance(value, Money) else value)
+
+
+def listing_record(row: Mapping[str, Any]) -> dict[str, Any]:
+    """A ``listing`` line from a listing row or dict using the entity's field names."""
+
+    return {
+        "type": "listing",
+        "id": row["id"],
+        "host_id": row["host_id"],
+        "title": row.get("title") or "",
+        "price_per_month": _money(row.get("price_per_month")),
+        "city": row.get("city") or "",
+        "state": row.get("state") or "",
+        "available_from": _iso(row.get("available_from")),
+        "available_to": _iso(row.get("available_to")),
+        "status": row.get("status") or ListingStatus.PUBLISHED.value,
+        "roommate_features": (row.get("roommate_features") or b"").hex(),
+    }
+
+
+def seeker_record(row: Mapping[str, Any]) -> dict[str, Any]:
+    """A ``seeker`` line; interests come from ``interests`` or ``interests_csv``."""
+
+    interests = row.get("interests")
+    if interests is None:
+        csv = row.get("interests_csv")
+        interests = csv.split(",") if csv else []
+    return {
+        "type": "seeker",
+        "id": row["id"],
+        "user_id": row["user_id"],
+        "bio": row.get("bio"),
+        "city": row.get("city"),
+        "budget_min": _money(row.get("budget_min")),
+        "budget_max": _money(row.get("budget_max")),
+        "interests": list(interests),
+        "available_from": _iso(row.get("available_from")),
+        "available_to": _iso(row.get("available_to")),
+    }
+
+
+def swipe_record(
+    at: datetime, seeker_id: str, listing_id: str, decision: str
+) -> dict[str, Any]:
+    return {
+        "type": "swipe",
+        "at": at.isoformat(),
+        "seeker_id": seeker_id,
+        "listing_id": listing_id,
+        "decision": decision.upper(),
+    }
+
+
+def _date(value: str | None) -> date | None:
+    return None if value is None else date.fromisoformat(value)
+
+
+def _money_from(value: str | None) -> Money | None:
+    return None if value is None else Money(Decimal(value))
+
+
+def _listing_from(record: Mapping[str, Any]) -> Listing:
+    return Listing.from_trusted_row(
+        id=ListingId(record["id"]),
+        host_id=HostId(record["host_id"]),
+        title=record["title"],
+        price_per_month=_money_from(record["price_per_month"]),
+        city=record["city"],
+        state=record["state"],
+        available_from=_date(record["available_from"]),
+        available_to=_date(record["available_to"]),
+        status=ListingStatus(record["status"]),
+        contact_email=None,
+        bio=None,
+        roommate_features=bytes.fromhex(record["roommate_features"]),
+    )
+
+
+def _seeker_from(record: Mapping[str, Any]) -> SeekerProfile:
+    available_from = _date(record["available_from"])
+    available_to = _date(record["available_to"])
+    if available_from is None or available_to is None:
+        raise ValueError(f"seeker {record['id']!r} has no availability dates")
+    return SeekerProfile.from_trusted_row(
+        id=SeekerId(record["id"]),
+        user_id=UserId(record["user_id"]),
+        bio=record["bio"],
+        available_from=available_from,
+        available_to=available_to,
+        budget_min=_money_from(record["budget_min"]),
+        budget_max=_money_from(record["budget_max"]),
+        city=record["city"],
+        interests=tuple(record["interests"]),
+        contact_email=None,
+    )
+
+
+def write_log(out: IO[str], records: Iterable[Mapping[str, Any]]) -> int:
+    count = 0
+    for record in records:
+        out.write(json.dumps(record, separators=(",", ":")) + "\n")
+        count += 1
+    return count
+
+
+def read_log(lines: Iterable[str]) -> SwipeLog:
+    log = SwipeLog()
+    for line in lines:
+        if not line.strip():
+            continue
+        record = json.loads(line)
+        kind = record.get("type")
+        if kind == "swipe":
+            log.swipes.append(
+                SwipeRecord(
+                    datetime.fromisoformat(record["at"]),
+                    SeekerId(record["seeker_id"]),
+                    ListingId(record["listing_id"]),
+                    record["decision"] == "LIKE",
+                )
+            )
+        elif kind == "listing":
+            listing = _listing_from(record)
+            log.listings[listing.id] = listing
+        elif kind == "seeker":
+            seeker = _seeker_from(record)
+            log.seekers[seeker.id] = seeker
+        else:
+            raise ValueError(f"unknown record type {kind!r}")
+    # Stable: swipes with the same timestamp keep their order in the file.
+    log.swipes.sort(key=lambda swipe: swipe.at)
+    return log
+
+
+class ReplayListings:
+    """``ListingRepo.search`` over the listings of a log, indexed by city key."""
+
+    def __init__(self, listings: Iterable[Listing]) -> None:
+        self._by_city: defaultdict[str, list[Listing]] = defaultdict(list)
+        for listing in listings:
+            self._by_city[normalize_city_key(listing.city)].append(listing)
+
+    def search(
+        self,
+        *,
+        city: str | None = None,
+        status: str | None = None,
+        limit: int = 20,
+        offset: int = 0,
+    ) -> Page:
+        if city is not None:
+            items = self._by_city.get(normalize_city_key(city), [])
+        else:
+            items = [listing for group in self._by_city.values() for listing in group]
+        if status is not None:
+            items = [listing for listing in items if listing.status.value == status]
+        return Page(
+            items=items[offset : offset + limit],
+            total=len(items),
+            limit=limit,
+            offset=offset,
+        )
+
+
+def percentile(samples: Sequence[int], q: float) -> int:
+    """Nearest-rank percentile of ``samples`` (any order); 0 when empty."""
+
+    if not samples:
+        return 0
+    ordered = sorted(samples)
+    return ordered[max(0, math.ceil(q / 100 * len(ordered)) - 1)]
+
+
+@dataclass(slots=True)
+class ReplayReport:
+    engine: str
+    k: int
+    queries: int = 0
+    hits: int = 0
+    ndcg_total: float = 0.0
+    recommend_ns: list[int] = field(default_factory=list)
+    score_ns: list[int] = field(default_factory=list)
+
+    @property
+    def hit_rate(self) -> float:
+        return self.hits / self.queries if self.queries else 0.0
+
+    @property
+    def ndcg(self) -> float:
+        return self.ndcg_total / self.queries if self.queries else 0.0
+
+    def rows(self) -> dict[str, str]:
+        """Formatted metrics, keyed by row label; latencies in microseconds."""
+
+        rows = {
+            "queries": str(self.queries),
+            f"hit_rate@{self.k}": f"{self.hit_rate:.4f}",
+            f"ndcg@{self.k}": f"{self.ndcg:.4f}",
+        }
+        for call, samples in (
+            ("recommendations_for", self.recommend_ns),
+            ("score_pair", self.score_ns),
+        ):
+            for q in (50, 90, 99):
+                rows[f"{call} p{q} us"] = f"{percentile(samples, q) / 1000:.1f}"
+            rows[f"{call} max us"] = f"{max(samples, default=0) / 1000:.1f}"
+        return rows
+
+
+def _ndcg(ranked: Sequence[ListingId], relevant: set[ListingId], k: int) -> float:
+    gains = sum(
+        1 / math.log2(rank + 2)
+        for rank, listing_id in enumerate(ranked)
+        if listing_id in relevant
+    )
+    ideal = sum(1 / math.log2(rank + 2) for rank in range(min(k, len(relevant))))
+    return gains / ideal if ideal else 0.0
+
+
+def replay(
+    name: str,
+    engine: MatchEngine,
+    log: SwipeLog,
+    *,
+    k: int = DEFAULT_K,
+    start: datetime | None = None,
+    clock: Callable[[], int] = time.perf_counter_ns,
+) -> ReplayReport:
+    """Replay ``log`` against ``engine``; swipes before ``start`` only warm up.
+
+    Exported logs are stamped in UTC, so a ``start`` without a timezone is UTC.
+    """
+
+    if start is not None and start.tzinfo is None:
+        start = start.replace(tzinfo=UTC)
+
+    report = ReplayReport(name, k)
+    # Each seeker's LIKEs still ahead of the replay, in order.
+    ahead: defaultdict[SeekerId, deque[ListingId]] = defaultdict(deque)
+    for swipe in log.swipes:
+        if swipe.liked:
+            ahead[swipe.seeker_id].append(swipe.listing_id)
+    seen: defaultdict[SeekerId, set[ListingId]] = defaultdict(set)
+
+    for swipe in log.swipes:
+        seeker = log.seekers.get(swipe.seeker_id)
+        listing = log.listings.get(swipe.listing_id)
+        swiped = seen[swipe.seeker_id]
+        if seeker is not None and listing is not None:
+            began = clock()
+            engine.score_pair(seeker, listing)
+            report.score_ns.append(clock() - began)
+
+            if swipe.liked and (start is None or swipe.at >= start):
+                began = clock()
+                recommended = engine.recommendations_for(seeker, limit=k + len(swiped))
+                report.recommend_ns.append(clock() - began)
+                ranked = [lid for lid in recommended if lid not in swiped][:k]
+                relevant = {lid for lid in ahead[swipe.seeker_id] if lid not in swiped}
+                report.queries += 1
+                report.hits += swipe.listing_id in ranked
+                report.ndcg_total += _ndcg(ranked, relevant, k)
+        if swipe.liked:
+            ahead[swipe.seeker_id].popleft()
+        swiped.add(swipe.listing_id)
+    return report
+
+
+def format_reports(reports: Sequence[ReplayReport]) -> str:
+    """The reports side by side, one column per engine."""
+
+    table = [r.rows() for r in reports]
+    labels = list(table[0]) if table else []
+    width = max((len(label) for label in labels), default=0)
+    columns = [
+        max(len(r.engine), *(len(rows[label]) for label in labels))
+        for r, rows in zip(reports, table, strict=True)
+    ]
+    lines = [
+        " " * width
+        + "".join(f"  {r.engine:>{w}}" for r, w in zip(reports, columns, strict=True))
+    ]
+    for label in labels:
+        cells = "".join(
+            f"  {rows[label]:>{w}}" for rows, w in zip(table, columns, strict=True)
+        )
+        lines.append(f"{label:<{width}}{cells}")
+    return "\n".join(lines)
+
+
+__all__ = [
+    "DEFAULT_K",
+    "ReplayListings",
+    "ReplayReport",
+    "SwipeLog",
+    "SwipeRecord",
+    "format_reports",
+    "listing_record",
+    "percentile",
+    "read_log",
+    "replay",
+    "seeker_record",
+    "swipe_record",
+    "write_log",
+]
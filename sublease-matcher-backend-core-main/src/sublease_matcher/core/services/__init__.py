@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from .interest import Interest, InterestIndex, Opening, Percolator
 from .listings import ListingService
 from .models import (
     PublishListingCmd,
@@ -9,12 +10,17 @@ from .models import (
     UpdateSeekerCmd,
     UpsertListingCmd,
 )
-from .ports import MatchEngine
+from .ports import MatchEngine, PublishListener
 from .seekers import SeekerService
 from .swipes import SwipeService
 
 __all__ = [
     "MatchEngine",
+    "PublishListener",
+    "Interest",
+    "InterestIndex",
+    "Opening",
+    "Percolator",
     "UpdateSeekerCmd",
     "UpsertListingCmd",
     "PublishListingCmd",
@@ -0,0 +1,117 @@
+"""Roommate compatibility on top of the city/budget score.
+
+A seeker's trait word is replicated into one 64-bit lane per roommate, so a
+single AND against the listing's packed ``roommate_features`` compares the
+seeker with every roommate at once, and ``int.bit_count`` totals each feature
+across all of them. Points, in hundredths:
+
+- interests (50): share of the seeker's interests that roommates have,
+  averaged over roommates; half marks if the seeker lists none;
+- major (20): any roommate with a major keyword in common; half marks if the
+  seeker's major is unknown;
+- habits (30): starts at half and moves with agreeing minus clashing habits
+  over every roommate and habit dimension.
+
+Compatibility is then blended into the match score at ``ROOMMATE_WEIGHT``
+percent; listings without roommates keep their plain score.
+"""
+
+from __future__ import annotations
+
+from functools import lru_cache
+
+from ..domain.traits import (
+    HABIT_DIMENSIONS,
+    HABIT_MASK,
+    HABIT_OFFSET,
+    INTEREST_MASK,
+    MAJOR_MASK,
+    WORD_BITS,
+    WORD_BYTES,
+)
+from .scoring import (
+    ListingScoring,
+    SeekerScoring,
+    div_round_half_even,
+    score_hundredths,
+)
+
+INTEREST_POINTS = 50
+MAJOR_POINTS = 20
+HABIT_POINTS = 30
+ROOMMATE_WEIGHT = 20
+# The first bit of each habit pair.
+_HABIT_LOW = int("01" * HABIT_DIMENSIONS, 2) << HABIT_OFFSET
+
+
+@lru_cache(maxsize=32)
+def _lanes(count: int) -> tuple[int, int, int, int, int]:
+    """Lane-replicated ``(ones, interests, majors, habits, habit_low)`` masks."""
+
+    ones = sum(1 << (WORD_BITS * lane) for lane in range(count))
+    return (
+        ones,
+        INTEREST_MASK * ones,
+        MAJOR_MASK * ones,
+        HABIT_MASK * ones,
+        _HABIT_LOW * ones,
+    )
+
+
+def compatibility_hundredths(
+    seeker_traits: int, roommate_features: bytes
+) -> int | None:
+    """Seeker-roommates compatibility on 0-100, or ``None`` without roommates."""
+
+    count = len(roommate_features) // WORD_BYTES
+    if not count:
+        return None
+    packed = int.from_bytes(roommate_features, "little")
+    ones, interests, majors, habits, habit_low = _lanes(count)
+    mine = seeker_traits * ones
+    shared = packed & mine
+
+    wanted = (seeker_traits & INTEREST_MASK).bit_count()
+    if wanted:
+        hits = (shared & interests).bit_count()
+        interest = div_round_half_even(INTEREST_POINTS * hits, wanted * count)
+    else:
+        interest = INTEREST_POINTS // 2
+
+    if seeker_traits & MAJOR_MASK:
+        major = MAJOR_POINTS if shared & majors else 0
+    else:
+        major = MAJOR_POINTS // 2
+
+    my_habits = mine & habits
+    opposite = ((my_habits & habit_low) << 1) | ((my_habits >> 1) & habit_low)
+    balance = (packed & my_habits).bit_count() - (packed & opposite).bit_count()
+    half = HABIT_POINTS // 2
+    step = div_round_half_even(half * abs(balance), HABIT_DIMENSIONS * count)
+    habit = half + step if balance >= 0 else half - step
+
+    return interest + major + habit
+
+
+def blend_compatibility(score: int, compatibility: int | None) -> int:
+    """Mix compatibility into a 0-100 match score; out-of-range pairs stay at 0."""
+
+    if not score or compatibility is None:
+        return score
+    weighted = score * (100 - ROOMMATE_WEIGHT) + compatibility * ROOMMATE_WEIGHT
+    return div_round_half_even(weighted, 100)
+
+
+def match_hundredths(seeker: SeekerScoring, listing: ListingScoring) -> int:
+    """City/budget score with roommate compatibility blended in."""
+
+    compatibility = compatibility_hundredths(seeker.traits, listing.roommate_features)
+    return blend_compatibility(score_hundredths(seeker, listing), compatibility)
+
+
+__all__ = [
+    "ROOMMATE_WEIGHT",
+    "blend_compatibility",
+    "compatibility_hundredths",
+    "match_hundredths",
+]
@@ -0,0 +1,247 @@
+"""Reverse index of what seekers are looking for, queried by a listing.
+
+Entries are seekers' profiles or their saved searches. Instead of checking a
+new or changed listing against every entry, each entry's preferences are filed
+under three keys: city key, budget band (``BUDGET_BAND_CENTS`` wide) and move-in
+month. A listing then visits only its city, the bands at or above its price and
+the months it covers, and the entries found there get an exact ``suits`` check.
+The cost is a few bisects plus the number of candidates, however many entries
+are indexed.
+
+A listing suits an entry when it is in the entry's city, costs no more than
+its maximum budget and is available from the move-in date through the
+move-out date. An unknown budget, price or date matches anything. An entry
+with interests also needs a roommate sharing at least one of them. Entries
+without a city are not indexed.
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_left, insort
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass
+from datetime import date
+
+from ..domain import Listing, SeekerId, SeekerProfile, normalize_city_key
+from .scoring import to_cents
+
+BUDGET_BAND_CENTS = 25_000
+# Seekers with no budget sit above every band, so every price reaches them.
+_ANY_BUDGET = 1 << 62
+# Seekers with no move-in date sit below every month.
+_ANY_MONTH = -1
+
+
+def _month(day: date) -> int:
+    return day.year * 12 + day.month - 1
+
+
+@dataclass(slots=True, frozen=True)
+class Interest:
+    """What the index keeps of a seeker or a saved search."""
+
+    city_key: str
+    budget_max_cents: int | None = None
+    move_in: date | None = None
+    move_out: date | None = None
+    interests: frozenset[str] = frozenset()
+
+    @classmethod
+    def of(cls, seeker: SeekerProfile) -> Interest | None:
+        """``None`` for seekers that must not be matched (hidden or cityless)."""
+
+        city_key = normalize_city_key(seeker.city)
+        if seeker.hidden or not city_key:
+            return None
+        return cls(city_key, to_cents(seeker.budget_max), seeker.available_from)
+
+
+@dataclass(slots=True, frozen=True)
+class Opening:
+    """What a lookup needs of a listing."""
+
+    city_key: str
+    price_cents: int | None = None
+    available_from: date | None = None
+    available_to: date | None = None
+    # Interests of the roommates, lower-cased.
+    interests: frozenset[str] = frozenset()
+
+    @classmethod
+    def of(cls, listing: Listing) -> Opening:
+        return cls(
+            normalize_city_key(listing.city),
+            to_cents(listing.price_per_month),
+            listing.available_from,
+            listing.available_to,
+            frozenset(
+                interest.lower()
+                for roommate in listing.roommates
+                for interest in roommate.interests
+            ),
+        )
+
+
+def suits(interest: Interest, opening: Opening) -> bool:
+    if interest.city_key != opening.city_key:
+        return False
+    if (
+        interest.budget_max_cents is not None
+        and opening.price_cents is not None
+        and opening.price_cents > interest.budget_max_cents
+    ):
+        return False
+    if interest.interests and not interest.interests & opening.interests:
+        return False
+    move_in, move_out = interest.move_in, interest.move_out
+    start, end = opening.available_from, opening.available_to
+    if move_in is not None and start is not None and start > move_in:
+        return False
+    if end is None:
+        return True
+    return (move_in is None or end >= move_in) and (move_out is None or end >= move_out)
+
+
+class _Sorted[V]:
+    """Buckets by integer key, with the keys kept sorted for range scans."""
+
+    __slots__ = ("_buckets", "_keys")
+
+    def __init__(self) -> None:
+        self._keys: list[int] = []
+        self._buckets: dict[int, V] = {}
+
+    def __bool__(self) -> bool:
+        return bool(self._keys)
+
+    def __getitem__(self, key: int) -> V:
+        return self._buckets[key]
+
+    def get(self, key: int) -> V | None:
+        return self._buckets.get(key)
+
+    def setdefault(self, key: int, factory: Callable[[], V]) -> V:
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            bucket = self._buckets[key] = factory()
+            insort(self._keys, key)
+        return bucket
+
+    def pop(self, key: int) -> None:
+        del self._buckets[key]
+        del self._keys[bisect_left(self._keys, key)]
+
+    def between(self, low: int, high: int | None = None) -> Iterator[V]:
+        """Buckets with ``low <= key <= high`` (no upper bound for ``None``)."""
+
+        for key in self._keys[bisect_left(self._keys, low) :]:
+            if high is not None and key > high:
+                return
+            yield self._buckets[key]
+
+
+Months = _Sorted[set[str]]
+
+
+class InterestIndex:
+    """Entries filed by city key, then budget band, then move-in month.
+
+    Keys are seeker ids or saved-search ids, whichever the caller indexes.
+    """
+
+    def __init__(self) -> None:
+        self._cities: dict[str, _Sorted[Months]] = {}
+        self._interests: dict[str, Interest] = {}
+
+    def __len__(self) -> int:
+        return len(self._interests)
+
+    def __contains__(self, seeker_id: object) -> bool:
+        return seeker_id in self._interests
+
+    @staticmethod
+    def _keys(interest: Interest) -> tuple[int, int]:
+        budget = interest.budget_max_cents
+        band = _ANY_BUDGET if budget is None else budget // BUDGET_BAND_CENTS
+        month = _ANY_MONTH if interest.move_in is None else _month(interest.move_in)
+        return band, month
+
+    def put(self, key: str, interest: Interest | None) -> None:
+        """File ``key`` under ``interest``, replacing its previous entry."""
+
+        self.discard(key)
+        if interest is None or not interest.city_key:
+            return
+        band, month = self._keys(interest)
+        bands = self._cities.get(interest.city_key)
+        if bands is None:
+            bands = self._cities[interest.city_key] = _Sorted()
+        bands.setdefault(band, _Sorted).setdefault(month, set).add(key)
+        self._interests[key] = interest
+
+    def discard(self, key: str) -> None:
+        interest = self._interests.pop(key, None)
+        if interest is None:
+            return
+        band, month = self._keys(interest)
+        bands = self._cities[interest.city_key]
+        months = bands[band]
+        keys = months[month]
+        keys.discard(key)
+        # Drop emptied buckets so range scans never walk dead keys.
+        if not keys:
+            months.pop(month)
+            if not months:
+                bands.pop(band)
+                if not bands:
+                    del self._cities[interest.city_key]
+
+    def match(self, opening: Opening) -> list[str]:
+        """Keys of the entries the opening suits, sorted."""
+
+        bands = self._cities.get(opening.city_key)
+        if bands is None:
+            return []
+        price = opening.price_cents
+        low_band = 0 if price is None else price // BUDGET_BAND_CENTS
+        start = opening.available_from
+        end = opening.available_to
+        low_month = _ANY_MONTH if start is None else _month(start)
+        high_month = None if end is None else _month(end)
+        found: list[str] = []
+        for months in bands.between(low_band):
+            buckets = list(months.between(low_month, high_month))
+            if start is not None:
+                undated = months.get(_ANY_MONTH)
+                if undated is not None:
+                    buckets.append(undated)
+            for keys in buckets:
+                found.extend(
+                    key for key in keys if suits(self._interests[key], opening)
+                )
+        found.sort()
+        return found
+
+
+class Percolator:
+    """Publish listener that hands each suited seeker of a listing to ``notify``."""
+
+    def __init__(
+        self, index: InterestIndex, notify: Callable[[SeekerId, Listing], None]
+    ) -> None:
+        self._index = index
+        self._notify = notify
+
+    def listing_published(self, listing: Listing) -> None:
+        for seeker_id in self._index.match(Opening.of(listing)):
+            self._notify(SeekerId(seeker_id), listing)
+
+
+__all__ = [
+    "BUDGET_BAND_CENTS",
+    "Interest",
+    "InterestIndex",
+    "Opening",
+    "Percolator",
+    "suits",
+]
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections.abc import Sequence
 from dataclasses import replace
 from decimal import Decimal
 from uuid import uuid4
@@ -10,13 +11,17 @@ from ..domain import HostId, Listing, ListingId, ListingStatus, Money
 from ..errors import Conflict, NotFound, Validation
 from ..ports.uow import UnitOfWork
 from .models import PublishListingCmd, UpsertListingCmd
+from .ports import PublishListener
 
 
 class ListingService:
     """Handles host listing creation, updates, and state transitions."""
 
-    def __init__(self, uow: UnitOfWork) -> None:
+    def __init__(
+        self, uow: UnitOfWork, *, listeners: Sequence[PublishListener] = ()
+    ) -> None:
         self._uow = uow
+        self._listeners = tuple(listeners)
 
     def get(self, listing_id: ListingId) -> Listing:
         listing = self._uow.listings.get(listing_id)
@@ -70,6 +75,8 @@ class ListingService:
             raise
         else:
             self._uow.commit()
+            for listener in self._listeners:
+                listener.listing_published(listing)
             return listing
 
     def unlist(self, listing_id: ListingId) -> Listing:
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import uuid
 from collections.abc import Sequence
-from decimal import Decimal
+from typing import TYPE_CHECKING
 
 from ..domain import (
     Listing,
@@ -17,6 +17,12 @@ from ..domain import (
 )
 from ..ports.repos import ListingRepo
 from ..ports.uow import UnitOfWork
+from .compatibility import match_hundredths
+from .scoring import ListingScoring, SeekerScoring
+
+if TYPE_CHECKING:
+    # Only the learned engine needs these, and they need NumPy.
+    from ..ranking import ModelFile
 
 
 def generate_match_id(seeker_id: SeekerId, listing_id: ListingId) -> MatchId:
@@ -28,7 +34,7 @@ def generate_match_id(seeker_id: SeekerId, listing_id: ListingId) -> MatchId:
 
 
 class SimpleMatchEngine:
-    """A basic scoring engine based on City and Budget fit."""
+    """A basic scoring engine based on city, budget and roommate fit."""
 
     def __init__(self, listings: ListingRepo) -> None:
         self._listings = listings
@@ -46,12 +52,13 @@ class SimpleMatchEngine:
         # Fetch candidates (simple city filter first)
         page = self._listings.search(city=seeker.city, limit=limit * 2, offset=0)
 
+        seeker_scoring = SeekerScoring.of(seeker)
         candidates = []
         for item in page.items:
             # Depending on repo implementation, item might be Listing or dict.
             # We assume Listing domain object here based on ports.
             if isinstance(item, Listing):
-                score = self.score_pair(seeker, item)
+                score = match_hundredths(seeker_scoring, ListingScoring.of(item))
                 if score > 0:
                     candidates.append((item.id, score))
 
@@ -60,46 +67,61 @@ class SimpleMatchEngine:
         return [cid for cid, _ in candidates[:limit]]
 
     def score_pair(self, seeker: SeekerProfile, listing: Listing) -> float:
-        """Scores match on [0,1]: 0.5 for City + 0.5 for Budget."""
-        # 1. City Check
-        s_city = seeker.city.strip().lower() if seeker.city else ""
-        l_city = listing.city.strip().lower()
-        if s_city != l_city:
-            return 0.0
+        """Scores match on [0,1]: 0.5 for City + 0.5 for Budget, then roommate fit.
 
-        score = 0.5
+        Budget fit decays by 0.1 per $100 over; see ``services.scoring``. With
+        roommates, compatibility is blended in; see ``services.compatibility``.
+        """
+        scoring = SeekerScoring.of(seeker)
+        return match_hundredths(scoring, ListingScoring.of(listing)) / 100
 
-        # 2. Budget Check
-        if not seeker.budget_max or not listing.price_per_month:
-            return score + 0.5  # Optimistic if data missing
 
-        max_b = seeker.budget_max.amount
-        price = listing.price_per_month.amount
+class LearnedMatchEngine:
+    """Scores with a trained ``LinearModel`` (see ``core.ranking``).
 
-        if price <= max_b:
-            return 1.0
+    Candidates are fetched like ``SimpleMatchEngine`` does and scored as one
+    batch: a single matrix-vector product per call. The model comes from a
+    ``ModelFile``, so retraining only has to replace the file; each worker
+    picks the new version up within ``check_seconds`` without a restart.
+    """
 
-        # Decay: 0.1 penalty per $100 over
-        # Ensure Decimal math
-        penalty = ((price - max_b) / Decimal("100")) * Decimal("0.1")
-        budget_points = max(Decimal("0.0"), Decimal("0.5") - penalty)
+    def __init__(self, listings: ListingRepo, model: ModelFile) -> None:
+        self._listings = listings
+        self._model = model
 
-        return float(round(Decimal(str(score)) + budget_points, 2))
+    def recommendations_for(
+        self,
+        seeker: SeekerProfile,
+        *,
+        limit: int = 20,
+    ) -> Sequence[ListingId]:
+        """Return listings in the seeker's city, most likely to be liked first."""
+        if not seeker.city:
+            return []
+
+        page = self._listings.search(city=seeker.city, limit=limit * 2, offset=0)
+        listings = [
+            ListingScoring.of(item) for item in page.items if isinstance(item, Listing)
+        ]
+        scores = self._model.model.score_hundredths(SeekerScoring.of(seeker), listings)
+        ranked = sorted(range(len(listings)), key=lambda index: -scores[index])
+        return [listings[index].id for index in ranked[:limit]]
+
+    def score_pair(self, seeker: SeekerProfile, listing: Listing) -> float:
+        """Predicted chance on [0,1] that the seeker likes the listing."""
+        scores = self._model.model.score_hundredths(
+            SeekerScoring.of(seeker), [ListingScoring.of(listing)]
+        )
+        return scores[0] / 100
 
 
 class MatchService:
     def __init__(self, uow: UnitOfWork) -> None:
         self._uow = uow
 
-    def get_my_matches(self, user_id: UserId) -> list[Match]:
-        """Returns matches sorted by Score (Desc)."""
-        page = self._uow.matches.for_user(user_id, limit=100)
-
-        matches = []
-        for item in page.items:
-            if isinstance(item, Match):
-                matches.append(item)
-
-        # Sort desc by score, break ties with ID
-        matches.sort(key=lambda m: (-1 * (m.score or 0), str(m.id)))
-        return matches
+    def get_my_matches(
+        self, user_id: UserId, *, limit: int = 50, offset: int = 0
+    ) -> list[Match]:
+        """Returns one page of matches, best score first (ordering is the repo's)."""
+        page = self._uow.matches.for_user(user_id, limit=limit, offset=offset)
+        return [item for item in page.items if isinstance(item, Match)]
@@ -0,0 +1,109 @@
+"""Item-item neighbours from co-likes, and their lift on the match score.
+
+Each seeker's liked listings form a basket; two listings liked by the same
+seeker are co-liked. Similarity is the cosine of their like vectors,
+``co_likes / sqrt(likes_a * likes_b)``, and every listing keeps its ``k`` most
+similar neighbours.
+
+The co-like matrix is never held whole: anchors are split into ``shards`` by
+hash and the baskets are read once per shard, so peak memory is about one
+shard's share of the co-like pairs. ``max_basket`` caps how many likes a single
+seeker contributes, since a basket costs ``n * (n - 1)`` pair updates.
+
+At request time the neighbours of a seeker's recent likes lift the listings
+they point at toward 100, by at most ``NEIGHBOR_WEIGHT`` percent of the gap;
+listings with no neighbour entry keep their score.
+"""
+
+from __future__ import annotations
+
+import heapq
+import math
+import zlib
+from collections import Counter, defaultdict
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from itertools import islice
+
+from .scoring import div_round_half_even
+
+NEIGHBOR_WEIGHT = 50
+DEFAULT_K = 20
+DEFAULT_MAX_BASKET = 200
+DEFAULT_MIN_CO_LIKES = 2
+
+Neighbors = list[tuple[str, float]]
+
+
+def _shard(listing_id: str, shards: int) -> int:
+    return zlib.crc32(listing_id.encode()) % shards
+
+
+def _capped(baskets: Iterable[Sequence[str]], max_basket: int) -> Iterator[list[str]]:
+    for basket in baskets:
+        # A repeated like must not count as a co-like with itself.
+        yield list(dict.fromkeys(islice(basket, max_basket)))
+
+
+def iter_neighbors(
+    baskets: Callable[[], Iterable[Sequence[str]]],
+    *,
+    k: int = DEFAULT_K,
+    shards: int = 1,
+    max_basket: int = DEFAULT_MAX_BASKET,
+    min_co_likes: int = DEFAULT_MIN_CO_LIKES,
+) -> Iterator[tuple[str, Neighbors]]:
+    """Yield ``(listing_id, [(neighbor_id, similarity), ...])``, best neighbour first.
+
+    ``baskets`` returns a fresh iterable of per-seeker liked listing ids on each
+    call (most recent first, if ``max_basket`` should keep the recent ones); it
+    is called ``shards + 1`` times. Listings without a neighbour reaching
+    ``min_co_likes`` are not yielded.
+    """
+
+    if k < 1 or shards < 1:
+        raise ValueError("k and shards must be positive")
+    likes: Counter[str] = Counter()
+    for basket in _capped(baskets(), max_basket):
+        likes.update(basket)
+
+    for shard in range(shards):
+        co_likes: defaultdict[str, Counter[str]] = defaultdict(Counter)
+        for basket in _capped(baskets(), max_basket):
+            if len(basket) < 2:
+                continue
+            for anchor in basket:
+                if _shard(anchor, shards) == shard:
+                    row = co_likes[anchor]
+                    row.update(basket)
+                    row[anchor] -= 1
+        for anchor, row in co_likes.items():
+            mine = likes[anchor]
+            best = heapq.nlargest(
+                k,
+                (
+                    (count / math.sqrt(mine * likes[other]), other)
+                    for other, count in row.items()
+                    if count >= min_co_likes and other != anchor
+                ),
+            )
+            if best:
+                yield anchor, [(other, similarity) for similarity, other in best]
+        del co_likes
+
+
+def neighbor_lift(score: int, similarity: float) -> int:
+    """Raise a 0-100 score toward 100 by ``similarity``; out-of-range pairs stay 0."""
+
+    if not score or similarity <= 0:
+        return score
+    similarity_hundredths = min(100, round(similarity * 100))
+    gap = (100 - score) * similarity_hundredths * NEIGHBOR_WEIGHT
+    return score + div_round_half_even(gap, 100 * 100)
+
+
+__all__ = [
+    "NEIGHBOR_WEIGHT",
+    "Neighbors",
+    "iter_neighbors",
+    "neighbor_lift",
+]
@@ -18,4 +18,10 @@ class MatchEngine(Protocol):
     def score_pair(self, seeker: SeekerProfile, listing: Listing) -> float: ...
 
 
-__all__ = ["MatchEngine"]
+class PublishListener(Protocol):
+    """Told about every listing that was just published, after the commit."""
+
+    def listing_published(self, listing: Listing) -> None: ...
+
+
+__all__ = ["MatchEngine", "PublishListener"]
@@ -0,0 +1,150 @@
+"""Integer scoring projections used by the match engines.
+
+Prices and budgets are converted to integer cents once, when an entity is
+projected, so scoring a pair is a string compare and a few integer operations.
+Scores are computed in hundredths (0-100) and rounded half-to-even, which is
+what ``round(Decimal, 2)`` did in the previous Decimal implementation, so
+results are identical. Exact ``Money`` stays at the edges.
+
+Locations are resolved from the gazetteer at projection time too, once per
+distinct city and state: repeat projections reuse the key and point. Listings in
+another town still earn city points, decaying linearly to nothing at
+``DECAY_KM``; the seeker's projection carries its precomputed local scale, so
+the per-pair distance is a few multiplications, not trigonometry.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from decimal import Decimal
+from functools import lru_cache
+
+from ..domain import Listing, ListingId, Money, SeekerProfile, normalize_city_key
+from ..domain.traits import encode_traits
+from ..geo import GeoPoint, Radius, locate
+
+CITY_POINTS = 50
+BUDGET_POINTS = 50
+# 0.1 points per $100 over budget is one hundredth per 1000 cents.
+CENTS_PER_POINT = 1000
+DECAY_KM = 40
+_DECAY_METRES = DECAY_KM * 1000
+
+
+@lru_cache(maxsize=4096)
+def _place(city: str | None, state: str | None) -> tuple[str, GeoPoint | None]:
+    """City key and gazetteer point for a spelling, computed once per spelling."""
+
+    return normalize_city_key(city), locate(city, state)
+
+
+def to_cents(value: Money | Decimal | None) -> int | None:
+    """Exact cents for a money value; plain Decimals are rounded like ``Money``."""
+
+    if value is None:
+        return None
+    if not isinstance(value, Money):
+        value = Money(value)
+    return value.cents
+
+
+def div_round_half_even(numerator: int, denominator: int) -> int:
+    """``round(numerator / denominator)`` for non-negative ints, without floats."""
+
+    quotient, remainder = divmod(numerator, denominator)
+    twice = 2 * remainder
+    if twice > denominator or (twice == denominator and quotient % 2):
+        quotient += 1
+    return quotient
+
+
+@dataclass(slots=True, frozen=True)
+class ListingScoring:
+    """What scoring needs from a listing."""
+
+    id: ListingId
+    city_key: str
+    price_cents: int | None
+    point: GeoPoint | None = None
+    roommate_features: bytes = b""
+
+    @classmethod
+    def of(cls, listing: Listing) -> ListingScoring:
+        city_key, point = _place(listing.city, listing.state)
+        return cls(
+            listing.id,
+            city_key,
+            to_cents(listing.price_per_month),
+            point,
+            listing.roommate_features,
+        )
+
+
+@dataclass(slots=True, frozen=True)
+class SeekerScoring:
+    """What scoring needs from a seeker."""
+
+    city_key: str
+    budget_max_cents: int | None
+    origin: Radius | None = None
+    # Trait word (see ``domain.traits``) for roommate compatibility.
+    traits: int = 0
+
+    @classmethod
+    def of(cls, seeker: SeekerProfile) -> SeekerScoring:
+        city_key, point = _place(seeker.city, None)
+        traits = encode_traits(interests=seeker.interests, bio=seeker.bio)
+        return cls(city_key, to_cents(seeker.budget_max), decay_origin(point), traits)
+
+
+def decay_origin(point: GeoPoint | None) -> Radius | None:
+    """The seeker-side radius that ``city_points`` measures distance from."""
+
+    return None if point is None else Radius(point, DECAY_KM)
+
+
+def city_points(seeker: SeekerScoring, listing: ListingScoring) -> int:
+    """Location fit in hundredths: full marks for the same city, then distance decay."""
+
+    if seeker.city_key == listing.city_key:
+        return CITY_POINTS
+    if seeker.origin is None or listing.point is None:
+        return 0
+    metres = round(seeker.origin.distance_km(listing.point) * 1000)
+    if metres >= _DECAY_METRES:
+        return 0
+    return div_round_half_even(CITY_POINTS * (_DECAY_METRES - metres), _DECAY_METRES)
+
+
+def budget_points(price_cents: int, budget_max_cents: int) -> int:
+    """Budget fit in hundredths: full marks within budget, then linear decay."""
+
+    over = price_cents - budget_max_cents
+    if over <= 0:
+        return BUDGET_POINTS
+    return max(0, BUDGET_POINTS - div_round_half_even(over, CENTS_PER_POINT))
+
+
+def score_hundredths(seeker: SeekerScoring, listing: ListingScoring) -> int:
+    """Score a pair on 0-100: nothing out of range, else location + budget."""
+
+    location = city_points(seeker, listing)
+    if not location:
+        return 0
+    if seeker.budget_max_cents is None or listing.price_cents is None:
+        # Optimistic if data is missing.
+        return location + BUDGET_POINTS
+    return location + budget_points(listing.price_cents, seeker.budget_max_cents)
+
+
+__all__ = [
+    "DECAY_KM",
+    "ListingScoring",
+    "SeekerScoring",
+    "budget_points",
+    "city_points",
+    "decay_origin",
+    "div_round_half_even",
+    "score_hundredths",
+    "to_cents",
+]
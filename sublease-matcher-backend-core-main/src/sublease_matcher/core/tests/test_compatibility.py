@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+import random
+from datetime import date
+
+from sublease_matcher.core.domain import (
+    HostId,
+    Listing,
+    ListingId,
+    ListingStatus,
+    RoommateId,
+    RoommateProfile,
+    encode_traits,
+    pack_traits,
+)
+from sublease_matcher.core.domain.traits import (
+    HABIT_MASK,
+    HABIT_OFFSET,
+    INTEREST_MASK,
+    MAJOR_MASK,
+)
+from sublease_matcher.core.mappers import listing_from_row, listing_to_dict
+from sublease_matcher.core.services.compatibility import (
+    blend_compatibility,
+    compatibility_hundredths,
+)
+from sublease_matcher.core.services.scoring import div_round_half_even
+
+NEXT_YEAR = date.today().year + 1
+
+
+def one_by_one(seeker: int, roommates: list[int]) -> int:
+    """The lane-parallel score written as a loop over roommates."""
+    count = len(roommates)
+    wanted = (seeker & INTEREST_MASK).bit_count()
+    hits = sum((seeker & r & INTEREST_MASK).bit_count() for r in roommates)
+    interest = div_round_half_even(50 * hits, wanted * count) if wanted else 25
+    if seeker & MAJOR_MASK:
+        major = 20 if any(seeker & r & MAJOR_MASK for r in roommates) else 0
+    else:
+        major = 10
+    balance = 0
+    for roommate in roommates:
+        for dimension in range(3):
+            shift = HABIT_OFFSET + 2 * dimension
+            mine, theirs = (seeker >> shift) & 3, (roommate >> shift) & 3
+            if mine and theirs:
+                balance += 1 if mine == theirs else -1
+    step = div_round_half_even(15 * abs(balance), 3 * count)
+    return interest + major + (15 + step if balance >= 0 else 15 - step)
+
+
+def random_word(rng: random.Random) -> int:
+    word = rng.getrandbits(56) & rng.getrandbits(56) & ~HABIT_MASK
+    for dimension in range(3):
+        word |= rng.choice((0, 1, 2)) << (HABIT_OFFSET + 2 * dimension)
+    return word
+
+
+def test_packed_scoring_matches_a_per_roommate_loop() -> None:
+    rng = random.Random(11)
+    for _ in range(2000):
+        seeker = random_word(rng)
+        roommates = [random_word(rng) for _ in range(rng.randint(1, 6))]
+        score = compatibility_hundredths(seeker, pack_traits(roommates))
+        assert score == one_by_one(seeker, roommates)
+        assert score is not None and 0 <= score <= 100
+
+
+def test_habits_and_interests_move_the_score() -> None:
+    seeker = encode_traits(
+        interests=("Hiking", "board games"), bio="Early riser, pretty tidy."
+    )
+    alike = encode_traits(
+        interests=("hiking",),
+        sleeping_habits="early bird",
+        cleanliness="very clean",
+    )
+    unlike = encode_traits(
+        interests=("gaming",),
+        sleeping_habits="night owl",
+        cleanliness="messy",
+    )
+
+    good = compatibility_hundredths(seeker, pack_traits([alike]))
+    mixed = compatibility_hundredths(seeker, pack_traits([alike, unlike]))
+    bad = compatibility_hundredths(seeker, pack_traits([unlike]))
+    assert good is not None and mixed is not None and bad is not None
+    assert good > mixed > bad
+    assert compatibility_hundredths(seeker, b"") is None
+
+
+def test_blend_keeps_plain_scores_without_roommates() -> None:
+    assert blend_compatibility(73, None) == 73
+    assert blend_compatibility(0, 100) == 0
+    assert blend_compatibility(100, 0) == 80
+
+
+def test_listing_encodes_roommates_once_and_rows_keep_them() -> None:
+    roommates = tuple(
+        RoommateProfile(
+            id=RoommateId(f"r{n}"),
+            name="Sam",
+            sleeping_habits="night owl",
+            gender=None,
+            pronouns=None,
+            interests=("music",),
+            major_minor="Computer Science",
+        )
+        for n in range(3)
+    )
+    listing = Listing(
+        id=ListingId("l1"),
+        host_id=HostId("h1"),
+        title="Room",
+        price_per_month=None,
+        city="Eau Claire",
+        state="WI",
+        available_from=date(NEXT_YEAR, 1, 1),
+        available_to=None,
+        status=ListingStatus.DRAFT,
+        contact_email=None,
+        bio=None,
+        roommates=roommates,
+        roommates_count=3,
+    )
+    assert len(listing.roommate_features) == 3 * 8
+
+    row = {**listing_to_dict(listing), "status": "DRAFT"}
+    assert listing_from_row(row).roommate_features is listing.roommate_features
+    del row["roommate_features"]
+    assert listing_from_row(row).roommate_features == listing.roommate_features
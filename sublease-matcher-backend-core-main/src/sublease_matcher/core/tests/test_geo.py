@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+import math
+import random
+from datetime import date
+
+import pytest
+
+from sublease_matcher.core.domain import HostId, Listing, ListingId, ListingStatus
+from sublease_matcher.core.geo import (
+    GeoPoint,
+    Radius,
+    default_gazetteer,
+    geohash,
+    locate,
+)
+from sublease_matcher.core.services import scoring
+from sublease_matcher.core.services.scoring import (
+    DECAY_KM,
+    ListingScoring,
+    SeekerScoring,
+    decay_origin,
+    score_hundredths,
+)
+
+MADISON = GeoPoint(43.0731, -89.4012)
+
+
+def haversine_km(a: GeoPoint, b: GeoPoint) -> float:
+    lat1, lat2 = math.radians(a.lat), math.radians(b.lat)
+    dlat, dlon = lat2 - lat1, math.radians(b.lon - a.lon)
+    h = math.sin(dlat / 2) ** 2
+    h += math.cos(lat1) * math.cos(lat2) * math.sin(dlon / 2) ** 2
+    return 2 * 6371.0088 * math.asin(math.sqrt(h))
+
+
+def test_geohash_known_value() -> None:
+    assert geohash(GeoPoint(57.64911, 10.40744), 11) == "u4pruydqqvj"
+
+
+def test_gazetteer_lookup_uses_city_key_and_state() -> None:
+    assert locate("Madison", "WI") == MADISON
+    assert locate("  madison ") == MADISON
+    assert locate("St. Paul", "mn") == locate("Saint Paul", "MN") is not None
+    # Osseo exists in both states, so a bare city name is ambiguous.
+    assert locate("Osseo") is None
+    assert locate("Osseo", "MN") != locate("Osseo", "WI")
+    assert locate("Atlantis", "WI") is None
+    assert len(default_gazetteer()) > 50
+
+
+def test_radius_cells_cover_every_point_inside_it() -> None:
+    rng = random.Random(7)
+    for km in (2, 15, 40, 120):
+        radius = Radius(MADISON, km)
+        cells = radius.cells()
+        for _ in range(500):
+            point = GeoPoint(
+                MADISON.lat + rng.uniform(-1.5, 1.5), MADISON.lon + rng.uniform(-2, 2)
+            )
+            if radius.contains(point):
+                assert geohash(point).startswith(tuple(cells)), (km, point)
+
+
+def test_planar_distance_tracks_haversine_at_regional_range() -> None:
+    radius = Radius(MADISON, 100)
+    for city in ("Sun Prairie", "Milwaukee", "La Crosse"):
+        point = locate(city, "WI")
+        assert point is not None
+        exact = haversine_km(MADISON, point)
+        assert abs(radius.distance_km(point) - exact) / exact < 0.01, city
+
+
+def test_score_decays_with_distance_from_the_seekers_city() -> None:
+    seeker = SeekerScoring("madison", None, decay_origin(MADISON))
+
+    def score(city: str) -> int:
+        point = locate(city, "WI")
+        listing = ListingScoring(ListingId("l"), city.lower(), None, point)
+        return score_hundredths(seeker, listing)
+
+    unlocated = ListingScoring(ListingId("l"), "madison", None)
+    assert score_hundredths(seeker, unlocated) == 100
+    assert 50 < score("Middleton") < score("Madison") == 100
+    assert score("Middleton") > score("Sun Prairie") > 50
+    assert score("Milwaukee") == 0
+    milwaukee = locate("Milwaukee", "WI")
+    assert milwaukee is not None and haversine_km(MADISON, milwaukee) > DECAY_KM
+
+
+def test_projections_resolve_each_city_once(monkeypatch: pytest.MonkeyPatch) -> None:
+    calls: list[tuple[str | None, str | None]] = []
+
+    def counting_locate(city: str | None, state: str | None = None) -> GeoPoint | None:
+        calls.append((city, state))
+        return locate(city, state)
+
+    monkeypatch.setattr(scoring, "locate", counting_locate)
+    scoring._place.cache_clear()
+    listings = [
+        Listing.from_trusted_row(
+            id=ListingId(f"listing-{index}"),
+            host_id=HostId(f"host-{index}"),
+            title="Room",
+            price_per_month=None,
+            city="Middleton",
+            state="WI",
+            available_from=date(2020, 1, 1),
+            available_to=None,
+            status=ListingStatus.PUBLISHED,
+            contact_email=None,
+            bio=None,
+        )
+        for index in range(3)
+    ]
+    projected = [ListingScoring.of(listing) for listing in listings * 2]
+    scoring._place.cache_clear()
+
+    assert calls == [("Middleton", "WI")]
+    assert {(p.city_key, p.point) for p in projected} == {
+        ("middleton", locate("Middleton", "WI"))
+    }
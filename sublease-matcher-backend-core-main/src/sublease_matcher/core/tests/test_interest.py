@@ -0,0 +1,154 @@
+from __future__ import annotations
+
+import random
+from datetime import date, timedelta
+from decimal import Decimal
+
+from sublease_matcher.core.domain import (
+    HostId,
+    Listing,
+    ListingId,
+    ListingStatus,
+    Money,
+    SeekerId,
+)
+from sublease_matcher.core.services.interest import (
+    Interest,
+    InterestIndex,
+    Opening,
+    Percolator,
+    suits,
+)
+from sublease_matcher.core.services.listings import ListingService
+from sublease_matcher.core.services.models import PublishListingCmd
+
+CITIES = ("eau claire", "madison", "minneapolis")
+HOBBIES = ("music", "hiking", "cooking", "gaming")
+NEXT_YEAR = date.today().year + 1
+
+
+def random_interest(rng: random.Random) -> Interest:
+    budget = rng.choice((None, rng.randrange(40_000, 200_000)))
+    move_in = rng.choice((None, date(2026, 1, 1) + timedelta(days=rng.randrange(700))))
+    move_out = None
+    if rng.random() < 0.3:
+        stay = timedelta(days=rng.randrange(30, 200))
+        move_out = (move_in or date(2026, 1, 1)) + stay
+    interests = frozenset(rng.sample(HOBBIES, rng.choice((0, 0, 1, 2))))
+    return Interest(rng.choice(CITIES), budget, move_in, move_out, interests)
+
+
+def random_opening(rng: random.Random) -> Opening:
+    start = rng.choice((None, date(2026, 1, 1) + timedelta(days=rng.randrange(700))))
+    end = None
+    if rng.random() < 0.7:
+        end = (start or date(2026, 1, 1)) + timedelta(days=rng.randrange(30, 400))
+    price = rng.choice((None, rng.randrange(30_000, 220_000)))
+    interests = frozenset(rng.sample(HOBBIES, rng.randrange(3)))
+    return Opening(rng.choice(CITIES), price, start, end, interests)
+
+
+def test_match_agrees_with_checking_every_seeker() -> None:
+    rng = random.Random(7)
+    interests = {SeekerId(f"s{n:04}"): random_interest(rng) for n in range(600)}
+    index = InterestIndex()
+    for seeker_id, interest in interests.items():
+        index.put(seeker_id, interest)
+    # Seekers move and leave; emptied buckets must not break lookups.
+    for seeker_id in list(interests)[::3]:
+        interests[seeker_id] = random_interest(rng)
+        index.put(seeker_id, interests[seeker_id])
+    for seeker_id in list(interests)[1::5]:
+        index.discard(seeker_id)
+        del interests[seeker_id]
+    assert len(index) == len(interests)
+
+    for _ in range(300):
+        opening = random_opening(rng)
+        expected = sorted(
+            seeker_id
+            for seeker_id, interest in interests.items()
+            if suits(interest, opening)
+        )
+        assert index.match(opening) == expected
+
+
+def test_suits_needs_the_move_in_date_covered() -> None:
+    interest = Interest("madison", 100_000, date(2026, 9, 1))
+    assert suits(interest, Opening("madison", 100_000, date(2026, 8, 15), None))
+    assert not suits(interest, Opening("madison", 100_001, None, None))
+    assert not suits(interest, Opening("madison", None, date(2026, 9, 2), None))
+    assert not suits(interest, Opening("madison", None, None, date(2026, 8, 31)))
+    assert not suits(interest, Opening("eau claire", None, None, None))
+
+    staying = Interest("madison", None, date(2026, 9, 1), date(2026, 12, 31))
+    assert not suits(staying, Opening("madison", None, None, date(2026, 11, 30)))
+    picky = Interest("madison", interests=frozenset({"music", "chess"}))
+    assert suits(picky, Opening("madison", interests=frozenset({"chess"})))
+    assert not suits(picky, Opening("madison", interests=frozenset({"hiking"})))
+
+
+def make_listing() -> Listing:
+    return Listing(
+        id=ListingId("listing-1"),
+        host_id=HostId("host-1"),
+        title="Room",
+        price_per_month=Money(Decimal("700")),
+        city="Eau Claire",
+        state="WI",
+        available_from=date(NEXT_YEAR, 1, 1),
+        available_to=None,
+        status=ListingStatus.DRAFT,
+        contact_email="host@example.com",
+        bio=None,
+        roommates=(),
+    )
+
+
+class _Listings:
+    def __init__(self, listing: Listing) -> None:
+        self.listing = listing
+
+    def get(self, listing_id: ListingId) -> Listing | None:
+        return self.listing if listing_id == self.listing.id else None
+
+    def upsert(self, listing: Listing) -> None:
+        self.listing = listing
+
+
+class _UnitOfWork:
+    def __init__(self, listing: Listing) -> None:
+        self.listings = _Listings(listing)
+        self.committed = False
+
+    def begin(self) -> None:
+        pass
+
+    def commit(self) -> None:
+        self.committed = True
+
+    def rollback(self) -> None:
+        pass
+
+
+def test_publishing_notifies_suited_seekers_after_commit() -> None:
+    index = InterestIndex()
+    index.put(SeekerId("fits"), Interest("eau claire", 80_000, date(NEXT_YEAR, 2, 1)))
+    index.put(SeekerId("too-poor"), Interest("eau claire", 50_000, None))
+    index.put(SeekerId("elsewhere"), Interest("madison", None, None))
+    uow = _UnitOfWork(make_listing())
+    notified: list[tuple[SeekerId, bool]] = []
+    service = ListingService(
+        uow,  # type: ignore[arg-type]
+        listeners=[
+            Percolator(
+                index, lambda seeker_id, _: notified.append((seeker_id, uow.committed))
+            )
+        ],
+    )
+
+    cmd = PublishListingCmd(ListingId("listing-1"), HostId("host-1"))
+    listing = service.publish(cmd)
+
+    assert listing.status is ListingStatus.PUBLISHED
+    assert notified == [("fits", True)]
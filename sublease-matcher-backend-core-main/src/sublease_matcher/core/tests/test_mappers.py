@@ -0,0 +1,225 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from datetime import UTC, date, datetime
+from decimal import Decimal
+
+from sublease_matcher.core.domain import (
+    Decision,
+    HostId,
+    Listing,
+    ListingId,
+    ListingStatus,
+    Match,
+    MatchId,
+    MatchStatus,
+    Money,
+    RoommateId,
+    RoommateProfile,
+    SeekerId,
+    SeekerProfile,
+    Swipe,
+    SwipeId,
+    UserId,
+)
+from sublease_matcher.core.errors import Validation
+from sublease_matcher.core.mappers import (
+    _compile_from_dict,
+    _compile_to_dict,
+    listing_from_dict,
+    listing_from_row,
+    listing_to_dict,
+    match_from_dict,
+    match_to_dict,
+    roommate_from_dict,
+    roommate_to_dict,
+    seeker_from_dict,
+    seeker_from_row,
+    seeker_to_dict,
+    swipe_from_dict,
+    swipe_to_dict,
+)
+
+NEXT_YEAR = date.today().year + 1
+
+
+def make_listing(roommate_count: int = 0) -> Listing:
+    roommates = tuple(
+        RoommateProfile(
+            id=RoommateId(f"roommate-{index}"),
+            name=f"Roommate {index}",
+            sleeping_habits=None,
+            gender=None,
+            pronouns="they/them",
+            interests=("music",),
+            major_minor=None,
+        )
+        for index in range(roommate_count)
+    )
+    return Listing(
+        id=ListingId("listing-1"),
+        host_id=HostId("host-1"),
+        title="  Room near Water St ",
+        price_per_month=Money(Decimal("650")),
+        city="Eau Claire",
+        state="wi",
+        available_from=date(NEXT_YEAR, 8, 15),
+        available_to=date(NEXT_YEAR, 12, 20),
+        status=ListingStatus.PUBLISHED,
+        contact_email=" h1@example.edu",
+        bio=None,
+        roommates=roommates,
+        roommates_count=roommate_count,
+    )
+
+
+def stored_row(listing: Listing) -> dict[str, object]:
+    """Shape a listing the way a repository row carries it (plain NUMERIC price)."""
+    assert listing.price_per_month is not None
+    price = listing.price_per_month.amount
+    return {**listing_to_dict(listing), "price_per_month": price}
+
+
+def test_listing_from_row_matches_the_validating_constructor() -> None:
+    for listing in (make_listing(), make_listing(roommate_count=2)):
+        restored = listing_from_row(stored_row(listing))
+
+        assert restored == listing
+        assert isinstance(restored, Listing)
+        assert restored.roommates_count == len(listing.roommates)
+
+
+def test_unquantized_amounts_are_still_normalized() -> None:
+    row = {**stored_row(make_listing()), "price_per_month": Decimal("650")}
+
+    price = listing_from_row(row).price_per_month
+
+    assert price is not None and str(price.amount) == "650.00"
+    rounded = listing_from_row({**row, "price_per_month": "12.345"}).price_per_month
+    assert rounded == Money(Decimal("12.35"))
+
+
+def test_rows_from_past_terms_still_load() -> None:
+    row = {
+        **stored_row(make_listing()),
+        "available_from": date(2019, 1, 1),
+        "available_to": date(2019, 5, 1),
+    }
+
+    assert listing_from_row(row).available_from == date(2019, 1, 1)
+
+
+def test_seeker_from_row_reads_stored_interest_csv() -> None:
+    profile = seeker_from_row(
+        {
+            "id": "seeker-9",
+            "user_id": "user-9",
+            "bio": "hi",
+            "available_from": date(2020, 8, 1),
+            "available_to": date(2020, 12, 1),
+            "budget_min": Decimal("500.00"),
+            "budget_max": None,
+            "city": "Eau Claire",
+            "interests_csv": "coding,hiking",
+            "contact_email": "s9@example.edu",
+        }
+    )
+
+    assert isinstance(profile, SeekerProfile)
+    assert profile.interests == ("coding", "hiking")
+    assert profile.budget_min == Money(Decimal("500"))
+    assert profile.hidden is False
+
+
+def test_generated_mappers_round_trip_without_copying() -> None:
+    listing = make_listing(roommate_count=2)
+    seeker = SeekerProfile(
+        id=SeekerId("seeker-1"),
+        user_id=UserId("user-1"),
+        bio="hi",
+        available_from=date(NEXT_YEAR, 1, 10),
+        available_to=date(NEXT_YEAR, 5, 10),
+        budget_min=Money(Decimal("400")),
+        budget_max=Money(Decimal("800")),
+        city="Eau Claire",
+        interests=("Hiking", "coding"),
+        contact_email="s1@example.edu",
+    )
+    match = Match(
+        id=MatchId("match-1"),
+        seeker_id=seeker.id,
+        listing_id=listing.id,
+        status=MatchStatus.MUTUAL,
+        score=0.9,
+        matched_at=datetime(NEXT_YEAR, 1, 1, tzinfo=UTC),
+    )
+    swipe = Swipe(
+        id=SwipeId("swipe-1"),
+        user_id=seeker.user_id,
+        target_id=str(listing.id),
+        decision=Decision.LIKE,
+        created_at=datetime(NEXT_YEAR, 1, 1, tzinfo=UTC),
+    )
+
+    assert listing_from_dict(listing_to_dict(listing)) == listing
+    assert seeker_from_dict(seeker_to_dict(seeker)) == seeker
+    assert match_from_dict(match_to_dict(match)) == match
+    assert swipe_from_dict(swipe_to_dict(swipe)) == swipe
+    roommate = listing.roommates[0]
+    assert roommate_from_dict(roommate_to_dict(roommate)) == roommate
+
+    as_dict = listing_to_dict(listing)
+    assert list(as_dict) == [
+        "id",
+        "host_id",
+        "title",
+        "price_per_month",
+        "city",
+        "state",
+        "available_from",
+        "available_to",
+        "status",
+        "contact_email",
+        "bio",
+        "roommates",
+        "roommates_count",
+        "roommate_features",
+    ]
+    assert as_dict["price_per_month"] is listing.price_per_month
+    assert as_dict["roommates"] is listing.roommates
+
+
+def test_from_dict_fills_defaults_and_still_validates() -> None:
+    row = listing_to_dict(make_listing())
+    del row["roommates"], row["roommates_count"]
+    assert listing_from_dict(row).roommates == ()
+
+    try:
+        listing_from_dict({**row, "state": "ZZ"})
+    except Validation:
+        pass
+    else:
+        raise AssertionError("expected Validation")
+
+
+@dataclass
+class Tagged:
+    name: str
+    tags: list[str] = field(default_factory=list)
+    tag_count: int = field(init=False, default=0)
+
+    def __post_init__(self) -> None:
+        self.tag_count = len(self.tags)
+
+
+def test_from_dict_skips_init_false_fields_and_calls_default_factories() -> None:
+    to_dict = _compile_to_dict(Tagged)
+    from_dict = _compile_from_dict(Tagged)
+
+    tagged = Tagged("a", ["x", "y"])
+    assert to_dict(tagged) == {"name": "a", "tags": ["x", "y"], "tag_count": 2}
+    assert from_dict(to_dict(tagged)) == tagged
+
+    first, second = from_dict({"name": "b", "tag_count": 9}), from_dict({"name": "c"})
+    assert first.tag_count == 0
+    assert first.tags == [] and first.tags is not second.tags
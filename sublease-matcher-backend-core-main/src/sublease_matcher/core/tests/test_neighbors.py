@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+import math
+import random
+
+from sublease_matcher.core.services.neighbors import iter_neighbors, neighbor_lift
+
+
+def random_baskets(seed: int) -> list[list[str]]:
+    rng = random.Random(seed)
+    listings = [f"listing-{n}" for n in range(40)]
+    return [rng.sample(listings, rng.randint(0, 8)) for _ in range(300)]
+
+
+def test_neighbors_are_cosine_top_k() -> None:
+    baskets = random_baskets(3)
+    neighbors = dict(iter_neighbors(lambda: baskets, k=5, min_co_likes=1))
+
+    likers: dict[str, set[int]] = {}
+    for seeker, basket in enumerate(baskets):
+        for listing in basket:
+            likers.setdefault(listing, set()).add(seeker)
+    for anchor, row in neighbors.items():
+        assert len(row) <= 5
+        assert [score for _, score in row] == sorted((s for _, s in row), reverse=True)
+        expected = sorted(
+            (
+                len(likers[anchor] & seekers)
+                / math.sqrt(len(likers[anchor]) * len(seekers))
+                for other, seekers in likers.items()
+                if other != anchor and likers[anchor] & seekers
+            ),
+            reverse=True,
+        )[:5]
+        assert [score for _, score in row] == expected
+
+
+def test_sharding_and_basket_cap_bound_the_work_not_the_result() -> None:
+    baskets = random_baskets(5)
+    whole = dict(iter_neighbors(lambda: baskets, k=4))
+    sharded = dict(iter_neighbors(lambda: iter(baskets), k=4, shards=7))
+    assert sharded == whole
+
+    capped = dict(iter_neighbors(lambda: [["a", "b", "c"], ["a", "b"]], max_basket=2))
+    assert capped == {"a": [("b", 1.0)], "b": [("a", 1.0)]}
+
+
+def test_lift_moves_toward_full_marks_only_for_neighbors() -> None:
+    assert neighbor_lift(60, 0.0) == 60
+    assert neighbor_lift(0, 1.0) == 0
+    assert neighbor_lift(60, 1.0) == 80
+    assert 60 < neighbor_lift(60, 0.3) < neighbor_lift(60, 0.6) < 80
+    assert neighbor_lift(100, 1.0) == 100
@@ -0,0 +1,144 @@
+from __future__ import annotations
+
+import io
+import math
+from collections.abc import Sequence
+from datetime import UTC, date, datetime, timedelta
+from decimal import Decimal
+from itertools import count
+
+import pytest
+
+from sublease_matcher.core.domain import Listing, ListingId, SeekerId, SeekerProfile
+from sublease_matcher.core.replay import (
+    ReplayListings,
+    format_reports,
+    listing_record,
+    percentile,
+    read_log,
+    replay,
+    seeker_record,
+    swipe_record,
+    write_log,
+)
+from sublease_matcher.core.services.matches import SimpleMatchEngine
+
+T0 = datetime(2026, 3, 1, tzinfo=UTC)
+
+
+def make_log_text() -> str:
+    listings = [
+        {
+            "id": f"l{n}",
+            "host_id": f"h{n}",
+            "title": "Room",
+            "price_per_month": Decimal(500 + 100 * n),
+            "city": "Eau Claire",
+            "state": "WI",
+            "available_from": date(2026, 9, 1),
+            "status": "PUBLISHED",
+            "roommate_features": b"\x01" * 8 if n == 1 else b"",
+        }
+        for n in range(4)
+    ]
+    seeker = {
+        "id": "s1",
+        "user_id": "u1",
+        "bio": None,
+        "city": "Eau Claire",
+        "budget_max": Decimal("800"),
+        "interests_csv": "music,hiking",
+        "available_from": date(2026, 9, 1),
+        "available_to": date(2027, 5, 31),
+    }
+    swipes = [("l0", "PASS"), ("l3", "LIKE"), ("l1", "LIKE"), ("l9", "LIKE")]
+    out = io.StringIO()
+    write_log(
+        out,
+        [
+            seeker_record(seeker),
+            *map(listing_record, listings),
+            *(
+                swipe_record(T0 + timedelta(minutes=n), "s1", listing_id, decision)
+                for n, (listing_id, decision) in enumerate(swipes)
+            ),
+        ],
+    )
+    return out.getvalue()
+
+
+class FixedEngine:
+    """Always recommends the same order; each call costs one clock tick."""
+
+    def __init__(self, order: Sequence[str]) -> None:
+        self.order = [ListingId(listing_id) for listing_id in order]
+
+    def recommendations_for(
+        self, seeker: SeekerProfile, *, limit: int = 20
+    ) -> Sequence[ListingId]:
+        return self.order[:limit]
+
+    def score_pair(self, seeker: SeekerProfile, listing: Listing) -> float:
+        return 0.5
+
+
+def test_log_round_trips_entities_and_orders_swipes() -> None:
+    log = read_log(reversed(make_log_text().splitlines()))
+    assert [swipe.listing_id for swipe in log.swipes] == ["l0", "l3", "l1", "l9"]
+    assert log.seekers[SeekerId("s1")].interests == ("music", "hiking")
+    price = log.listings[ListingId("l2")].price_per_month
+    assert price is not None
+    assert price.cents == 70000
+    assert log.listings[ListingId("l1")].roommate_features == b"\x01" * 8
+
+
+def test_seeker_records_without_dates_are_rejected() -> None:
+    out = io.StringIO()
+    write_log(out, [seeker_record({"id": "s2", "user_id": "u2"})])
+    with pytest.raises(ValueError, match="s2"):
+        read_log(out.getvalue().splitlines())
+
+
+def test_replay_scores_later_likes_after_dropping_swiped_listings() -> None:
+    log = read_log(make_log_text().splitlines())
+    ticks = count(step=1000)
+    engine = FixedEngine(["l0", "l1", "l3"])
+    report = replay("fixed", engine, log, k=1, clock=lambda: next(ticks))
+
+    # l9 is not in the log's listings, so only two LIKEs are queries.
+    assert report.queries == 2
+    # First query: l0 was passed, so the top 1 is l1, but the seeker likes l3 now.
+    # Second query: l0 and l3 are swiped, l1 is on top and is the LIKE.
+    assert report.hits == 1
+    assert math.isclose(report.ndcg, (1.0 + 1.0) / 2)
+    assert report.recommend_ns == [1000, 1000]
+    assert len(report.score_ns) == 3
+
+    start = T0 + timedelta(minutes=2)
+    later = replay("fixed", FixedEngine(["l1"]), log, k=1, start=start)
+    assert later.queries == 1 and later.hits == 1
+
+
+def test_start_without_timezone_is_taken_as_utc() -> None:
+    log = read_log(make_log_text().splitlines())
+    assert log.swipes[0].at.tzinfo is not None
+
+    naive = (T0 + timedelta(minutes=2)).replace(tzinfo=None)
+    later = replay("fixed", FixedEngine(["l1"]), log, k=1, start=naive)
+    assert later.queries == 1 and later.hits == 1
+
+
+def test_reports_compare_engines_side_by_side() -> None:
+    log = read_log(make_log_text().splitlines())
+    listings = ReplayListings(log.listings.values())
+    engine = SimpleMatchEngine(listings)  # type: ignore[arg-type]
+    reports = [
+        replay("simple", engine, log, k=2),
+        replay("fixed", FixedEngine(["l3", "l1"]), log, k=2),
+    ]
+    assert reports[1].hit_rate == 1.0
+    table = format_reports(reports).splitlines()
+    assert table[0].split() == ["simple", "fixed"]
+    assert any(line.startswith("hit_rate@2") for line in table)
+    assert percentile([5, 1, 3, 2, 4], 50) == 3
+    assert percentile([], 99) == 0
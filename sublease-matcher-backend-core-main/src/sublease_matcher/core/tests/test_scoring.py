@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+from decimal import Decimal
+
+from sublease_matcher.core.domain import ListingId, Money, normalize_city_key
+from sublease_matcher.core.services.scoring import (
+    ListingScoring,
+    SeekerScoring,
+    budget_points,
+    div_round_half_even,
+    score_hundredths,
+    to_cents,
+)
+
+
+def decimal_score(price: Decimal, budget_max: Decimal) -> float:
+    """The Decimal formula the engine used before switching to integer cents."""
+    if price <= budget_max:
+        return 1.0
+    penalty = ((price - budget_max) / Decimal("100")) * Decimal("0.1")
+    budget = max(Decimal("0.0"), Decimal("0.5") - penalty)
+    return float(round(Decimal("0.5") + budget, 2))
+
+
+def test_integer_budget_fit_matches_the_decimal_formula_to_the_cent() -> None:
+    budget = 123_456
+    for over in range(-500, 60_000, 7):
+        price = budget + over
+        expected = decimal_score(Decimal(price).scaleb(-2), Decimal(budget).scaleb(-2))
+        assert (50 + budget_points(price, budget)) / 100 == expected, over
+
+
+def test_ties_round_half_to_even() -> None:
+    rounded = [div_round_half_even(n, 1000) for n in (1500, 2500, 2499, 2501)]
+    assert rounded == [2, 2, 2, 3]
+
+
+def test_cents_are_exact() -> None:
+    assert to_cents(Money(Decimal("650.005"))) == 65001
+    assert to_cents(Decimal("0.1")) == 10
+    assert Money.from_cents(65001) == Money(Decimal("650.01"))
+
+
+def test_score_requires_the_same_city() -> None:
+    listing = ListingScoring(ListingId("listing-1"), "eau claire", price_cents=90_000)
+
+    assert score_hundredths(SeekerScoring("madison", 80_000), listing) == 0
+    assert score_hundredths(SeekerScoring("eau claire", None), listing) == 100
+    assert score_hundredths(SeekerScoring("eau claire", 80_000), listing) == 90
+
+
+def test_city_keys_ignore_case_spacing_and_common_variants() -> None:
+    assert normalize_city_key(" St. Paul, MN") == normalize_city_key("saint  paul")
+    assert normalize_city_key("EauClaire") == "eau claire"
+    assert normalize_city_key("Mpls") == "minneapolis"
+    assert normalize_city_key("   ") == ""
+    listing_key = normalize_city_key("Eau Claire ")
+    listing = ListingScoring(ListingId("listing-1"), listing_key, 1)
+    seeker = SeekerScoring(normalize_city_key("eau claire"), 1)
+    assert score_hundredths(seeker, listing) == 100